@@ -39,6 +39,12 @@ FILINGS_DIR_NAME = "filings"
 PARSED_JSON_FILENAME = "parsed.json"
 GLOB_PATTERN_PARSED_FILES = "*/*/*/parsed.json"
 
+# Archives a filing is stored as when the downloader did not extract it
+# (DOWNLOADER_EXTRACT_FILINGS=false); the parser needs extracted filings
+FILING_ARCHIVE_EXTENSIONS = (
+    '.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz',
+)
+
 # ============================================================================
 # Status Values
 # ============================================================================
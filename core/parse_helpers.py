@@ -158,6 +158,9 @@ def save_parsed_json(parsed, output_dir: Path) -> Path:
     """
     Serialize and save parsed filing as JSON.
 
+    Written atomically (temporary file moved into place), so an
+    interrupted run never leaves a truncated parsed.json.
+
     Args:
         parsed: ParsedFiling object
         output_dir: Output directory
@@ -166,11 +169,111 @@ def save_parsed_json(parsed, output_dir: Path) -> Path:
         Path to saved JSON file
     """
     from parser.xbrl_parser.serialization.json_serializer import JSONSerializer
+    from parser.output.parsed_json import write_parsed_json
+
+    return write_parsed_json(JSONSerializer(), parsed, output_dir / "parsed.json")
+
+
+def save_source_record(output_dir: Path, filing_path: Path) -> Optional[Path]:
+    """
+    Record the source filing next to parsed.json.
+
+    The mapper resolves the filing from this record instead of searching
+    the filings tree.
+
+    Structure: .../entities/{market}/{company}/filings/{FORM_TYPE}/{accession}/
+
+    Args:
+        output_dir: Parsed output directory
+        filing_path: Path to filing directory
+
+    Returns:
+        Path to source record, or None if it could not be written
+    """
+    from parser.output.source_record import write_source_record
+
+    market = company = form = None
+    parts = filing_path.parts
+    try:
+        filings_idx = parts.index('filings')
+        if filings_idx >= 2 and filings_idx + 1 < len(parts):
+            market = parts[filings_idx - 2]
+            company = parts[filings_idx - 1]
+            form = parts[filings_idx + 1]
+    except ValueError:
+        pass
+
+    return write_source_record(
+        output_dir, filing_path, market=market, company=company, form=form
+    )
+
+
+def save_profile_outputs(
+    parsed,
+    output_dir: Path,
+    parser_config=None,
+    parse_time: Optional[float] = None
+) -> list[Path]:
+    """
+    Write the secondary artifacts selected by the workflow output profile.
 
-    serializer = JSONSerializer()
-    json_output = serializer.serialize(parsed)
+    parsed.json is written by save_parsed_json; the default 'minimal'
+    profile adds nothing. Failures are logged and do not fail the parse.
 
-    json_file = output_dir / "parsed.json"
-    json_file.write_text(json_output)
+    Args:
+        parsed: ParsedFiling object
+        output_dir: Output directory
+        parser_config: Parser ConfigLoader (loaded if not given)
+        parse_time: Parse time in seconds (for the summary report)
 
-    return json_file
+    Returns:
+        Paths of written files
+    """
+    from parser.core.config_loader import ConfigLoader
+    from parser.output.profiles import get_output_profile
+
+    config = parser_config or ConfigLoader()
+    profile = get_output_profile(config.get('workflow_output_profile', 'minimal'))
+    written = []
+
+    if profile.csv:
+        try:
+            from parser.output.extracted_data.data_extractor import DataExtractor
+            csv_file = output_dir / "facts.csv"
+            DataExtractor().save_facts_csv(parsed, csv_file, include_context_details=True)
+            written.append(csv_file)
+        except Exception as e:
+            logger.warning(f"CSV export failed: {e}")
+
+    if profile.summary:
+        try:
+            from parser.output.parsed_report.report_generator import ReportGenerator
+            summary_file = output_dir / "summary.txt"
+            summary_file.write_text(
+                ReportGenerator().generate_summary(parsed, parse_time=parse_time)
+            )
+            written.append(summary_file)
+        except Exception as e:
+            logger.warning(f"Summary report failed: {e}")
+
+    if profile.excel:
+        try:
+            from parser.output.excel_exporter import ExcelExporter
+            excel_exporter = ExcelExporter()
+            if excel_exporter.has_openpyxl:
+                excel_file = output_dir / "workbook.xlsx"
+                excel_exporter.export(parsed, excel_file, include_errors=True)
+                written.append(excel_file)
+        except Exception as e:
+            logger.warning(f"Excel export failed: {e}")
+
+    if profile.columnar and config.get('enable_columnar_export', True):
+        try:
+            from parser.output.columnar_exporter import ColumnarExporter
+            columnar_exporter = ColumnarExporter()
+            if columnar_exporter.has_pyarrow:
+                written.extend(columnar_exporter.export(parsed, output_dir))
+        except Exception as e:
+            logger.warning(f"Columnar export failed: {e}")
+
+    return written
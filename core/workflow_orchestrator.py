@@ -40,10 +40,15 @@ from database.models import DownloadedFiling, Entity
 from searcher.engine.orchestrator import SearchOrchestrator
 from downloader.engine.coordinator import DownloadCoordinator
 from mapper.mapping.orchestrator import MappingOrchestrator
+from mapper.observability.instrumentation import (
+    get_instrumentation,
+    configure_instrumentation,
+)
 
 # Configuration
 from database.core.config_loader import ConfigLoader as DatabaseConfig
 from parser.core.config_loader import ConfigLoader as ParserConfig
+from mapper.core.config_loader import ConfigLoader as MapperConfig
 
 # Workflow constants and helpers
 from .constants import (
@@ -60,6 +65,7 @@ from .constants import (
     PARSE_STATUS_FAILED,
     PARSED_JSON_FILENAME,
     GLOB_PATTERN_PARSED_FILES,
+    FILING_ARCHIVE_EXTENSIONS,
 )
 from .parse_helpers import (
     extract_form_type_from_path,
@@ -67,6 +73,8 @@ from .parse_helpers import (
     get_parser_output_directory,
     enrich_metadata,
     save_parsed_json,
+    save_profile_outputs,
+    save_source_record,
 )
 
 
@@ -200,6 +208,9 @@ class WorkflowOrchestrator:
         self._parser = None
         self._mapper = None
 
+        # Pipeline metrics (configured per run in run_complete_workflow)
+        self.instrumentation = get_instrumentation()
+
         self.logger.info("WorkflowOrchestrator initialized")
 
     async def run_complete_workflow(
@@ -247,19 +258,24 @@ class WorkflowOrchestrator:
         # Reset state
         self.state = WorkflowState()
 
+        # Per-run metrics (MAPPER_ENABLE_METRICS); spans are no-ops when disabled
+        self.instrumentation = configure_instrumentation(MapperConfig(), run_name='workflow')
+
         try:
             # Phase 0: Database Initialization (0-5%)
             self.state.update("database_init", PROGRESS_DATABASE_INIT,
                               "Initializing database")
-            self._initialize_database()
+            with self.instrumentation.span('workflow.database_init'):
+                self._initialize_database()
 
             # Phase 1: Search (5-20%)
             self.state.update("search", PROGRESS_SEARCH_START,
                               "Searching for filings")
-            search_results = await self._phase_search(
-                market_id, company_identifier, form_type,
-                num_filings, start_date, end_date
-            )
+            with self.instrumentation.span('workflow.search'):
+                search_results = await self._phase_search(
+                    market_id, company_identifier, form_type,
+                    num_filings, start_date, end_date
+                )
 
             if search_results['filings_saved'] == 0:
                 self.state.add_warning("search", "No filings found")
@@ -268,7 +284,8 @@ class WorkflowOrchestrator:
             # Phase 2: Download (20-50%)
             self.state.update("download", PROGRESS_DOWNLOAD_START,
                               "Downloading filings")
-            download_results = await self._phase_download(num_filings)
+            with self.instrumentation.span('workflow.download'):
+                download_results = await self._phase_download(num_filings)
 
             if download_results['succeeded'] == 0:
                 self.state.add_error("download",
@@ -278,7 +295,8 @@ class WorkflowOrchestrator:
             # Phase 3: Parse (50-75%)
             self.state.update("parse", PROGRESS_PARSE_START,
                               "Parsing XBRL filings")
-            parse_results = await self._phase_parse(market_id, form_type)
+            with self.instrumentation.span('workflow.parse'):
+                parse_results = await self._phase_parse(market_id, form_type)
 
             if parse_results['parsed_count'] == 0:
                 # Check if parsing was skipped due to PDF-only format (expected, not an error)
@@ -293,7 +311,8 @@ class WorkflowOrchestrator:
             # Phase 4: Map (75-100%)
             self.state.update("map", PROGRESS_MAP_START,
                               "Mapping to financial statements")
-            map_results = await self._phase_map(market_id, form_type)
+            with self.instrumentation.span('workflow.map'):
+                map_results = await self._phase_map(market_id, form_type)
 
             # Complete
             self.state.update("complete", PROGRESS_COMPLETE,
@@ -312,6 +331,9 @@ class WorkflowOrchestrator:
             self.state.update("error", 0, f"Workflow failed: {e}")
             raise
 
+        finally:
+            self.instrumentation.write_report()
+
     def _initialize_database(self):
         """Initialize database (Phase 0)."""
         self.logger.info("Phase 0: Database Initialization")
@@ -465,6 +487,7 @@ class WorkflowOrchestrator:
                             parser_output
                         )
                     except Exception as e:
+                        self.instrumentation.count('parse_failures')
                         self.logger.error(
                             f"Parse failed for {downloaded_filing.filing_id}: {e}"
                         )
@@ -517,6 +540,23 @@ class WorkflowOrchestrator:
         files_in_dir = list(filing_path.iterdir()) if filing_path.is_dir() else []
         parseable_files = [f for f in files_in_dir if f.suffix.lower() in parseable_extensions]
         pdf_files = [f for f in files_in_dir if f.suffix.lower() == '.pdf']
+        archive_files = [
+            f for f in files_in_dir
+            if f.is_file() and f.name.lower().endswith(FILING_ARCHIVE_EXTENSIONS)
+        ]
+
+        if not parseable_files and archive_files:
+            # Stored without extraction (DOWNLOADER_EXTRACT_FILINGS=false):
+            # only the mapper reads archives in place
+            message = (
+                f"{entity.company_name}: filing stored as archives, not extracted "
+                f"({', '.join(f.name for f in archive_files)}); parsing needs "
+                f"DOWNLOADER_EXTRACT_FILINGS=true"
+            )
+            self.logger.error(f"Cannot parse {filing_path}: {message}")
+            downloaded_filing.parse_status = PARSE_STATUS_FAILED
+            self.state.add_error("parse", message)
+            return 0
 
         if not parseable_files and pdf_files:
             # Only PDF files present - skip parsing gracefully
@@ -534,8 +574,10 @@ class WorkflowOrchestrator:
 
         self.logger.info(f"Parsing: {entity.company_name} - {filing_path}")
 
-        # Parse filing
+        # Parse filing (recorded once the output folder names the filing)
+        parse_started = time.perf_counter()
         parsed = self._parser.parse(filing_path)
+        parse_seconds = time.perf_counter() - parse_started
 
         # Extract actual form type from physical directory structure
         actual_form_type = extract_form_type_from_path(
@@ -561,8 +603,18 @@ class WorkflowOrchestrator:
             filing_date_str
         )
 
+        # Same company/form/date identity the mapper reports under
+        filing_id = '/'.join(output_dir.parts[-3:])
+        self.instrumentation.record('workflow.parse_filing', parse_seconds, filing_id=filing_id)
+
         # Save parsed.json
-        json_file = save_parsed_json(parsed, output_dir)
+        with self.instrumentation.filing(filing_id):
+            with self.instrumentation.span('workflow.save_parsed'):
+                json_file = save_parsed_json(parsed, output_dir)
+                save_source_record(output_dir, filing_path)
+            with self.instrumentation.span('workflow.save_profile_outputs'):
+                save_profile_outputs(parsed, output_dir, self.parser_config, parse_seconds)
+        self.instrumentation.count('filings_parsed', filing_id=filing_id)
 
         # Update database
         downloaded_filing.parse_status = PARSE_STATUS_COMPLETED
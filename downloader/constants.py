@@ -50,6 +50,7 @@ DEFAULT_MAX_RETRIES: int = DEFAULT_RETRY_ATTEMPTS  # Alias for backward compatib
 DEFAULT_RETRY_DELAY: float = 1.0  # Initial retry delay in seconds
 DEFAULT_MAX_RETRY_DELAY: int = 60  # Maximum retry delay in seconds
 DEFAULT_MAX_CONCURRENT: int = 3  # Maximum concurrent downloads
+DEFAULT_MAX_CONCURRENT_PER_HOST: int = 2  # Maximum concurrent downloads from one host
 
 # ============================================================================
 # DATABASE CONFIGURATION DEFAULTS
@@ -73,6 +74,11 @@ MIN_ZIP_SIZE: int = 100  # Minimum bytes for valid ZIP
 MAX_EXTRACTION_DEPTH: int = 25  # Maximum directory nesting depth
 MAX_ARCHIVE_SIZE: int = 524288000  # 500MB default
 
+# Archive members extracted per distribution type (comma-separated
+# extensions, empty = extract everything)
+DEFAULT_EXTRACT_FILING_EXTENSIONS: str = '.xml,.xsd,.xbrl,.htm,.html,.xhtml,.json'
+DEFAULT_EXTRACT_TAXONOMY_EXTENSIONS: str = ''
+
 # ============================================================================
 # OPERATIONAL DEFAULTS
 # ============================================================================
@@ -271,6 +277,7 @@ ENV_RETRY_ATTEMPTS: str = 'DOWNLOADER_RETRY_ATTEMPTS'
 ENV_RETRY_DELAY: str = 'DOWNLOADER_RETRY_DELAY'
 ENV_MAX_RETRY_DELAY: str = 'DOWNLOADER_MAX_RETRY_DELAY'
 ENV_MAX_CONCURRENT: str = 'DOWNLOADER_MAX_CONCURRENT'
+ENV_MAX_CONCURRENT_PER_HOST: str = 'DOWNLOADER_MAX_CONCURRENT_PER_HOST'
 ENV_CHUNK_SIZE: str = 'DOWNLOADER_CHUNK_SIZE'
 ENV_ENABLE_RESUME: str = 'DOWNLOADER_ENABLE_RESUME'
 
@@ -279,6 +286,12 @@ ENV_MAX_ARCHIVE_SIZE: str = 'DOWNLOADER_MAX_ARCHIVE_SIZE'
 ENV_VERIFY_EXTRACTION: str = 'DOWNLOADER_VERIFY_EXTRACTION'
 ENV_PRESERVE_ZIP: str = 'DOWNLOADER_PRESERVE_ZIP'
 ENV_MAX_EXTRACTION_DEPTH: str = 'DOWNLOADER_MAX_EXTRACTION_DEPTH'
+ENV_EXTRACT_FILING_EXTENSIONS: str = 'DOWNLOADER_EXTRACT_FILING_EXTENSIONS'
+ENV_EXTRACT_TAXONOMY_EXTENSIONS: str = 'DOWNLOADER_EXTRACT_TAXONOMY_EXTENSIONS'
+ENV_EXTRACT_FILINGS: str = 'DOWNLOADER_EXTRACT_FILINGS'
+ENV_BLOB_STORE: str = 'DOWNLOADER_BLOB_STORE'
+ENV_BLOB_STORE_DIR: str = 'DOWNLOADER_BLOB_STORE_DIR'
+ENV_FILING_CATALOG: str = 'DOWNLOADER_FILING_CATALOG'
 
 # Validation Configuration
 ENV_MIN_FILE_SIZE: str = 'DOWNLOADER_MIN_FILE_SIZE'
@@ -338,6 +351,7 @@ __all__ = [
     'DEFAULT_RETRY_DELAY',
     'DEFAULT_MAX_RETRY_DELAY',
     'DEFAULT_MAX_CONCURRENT',
+    'DEFAULT_MAX_CONCURRENT_PER_HOST',
 
     # Database Configuration Defaults
     'DEFAULT_DB_PORT',
@@ -354,6 +368,8 @@ __all__ = [
     'MIN_ZIP_SIZE',
     'MAX_EXTRACTION_DEPTH',
     'MAX_ARCHIVE_SIZE',
+    'DEFAULT_EXTRACT_FILING_EXTENSIONS',
+    'DEFAULT_EXTRACT_TAXONOMY_EXTENSIONS',
     
     # Operational Defaults
     'TEMP_RETENTION_HOURS',
@@ -409,12 +425,19 @@ __all__ = [
     'ENV_RETRY_DELAY',
     'ENV_MAX_RETRY_DELAY',
     'ENV_MAX_CONCURRENT',
+    'ENV_MAX_CONCURRENT_PER_HOST',
     'ENV_CHUNK_SIZE',
     'ENV_ENABLE_RESUME',
     'ENV_MAX_ARCHIVE_SIZE',
     'ENV_VERIFY_EXTRACTION',
     'ENV_PRESERVE_ZIP',
     'ENV_MAX_EXTRACTION_DEPTH',
+    'ENV_EXTRACT_FILING_EXTENSIONS',
+    'ENV_EXTRACT_TAXONOMY_EXTENSIONS',
+    'ENV_EXTRACT_FILINGS',
+    'ENV_BLOB_STORE',
+    'ENV_BLOB_STORE_DIR',
+    'ENV_FILING_CATALOG',
     'ENV_MIN_FILE_SIZE',
     'ENV_VERIFY_CHECKSUMS',
     'ENV_VERIFY_URL_BEFORE',
@@ -33,12 +33,19 @@ from downloader.constants import (
     ENV_RETRY_DELAY,
     ENV_MAX_RETRY_DELAY,
     ENV_MAX_CONCURRENT,
+    ENV_MAX_CONCURRENT_PER_HOST,
     ENV_CHUNK_SIZE,
     ENV_ENABLE_RESUME,
     ENV_MAX_ARCHIVE_SIZE,
     ENV_VERIFY_EXTRACTION,
     ENV_PRESERVE_ZIP,
     ENV_MAX_EXTRACTION_DEPTH,
+    ENV_EXTRACT_FILING_EXTENSIONS,
+    ENV_EXTRACT_TAXONOMY_EXTENSIONS,
+    ENV_EXTRACT_FILINGS,
+    ENV_BLOB_STORE,
+    ENV_BLOB_STORE_DIR,
+    ENV_FILING_CATALOG,
     ENV_MIN_FILE_SIZE,
     ENV_VERIFY_CHECKSUMS,
     ENV_VERIFY_URL_BEFORE,
@@ -62,6 +69,7 @@ from downloader.constants import (
     DEFAULT_RETRY_DELAY,
     DEFAULT_MAX_RETRY_DELAY,
     DEFAULT_MAX_CONCURRENT,
+    DEFAULT_MAX_CONCURRENT_PER_HOST,
     DEFAULT_DB_PORT,
     DEFAULT_DB_POOL_SIZE,
     DEFAULT_DB_POOL_MAX_OVERFLOW,
@@ -71,6 +79,8 @@ from downloader.constants import (
     MIN_FILE_SIZE,
     MAX_ARCHIVE_SIZE,
     MAX_EXTRACTION_DEPTH,
+    DEFAULT_EXTRACT_FILING_EXTENSIONS,
+    DEFAULT_EXTRACT_TAXONOMY_EXTENSIONS,
     TEMP_RETENTION_HOURS,
     MAX_SEARCH_DEPTH,
 )
@@ -174,6 +184,9 @@ class ConfigLoader:
             'retry_delay': self._get_int(ENV_RETRY_DELAY, DEFAULT_RETRY_DELAY),
             'max_retry_delay': self._get_int(ENV_MAX_RETRY_DELAY, DEFAULT_MAX_RETRY_DELAY),
             'max_concurrent': self._get_int(ENV_MAX_CONCURRENT, DEFAULT_MAX_CONCURRENT),
+            'max_concurrent_per_host': self._get_int(
+                ENV_MAX_CONCURRENT_PER_HOST, DEFAULT_MAX_CONCURRENT_PER_HOST
+            ),
             'chunk_size': self._get_int(ENV_CHUNK_SIZE, DEFAULT_CHUNK_SIZE),
             'enable_resume': self._get_bool(ENV_ENABLE_RESUME, True),
             
@@ -184,6 +197,23 @@ class ConfigLoader:
             'verify_extraction': self._get_bool(ENV_VERIFY_EXTRACTION, True),
             'preserve_zip': self._get_bool(ENV_PRESERVE_ZIP, False),
             'max_extraction_depth': self._get_int(ENV_MAX_EXTRACTION_DEPTH, MAX_EXTRACTION_DEPTH),
+            'extract_filing_extensions': self._get_env(
+                ENV_EXTRACT_FILING_EXTENSIONS, DEFAULT_EXTRACT_FILING_EXTENSIONS
+            ),
+            'extract_taxonomy_extensions': self._get_env(
+                ENV_EXTRACT_TAXONOMY_EXTENSIONS, DEFAULT_EXTRACT_TAXONOMY_EXTENSIONS
+            ),
+            # False: filing archives are stored as downloaded. Only the
+            # mapper reads them in place; the workflow parse phase and
+            # verification's XBRL checks fail on them
+            'extract_filings': self._get_bool(ENV_EXTRACT_FILINGS, True),
+            # Content-addressed store (must share a filesystem with the
+            # entities and taxonomy trees; default: downloader_cache_dir/blobs)
+            'blob_store_enabled': self._get_bool(ENV_BLOB_STORE, True),
+            'blob_store_dir': self._get_path(ENV_BLOB_STORE_DIR, required=False),
+            # Catalog of downloaded filings at the entities root (parser
+            # lists filings from it instead of walking the tree)
+            'filing_catalog_enabled': self._get_bool(ENV_FILING_CATALOG, True),
             
             # ================================================================
             # VALIDATION CONFIGURATION
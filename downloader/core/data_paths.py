@@ -12,10 +12,12 @@ Architecture:
 - File verification support
 """
 
+import shutil
 from pathlib import Path
 from typing import Optional
 
 from downloader.core.config_loader import ConfigLoader
+from downloader.engine.constants import TEMP_DOWNLOAD_DIR_PREFIX
 
 
 class DataPathsManager:
@@ -301,6 +303,15 @@ class DataPathsManager:
                     except Exception:
                         # File deletion failed, increment counter and continue
                         failed_count += 1
+                elif file_path.is_dir() and file_path.name.startswith(TEMP_DOWNLOAD_DIR_PREFIX):
+                    # Per-download directory left by an interrupted download
+                    try:
+                        size = sum(f.stat().st_size for f in file_path.rglob('*') if f.is_file())
+                        shutil.rmtree(file_path)
+                        deleted_count += 1
+                        total_size += size
+                    except Exception:
+                        failed_count += 1
         except Exception:
             # Directory iteration failed, return current counts
             pass
@@ -2,19 +2,34 @@
 """
 Archive Downloader
 
-Handles downloading and extracting ZIP/TAR archive files.
+Handles downloading and extracting ZIP/TAR archive files, or storing
+them unextracted.
 Separated from main coordinator for better modularity.
+
+With a blob store, downloads whose URL still serves the content already
+stored (same HTTP validators) are linked from the store instead of
+fetched again.
+
+Every download is written to its own temp directory: a downloaded file
+becomes a hard link of its (read-only) blob, so it must never be written
+to again by a later download of the same URL.
 """
 
+import asyncio
 import os
+import shutil
+import tempfile
 from pathlib import Path
+from typing import Optional
 
 from downloader.core.logger import get_logger
 from downloader.core.config_loader import ConfigLoader
 from downloader.engine.protocol_handlers import HTTPHandler
 from downloader.engine.retry_manager import RetryManager
+from downloader.engine.blob_store import BlobStore
 from downloader.engine.extraction.archive_handler import ArchiveHandler
 from downloader.engine.result import DownloadResult, ExtractionResult
+from downloader.engine.constants import TEMP_DOWNLOAD_DIR_PREFIX
 from downloader.constants import LOG_PROCESS, LOG_OUTPUT
 
 logger = get_logger(__name__, 'engine')
@@ -36,7 +51,8 @@ class ArchiveDownloader:
         http_handler: HTTPHandler,
         retry_manager: RetryManager,
         temp_dir: Path,
-        config: ConfigLoader
+        config: ConfigLoader,
+        blob_store: Optional[BlobStore] = None
     ):
         """
         Initialize archive downloader.
@@ -46,25 +62,49 @@ class ArchiveDownloader:
             retry_manager: Retry manager for failed downloads
             temp_dir: Temporary directory for downloads
             config: Configuration loader
+            blob_store: Optional content-addressed store (skips re-downloads)
         """
         self.http_handler = http_handler
         self.retry_manager = retry_manager
         self.temp_dir = temp_dir
         self.config = config
+        self.blob_store = blob_store
     
-    async def download_to_temp(self, url: str) -> DownloadResult:
+    async def download_to_temp(
+        self,
+        url: str,
+        detection: Optional[dict] = None
+    ) -> DownloadResult:
         """
         Download archive file to temporary directory.
         
+        The file keeps its URL basename inside a directory unique to this
+        download; call discard_temp() once it has been moved or extracted.
+        
         Args:
             url: Source URL
+            detection: DistributionDetector result for url (enables
+                       the blob store check before downloading)
             
         Returns:
             DownloadResult
         """
         # Extract filename from URL
         filename = os.path.basename(url)
-        temp_path = self.temp_dir / filename
+        temp_path = self._new_temp_path(filename)
+        
+        # Same URL, same validators, blob present: no need to fetch
+        if self.blob_store is not None and detection is not None:
+            blob = self.blob_store.lookup_url(url, detection)
+            if blob is not None and self.blob_store.materialize(blob, temp_path):
+                logger.info(f"{LOG_OUTPUT} Unchanged since last download, linked from blob store: {filename}")
+                return DownloadResult(
+                    success=True,
+                    file_path=temp_path,
+                    file_size=temp_path.stat().st_size,
+                    url=url,
+                    from_blob_store=True
+                )
         
         logger.info(f"{LOG_PROCESS} Downloading to temp: {temp_path.name}")
         
@@ -83,6 +123,7 @@ class ArchiveDownloader:
             # Verify download succeeded
             if not download_result or not download_result.success:
                 logger.error(f"Download failed")
+                self.discard_temp(temp_path)
                 return DownloadResult(
                     success=False,
                     error_message="Download failed"
@@ -91,6 +132,7 @@ class ArchiveDownloader:
             # Verify file exists
             if not temp_path.exists():
                 logger.error(f"Downloaded file not found: {temp_path}")
+                self.discard_temp(temp_path)
                 return DownloadResult(
                     success=False,
                     error_message=f"File not found: {temp_path}"
@@ -98,6 +140,11 @@ class ArchiveDownloader:
             
             logger.info(f"{LOG_OUTPUT} Download complete: {temp_path.name}")
             
+            if self.blob_store is not None:
+                sha256 = await asyncio.to_thread(self.blob_store.add_file, temp_path)
+                if sha256 is not None:
+                    self.blob_store.record_url(url, detection, sha256)
+            
             return DownloadResult(
                 success=True,
                 file_path=temp_path
@@ -105,18 +152,54 @@ class ArchiveDownloader:
         
         except Exception as e:
             logger.error(f"Download failed: {e}")
+            self.discard_temp(temp_path)
             return DownloadResult(
                 success=False,
                 error_message=f"Unexpected error: {e}"
             )
     
-    async def extract(self, archive_path: Path, target_dir: Path) -> ExtractionResult:
+    def discard_temp(self, temp_path: Optional[Path]) -> None:
+        """
+        Remove a temp download and its download directory.
+        
+        Unlinking only drops this name; a blob linked to the file is kept.
+        
+        Args:
+            temp_path: File returned by download_to_temp (may already be
+                       moved or extracted)
+        """
+        if temp_path is None:
+            return
+        
+        temp_path = Path(temp_path)
+        try:
+            temp_path.unlink(missing_ok=True)
+            work_dir = temp_path.parent
+            if work_dir.name.startswith(TEMP_DOWNLOAD_DIR_PREFIX) and work_dir.parent == Path(self.temp_dir):
+                shutil.rmtree(work_dir, ignore_errors=True)
+        except OSError as e:
+            logger.warning(f"Could not remove temp download {temp_path}: {e}")
+    
+    def _new_temp_path(self, filename: str) -> Path:
+        """Temp path for filename in a new directory unique to this download."""
+        temp_dir = Path(self.temp_dir)
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        work_dir = tempfile.mkdtemp(prefix=TEMP_DOWNLOAD_DIR_PREFIX, dir=temp_dir)
+        return Path(work_dir) / filename
+    
+    async def extract(
+        self,
+        archive_path: Path,
+        target_dir: Path,
+        download_type: Optional[str] = None
+    ) -> ExtractionResult:
         """
         Extract archive to target directory.
         
         Args:
             archive_path: Path to archive file
             target_dir: Extraction destination
+            download_type: 'filing' or 'taxonomy' (selects archive member filter)
             
         Returns:
             ExtractionResult
@@ -125,11 +208,15 @@ class ArchiveDownloader:
         
         try:
             # Use ArchiveHandler for format-agnostic extraction
+            # Extraction is blocking I/O; run it off the event loop so
+            # concurrent downloads keep streaming
             handler = ArchiveHandler(self.config)
-            extract_result = handler.extract(
+            extract_result = await asyncio.to_thread(
+                handler.extract,
                 archive_path=archive_path,
                 target_dir=target_dir,
-                cleanup_archive=True  # Remove temp file after extraction
+                cleanup_archive=True,  # Remove temp file after extraction
+                download_type=download_type
             )
             
             if extract_result.success:
@@ -149,5 +236,42 @@ class ArchiveDownloader:
                 error_message=str(e)
             )
 
+    
+    def store(self, archive_path: Path, target_dir: Path) -> ExtractionResult:
+        """
+        Move archive into target directory without extracting it.
+        
+        Args:
+            archive_path: Path to downloaded archive
+            target_dir: Destination directory
+            
+        Returns:
+            ExtractionResult (one file: the archive)
+        """
+        logger.info(f"{LOG_PROCESS} Storing archive unextracted: {archive_path.name} → {target_dir}")
+        
+        try:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            stored_path = target_dir / archive_path.name
+            shutil.move(str(archive_path), str(stored_path))
+            
+            logger.info(f"{LOG_OUTPUT} Archive stored: {stored_path}")
+            
+            return ExtractionResult(
+                success=True,
+                extract_directory=target_dir,
+                files_extracted=1,
+                archive_path=stored_path,
+                directory_structure=[stored_path.name]
+            )
+        
+        except Exception as e:
+            logger.error(f"Storing archive failed: {e}")
+            return ExtractionResult(
+                success=False,
+                archive_path=archive_path,
+                error_message=str(e)
+            )
+
 
 __all__ = ['ArchiveDownloader']
\ No newline at end of file
@@ -0,0 +1,384 @@
+# Path: downloader/engine/blob_store.py
+"""
+Blob Store
+
+Content-addressed storage for downloaded bytes, keyed by SHA-256.
+Identical files (the same taxonomy package from different mirrors, the
+same extension schema in amended filings) are stored once; every
+filing or taxonomy directory holds hardlinks to the shared blob.
+
+Layout (below blob root):
+- objects/ab/abcdef...: one read-only blob per distinct content
+- urls/cd/cdef....json: URL index entry (sha256 of the downloaded file
+  plus the HTTP validators seen when it was fetched)
+
+Per directory:
+- .blob_manifest.json: relative path -> sha256 of every linked file
+
+Skipping downloads: before fetching a URL, the detection result (HEAD
+request) is compared with the URL index. Same ETag / Last-Modified /
+Content-Length and the blob still present means the bytes are already
+here; the blob is linked into place instead of downloaded.
+
+Hardlinks need the blob root on the same filesystem as the target
+directories. Where linking fails the file is kept as a plain copy.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+from downloader.core.logger import get_logger
+from downloader.core.config_loader import ConfigLoader
+from downloader.constants import LOG_PROCESS, LOG_OUTPUT
+from downloader.engine.constants import (
+    BLOB_STORE_DIRNAME,
+    BLOB_OBJECTS_DIRNAME,
+    BLOB_URL_INDEX_DIRNAME,
+    BLOB_MANIFEST_FILENAME,
+    BLOB_HASH_CHUNK_SIZE,
+    BLOB_FILE_MODE,
+)
+from downloader.engine.extraction.constants import LIBRARY_INVENTORY_FILENAME
+
+logger = get_logger(__name__, 'engine')
+
+# HTTP validators compared before skipping a download
+URL_VALIDATOR_KEYS = ('etag', 'last_modified', 'content_length')
+
+# At least one of these must be present; size alone identifies nothing
+URL_IDENTITY_KEYS = ('etag', 'last_modified')
+
+
+class BlobStore:
+    """
+    SHA-256 content-addressed store with hardlinked directory views.
+
+    Example:
+        store = BlobStore.from_config(config)
+        if store:
+            blob = store.lookup_url(url, detection)
+            ...
+            stats = store.dedupe_directory(target_dir)
+    """
+
+    def __init__(self, root: Path):
+        """
+        Initialize blob store.
+
+        Args:
+            root: Blob store root directory
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / BLOB_OBJECTS_DIRNAME
+        self.urls_dir = self.root / BLOB_URL_INDEX_DIRNAME
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.urls_dir.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader) -> Optional['BlobStore']:
+        """
+        Create store from configuration.
+
+        Args:
+            config: ConfigLoader instance
+
+        Returns:
+            BlobStore, or None if disabled or no directory is configured
+        """
+        if not config.get('blob_store_enabled', True):
+            return None
+
+        root = config.get('blob_store_dir')
+        if root is None:
+            cache_dir = config.get('downloader_cache_dir')
+            if cache_dir is None:
+                return None
+            root = Path(cache_dir) / BLOB_STORE_DIRNAME
+
+        try:
+            return cls(root)
+        except OSError as e:
+            logger.warning(f"Blob store unavailable ({root}): {e}")
+            return None
+
+    # ------------------------------------------------------------------
+    # URL index
+    # ------------------------------------------------------------------
+
+    def lookup_url(self, url: str, detection: dict) -> Optional[Path]:
+        """
+        Find blob holding the current content of a URL.
+
+        Args:
+            url: Download URL
+            detection: DistributionDetector result for the URL
+
+        Returns:
+            Blob path, or None if unknown, changed or not verifiable
+        """
+        validators = self._validators(detection)
+        if not any(key in validators for key in URL_IDENTITY_KEYS):
+            return None
+
+        try:
+            with open(self._url_entry_path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable URL index entry for {url}: {e}")
+            return None
+
+        stored = entry.get('validators', {})
+        # Every validator the server sends now must match what it sent then
+        if any(stored.get(key) != value for key, value in validators.items()):
+            return None
+
+        blob = self.blob_path(entry.get('sha256', ''))
+        return blob if blob.is_file() else None
+
+    def record_url(self, url: str, detection: Optional[dict], sha256: str) -> None:
+        """
+        Remember which blob a URL delivered.
+
+        Args:
+            url: Download URL
+            detection: DistributionDetector result for the URL
+            sha256: Digest of the downloaded file
+        """
+        entry = {
+            'url': url,
+            'sha256': sha256,
+            'validators': self._validators(detection or {}),
+        }
+        entry_path = self._url_entry_path(url)
+
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            tmp_path.replace(entry_path)
+        except OSError as e:
+            logger.warning(f"Could not record URL index entry for {url}: {e}")
+
+    # ------------------------------------------------------------------
+    # Blobs
+    # ------------------------------------------------------------------
+
+    def blob_path(self, sha256: str) -> Path:
+        """Path of blob for digest."""
+        return self.objects_dir / sha256[:2] / sha256
+
+    def add_file(self, path: Path) -> Optional[str]:
+        """
+        Store file content and replace the file with a link to its blob.
+
+        Args:
+            path: File to store
+
+        Returns:
+            SHA-256 digest, or None if the file could not be read
+        """
+        path = Path(path)
+
+        try:
+            sha256 = self._hash_file(path)
+        except OSError as e:
+            logger.warning(f"Cannot hash {path}: {e}")
+            return None
+
+        self._link(path, sha256)
+        return sha256
+
+    def _link(self, path: Path, sha256: str) -> bool:
+        """
+        Link file and blob of its digest.
+
+        Args:
+            path: File with content sha256
+            sha256: Digest of path
+
+        Returns:
+            True if the blob already existed (path now links to it)
+        """
+        blob = self.blob_path(sha256)
+
+        try:
+            if blob.exists():
+                # Duplicate content: drop this copy, link the blob instead
+                tmp_link = path.with_name(f'.{path.name}.{os.getpid()}.blob')
+                os.link(blob, tmp_link)
+                os.replace(tmp_link, path)
+                return True
+
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            os.link(path, blob)
+            os.chmod(blob, BLOB_FILE_MODE)
+        except OSError as e:
+            # Different filesystem or no link support: keep the plain copy
+            logger.debug(f"Cannot link {path} to blob store: {e}")
+
+        return False
+
+    def materialize(self, blob: Path, destination: Path) -> bool:
+        """
+        Place blob content at destination (hardlink, copy as fallback).
+
+        Args:
+            blob: Blob path
+            destination: File to create
+
+        Returns:
+            True if destination now holds the content
+        """
+        try:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            if destination.exists():
+                destination.unlink()
+            try:
+                os.link(blob, destination)
+            except OSError:
+                shutil.copyfile(blob, destination)
+            return True
+        except OSError as e:
+            logger.warning(f"Cannot materialize blob {blob.name} at {destination}: {e}")
+            return False
+
+    # ------------------------------------------------------------------
+    # Directory views
+    # ------------------------------------------------------------------
+
+    def dedupe_directory(self, directory: Path) -> dict:
+        """
+        Move every file of a directory into the store and link it back.
+
+        Writes the directory's blob manifest.
+
+        Args:
+            directory: Extracted filing or taxonomy directory
+
+        Returns:
+            Dictionary with files, linked (already stored), new_blobs and
+            bytes_deduplicated
+        """
+        directory = Path(directory)
+        manifest = {}
+        stats = {'files': 0, 'linked': 0, 'new_blobs': 0, 'bytes_deduplicated': 0}
+
+        for root, dirs, files in os.walk(directory):
+            for name in files:
+                if root == str(directory) and name in (
+                    BLOB_MANIFEST_FILENAME, LIBRARY_INVENTORY_FILENAME
+                ):
+                    continue
+
+                file_path = Path(root) / name
+                if file_path.is_symlink():
+                    continue
+
+                try:
+                    size = file_path.stat().st_size
+                    sha256 = self._hash_file(file_path)
+                except OSError as e:
+                    logger.warning(f"Skipping unreadable file in blob store: {file_path}: {e}")
+                    continue
+
+                existed = self._link(file_path, sha256)
+                manifest[os.path.relpath(file_path, directory)] = sha256
+                stats['files'] += 1
+                if existed:
+                    stats['linked'] += 1
+                    stats['bytes_deduplicated'] += size
+                else:
+                    stats['new_blobs'] += 1
+
+        try:
+            with open(directory / BLOB_MANIFEST_FILENAME, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+        except OSError as e:
+            logger.warning(f"Could not write blob manifest for {directory}: {e}")
+
+        logger.info(
+            f"{LOG_OUTPUT} Blob store: {stats['files']} files, {stats['linked']} already stored "
+            f"({stats['bytes_deduplicated']} bytes deduplicated), {stats['new_blobs']} new"
+        )
+
+        return stats
+
+    def release(self, directory: Path) -> int:
+        """
+        Remove blob links from a directory before it is rewritten.
+
+        Linked files share their inode with the blob; writing over them in
+        place would change every other directory linked to it.
+
+        Args:
+            directory: Directory about to be (re)populated
+
+        Returns:
+            Number of links removed
+        """
+        directory = Path(directory)
+        manifest_path = directory / BLOB_MANIFEST_FILENAME
+
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable blob manifest {manifest_path}: {e}")
+            manifest = {}
+
+        removed = 0
+        for relative in manifest:
+            try:
+                (directory / relative).unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Cannot remove blob link {relative}: {e}")
+
+        try:
+            manifest_path.unlink()
+        except OSError:
+            pass
+
+        if removed:
+            logger.info(f"{LOG_PROCESS} Released {removed} blob links in {directory}")
+
+        return removed
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _hash_file(self, path: Path) -> str:
+        """SHA-256 of file content."""
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(BLOB_HASH_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _url_entry_path(self, url: str) -> Path:
+        """URL index entry path (hashed to avoid unsafe characters)."""
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.urls_dir / digest[:2] / f"{digest}.json"
+
+    def _validators(self, detection: dict) -> dict:
+        """HTTP validators present in a detection result."""
+        return {
+            key: detection[key]
+            for key in URL_VALIDATOR_KEYS
+            if detection.get(key)
+        }
+
+
+__all__ = ['BlobStore']
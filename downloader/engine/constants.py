@@ -132,6 +132,44 @@ UNSAFE_PATH_CHARS = {'/', '\\'}
 # Replacement character for spaces and unsafe chars
 PATH_REPLACEMENT_CHAR = '_'
 
+# ============================================================================
+# BLOB STORE CONSTANTS
+# ============================================================================
+
+# Subdirectory of downloader_cache_dir used when no blob dir is configured
+BLOB_STORE_DIRNAME = 'blobs'
+
+# Layout below the blob root
+BLOB_OBJECTS_DIRNAME = 'objects'
+BLOB_URL_INDEX_DIRNAME = 'urls'
+
+# Per-directory manifest of files linked to blobs (relative path -> sha256)
+BLOB_MANIFEST_FILENAME = '.blob_manifest.json'
+
+# Read size when hashing files (bytes)
+BLOB_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Blobs are shared by every link; read-only so in-place writes fail
+# instead of changing other filings
+BLOB_FILE_MODE = 0o444
+
+# Each download gets its own directory below the temp dir (prefix of its
+# name): a temp file may be linked into the blob store, so a later
+# download of the same URL must never write to the same path
+TEMP_DOWNLOAD_DIR_PREFIX = 'download-'
+
+# ============================================================================
+# FILING CATALOG CONSTANTS
+# ============================================================================
+
+# Catalog format: see downloader/engine/filing_catalog.py
+FILING_CATALOG_FILENAME = '.filing_catalog.jsonl'
+FILING_CATALOG_FORMAT_VERSION = 1
+
+# Catalog 'date' rule: YYYYMMDD in instance file names (e.g. aapl-20240928.htm)
+FILING_DATE_FILENAME_PATTERN = r'[-_](\d{8})[._]'
+FILING_DATE_FILE_SUFFIXES = ('.xml', '.htm', '.html')
+
 # ============================================================================
 # EXPORTS
 # ============================================================================
@@ -173,6 +211,21 @@ __all__ = [
     # Retry manager
     'MAX_RETRY_DELAY',
     
+    # Blob store
+    'BLOB_STORE_DIRNAME',
+    'BLOB_OBJECTS_DIRNAME',
+    'BLOB_URL_INDEX_DIRNAME',
+    'BLOB_MANIFEST_FILENAME',
+    'BLOB_HASH_CHUNK_SIZE',
+    'BLOB_FILE_MODE',
+    'TEMP_DOWNLOAD_DIR_PREFIX',
+    
+    # Filing catalog
+    'FILING_CATALOG_FILENAME',
+    'FILING_CATALOG_FORMAT_VERSION',
+    'FILING_DATE_FILENAME_PATTERN',
+    'FILING_DATE_FILE_SUFFIXES',
+    
     # Validator
     'VALID_URL_SCHEMES',
     
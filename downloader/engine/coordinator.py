@@ -15,9 +15,11 @@ Architecture:
 - IPO logging throughout
 """
 
+import asyncio
 import time
 from typing import Optional
 from pathlib import Path
+from urllib.parse import urlparse
 
 from downloader.core.logger import get_logger
 from downloader.core.config_loader import ConfigLoader
@@ -30,7 +32,10 @@ from downloader.engine.path_resolver import PathResolver
 from downloader.engine.failure_handler import FailureHandler
 from downloader.engine.archive_downloader import ArchiveDownloader
 from downloader.engine.distribution_processor import DistributionProcessor
+from downloader.engine.blob_store import BlobStore
+from downloader.engine.filing_catalog import FilingCatalogWriter
 from downloader.engine.result import ProcessingResult
+from downloader.engine.extraction.inventory_writer import InventoryWriter
 from downloader.constants import (
     STATUS_DOWNLOADING,
     STATUS_COMPLETED,
@@ -64,6 +69,7 @@ class DownloadCoordinator:
     Example:
         coordinator = DownloadCoordinator()
         await coordinator.process_pending_downloads(limit=10)
+        await coordinator.process_pending_taxonomies(limit=100)
     """
     
     def __init__(self, config: Optional[ConfigLoader] = None):
@@ -79,6 +85,7 @@ class DownloadCoordinator:
         self.http_handler = HTTPHandler(self.config)
         self.retry_manager = RetryManager(config=self.config)
         self.validator = Validator(self.config)
+        self.inventory_writer = InventoryWriter()
         self.path_manager = DataPathsManager(self.config)
         self.db_repo = DatabaseRepository()
         
@@ -99,12 +106,20 @@ class DownloadCoordinator:
         )
         self.failure_handler = FailureHandler(self.db_repo)
         
+        # Content-addressed store: identical bytes kept once, unchanged
+        # URLs not fetched again (None when disabled)
+        self.blob_store = BlobStore.from_config(self.config)
+        
+        # Catalog of downloaded filings read by the parser (None when disabled)
+        self.filing_catalog = FilingCatalogWriter.from_config(self.config)
+        
         # Initialize archive downloader
         self.archive_downloader = ArchiveDownloader(
             http_handler=self.http_handler,
             retry_manager=self.retry_manager,
             temp_dir=self.temp_dir,
-            config=self.config
+            config=self.config,
+            blob_store=self.blob_store
         )
         
         # Initialize distribution processor
@@ -130,6 +145,10 @@ class DownloadCoordinator:
             'total': 0,
             'succeeded': 0,
             'failed': 0,
+            'members_skipped': 0,
+            'bytes_skipped': 0,
+            'downloads_skipped': 0,
+            'bytes_deduplicated': 0,
             'duration': 0.0
         }
         
@@ -151,17 +170,99 @@ class DownloadCoordinator:
         # Process each download
         for item in all_pending:
             result = await self.process_single_filing(item)
-            
-            if result.success:
-                stats['succeeded'] += 1
-            else:
-                stats['failed'] += 1
+            self._record_result(stats, result)
         
         stats['duration'] = time.time() - start_time
         
         logger.info(
             f"{LOG_OUTPUT} Processing complete: {stats['succeeded']}/{stats['total']} succeeded "
-            f"in {stats['duration']:.1f}s"
+            f"in {stats['duration']:.1f}s ({stats['members_skipped']} archive members skipped, "
+            f"{stats['downloads_skipped']} downloads served from blob store, "
+            f"{stats['bytes_deduplicated']} bytes deduplicated)"
+        )
+        
+        return stats
+    
+    async def process_pending_taxonomies(
+        self,
+        limit: int = 100,
+        max_concurrent: Optional[int] = None,
+        max_per_host: Optional[int] = None
+    ) -> dict:
+        """
+        Download and extract pending taxonomies concurrently.
+        
+        Bounded by a global limit (max_concurrent) and a per-host limit
+        (max_concurrent_per_host), so one slow or strict host cannot take
+        every slot. Taxonomies whose archives share a file name would share
+        a temp file; they run one after another.
+        
+        Args:
+            limit: Maximum number to process
+            max_concurrent: Global concurrency (default: config max_concurrent)
+            max_per_host: Per-host concurrency (default: config max_concurrent_per_host)
+            
+        Returns:
+            Dictionary with processing statistics
+        """
+        max_concurrent = max(1, max_concurrent or self.config.get('max_concurrent'))
+        max_per_host = max(1, max_per_host or self.config.get('max_concurrent_per_host'))
+        
+        logger.info(
+            f"{LOG_INPUT} Processing pending taxonomies (limit={limit}, "
+            f"concurrent={max_concurrent}, per_host={max_per_host})"
+        )
+        
+        start_time = time.time()
+        stats = {
+            'total': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'members_skipped': 0,
+            'bytes_skipped': 0,
+            'downloads_skipped': 0,
+            'bytes_deduplicated': 0,
+            'duration': 0.0
+        }
+        
+        pending_taxonomies = self.db_repo.get_pending_taxonomies(limit=limit)
+        stats['total'] = len(pending_taxonomies)
+        
+        # Group by source URL: taxonomies sharing an archive run one after
+        # another, so later ones are served from the blob store
+        groups = {}
+        for taxonomy in pending_taxonomies:
+            key = taxonomy.source_url or str(taxonomy.library_id)
+            groups.setdefault(key, []).append(taxonomy)
+        
+        global_slots = asyncio.Semaphore(max_concurrent)
+        host_slots = {}
+        
+        async def process_group(taxonomies):
+            for taxonomy in taxonomies:
+                host = urlparse(taxonomy.source_url or '').netloc.lower()
+                if host not in host_slots:
+                    host_slots[host] = asyncio.Semaphore(max_per_host)
+                
+                # Host slot first: waiting on a busy host holds no global slot
+                async with host_slots[host]:
+                    async with global_slots:
+                        result = await self.process_single_filing(taxonomy)
+                
+                self._record_result(stats, result)
+        
+        logger.info(
+            f"{LOG_PROCESS} Found {len(pending_taxonomies)} pending taxonomies "
+            f"across {len({urlparse(t.source_url or '').netloc for t in pending_taxonomies})} hosts"
+        )
+        
+        await asyncio.gather(*(process_group(group) for group in groups.values()))
+        
+        stats['duration'] = time.time() - start_time
+        
+        logger.info(
+            f"{LOG_OUTPUT} Taxonomy processing complete: {stats['succeeded']}/{stats['total']} "
+            f"succeeded in {stats['duration']:.1f}s"
         )
         
         return stats
@@ -209,10 +310,16 @@ class DownloadCoordinator:
             # Get download URL
             url = filing.filing_url if download_type == 'filing' else filing.source_url
             
+            # Stored files are links to shared blobs: unlink them before the
+            # directory is rewritten so no other directory changes with it
+            if self.blob_store is not None:
+                self.blob_store.release(target_dir)
+            
             # Download and extract using distribution processor
             processing_result = await self.distribution_processor.download_and_extract(
                 url,
-                target_dir
+                target_dir,
+                download_type
             )
             
             if not processing_result.success:
@@ -241,7 +348,17 @@ class DownloadCoordinator:
                 await self.failure_handler.handle_failure(filing, result, download_type)
                 return result
             
-            final_file_count = len(list(target_dir.rglob('*')))
+            if self.blob_store is not None:
+                blob_stats = await asyncio.to_thread(self.blob_store.dedupe_directory, target_dir)
+                result.bytes_deduplicated = blob_stats['bytes_deduplicated']
+            
+            if download_type == 'filing':
+                final_file_count = len(list(target_dir.rglob('*')))
+            else:
+                # Taxonomy: record inventory manifest (library module reads it
+                # instead of walking the tree); hashing runs off the event loop
+                manifest = await asyncio.to_thread(self.inventory_writer.write, target_dir)
+                final_file_count = manifest['file_count']
             if final_file_count == 0:
                 logger.error(f"{LOG_OUTPUT} CRITICAL: Directory exists but contains no files!")
                 result.error_stage = 'verification'
@@ -267,6 +384,9 @@ class DownloadCoordinator:
                     # Update status to completed
                     self.db_repo.update_download_status(str(filing.search_id), STATUS_COMPLETED)
                     result.success = True
+                    
+                    if self.filing_catalog is not None:
+                        await asyncio.to_thread(self.filing_catalog.record, filing, target_dir)
                     logger.info(f"{LOG_OUTPUT} Filing processed successfully")
                 else:
                     result.error_stage = 'database'
@@ -296,6 +416,28 @@ class DownloadCoordinator:
         
         return result
     
+    def _record_result(self, stats: dict, result: ProcessingResult) -> None:
+        """
+        Add one processing result to run statistics.
+        
+        Args:
+            stats: Statistics dictionary being accumulated
+            result: ProcessingResult of one download
+        """
+        if result.success:
+            stats['succeeded'] += 1
+        else:
+            stats['failed'] += 1
+        
+        extraction = result.extraction_result
+        if extraction is not None:
+            stats['members_skipped'] += extraction.files_skipped
+            stats['bytes_skipped'] += extraction.bytes_skipped
+        
+        if result.download_result is not None and result.download_result.from_blob_store:
+            stats['downloads_skipped'] += 1
+        stats['bytes_deduplicated'] += result.bytes_deduplicated
+    
     async def close(self):
         """Close coordinator and cleanup resources."""
         logger.info("Closing download coordinator")
@@ -78,6 +78,8 @@ class DistributionDetector:
                 'url': str,  # May be modified if alternative found
                 'content_type': str,
                 'content_length': int,
+                'etag': str,  # HTTP validators (None if not sent);
+                'last_modified': str,  # used to skip re-downloads
                 'exists': bool,
                 'alternatives': list[str],  # Alternative URLs tried
             }
@@ -157,6 +159,8 @@ class DistributionDetector:
                         'url': url,
                         'content_type': content_type,
                         'content_length': content_length,
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'),
                         'exists': True,
                         'status': response.status,
                     }
@@ -21,6 +21,7 @@ from downloader.engine.extraction.xsd_handler import XSDHandler
 from downloader.engine.extraction.directory_handler import DirectoryHandler
 from downloader.engine.archive_downloader import ArchiveDownloader
 from downloader.engine.result import ProcessingResult, ExtractionResult
+from downloader.engine.extraction.constants import SUPPORTED_ARCHIVE_EXTENSIONS
 from downloader.constants import LOG_PROCESS, LOG_OUTPUT
 
 logger = get_logger(__name__, 'engine')
@@ -47,7 +48,12 @@ class DistributionProcessor:
         self.archive_downloader = archive_downloader
         self.config = config if config else ConfigLoader()
     
-    async def download_and_extract(self, url: str, target_dir: Path) -> ProcessingResult:
+    async def download_and_extract(
+        self,
+        url: str,
+        target_dir: Path,
+        download_type: Optional[str] = None
+    ) -> ProcessingResult:
         """
         Download and extract using distribution-agnostic approach.
         
@@ -57,6 +63,7 @@ class DistributionProcessor:
         Args:
             url: Source URL
             target_dir: Target directory for extracted files
+            download_type: 'filing' or 'taxonomy' (selects archive member filter)
             
         Returns:
             ProcessingResult
@@ -97,10 +104,10 @@ class DistributionProcessor:
             
             # Step 2: Route to appropriate handler
             if dist_type == 'archive':
-                return await self._handle_archive(working_url, target_dir)
+                return await self._handle_archive(working_url, target_dir, download_type, detection)
 
             elif dist_type == 'ixbrl':
-                return await self._handle_ixbrl(working_url, target_dir)
+                return await self._handle_ixbrl(working_url, target_dir, detection)
 
             elif dist_type == 'xsd':
                 return await self._handle_xsd(working_url, target_dir)
@@ -119,7 +126,12 @@ class DistributionProcessor:
             logger.error(f"Error in distribution detection: {e}")
             return result
     
-    async def _handle_ixbrl(self, url: str, target_dir: Path) -> ProcessingResult:
+    async def _handle_ixbrl(
+        self,
+        url: str,
+        target_dir: Path,
+        detection: Optional[dict] = None
+    ) -> ProcessingResult:
         """
         Handle iXBRL/XHTML single file downloads.
 
@@ -128,6 +140,7 @@ class DistributionProcessor:
         Args:
             url: iXBRL file URL
             target_dir: Target directory
+            detection: Detection result (blob store check before download)
 
         Returns:
             ProcessingResult
@@ -141,7 +154,7 @@ class DistributionProcessor:
             target_dir.mkdir(parents=True, exist_ok=True)
 
             # Download directly to target (no temp, no extraction)
-            temp_result = await self.archive_downloader.download_to_temp(url)
+            temp_result = await self.archive_downloader.download_to_temp(url, detection)
             if not temp_result.success:
                 result.error_stage = 'download'
                 result.download_result = temp_result
@@ -155,6 +168,7 @@ class DistributionProcessor:
             target_path = target_dir / source_path.name
 
             shutil.move(str(source_path), str(target_path))
+            self.archive_downloader.discard_temp(source_path)
 
             result.success = True
             result.extraction_result = ExtractionResult(
@@ -171,13 +185,21 @@ class DistributionProcessor:
             logger.error(f"iXBRL download error: {e}")
             return result
 
-    async def _handle_archive(self, url: str, target_dir: Path) -> ProcessingResult:
+    async def _handle_archive(
+        self,
+        url: str,
+        target_dir: Path,
+        download_type: Optional[str] = None,
+        detection: Optional[dict] = None
+    ) -> ProcessingResult:
         """
         Handle ZIP/archive downloads.
 
         Args:
             url: Archive URL
             target_dir: Target directory
+            download_type: 'filing' or 'taxonomy' (selects archive member filter)
+            detection: Detection result (blob store check before download)
 
         Returns:
             ProcessingResult
@@ -187,7 +209,7 @@ class DistributionProcessor:
         logger.info(f"{LOG_PROCESS} Handling as archive")
         
         # Download to temp
-        temp_result = await self.archive_downloader.download_to_temp(url)
+        temp_result = await self.archive_downloader.download_to_temp(url, detection)
         if not temp_result.success:
             result.error_stage = 'download'
             result.download_result = temp_result
@@ -195,11 +217,33 @@ class DistributionProcessor:
         
         result.download_result = temp_result
         
+        # Filing archives can be kept as downloaded; the mapper serves
+        # members from the archive instead of an extracted tree (the parser
+        # and verification need extracted filings). Archives are recognized
+        # by file name, so one without a known extension is extracted
+        # instead
+        if (
+            download_type == 'filing'
+            and not self.config.get('extract_filings', True)
+            and temp_result.file_path.name.lower().endswith(tuple(SUPPORTED_ARCHIVE_EXTENSIONS))
+        ):
+            result.extraction_result = self.archive_downloader.store(
+                temp_result.file_path,
+                target_dir
+            )
+            self.archive_downloader.discard_temp(temp_result.file_path)
+            result.success = result.extraction_result.success
+            if not result.success:
+                result.error_stage = 'extraction'
+            return result
+        
         # Extract
         extract_result = await self.archive_downloader.extract(
             temp_result.file_path,
-            target_dir
+            target_dir,
+            download_type
         )
+        self.archive_downloader.discard_temp(temp_result.file_path)
         if not extract_result.success:
             result.error_stage = 'extraction'
             result.extraction_result = extract_result
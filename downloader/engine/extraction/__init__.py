@@ -12,6 +12,7 @@ Use DirectoryHandler for directory mirroring.
 
 from downloader.engine.extraction.archive_handler import (
     ArchiveHandler,
+    MemberFilter,
     ZipExtractor,
     TarExtractor,
     BaseExtractor,
@@ -22,6 +23,7 @@ from downloader.engine.extraction.directory_handler import DirectoryHandler
 __all__ = [
     # Archive extraction
     'ArchiveHandler',
+    'MemberFilter',
     'ZipExtractor',
     'TarExtractor',
     'BaseExtractor',
@@ -10,6 +10,9 @@ Architecture:
 - Individual extractor classes per format
 - Common interface (ExtractionResult)
 - Easy to extend for new formats
+- Optional member filter per download type (filing, taxonomy):
+  only matching members are written, the rest stay in the archive and
+  are reported as skipped
 
 CRITICAL PRINCIPLE: Format-agnostic extraction.
 No assumptions about archive format - detect and handle dynamically.
@@ -18,7 +21,7 @@ No assumptions about archive format - detect and handle dynamically.
 import zipfile
 import tarfile
 from pathlib import Path
-from typing import Optional, Type
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
 import time
 
 from downloader.core.logger import get_logger
@@ -42,6 +45,97 @@ from downloader.engine.extraction.constants import (
 logger = get_logger(__name__, 'extraction')
 
 
+class MemberFilter:
+    """
+    Selects which archive members are extracted.
+    
+    Matches member file names by extension (case-insensitive). Configured
+    per download type via 'extract_<type>_extensions' (comma-separated,
+    empty = no filter).
+    
+    Example:
+        member_filter = MemberFilter.from_config(config, 'filing')
+        if member_filter:
+            selected, skipped = member_filter.select(
+                zf.infolist(), lambda m: m.filename, lambda m: not m.is_dir()
+            )
+    """
+    
+    def __init__(self, extensions: Iterable[str]):
+        """
+        Initialize member filter.
+        
+        Args:
+            extensions: File extensions to extract (with or without leading dot)
+        """
+        self.extensions = tuple(sorted({
+            ext if ext.startswith('.') else f'.{ext}'
+            for ext in (e.strip().lower() for e in extensions)
+            if ext
+        }))
+    
+    @classmethod
+    def from_config(
+        cls,
+        config: ConfigLoader,
+        download_type: Optional[str]
+    ) -> Optional['MemberFilter']:
+        """
+        Build filter for a download type.
+        
+        Args:
+            config: ConfigLoader instance
+            download_type: 'filing', 'taxonomy' or None
+            
+        Returns:
+            MemberFilter or None if everything is extracted
+        """
+        if not download_type:
+            return None
+        
+        value = config.get(f'extract_{download_type}_extensions')
+        if not value:
+            return None
+        
+        member_filter = cls(value.split(','))
+        return member_filter if member_filter.extensions else None
+    
+    def accepts(self, member_name: str) -> bool:
+        """Check if member is extracted."""
+        return member_name.lower().endswith(self.extensions)
+    
+    def select(
+        self,
+        members: List[Any],
+        get_name: Callable[[Any], str],
+        is_file: Callable[[Any], bool]
+    ) -> Tuple[List[Any], List[Any]]:
+        """
+        Split archive members into extracted and skipped.
+        
+        If no file matches, every member is extracted: the archive holds
+        none of the expected content (for example a PDF-only filing) and
+        downstream checks need to see what it does hold.
+        
+        Args:
+            members: Archive members (ZipInfo or TarInfo)
+            get_name: Returns member path
+            is_file: Returns True for regular files
+            
+        Returns:
+            Tuple of (members to extract, skipped files)
+        """
+        files = [m for m in members if is_file(m)]
+        selected = [m for m in files if self.accepts(get_name(m))]
+        
+        if not selected:
+            logger.info(f"{LOG_PROCESS} No archive members match extraction filter, extracting all")
+            return members, []
+        
+        skipped = [m for m in files if not self.accepts(get_name(m))]
+        return selected, skipped
+
+
 class BaseExtractor:
     """
     Base class for archive extractors.
@@ -67,7 +161,8 @@ class BaseExtractor:
         self,
         archive_path: Path,
         target_dir: Path,
-        cleanup_archive: bool = True
+        cleanup_archive: bool = True,
+        member_filter: Optional[MemberFilter] = None
     ) -> ExtractionResult:
         """
         Extract archive to target directory.
@@ -78,6 +173,7 @@ class BaseExtractor:
             archive_path: Path to archive file
             target_dir: Target directory for extraction
             cleanup_archive: Whether to delete archive after extraction
+            member_filter: Optional filter selecting members to extract
             
         Returns:
             ExtractionResult with extraction details
@@ -136,7 +232,8 @@ class ZipExtractor(BaseExtractor):
         self,
         archive_path: Path,
         target_dir: Path,
-        cleanup_archive: bool = True
+        cleanup_archive: bool = True,
+        member_filter: Optional[MemberFilter] = None
     ) -> ExtractionResult:
         """
         Extract ZIP archive.
@@ -145,6 +242,7 @@ class ZipExtractor(BaseExtractor):
             archive_path: Path to ZIP file
             target_dir: Target directory
             cleanup_archive: Whether to delete ZIP after extraction
+            member_filter: Optional filter selecting members to extract
             
         Returns:
             ExtractionResult
@@ -176,20 +274,29 @@ class ZipExtractor(BaseExtractor):
                     logger.error(f"{LOG_OUTPUT} {result.error_message}")
                     return result
                 
-                # Check total size
-                total_size = sum(info.file_size for info in zf.infolist())
+                members = zf.infolist()
+                skipped = []
+                if member_filter:
+                    members, skipped = member_filter.select(
+                        members, lambda m: m.filename, lambda m: not m.is_dir()
+                    )
+                
+                # Check total size (of what is written)
+                total_size = sum(info.file_size for info in members)
                 if total_size > self.max_extraction_size:
                     result.error_message = f"ZIP too large: {total_size} bytes"
                     logger.error(f"{LOG_OUTPUT} {result.error_message}")
                     return result
                 
-                logger.info(f"{LOG_PROCESS} Extracting {len(zf.namelist())} files...")
+                logger.info(f"{LOG_PROCESS} Extracting {len(members)} files...")
                 
-                # Extract all
-                zf.extractall(target_dir)
+                # Extract selected members
+                zf.extractall(target_dir, members=members)
                 
-                result.files_extracted = len(zf.namelist())
-                result.directory_structure = zf.namelist()
+                result.files_extracted = len(members)
+                result.directory_structure = [m.filename for m in members]
+                result.files_skipped = len(skipped)
+                result.bytes_skipped = sum(m.file_size for m in skipped)
             
             # Success
             result.success = True
@@ -198,6 +305,10 @@ class ZipExtractor(BaseExtractor):
             logger.info(
                 f"{LOG_OUTPUT} ZIP extraction complete: {result.files_extracted} files "
                 f"in {result.duration:.2f}s"
+                + (
+                    f" ({result.files_skipped} members, {result.bytes_skipped} bytes skipped)"
+                    if result.files_skipped else ""
+                )
             )
             
             # Cleanup if requested
@@ -245,7 +356,8 @@ class TarExtractor(BaseExtractor):
         self,
         archive_path: Path,
         target_dir: Path,
-        cleanup_archive: bool = True
+        cleanup_archive: bool = True,
+        member_filter: Optional[MemberFilter] = None
     ) -> ExtractionResult:
         """
         Extract TAR archive (including compressed variants).
@@ -254,6 +366,7 @@ class TarExtractor(BaseExtractor):
             archive_path: Path to TAR file
             target_dir: Target directory
             cleanup_archive: Whether to delete TAR after extraction
+            member_filter: Optional filter selecting members to extract
             
         Returns:
             ExtractionResult
@@ -291,8 +404,13 @@ class TarExtractor(BaseExtractor):
                 
                 # Get member list
                 members = tf.getmembers()
+                skipped = []
+                if member_filter:
+                    members, skipped = member_filter.select(
+                        members, lambda m: m.name, lambda m: m.isfile()
+                    )
                 
-                # Check total size
+                # Check total size (of what is written)
                 total_size = sum(m.size for m in members if m.isfile())
                 if total_size > self.max_extraction_size:
                     result.error_message = f"TAR too large: {total_size} bytes"
@@ -301,11 +419,13 @@ class TarExtractor(BaseExtractor):
                 
                 logger.info(f"{LOG_PROCESS} Extracting {len(members)} items...")
                 
-                # Extract all
-                tf.extractall(target_dir)
+                # Extract selected members
+                tf.extractall(target_dir, members=members)
                 
                 result.files_extracted = len(members)
                 result.directory_structure = [m.name for m in members]
+                result.files_skipped = len(skipped)
+                result.bytes_skipped = sum(m.size for m in skipped)
             
             # Success
             result.success = True
@@ -314,6 +434,10 @@ class TarExtractor(BaseExtractor):
             logger.info(
                 f"{LOG_OUTPUT} TAR extraction complete: {result.files_extracted} items "
                 f"in {result.duration:.2f}s"
+                + (
+                    f" ({result.files_skipped} members, {result.bytes_skipped} bytes skipped)"
+                    if result.files_skipped else ""
+                )
             )
             
             # Cleanup if requested
@@ -423,17 +547,21 @@ class ArchiveHandler:
         self,
         archive_path: Path,
         target_dir: Path,
-        cleanup_archive: bool = True
+        cleanup_archive: bool = True,
+        download_type: Optional[str] = None
     ) -> ExtractionResult:
         """
         Extract archive using appropriate extractor.
         
-        Automatically detects format from file extension.
+        Automatically detects format from file extension. The member
+        filter configured for download_type is applied; without a
+        type (or with an empty filter) every member is extracted.
         
         Args:
             archive_path: Path to archive file
             target_dir: Target directory for extraction
             cleanup_archive: Whether to delete archive after extraction
+            download_type: 'filing', 'taxonomy' or None
             
         Returns:
             ExtractionResult
@@ -461,8 +589,15 @@ class ArchiveHandler:
         # Create extractor and extract
         logger.info(f"{LOG_PROCESS} Using {extractor_class.__name__}")
         extractor = extractor_class(config=self.config)
+        member_filter = MemberFilter.from_config(self.config, download_type)
+        
+        if member_filter:
+            logger.info(
+                f"{LOG_PROCESS} Extracting {download_type} members: "
+                f"{', '.join(member_filter.extensions)}"
+            )
         
-        return extractor.extract(archive_path, target_dir, cleanup_archive)
+        return extractor.extract(archive_path, target_dir, cleanup_archive, member_filter)
     
     def _detect_format(self, archive_path: Path) -> Optional[Type[BaseExtractor]]:
         """
@@ -519,6 +654,7 @@ class ArchiveHandler:
 
 __all__ = [
     'ArchiveHandler',
+    'MemberFilter',
     'BaseExtractor',
     'ZipExtractor',
     'TarExtractor',
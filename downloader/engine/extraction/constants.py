@@ -119,6 +119,17 @@ MIN_VALID_XSD_SIZE = 10
 # Maximum file size for XSD files (bytes) - 10MB
 MAX_XSD_FILE_SIZE = 10 * 1024 * 1024
 
+# ============================================================================
+# LIBRARY INVENTORY MANIFEST
+# ============================================================================
+
+# Manifest format: library/loaders/library_inventory.py
+LIBRARY_INVENTORY_FILENAME = '.library_inventory.json'
+LIBRARY_INVENTORY_FORMAT_VERSION = 1
+
+# Read size when hashing file contents (bytes)
+INVENTORY_HASH_CHUNK_SIZE = 1024 * 1024
+
 # ============================================================================
 # EXPORTS
 # ============================================================================
@@ -166,4 +177,9 @@ __all__ = [
     # Validation
     'MIN_VALID_XSD_SIZE',
     'MAX_XSD_FILE_SIZE',
+    
+    # Library inventory
+    'LIBRARY_INVENTORY_FILENAME',
+    'LIBRARY_INVENTORY_FORMAT_VERSION',
+    'INVENTORY_HASH_CHUNK_SIZE',
 ]
\ No newline at end of file
@@ -0,0 +1,136 @@
+# Path: downloader/engine/extraction/inventory_writer.py
+"""
+Inventory Writer
+
+Writes the per-library inventory manifest right after a taxonomy is
+extracted, so the library module can check existence and completeness
+without walking the tree.
+
+Manifest format (LIBRARY_INVENTORY_FORMAT_VERSION) and write protocol:
+see library/loaders/library_inventory.py, which validates manifests
+against directory modification times and rebuilds any that are stale or
+of another version.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from downloader.core.logger import get_logger
+from downloader.constants import LOG_OUTPUT
+from downloader.engine.extraction.constants import (
+    LIBRARY_INVENTORY_FILENAME,
+    LIBRARY_INVENTORY_FORMAT_VERSION,
+    INVENTORY_HASH_CHUNK_SIZE,
+)
+
+logger = get_logger(__name__, 'extraction')
+
+
+class InventoryWriter:
+    """
+    Builds and writes library inventory manifests.
+
+    Example:
+        writer = InventoryWriter()
+        manifest = writer.write(target_dir)
+        total_files = manifest['file_count']
+    """
+
+    def write(self, directory: Path) -> dict:
+        """
+        Walk extracted directory once and write its manifest.
+
+        Args:
+            directory: Extracted taxonomy library directory
+
+        Returns:
+            Manifest dictionary (file_count, total_bytes, content_digest,
+            extracted_at, directories, format_version)
+        """
+        directory = Path(directory)
+        manifest = self.build(directory)
+
+        try:
+            self._write_file(directory, manifest)
+        except OSError as e:
+            logger.warning(f"Could not write inventory manifest for {directory}: {e}")
+            return manifest
+
+        logger.info(
+            f"{LOG_OUTPUT} Inventory manifest written: {manifest['file_count']} files, "
+            f"{manifest['total_bytes']} bytes"
+        )
+
+        return manifest
+
+    def _write_file(self, directory: Path, manifest: dict) -> None:
+        """Write manifest atomically, keeping the recorded root mtime."""
+        manifest_path = directory / LIBRARY_INVENTORY_FILENAME
+        tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, manifest_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # Creating and renaming the manifest changed the root mtime;
+        # writing it is not a change to the library
+        os.utime(directory, ns=(os.stat(directory).st_atime_ns, manifest['directories']['.']))
+
+    def build(self, directory: Path) -> dict:
+        """
+        Build manifest dictionary for directory.
+
+        Args:
+            directory: Extracted taxonomy library directory
+
+        Returns:
+            Manifest dictionary (not written)
+        """
+        hasher = hashlib.sha256()
+        file_count = 0
+        total_bytes = 0
+        directories = {}
+
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+
+            directories[os.path.relpath(root, directory)] = os.stat(root).st_mtime_ns
+
+            for name in sorted(files):
+                # Manifest and temporary files of an interrupted write
+                if name.startswith(LIBRARY_INVENTORY_FILENAME) and root == str(directory):
+                    continue
+
+                file_path = os.path.join(root, name)
+                try:
+                    size = os.path.getsize(file_path)
+                    relative = os.path.relpath(file_path, directory)
+                    hasher.update(f"{relative}\0{size}\0".encode('utf-8'))
+                    with open(file_path, 'rb') as f:
+                        for chunk in iter(lambda: f.read(INVENTORY_HASH_CHUNK_SIZE), b''):
+                            hasher.update(chunk)
+                except OSError as e:
+                    logger.warning(f"Skipping unreadable file in inventory: {file_path}: {e}")
+                    continue
+
+                file_count += 1
+                total_bytes += size
+
+        return {
+            'format_version': LIBRARY_INVENTORY_FORMAT_VERSION,
+            'file_count': file_count,
+            'total_bytes': total_bytes,
+            'content_digest': hasher.hexdigest(),
+            'extracted_at': datetime.now(timezone.utc).isoformat(),
+            'directories': directories,
+        }
+
+
+__all__ = ['InventoryWriter']
@@ -0,0 +1,164 @@
+# Path: downloader/engine/filing_catalog.py
+"""
+Filing Catalog Writer
+
+Appends one record per successfully downloaded filing to the catalog at
+the root of the entities tree. The parser lists filings from the catalog
+instead of walking every file of the archive.
+
+Catalog format (JSON Lines) - the reference for every reader and writer
+(parser/loaders/filing_catalog.py, mapper/loaders/filing_index.py):
+- header line written when the catalog is seeded from a full listing of
+  the tree: format_version, seeded_at, filings (no 'path')
+- one object per filing: market, company, form, date, accession, path
+  (relative to the entities root), filing_date, cataloged_at,
+  format_version
+- append-only after seeding; when a path appears more than once the last
+  record wins
+- 'date': first instance file name matching FILING_DATE_FILENAME_PATTERN
+  (e.g. aapl-20240928.htm -> 2024-09-28), falling back to the accession
+  directory name
+
+Only a seeded catalog is complete. The downloader never creates the
+catalog: it appends to a catalog the parser seeded, so filings downloaded
+before the catalog existed are never hidden from listings.
+
+Records are written with a single append, so a crash never leaves a
+partial catalog behind (at most one truncated last line, which readers
+skip).
+"""
+
+import json
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from downloader.core.logger import get_logger
+from downloader.core.config_loader import ConfigLoader
+from downloader.constants import LOG_OUTPUT
+from downloader.engine.constants import (
+    FILING_CATALOG_FILENAME,
+    FILING_CATALOG_FORMAT_VERSION,
+    FILING_DATE_FILENAME_PATTERN,
+    FILING_DATE_FILE_SUFFIXES,
+    FILINGS_SUBDIRECTORY,
+)
+
+logger = get_logger(__name__, 'engine')
+
+
+class FilingCatalogWriter:
+    """
+    Records downloaded filings in the entities-root catalog.
+
+    Example:
+        catalog = FilingCatalogWriter.from_config(config)
+        if catalog:
+            catalog.record(filing, target_dir)
+    """
+
+    def __init__(self, entities_dir: Path):
+        """
+        Initialize catalog writer.
+
+        Args:
+            entities_dir: Root of the entities tree (catalog location)
+        """
+        self.entities_dir = Path(entities_dir)
+        self.catalog_path = self.entities_dir / FILING_CATALOG_FILENAME
+        self._date_pattern = re.compile(FILING_DATE_FILENAME_PATTERN)
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader) -> Optional['FilingCatalogWriter']:
+        """
+        Create writer from configuration.
+
+        Args:
+            config: ConfigLoader instance
+
+        Returns:
+            FilingCatalogWriter, or None if disabled
+        """
+        if not config.get('filing_catalog_enabled', True):
+            return None
+
+        entities_dir = config.get('downloader_entities_dir')
+        if entities_dir is None:
+            return None
+
+        return cls(entities_dir)
+
+    def record(self, filing, target_dir: Path) -> Optional[dict]:
+        """
+        Append catalog record for a downloaded filing.
+
+        Args:
+            filing: FilingSearch record (filing_date, accession_number)
+            target_dir: Filing directory built by PathResolver
+
+        Returns:
+            Written record, or None if it could not be written
+        """
+        target_dir = Path(target_dir)
+
+        try:
+            relative = target_dir.relative_to(self.entities_dir)
+        except ValueError:
+            logger.warning(f"Filing outside entities root, not cataloged: {target_dir}")
+            return None
+
+        # Layout: market/company/filings/form/accession
+        parts = relative.parts
+        if len(parts) < 5 or parts[2] != FILINGS_SUBDIRECTORY:
+            logger.warning(f"Unexpected filing layout, not cataloged: {relative}")
+            return None
+
+        filing_date = getattr(filing, 'filing_date', None)
+
+        record = {
+            'format_version': FILING_CATALOG_FORMAT_VERSION,
+            'market': parts[0],
+            'company': parts[1],
+            'form': parts[3],
+            'date': self._extract_date(target_dir),
+            'accession': getattr(filing, 'accession_number', None) or parts[4],
+            'path': relative.as_posix(),
+            'filing_date': filing_date.isoformat() if filing_date else None,
+            'cataloged_at': datetime.now(timezone.utc).isoformat(),
+        }
+
+        line = json.dumps(record) + '\n'
+
+        try:
+            # No O_CREAT: a catalog started here would list only new downloads
+            fd = os.open(self.catalog_path, os.O_WRONLY | os.O_APPEND)
+            try:
+                os.write(fd, line.encode('utf-8'))
+            finally:
+                os.close(fd)
+        except FileNotFoundError:
+            logger.debug(f"No filing catalog yet (seeded by the parser), not cataloged: {record['path']}")
+            return None
+        except OSError as e:
+            logger.warning(f"Could not update filing catalog {self.catalog_path}: {e}")
+            return None
+
+        logger.info(f"{LOG_OUTPUT} Filing cataloged: {record['path']} ({record['date']})")
+
+        return record
+
+    def _extract_date(self, filing_dir: Path) -> str:
+        """Filing date from instance file names (catalog 'date' rule)."""
+        for f in filing_dir.rglob('*'):
+            if f.is_file() and f.suffix in FILING_DATE_FILE_SUFFIXES:
+                match = self._date_pattern.search(f.name)
+                if match:
+                    d = match.group(1)
+                    return f"{d[0:4]}-{d[4:6]}-{d[6:8]}"
+
+        return filing_dir.name
+
+
+__all__ = ['FilingCatalogWriter']
@@ -117,7 +117,8 @@ class HTTPHandler:
 
             # Check for resume
             resume_from = 0
-            if resume and output_path.exists():
+            # (a file linked into the blob store is complete; never append to it)
+            if resume and output_path.exists() and output_path.stat().st_nlink == 1:
                 resume_from = output_path.stat().st_size
                 request_headers[HEADER_RANGE] = f'bytes={resume_from}-'
                 logger.info(f"{LOG_PROCESS} Resuming from byte {resume_from}")
@@ -32,6 +32,7 @@ class DownloadResult:
         error_message: Error message if failed
         status_code: HTTP status code
         chunks_downloaded: Number of chunks downloaded
+        from_blob_store: Content linked from blob store, nothing fetched
     """
     success: bool
     file_path: Optional[Path] = None
@@ -41,6 +42,7 @@ class DownloadResult:
     error_message: Optional[str] = None
     status_code: Optional[int] = None
     chunks_downloaded: int = 0
+    from_blob_store: bool = False
     timestamp: datetime = field(default_factory=datetime.now)
     
     @property
@@ -62,6 +64,7 @@ class DownloadResult:
             'error_message': self.error_message,
             'status_code': self.status_code,
             'chunks_downloaded': self.chunks_downloaded,
+            'from_blob_store': self.from_blob_store,
             'download_speed_mbps': self.download_speed_mbps,
             'timestamp': self.timestamp.isoformat(),
         }
@@ -81,10 +84,14 @@ class ExtractionResult:
         error_message: Error message if failed
         directory_structure: Extracted directory structure
         instance_file: Path to discovered instance file
+        files_skipped: Members left in archive by the member filter
+        bytes_skipped: Uncompressed size of skipped members
     """
     success: bool
     extract_directory: Optional[Path] = None
     files_extracted: int = 0
+    files_skipped: int = 0
+    bytes_skipped: int = 0
     archive_path: Optional[Path] = None
     duration: float = 0.0
     error_message: Optional[str] = None
@@ -98,6 +105,8 @@ class ExtractionResult:
             'success': self.success,
             'extract_directory': str(self.extract_directory) if self.extract_directory else None,
             'files_extracted': self.files_extracted,
+            'files_skipped': self.files_skipped,
+            'bytes_skipped': self.bytes_skipped,
             'archive_path': str(self.archive_path) if self.archive_path else None,
             'duration': self.duration,
             'error_message': self.error_message,
@@ -177,6 +186,7 @@ class ProcessingResult:
         cleanup_performed: Whether temp cleanup was performed
         error_stage: Which stage failed: detection, download, extract, validate
         error_message: Detailed error message
+        bytes_deduplicated: Bytes linked to blobs already in the blob store
     """
     success: bool
     download_result: Optional[DownloadResult] = None
@@ -188,6 +198,7 @@ class ProcessingResult:
     cleanup_performed: bool = False
     error_stage: Optional[str] = None  # Which stage failed: detection, download, extract, validate
     error_message: Optional[str] = None  # Detailed error message
+    bytes_deduplicated: int = 0
     timestamp: datetime = field(default_factory=datetime.now)
     
     def to_dict(self) -> dict[str, any]:
@@ -203,6 +214,7 @@ class ProcessingResult:
             'cleanup_performed': self.cleanup_performed,
             'error_stage': self.error_stage,
             'error_message': self.error_message,
+            'bytes_deduplicated': self.bytes_deduplicated,
             'timestamp': self.timestamp.isoformat(),
         }
 
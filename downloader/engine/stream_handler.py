@@ -88,6 +88,10 @@ class StreamHandler:
         
         # Determine write mode
         mode = 'ab' if resume_from > 0 else 'wb'
+        if mode == 'wb':
+            # Never truncate in place: an existing file may be a hard link
+            # of a read-only blob shared with other filings
+            output_path.unlink(missing_ok=True)
         
         self.bytes_written = resume_from
         self.chunks_written = 0
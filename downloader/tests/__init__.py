@@ -0,0 +1,6 @@
+# Path: downloader/tests/__init__.py
+"""
+Downloader Tests
+
+Run from the repository root: python -m pytest downloader/tests
+"""
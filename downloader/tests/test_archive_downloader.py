@@ -0,0 +1,107 @@
+# Path: downloader/tests/test_archive_downloader.py
+"""
+Archive downloader temp files and the blob store.
+
+A downloaded temp file becomes a hard link of its read-only blob; later
+downloads of the same URL must not write through it.
+"""
+
+import asyncio
+import os
+
+from downloader.engine.archive_downloader import ArchiveDownloader
+from downloader.engine.blob_store import BlobStore
+from downloader.engine.constants import TEMP_DOWNLOAD_DIR_PREFIX
+from downloader.engine.result import DownloadResult
+
+
+URL = "https://example.com/filings/0001-archive.zip"
+
+
+class _ServedHTTPHandler:
+    """HTTP handler serving a fixed body, written like StreamHandler ('wb')."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.output_paths = []
+
+    async def download(self, url, output_path, **kwargs):
+        self.output_paths.append(output_path)
+        with open(output_path, 'wb') as f:
+            f.write(self.body)
+        return DownloadResult(success=True, file_path=output_path, url=url)
+
+
+class _NoRetry:
+    async def retry_async(self, func, *args, **kwargs):
+        return await func(*args, **kwargs)
+
+
+def _downloader(tmp_path, http_handler, blob_store):
+    return ArchiveDownloader(
+        http_handler=http_handler,
+        retry_manager=_NoRetry(),
+        temp_dir=tmp_path / "temp",
+        config=None,
+        blob_store=blob_store,
+    )
+
+
+def test_redownload_does_not_overwrite_blob(tmp_path):
+    blob_store = BlobStore(tmp_path / "blobs")
+    http = _ServedHTTPHandler(b"first version")
+    downloader = _downloader(tmp_path, http, blob_store)
+
+    first = asyncio.run(downloader.download_to_temp(URL))
+    assert first.success
+    sha_first = blob_store.add_file(first.file_path)
+    blob_first = blob_store.blob_path(sha_first)
+
+    http.body = b"second version"
+    second = asyncio.run(downloader.download_to_temp(URL))
+
+    assert second.success
+    assert second.file_path != first.file_path
+    assert second.file_path.name == first.file_path.name == os.path.basename(URL)
+    assert blob_first.read_bytes() == b"first version"
+    assert first.file_path.read_bytes() == b"first version"
+    assert second.file_path.read_bytes() == b"second version"
+
+
+def test_downloaded_file_linked_into_blob_store(tmp_path):
+    blob_store = BlobStore(tmp_path / "blobs")
+    downloader = _downloader(tmp_path, _ServedHTTPHandler(b"archive bytes"), blob_store)
+
+    result = asyncio.run(downloader.download_to_temp(URL))
+    sha256 = blob_store.add_file(result.file_path)
+
+    assert os.path.samefile(result.file_path, blob_store.blob_path(sha256))
+
+
+def test_discard_temp_keeps_blob(tmp_path):
+    blob_store = BlobStore(tmp_path / "blobs")
+    downloader = _downloader(tmp_path, _ServedHTTPHandler(b"archive bytes"), blob_store)
+
+    result = asyncio.run(downloader.download_to_temp(URL))
+    work_dir = result.file_path.parent
+    assert work_dir.name.startswith(TEMP_DOWNLOAD_DIR_PREFIX)
+
+    sha256 = blob_store.add_file(result.file_path)
+    downloader.discard_temp(result.file_path)
+
+    assert not work_dir.exists()
+    assert blob_store.blob_path(sha256).read_bytes() == b"archive bytes"
+    assert list((tmp_path / "temp").iterdir()) == []
+
+
+def test_failed_download_leaves_no_temp_directory(tmp_path):
+    class _FailingHTTPHandler:
+        async def download(self, url, output_path, **kwargs):
+            return DownloadResult(success=False, error_message="HTTP 500")
+
+    downloader = _downloader(tmp_path, _FailingHTTPHandler(), None)
+
+    result = asyncio.run(downloader.download_to_temp(URL))
+
+    assert not result.success
+    assert list((tmp_path / "temp").iterdir()) == []
@@ -0,0 +1,43 @@
+# Path: downloader/tests/test_filing_catalog.py
+"""
+Filing catalog writer: the downloader appends only to a seeded catalog.
+"""
+
+import json
+from datetime import date
+from types import SimpleNamespace
+
+from downloader.engine.constants import FILING_CATALOG_FILENAME
+from downloader.engine.filing_catalog import FilingCatalogWriter
+
+
+def _filing_dir(entities_dir):
+    target_dir = entities_dir / 'sec' / 'Apple_Inc' / 'filings' / '10-K' / '000032019324000123'
+    target_dir.mkdir(parents=True)
+    (target_dir / 'aapl-20240928.htm').write_text('<html/>')
+    return target_dir
+
+
+FILING = SimpleNamespace(filing_date=date(2024, 11, 1), accession_number='0000320193-24-000123')
+
+
+def test_record_does_not_create_catalog(tmp_path):
+    writer = FilingCatalogWriter(tmp_path)
+
+    assert writer.record(FILING, _filing_dir(tmp_path)) is None
+    assert not (tmp_path / FILING_CATALOG_FILENAME).exists()
+
+
+def test_record_appends_to_existing_catalog(tmp_path):
+    catalog_path = tmp_path / FILING_CATALOG_FILENAME
+    catalog_path.write_text(json.dumps({'format_version': 1, 'seeded_at': 'x', 'filings': 0}) + '\n')
+    writer = FilingCatalogWriter(tmp_path)
+
+    record = writer.record(FILING, _filing_dir(tmp_path))
+
+    lines = catalog_path.read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1]) == record
+    assert record['path'] == 'sec/Apple_Inc/filings/10-K/000032019324000123'
+    assert record['date'] == '2024-09-28'
+    assert record['filing_date'] == '2024-11-01'
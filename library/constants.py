@@ -23,6 +23,7 @@ ENV_LIBRARY_MONITOR_INTERVAL = 'LIBRARY_MONITOR_INTERVAL'
 ENV_LIBRARY_AUTO_CREATE = 'LIBRARY_AUTO_CREATE'
 ENV_LIBRARY_MIN_FILES_THRESHOLD = 'LIBRARY_MIN_FILES_THRESHOLD'
 ENV_LIBRARY_CACHE_TTL = 'LIBRARY_CACHE_TTL'
+ENV_LIBRARY_PERSISTENT_CACHE = 'LIBRARY_PERSISTENT_CACHE'
 ENV_LIBRARY_MAX_RETRIES = 'LIBRARY_MAX_RETRIES'
 
 ENV_DB_HOST = 'DB_HOST'
@@ -50,6 +51,14 @@ TAXONOMY_NAMESPACE_KEY = 'taxonomy_namespaces'
 FACTS_KEY = 'facts'
 METADATA_KEY = 'metadata'
 
+# Per-library inventory manifest (written at extraction time)
+LIBRARY_INVENTORY_FILENAME = '.library_inventory.json'
+LIBRARY_INVENTORY_FORMAT_VERSION = 1
+
+# Persistent result cache (subdirectory of library cache dir)
+RESULT_CACHE_DIRNAME = 'results'
+RESULT_CACHE_FORMAT_VERSION = 1
+
 
 # ============================================================================
 # LIBRARY STATUS CONSTANTS
@@ -99,6 +108,7 @@ __all__ = [
     'ENV_LIBRARY_AUTO_CREATE',
     'ENV_LIBRARY_MIN_FILES_THRESHOLD',
     'ENV_LIBRARY_CACHE_TTL',
+    'ENV_LIBRARY_PERSISTENT_CACHE',
     'ENV_LIBRARY_MAX_RETRIES',
     'ENV_DB_HOST',
     'ENV_DB_PORT',
@@ -116,6 +126,10 @@ __all__ = [
     'TAXONOMY_NAMESPACE_KEY',
     'FACTS_KEY',
     'METADATA_KEY',
+    'LIBRARY_INVENTORY_FILENAME',
+    'LIBRARY_INVENTORY_FORMAT_VERSION',
+    'RESULT_CACHE_DIRNAME',
+    'RESULT_CACHE_FORMAT_VERSION',
     
     # Status constants
     'LIBRARY_STATUS_ACTIVE',
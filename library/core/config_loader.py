@@ -30,6 +30,7 @@ from library.constants import (
     ENV_LIBRARY_AUTO_CREATE,
     ENV_LIBRARY_MIN_FILES_THRESHOLD,
     ENV_LIBRARY_CACHE_TTL,
+    ENV_LIBRARY_PERSISTENT_CACHE,
     ENV_LIBRARY_MAX_RETRIES,
     ENV_DB_HOST,
     ENV_DB_PORT,
@@ -92,6 +93,7 @@ class LibraryConfig:
             'library_auto_create': self._get_bool(ENV_LIBRARY_AUTO_CREATE, default=True),
             'library_min_files_threshold': self._get_int(ENV_LIBRARY_MIN_FILES_THRESHOLD, default=MIN_FILES_THRESHOLD),
             'library_cache_ttl': self._get_int(ENV_LIBRARY_CACHE_TTL, default=CACHE_TTL_SECONDS),
+            'library_persistent_cache': self._get_bool(ENV_LIBRARY_PERSISTENT_CACHE, default=True),
             'library_max_retries': self._get_int(ENV_LIBRARY_MAX_RETRIES, default=MAX_RETRY_ATTEMPTS),
             
             # Database settings
@@ -4,7 +4,8 @@ Availability Checker
 
 Checks taxonomy library availability using DUAL VERIFICATION:
 1. Database status (active + healthy + files > threshold)
-2. Disk verification (directory exists + file count > threshold)
+2. Disk verification (directory exists + file count > threshold,
+   read from the library's inventory manifest)
 
 100% AGNOSTIC - no hardcoded taxonomy logic.
 
@@ -39,11 +40,12 @@ Usage:
 """
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 from library.core.config_loader import LibraryConfig
 from library.core.data_paths import LibraryPaths
 from library.core.logger import get_logger
+from library.loaders.library_inventory import LibraryInventory
 from library.constants import (
     LOG_INPUT,
     LOG_PROCESS,
@@ -53,6 +55,7 @@ from library.constants import (
     MIN_FILES_THRESHOLD,
 )
 from library.engine.constants import STATUS_VALID  # Use engine constants for validation status
+from library.engine.constants import STATUS_COMPLETED, library_key
 
 logger = get_logger(__name__, 'engine')
 
@@ -97,6 +100,7 @@ class AvailabilityChecker:
         """
         self.config = config if config else LibraryConfig()
         self.paths = paths if paths else LibraryPaths(self.config)
+        self.inventory = LibraryInventory()
         
         self.min_files_threshold = self.config.get('library_min_files_threshold')
         
@@ -147,6 +151,9 @@ class AvailabilityChecker:
         available = []
         missing = []
         
+        # One query for the database side of every library
+        db_ready_keys = self.get_ready_library_keys(required_libraries)
+        
         for library in required_libraries:
             taxonomy_name = library.get('taxonomy_name')
             version = library.get('version')
@@ -154,7 +161,7 @@ class AvailabilityChecker:
             logger.debug(f"{LOG_PROCESS} Checking {taxonomy_name} v{version}")
             
             # DUAL VERIFICATION
-            db_ready = self._is_in_database(taxonomy_name, version)
+            db_ready = library_key(taxonomy_name, version) in db_ready_keys
             disk_ok = self._is_on_disk(taxonomy_name, version)
             
             if db_ready and disk_ok:
@@ -182,6 +189,62 @@ class AvailabilityChecker:
         
         return result
     
+    def get_ready_library_keys(
+        self,
+        required_libraries: List[Dict[str, Any]]
+    ) -> Set[Tuple[str, str]]:
+        """
+        Find which required libraries are ready in the database.
+        
+        Single set-based query for all libraries (instead of one query
+        per library), filtered by the same readiness rule as
+        _is_in_database.
+        
+        Args:
+            required_libraries: List of library metadata dicts
+                Each must have: taxonomy_name, version
+                
+        Returns:
+            Set of normalized (name, version) keys ready in database
+        """
+        required_keys = {
+            library_key(lib.get('taxonomy_name'), lib.get('version'))
+            for lib in required_libraries
+        }
+        names = {
+            lib.get('taxonomy_name') for lib in required_libraries
+            if lib.get('taxonomy_name')
+        }
+        names |= {name for name, _ in required_keys if name}
+        
+        if not names:
+            return set()
+        
+        try:
+            with self.session_scope() as session:
+                rows = session.query(
+                    self.TaxonomyLibrary.taxonomy_name,
+                    self.TaxonomyLibrary.taxonomy_version,
+                    self.TaxonomyLibrary.download_status,
+                    self.TaxonomyLibrary.total_files,
+                ).filter(
+                    self.TaxonomyLibrary.taxonomy_name.in_(names)
+                ).all()
+        
+        except Exception as e:
+            logger.error(f"Error checking database for {len(names)} taxonomies: {e}")
+            return set()
+        
+        ready_keys = {
+            library_key(name, version)
+            for name, version, download_status, total_files in rows
+            if download_status == STATUS_COMPLETED
+            and total_files
+            and total_files > self.min_files_threshold
+        }
+        
+        return ready_keys & required_keys
+    
     def _is_in_database(self, taxonomy_name: str, version: str) -> bool:
         """
         Check database: completed download + files > threshold.
@@ -233,11 +296,8 @@ class AvailabilityChecker:
         try:
             library_dir = self.paths.get_library_directory(taxonomy_name, version)
             
-            if not library_dir.exists():
-                return False
-            
-            # Count files recursively
-            file_count = sum(1 for _ in library_dir.rglob('*') if _.is_file())
+            # File count from inventory manifest (no tree walk)
+            file_count = self.inventory.get_file_count(library_dir)
             
             return file_count > self.min_files_threshold
             
@@ -263,9 +323,7 @@ class AvailabilityChecker:
         
         # Get file count
         library_dir = self.paths.get_library_directory(taxonomy_name, version)
-        file_count = 0
-        if library_dir.exists():
-            file_count = sum(1 for _ in library_dir.rglob('*') if _.is_file())
+        file_count = self.inventory.get_file_count(library_dir)
         
         status = {
             'taxonomy_name': taxonomy_name,
@@ -364,6 +364,42 @@ def get_authority_variations(authority: str) -> list:
     return variants
 
 
+def library_key(taxonomy_name: str, version: str) -> tuple:
+    """
+    Normalized (name, version) key for matching libraries.
+    
+    Database records, resolver output and directory names may differ in
+    case and surrounding whitespace; all sides are keyed by this.
+    
+    Args:
+        taxonomy_name: Taxonomy name (e.g., 'us-gaap')
+        version: Taxonomy version (e.g., '2024')
+        
+    Returns:
+        Tuple of (name, version), lowercased and stripped
+    """
+    return (
+        str(taxonomy_name or '').strip().lower(),
+        str(version or '').strip().lower(),
+    )
+
+
+def library_directory_names(taxonomy_name: str, version: str) -> tuple:
+    """
+    Normalized directory names a library may be stored under.
+    
+    Args:
+        taxonomy_name: Taxonomy name
+        version: Taxonomy version
+        
+    Returns:
+        Lowercased directory names in priority order
+        (name-version, name, name_version)
+    """
+    name, version = library_key(taxonomy_name, version)
+    return (f"{name}-{version}", name, f"{name}_{version}")
+
+
 # ============================================================================
 # EXPORTS
 # ============================================================================
@@ -438,4 +474,6 @@ __all__ = [
     'is_company_extension',
     'get_authority_transform',
     'get_authority_variations',
+    'library_key',
+    'library_directory_names',
 ]
\ No newline at end of file
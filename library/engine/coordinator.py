@@ -11,7 +11,7 @@ Architecture:
 - Resolves to libraries (URLResolver → searcher)
 - Checks availability (AvailabilityChecker)
 - Saves missing libraries (DatabaseConnector → searcher)
-- Caches results (ResultCache)
+- Caches results (ResultCache, persisted across runs)
 
 NO hardcoded taxonomy knowledge - pure orchestration.
 
@@ -25,6 +25,9 @@ Usage:
     
     # Process all new filings
     results = coordinator.process_new_filings()
+    
+    # Register every missing library across all filings in one pass
+    summary = coordinator.sync_libraries()
 """
 
 from typing import List, Dict, Any, Optional, Set
@@ -41,6 +44,7 @@ from library.engine.availability_checker import AvailabilityChecker
 from library.engine.db_connector import DatabaseConnector
 from library.engine.result_cache import ResultCache
 from library.models.filing_entry import FilingEntry
+from library.engine.constants import library_key, library_directory_names
 from library.constants import LOG_INPUT, LOG_PROCESS, LOG_OUTPUT
 
 logger = get_logger(__name__, 'engine')
@@ -108,7 +112,7 @@ class LibraryCoordinator:
         2. Extract namespaces
         3. Resolve to libraries (delegates to searcher)
         4. Check availability (dual verification)
-        5. Save missing libraries (delegates to searcher)
+        5. Save missing libraries (same batched database update)
         6. Cache result
         
         Args:
@@ -122,7 +126,7 @@ class LibraryCoordinator:
         logger.info(f"{LOG_INPUT} Processing filing: {filing_id}")
         
         # Check cache first
-        cached = self.cache.get_cached_result(filing_id)
+        cached = self.cache.get_cached_result(filing_id, filing.parsed_json_path)
         if cached:
             logger.info(f"{LOG_OUTPUT} Using cached result for {filing_id}")
             return cached
@@ -151,7 +155,7 @@ class LibraryCoordinator:
                     'libraries_ready': True,
                     'message': 'No taxonomy namespaces detected',
                 }
-                self.cache.cache_result(filing_id, result)
+                self.cache.cache_result(filing_id, result, filing.parsed_json_path)
                 return result
             
             logger.info(f"{LOG_OUTPUT} Detected {len(namespaces)} namespaces")
@@ -178,16 +182,9 @@ class LibraryCoordinator:
                     f"database/physical mismatches"
                 )
             
-            # Step 4: Save missing libraries (delegates to searcher)
-            saved_count = 0
+            # Step 4: Missing libraries were saved in the verification batch
+            saved_count = availability['saved_count']
             if availability['missing_libraries']:
-                logger.debug(f"{LOG_PROCESS} Saving missing libraries to database")
-                
-                for library in availability['missing_libraries']:
-                    save_result = self.db.save_taxonomy(library)
-                    if save_result['success']:
-                        saved_count += 1
-                
                 logger.info(f"{LOG_OUTPUT} Saved {saved_count} missing libraries")
             
             # Build result
@@ -208,8 +205,13 @@ class LibraryCoordinator:
                 'physical_only_count': availability.get('physical_only_count', 0),
             }
             
-            # Cache successful result
-            self.cache.cache_result(filing_id, result)
+            # Cache successful result (persisted when all libraries are ready)
+            self.cache.cache_result(
+                filing_id,
+                result,
+                filing.parsed_json_path,
+                availability['library_directories']
+            )
             
             logger.info(f"{LOG_OUTPUT} Successfully processed {filing_id}")
             
@@ -260,6 +262,74 @@ class LibraryCoordinator:
         
         return results
     
+    def sync_libraries(
+        self,
+        filings: Optional[List[FilingEntry]] = None
+    ) -> Dict[str, Any]:
+        """
+        Register every library missing for a set of filings in one pass.
+        
+        Namespaces of all filings are merged first, so each namespace is
+        resolved once (URLResolver.batch_resolve) and each library is
+        checked and registered once, however many filings need it. The
+        registered libraries are left pending for a concurrent download
+        (DownloadCoordinator.process_pending_taxonomies).
+        
+        Args:
+            filings: Filings to cover (default: all discovered filings)
+            
+        Returns:
+            Dictionary with sync summary
+        """
+        if filings is None:
+            filings = self.metadata_extractor.extract_all()
+        
+        logger.info(f"{LOG_INPUT} Syncing libraries for {len(filings)} filings")
+        
+        # Step 1: Union of namespaces over all filings
+        namespaces: Set[str] = set()
+        unreadable = 0
+        for filing in filings:
+            filing_info = self.parsed_reader.read_file(filing.parsed_json_path)
+            if filing_info.success:
+                namespaces.update(filing_info.namespaces)
+            else:
+                unreadable += 1
+        
+        # Step 2: Resolve once, deduplicated across filings
+        required_libraries = (
+            self.resolver.get_required_libraries(namespaces) if namespaces else []
+        )
+        
+        # Step 3: Verify and register missing libraries in one batch
+        availability = self._dual_verification(required_libraries)
+        
+        summary = {
+            'success': True,
+            'filings_scanned': len(filings),
+            'filings_unreadable': unreadable,
+            'namespaces_detected': len(namespaces),
+            'libraries_required': (
+                availability['available_count'] + availability['missing_count']
+            ),
+            'libraries_available': availability['available_count'],
+            'libraries_missing': availability['missing_count'],
+            'libraries_saved': availability['saved_count'],
+            'missing_libraries': [
+                f"{lib['taxonomy_name']} v{lib['version']}"
+                for lib in availability['missing_libraries']
+            ],
+            'reconciliation_updates': availability['reconciliation_updates'],
+        }
+        
+        logger.info(
+            f"{LOG_OUTPUT} Library sync: {summary['libraries_required']} required, "
+            f"{summary['libraries_available']} available, "
+            f"{summary['libraries_missing']} missing ({summary['libraries_saved']} registered)"
+        )
+        
+        return summary
+    
     def process_filing_by_id(self, filing_id: str) -> Optional[Dict[str, Any]]:
         """
         Process specific filing by ID.
@@ -295,6 +365,10 @@ class LibraryCoordinator:
         - Files might exist but database doesn't know
         - Files might be incomplete (below threshold)
         
+        Both sides are keyed by normalized (name, version): the database
+        side comes from one query, reconciliation is set arithmetic, and
+        all resulting status changes go to the database in one batch.
+        
         Args:
             required_libraries: List of library metadata from url_resolver
             
@@ -303,104 +377,83 @@ class LibraryCoordinator:
         """
         logger.debug(f"{LOG_PROCESS} Running dual verification (DB + Physical)")
         
-        # Step 1: Check database
-        db_availability = self.checker.check_library_availability(required_libraries)
+        # Index required libraries by normalized (name, version)
+        required = {}
+        for library in required_libraries:
+            key = library_key(library.get('taxonomy_name'), library.get('version'))
+            required.setdefault(key, library)
         
-        # Step 2: Check physical files
-        physical_verifications = self.taxonomy_reader.verify_libraries()
+        # Step 1: Check database (one query for all libraries)
+        db_ready = self.checker.get_ready_library_keys(required_libraries)
         
-        # Build lookup of physically available libraries
+        # Step 2: Check physical files
         physical_complete = {
-            v.directory_name: v
-            for v in physical_verifications
+            v.directory_name.strip().lower(): v
+            for v in self.taxonomy_reader.verify_libraries()
             if v.is_complete
         }
         
+        physical = {}
+        for key in required:
+            directory_name = next(
+                (name for name in library_directory_names(*key) if name in physical_complete),
+                None
+            )
+            if directory_name:
+                physical[key] = physical_complete[directory_name]
+        
         logger.debug(
-            f"{LOG_OUTPUT} DB reports {db_availability['available_count']} available, "
+            f"{LOG_OUTPUT} DB reports {len(db_ready)} available, "
             f"Physical has {len(physical_complete)} complete"
         )
         
-        # Step 3: Reconcile - find mismatches
-        truly_available = []
-        missing_libraries = []
-        needs_db_update = []
+        # Step 3: Reconcile with set operations
+        required_keys = set(required)
+        physical_keys = set(physical)
+        db_only = (db_ready & required_keys) - physical_keys
+        physical_only = physical_keys - db_ready
         
-        for library in required_libraries:
-            lib_name = library.get('taxonomy_name', '')
-            lib_version = library.get('version', '')
-            lib_key = f"{lib_name}-{lib_version}"
-            
-            # Check if in database
-            in_db = any(
-                lib.get('taxonomy_name') == lib_name and lib.get('version') == lib_version
-                for lib in db_availability.get('available_libraries', [])
+        truly_available = [lib for key, lib in required.items() if key in physical_keys]
+        missing_libraries = [lib for key, lib in required.items() if key not in physical_keys]
+        
+        for key in db_only:
+            # Database says yes, but files missing - CRITICAL MISMATCH
+            logger.warning(
+                f"Database claims {key[0]}-{key[1]} is available but files are missing/incomplete"
             )
-            
-            # Check if physically complete
-            # Try multiple naming patterns
-            physical_exists = False
-            for potential_name in [lib_key, lib_name, f"{lib_name}-{lib_version}"]:
-                if potential_name in physical_complete:
-                    physical_exists = True
-                    break
-            
-            # Reconciliation logic
-            if in_db and physical_exists:
-                # Perfect - both agree
-                truly_available.append(library)
-            elif in_db and not physical_exists:
-                # Database says yes, but files missing - CRITICAL MISMATCH
-                logger.warning(
-                    f"Database claims {lib_key} is available but files are missing/incomplete"
-                )
-                missing_libraries.append(library)
-                needs_db_update.append({
-                    'library': library,
-                    'action': 'mark_as_missing',
-                    'reason': 'files_not_found'
-                })
-            elif not in_db and physical_exists:
-                # Files exist but database doesn't know - update database
-                logger.info(f"Found {lib_key} on disk but not in database - will register")
-                truly_available.append(library)
-                needs_db_update.append({
-                    'library': library,
-                    'action': 'register_found',
-                    'reason': 'files_exist_not_in_db'
-                })
-            else:
-                # Neither - truly missing
-                missing_libraries.append(library)
+        for key in physical_only:
+            # Files exist but database doesn't know - update database
+            logger.info(f"Found {key[0]}-{key[1]} on disk but not in database - will register")
+        
+        # Step 4: Apply all status changes in one batch
+        # (register found libraries, queue missing ones for download)
+        found_on_disk = [
+            {
+                **required[key],
+                'file_count': physical[key].file_count,
+                'library_directory': physical[key].taxonomy_path,
+            }
+            for key in required if key in physical_only
+        ]
         
-        # Step 4: Apply reconciliation updates
-        for update in needs_db_update:
-            library = update['library']
-            action = update['action']
-            
-            if action == 'register_found':
-                # Register in database
-                self.db.save_taxonomy(library)
-                logger.info(
-                    f"{LOG_OUTPUT} Registered {library['taxonomy_name']} "
-                    f"v{library['version']} (found on disk)"
-                )
-            elif action == 'mark_as_missing':
-                # Could mark as inactive in database
-                # For now just log - db_connector can add this method later
-                logger.warning(
-                    f"{LOG_OUTPUT} Mismatch: {library['taxonomy_name']} "
-                    f"v{library['version']} in DB but files missing"
-                )
+        saved_count = 0
+        if found_on_disk or missing_libraries:
+            update = self.db.reconcile_libraries(found_on_disk, missing_libraries)
+            if update['success']:
+                saved_count = len(missing_libraries)
         
         result = {
             'available_libraries': truly_available,
             'missing_libraries': missing_libraries,
             'available_count': len(truly_available),
             'missing_count': len(missing_libraries),
-            'reconciliation_updates': len(needs_db_update),
-            'db_only_count': sum(1 for u in needs_db_update if u['action'] == 'mark_as_missing'),
-            'physical_only_count': sum(1 for u in needs_db_update if u['action'] == 'register_found'),
+            'reconciliation_updates': len(db_only) + len(physical_only),
+            'db_only_count': len(db_only),
+            'physical_only_count': len(physical_only),
+            'saved_count': saved_count,
+            'library_directories': sorted(
+                physical[key].taxonomy_path for key in physical_keys
+            ),
         }
         
         logger.info(
@@ -32,6 +32,8 @@ import uuid
 
 from library.core.config_loader import LibraryConfig
 from library.core.logger import get_logger
+from library.loaders.library_inventory import LibraryInventory
+from library.engine.constants import STATUS_COMPLETED, library_key
 from library.constants import (
     LOG_INPUT,
     LOG_PROCESS,
@@ -85,9 +87,11 @@ class DatabaseConnector:
             # Import database components
             from database import session_scope
             from database.models import TaxonomyLibrary
+            from sqlalchemy import or_
             
             self.session_scope = session_scope
             self.TaxonomyLibrary = TaxonomyLibrary
+            self.or_ = or_
             
             logger.info(f"{LOG_OUTPUT} Database connector initialized")
             
@@ -101,6 +105,7 @@ class DatabaseConnector:
 
         # Get taxonomies destination directory from config
         self.taxonomies_dir = Path(self.config.get('library_taxonomies_libraries'))
+        self.inventory = LibraryInventory()
 
     def _check_physical_existence(self, taxonomy_name: str, version: str) -> bool:
         """
@@ -126,9 +131,9 @@ class DatabaseConnector:
 
         for pattern in patterns:
             lib_dir = self.taxonomies_dir / pattern
-            if lib_dir.exists() and lib_dir.is_dir():
-                # Check if directory has files (not empty)
-                file_count = sum(1 for _ in lib_dir.rglob('*') if _.is_file())
+            if lib_dir.is_dir():
+                # Check if directory has files (from inventory manifest)
+                file_count = self.inventory.get_file_count(lib_dir)
                 if file_count > 0:
                     logger.debug(
                         f"{LOG_OUTPUT} Physical check: {pattern} exists with {file_count} files"
@@ -336,6 +341,140 @@ class DatabaseConnector:
                 'error': str(e),
             }
     
+    def reconcile_libraries(
+        self,
+        found_on_disk: List[Dict[str, Any]],
+        missing_on_disk: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Bring database records in line with disk in one batch.
+        
+        One query loads every affected record, one commit writes all
+        changes. Same rules as save_taxonomy (physical existence is the
+        source of truth), applied to many libraries at once:
+        - found_on_disk: record marked completed (created if absent)
+        - missing_on_disk: record marked pending for download (created if absent)
+        
+        Args:
+            found_on_disk: Library metadata dicts for complete libraries on disk
+                Optional keys: file_count, library_directory
+            missing_on_disk: Library metadata dicts for libraries not on disk
+                
+        Returns:
+            Dictionary with result:
+            {
+                'success': bool,
+                'created': int,
+                'updated': int,
+                'skipped': int,  # unknown taxonomies
+                'error': Optional[str]
+            }
+        """
+        result = {'success': True, 'created': 0, 'updated': 0, 'skipped': 0, 'error': None}
+        
+        # Skip "unknown" taxonomies (see save_taxonomy)
+        changes = []
+        for library, on_disk in (
+            [(lib, True) for lib in found_on_disk] +
+            [(lib, False) for lib in missing_on_disk]
+        ):
+            if library.get('taxonomy_name') == 'unknown' or library.get('version') == 'unknown':
+                result['skipped'] += 1
+            else:
+                changes.append((library, on_disk))
+        
+        if not changes:
+            return result
+        
+        logger.info(
+            f"{LOG_INPUT} Reconciling {len(changes)} libraries "
+            f"({len(found_on_disk)} on disk, {len(missing_on_disk)} missing)"
+        )
+        
+        names = {lib.get('taxonomy_name') for lib, _ in changes}
+        namespaces = {lib.get('namespace') for lib, _ in changes if lib.get('namespace')}
+        
+        try:
+            with self.session_scope() as session:
+                records = session.query(self.TaxonomyLibrary).filter(
+                    self.or_(
+                        self.TaxonomyLibrary.taxonomy_name.in_(names),
+                        self.TaxonomyLibrary.taxonomy_namespace.in_(namespaces),
+                    )
+                ).all()
+                
+                by_namespace = {r.taxonomy_namespace: r for r in records}
+                by_key = {library_key(r.taxonomy_name, r.taxonomy_version): r for r in records}
+                
+                for library, on_disk in changes:
+                    record = by_namespace.get(library.get('namespace')) or by_key.get(
+                        library_key(library.get('taxonomy_name'), library.get('version'))
+                    )
+                    
+                    if record is None:
+                        record = self.TaxonomyLibrary(
+                            taxonomy_name=library.get('taxonomy_name'),
+                            taxonomy_version=library.get('version'),
+                            taxonomy_namespace=library.get('namespace'),
+                            source_url=library.get('download_url'),
+                        )
+                        session.add(record)
+                        by_namespace[record.taxonomy_namespace] = record
+                        by_key[library_key(record.taxonomy_name, record.taxonomy_version)] = record
+                        self._apply_disk_state(record, library, on_disk)
+                        result['created'] += 1
+                    elif self._apply_disk_state(record, library, on_disk):
+                        result['updated'] += 1
+                
+                session.commit()
+            
+            logger.info(
+                f"{LOG_OUTPUT} Reconciled libraries: {result['created']} created, "
+                f"{result['updated']} updated"
+            )
+            
+        except Exception as e:
+            logger.error(f"Error reconciling libraries: {e}")
+            result.update({'success': False, 'created': 0, 'updated': 0, 'error': str(e)})
+        
+        return result
+    
+    def _apply_disk_state(
+        self,
+        record: Any,
+        library: Dict[str, Any],
+        on_disk: bool
+    ) -> bool:
+        """
+        Set record status from disk state.
+        
+        Args:
+            record: TaxonomyLibrary record
+            library: Library metadata dict
+            on_disk: True if library is complete on disk
+            
+        Returns:
+            True if any column was changed
+        """
+        if on_disk:
+            target = {'download_status': STATUS_COMPLETED}
+            if library.get('file_count'):
+                target['total_files'] = library['file_count']
+            if library.get('library_directory'):
+                target['library_directory'] = str(library['library_directory'])
+        else:
+            target = {'download_status': LIBRARY_STATUS_PENDING}
+            if library.get('download_url'):
+                target['source_url'] = library['download_url']
+        
+        changed = False
+        for column, value in target.items():
+            if getattr(record, column) != value:
+                setattr(record, column, value)
+                changed = True
+        
+        return changed
+    
     def get_pending_taxonomies(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
         Get taxonomies with status='pending'.
@@ -41,6 +41,7 @@ from typing import Dict, Any, List, Optional
 from library.core.config_loader import LibraryConfig
 from library.core.data_paths import LibraryPaths
 from library.core.logger import get_logger
+from library.loaders.library_inventory import LibraryInventory
 from library.constants import LOG_INPUT, LOG_PROCESS, LOG_OUTPUT
 
 logger = get_logger(__name__, 'engine')
@@ -83,6 +84,7 @@ class ManualProcessor:
         """
         self.config = config if config else LibraryConfig()
         self.paths = paths if paths else LibraryPaths(self.config)
+        self.inventory = LibraryInventory()
         
         logger.debug(f"{LOG_PROCESS} Manual processor initialized")
     
@@ -266,8 +268,8 @@ class ManualProcessor:
             with zipfile.ZipFile(archive_path, 'r') as zip_ref:
                 zip_ref.extractall(target_dir)
             
-            # Count extracted files
-            file_count = sum(1 for _ in target_dir.rglob('*') if _.is_file())
+            # Record inventory manifest (file count, bytes, digest)
+            file_count = self.inventory.write(target_dir).file_count
             
             logger.debug(f"{LOG_OUTPUT} Extracted {file_count} files")
             
@@ -2,14 +2,18 @@
 """
 Result Cache
 
-Simple in-memory cache for analysis results.
-Reduces redundant processing of same filings.
+Two-level cache for analysis results.
+Reduces redundant processing of same filings, within a run and across runs.
 
 Architecture:
-- Cache keyed by filing_id
-- TTL-based expiration
-- Statistics tracking (hits, misses)
-- Thread-safe operations
+- In-memory layer keyed by filing_id, TTL-based expiration
+- Persistent layer on disk (library_cache_dir/results/), one JSON entry
+  per filing, keyed by parsed.json fingerprint and the inventory
+  version (content digest) of every library the filing needed
+- Only results with all libraries ready are persisted
+- Entries invalidate themselves: a changed parsed.json, a removed
+  library directory or a library whose inventory changed is a miss
+- Statistics tracking (hits, misses, hit rates per layer)
 
 Usage:
     from library.engine.result_cache import ResultCache
@@ -17,31 +21,42 @@ Usage:
     cache = ResultCache()
     
     # Check cache first
-    result = cache.get_cached_result(filing_id)
+    result = cache.get_cached_result(filing_id, parsed_json_path)
     if result:
         return result
     
     # Process and cache
     result = expensive_operation()
-    cache.cache_result(filing_id, result)
+    cache.cache_result(filing_id, result, parsed_json_path, library_directories)
 """
 
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from datetime import datetime
 
 from library.core.config_loader import LibraryConfig
 from library.core.logger import get_logger
-from library.constants import LOG_INPUT, LOG_OUTPUT, CACHE_TTL_SECONDS
+from library.loaders.library_inventory import LibraryInventory
+from library.constants import (
+    LOG_INPUT,
+    LOG_OUTPUT,
+    RESULT_CACHE_DIRNAME,
+    RESULT_CACHE_FORMAT_VERSION,
+)
 
 logger = get_logger(__name__, 'engine')
 
 
 class ResultCache:
     """
-    Simple in-memory cache for analysis results.
+    Two-level cache for analysis results.
     
     Features:
-    - TTL-based expiration
+    - TTL-based expiration (in-memory layer)
+    - Fingerprint-validated persistent layer
     - Statistics tracking
     - Clear/invalidate operations
     
@@ -49,13 +64,13 @@ class ResultCache:
         cache = ResultCache()
         
         # Try cache first
-        cached = cache.get_cached_result('filing_123')
+        cached = cache.get_cached_result('filing_123', parsed_json_path)
         if cached:
             print("Cache hit!")
         else:
             # Process and cache
             result = process_filing()
-            cache.cache_result('filing_123', result)
+            cache.cache_result('filing_123', result, parsed_json_path, library_dirs)
     """
     
     def __init__(self, config: Optional[LibraryConfig] = None):
@@ -67,49 +82,81 @@ class ResultCache:
         """
         self.config = config if config else LibraryConfig()
         self.ttl_seconds = self.config.get('library_cache_ttl')
+        self.persistent = self.config.get('library_persistent_cache', required=False)
+        self.cache_dir = Path(self.config.get('library_cache_dir')) / RESULT_CACHE_DIRNAME
+        self.inventory = LibraryInventory()
         
         self._cache: Dict[str, Dict[str, Any]] = {}
         self._hits = 0
         self._misses = 0
+        self._persistent_hits = 0
+        self._persistent_misses = 0
         
-        logger.debug(f"{LOG_OUTPUT} Result cache initialized (TTL={self.ttl_seconds}s)")
+        logger.debug(
+            f"{LOG_OUTPUT} Result cache initialized (TTL={self.ttl_seconds}s, "
+            f"persistent={bool(self.persistent)})"
+        )
     
-    def get_cached_result(self, filing_id: str) -> Optional[Dict[str, Any]]:
+    def get_cached_result(
+        self,
+        filing_id: str,
+        parsed_json_path: Optional[Path] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Get cached result for filing.
         
         Args:
             filing_id: Filing identifier
-            
+            parsed_json_path: parsed.json of the filing (enables persistent layer)
+        
         Returns:
-            Cached result or None if not found/expired
+            Cached result or None if not found/expired/invalidated
         """
-        if filing_id not in self._cache:
-            self._misses += 1
-            logger.debug(f"{LOG_OUTPUT} Cache miss: {filing_id}")
-            return None
+        entry = self._cache.get(filing_id)
         
-        entry = self._cache[filing_id]
+        if entry and not self._is_expired(entry['cached_at']):
+            self._hits += 1
+            logger.debug(f"{LOG_OUTPUT} Cache hit: {filing_id}")
+            return entry['result']
         
-        # Check expiration
-        if self._is_expired(entry['cached_at']):
+        if entry:
             logger.debug(f"{LOG_OUTPUT} Cache expired: {filing_id}")
             del self._cache[filing_id]
-            self._misses += 1
-            return None
         
-        self._hits += 1
-        logger.debug(f"{LOG_OUTPUT} Cache hit: {filing_id}")
+        if self.persistent and parsed_json_path is not None:
+            result = self._load_persistent(filing_id, parsed_json_path)
+            
+            if result is not None:
+                self._hits += 1
+                self._persistent_hits += 1
+                self._cache[filing_id] = {'result': result, 'cached_at': datetime.now()}
+                logger.debug(f"{LOG_OUTPUT} Persistent cache hit: {filing_id}")
+                return result
+            
+            self._persistent_misses += 1
         
-        return entry['result']
+        self._misses += 1
+        logger.debug(f"{LOG_OUTPUT} Cache miss: {filing_id}")
+        return None
     
-    def cache_result(self, filing_id: str, result: Dict[str, Any]) -> None:
+    def cache_result(
+        self,
+        filing_id: str,
+        result: Dict[str, Any],
+        parsed_json_path: Optional[Path] = None,
+        library_directories: Optional[List[Path]] = None
+    ) -> None:
         """
         Cache analysis result.
         
+        Results with all libraries ready are also persisted when
+        parsed_json_path is given.
+        
         Args:
             filing_id: Filing identifier
             result: Analysis result dictionary
+            parsed_json_path: parsed.json the result was computed from
+            library_directories: Directories of the libraries the filing needs
         """
         self._cache[filing_id] = {
             'result': result,
@@ -117,10 +164,18 @@ class ResultCache:
         }
         
         logger.debug(f"{LOG_INPUT} Cached result: {filing_id}")
+        
+        if (
+            self.persistent
+            and parsed_json_path is not None
+            and result.get('success')
+            and result.get('libraries_ready')
+        ):
+            self._save_persistent(filing_id, result, parsed_json_path, library_directories or [])
     
     def invalidate_cache(self, filing_id: str) -> None:
         """
-        Remove cached result for filing.
+        Remove cached result for filing (both layers).
         
         Args:
             filing_id: Filing identifier
@@ -128,12 +183,34 @@ class ResultCache:
         if filing_id in self._cache:
             del self._cache[filing_id]
             logger.debug(f"{LOG_OUTPUT} Invalidated cache: {filing_id}")
+        
+        try:
+            self._entry_path(filing_id).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove cache entry for {filing_id}: {e}")
     
-    def clear_cache(self) -> None:
-        """Clear all cached results."""
+    def clear_cache(self, include_persistent: bool = False) -> None:
+        """
+        Clear all cached results.
+        
+        Args:
+            include_persistent: Also delete persistent entries
+        """
         count = len(self._cache)
         self._cache.clear()
         logger.info(f"{LOG_OUTPUT} Cleared {count} cached results")
+        
+        if include_persistent and self.cache_dir.exists():
+            removed = 0
+            for entry_path in self.cache_dir.glob('*/*.json'):
+                try:
+                    entry_path.unlink()
+                    removed += 1
+                except OSError as e:
+                    logger.warning(f"Could not remove cache entry {entry_path}: {e}")
+            logger.info(f"{LOG_OUTPUT} Cleared {removed} persistent cached results")
     
     def _is_expired(self, cached_at: datetime) -> bool:
         """
@@ -141,7 +218,7 @@ class ResultCache:
         
         Args:
             cached_at: Timestamp when entry was cached
-            
+        
         Returns:
             True if expired
         """
@@ -162,18 +239,30 @@ class ResultCache:
             else 0.0
         )
         
+        persistent_requests = self._persistent_hits + self._persistent_misses
+        persistent_hit_rate = (
+            (self._persistent_hits / persistent_requests * 100)
+            if persistent_requests > 0
+            else 0.0
+        )
+        
         return {
             'cache_hits': self._hits,
             'cache_misses': self._misses,
             'total_requests': total_requests,
             'hit_rate_percentage': round(hit_rate, 2),
+            'miss_rate_percentage': round(100 - hit_rate, 2) if total_requests else 0.0,
             'cache_size': len(self._cache),
             'ttl_seconds': self.ttl_seconds,
+            'persistent_enabled': bool(self.persistent),
+            'persistent_hits': self._persistent_hits,
+            'persistent_misses': self._persistent_misses,
+            'persistent_hit_rate_percentage': round(persistent_hit_rate, 2),
         }
     
     def cleanup_expired(self) -> int:
         """
-        Remove expired entries from cache.
+        Remove expired entries from in-memory cache.
         
         Returns:
             Number of entries removed
@@ -191,6 +280,110 @@ class ResultCache:
             logger.info(f"{LOG_OUTPUT} Cleaned up {len(expired_ids)} expired cache entries")
         
         return len(expired_ids)
+    
+    def _load_persistent(
+        self,
+        filing_id: str,
+        parsed_json_path: Path
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load persistent entry if its fingerprints still match.
+        
+        Args:
+            filing_id: Filing identifier
+            parsed_json_path: Current parsed.json of the filing
+        
+        Returns:
+            Cached result or None
+        """
+        entry_path = self._entry_path(filing_id)
+        
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry for {filing_id}: {e}")
+            return None
+        
+        if (
+            entry.get('format_version') != RESULT_CACHE_FORMAT_VERSION
+            or entry.get('parsed_fingerprint') != self._file_fingerprint(parsed_json_path)
+        ):
+            return None
+        
+        # Every library must still be on disk with unchanged inventory
+        for library in entry.get('libraries', []):
+            manifest = self.inventory.read(Path(library['directory']))
+            if manifest is None or manifest.content_digest != library['content_digest']:
+                logger.info(
+                    f"{LOG_OUTPUT} Library changed or removed, dropping cached result "
+                    f"for {filing_id}: {library['directory']}"
+                )
+                return None
+        
+        return entry.get('result')
+    
+    def _save_persistent(
+        self,
+        filing_id: str,
+        result: Dict[str, Any],
+        parsed_json_path: Path,
+        library_directories: List[Path]
+    ) -> None:
+        """
+        Write persistent entry for filing.
+        
+        Args:
+            filing_id: Filing identifier
+            result: Analysis result dictionary
+            parsed_json_path: parsed.json the result was computed from
+            library_directories: Directories of the libraries the filing needs
+        """
+        libraries = []
+        for directory in library_directories:
+            manifest = self.inventory.read(Path(directory))
+            if manifest is None:
+                # Library vanished while processing; do not persist
+                return
+            libraries.append({
+                'directory': str(directory),
+                'content_digest': manifest.content_digest,
+            })
+        
+        entry = {
+            'format_version': RESULT_CACHE_FORMAT_VERSION,
+            'filing_id': filing_id,
+            'parsed_fingerprint': self._file_fingerprint(parsed_json_path),
+            'libraries': libraries,
+            'cached_at': datetime.now().isoformat(),
+            'result': result,
+        }
+        
+        entry_path = self._entry_path(filing_id)
+        
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, default=str)
+            tmp_path.replace(entry_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not persist cached result for {filing_id}: {e}")
+    
+    def _file_fingerprint(self, path: Path) -> Optional[List[Any]]:
+        """Identity of a file: path, size and modification time."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return [str(path), stat.st_size, stat.st_mtime_ns]
+    
+    def _entry_path(self, filing_id: str) -> Path:
+        """Persistent entry path for a filing (hashed to avoid unsafe characters)."""
+        digest = hashlib.sha256(filing_id.encode('utf-8')).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json"
 
 
-__all__ = ['ResultCache']
\ No newline at end of file
+__all__ = ['ResultCache']
@@ -11,6 +11,7 @@ Usage:
     python library.py --list          # List all libraries
     python library.py --list-pending  # Show pending downloads
     python library.py --stats         # Show statistics
+    python library.py --sync          # Register and download all missing libraries
 """
 import sys
 import argparse
@@ -44,6 +45,8 @@ Examples:
   python library.py --list            Show all libraries
   python library.py --list-pending    Show pending downloads
   python library.py --download        Download all pending taxonomies
+  python library.py --sync            Register all missing taxonomies and
+                                      download them concurrently
   python library.py --manual          Show manual download instructions
   python library.py --stats           Show statistics
         """
@@ -97,6 +100,26 @@ Examples:
         help='Download all pending taxonomy libraries'
     )
     
+    parser.add_argument(
+        '--sync',
+        action='store_true',
+        help='Register libraries missing for all filings and download them concurrently'
+    )
+    
+    parser.add_argument(
+        '--max-concurrent',
+        type=int,
+        default=None,
+        help='Concurrent downloads for --sync (default: DOWNLOADER_MAX_CONCURRENT)'
+    )
+    
+    parser.add_argument(
+        '--max-per-host',
+        type=int,
+        default=None,
+        help='Concurrent downloads per host for --sync (default: DOWNLOADER_MAX_CONCURRENT_PER_HOST)'
+    )
+    
     args = parser.parse_args()
     
     # If no arguments, show help
@@ -124,6 +147,8 @@ Examples:
             return cmd_stats()
         elif args.download:
             return cmd_download()
+        elif args.sync:
+            return cmd_sync(args.max_concurrent, args.max_per_host)
         else:
             parser.print_help()
             return 0
@@ -437,5 +462,80 @@ def cmd_download():
         return 1
 
 
+def cmd_sync(max_concurrent=None, max_per_host=None):
+    """Register libraries missing for all filings and download them concurrently."""
+    logger.info("[INPUT] Starting library sync")
+    
+    print("\n" + "=" * 80)
+    print("LIBRARY SYNC - ALL FILINGS")
+    print("=" * 80)
+    
+    try:
+        from library.engine.coordinator import LibraryCoordinator
+        
+        # Add downloader module to path (sibling module)
+        downloader_path = Path(__file__).parent.parent / 'downloader'
+        if str(downloader_path) not in sys.path:
+            sys.path.insert(0, str(downloader_path))
+        
+        from downloader.engine.coordinator import DownloadCoordinator
+        import asyncio
+        
+        print("\nResolving library requirements of all parsed filings...")
+        
+        # One resolve/verify/register pass over every filing
+        summary = LibraryCoordinator().sync_libraries()
+        
+        print(f"Filings scanned:     {summary['filings_scanned']}")
+        print(f"Namespaces detected: {summary['namespaces_detected']}")
+        print(f"Libraries required:  {summary['libraries_required']}")
+        print(f"Already available:   {summary['libraries_available']}")
+        print(f"Missing:             {summary['libraries_missing']}")
+        for library in summary['missing_libraries']:
+            print(f"  - {library}")
+        
+        print("\nDownloading pending taxonomies...")
+        
+        async def run_downloads():
+            coordinator = DownloadCoordinator()
+            try:
+                return await coordinator.process_pending_taxonomies(
+                    limit=max(100, summary['libraries_missing']),
+                    max_concurrent=max_concurrent,
+                    max_per_host=max_per_host
+                )
+            finally:
+                await coordinator.close()
+        
+        stats = asyncio.run(run_downloads())
+        
+        # Display results
+        print("\n" + "=" * 80)
+        print("SYNC RESULTS")
+        print("=" * 80)
+        print(f"Total processed: {stats['total']}")
+        print(f"Succeeded: {stats['succeeded']}")
+        print(f"Failed: {stats['failed']}")
+        print(f"Duration: {stats['duration']:.1f}s")
+        print("=" * 80)
+        
+        logger.info(
+            f"[OUTPUT] Sync complete: {stats['succeeded']}/{stats['total']} downloads successful"
+        )
+        
+        return 0 if stats['failed'] == 0 else 1
+        
+    except ImportError as e:
+        print("\nError: Cannot import downloader module")
+        print(f"Details: {e}")
+        print("\nEnsure downloader module is available in parent directory.")
+        logger.error(f"Import error: {e}")
+        return 1
+    except Exception as e:
+        print(f"\nError during sync: {e}")
+        logger.error(f"Sync error: {e}")
+        return 1
+
+
 if __name__ == '__main__':
     sys.exit(main())
\ No newline at end of file
@@ -11,12 +11,14 @@ Discovery (Doorkeepers):
 Content Readers:
 - ParsedReader: Reads parsed.json and extracts namespaces
 - TaxonomyReader: Verifies physical taxonomy existence
+- LibraryInventory: Per-library inventory manifest (file counts without tree walks)
 """
 
 from library.loaders.parsed_loader import ParsedLoader, ParsedFileLocation
 from library.loaders.taxonomy_loader import TaxonomyLoader, TaxonomyLocation
 from library.loaders.parsed_reader import ParsedReader, ParsedFilingInfo
 from library.loaders.taxonomy_reader import TaxonomyReader, TaxonomyVerification
+from library.loaders.library_inventory import LibraryInventory, InventoryManifest
 
 __all__ = [
     'ParsedLoader',
@@ -27,4 +29,6 @@ __all__ = [
     'ParsedFilingInfo',
     'TaxonomyReader',
     'TaxonomyVerification',
+    'LibraryInventory',
+    'InventoryManifest',
 ]
\ No newline at end of file
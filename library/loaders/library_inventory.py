@@ -0,0 +1,276 @@
+# Path: library/loaders/library_inventory.py
+"""
+Library Inventory
+
+Per-library inventory manifest stored inside each taxonomy directory
+(LIBRARY_INVENTORY_FILENAME). Existence and completeness checks read the
+manifest instead of walking the whole tree.
+
+Manifest contents:
+- file_count, total_bytes: totals over every file except the manifest
+- content_digest: SHA-256 over relative paths, sizes and file contents
+- extracted_at: when the library was extracted (ISO 8601, UTC)
+- directories: modification time of every directory (root is '.')
+- format_version: LIBRARY_INVENTORY_FORMAT_VERSION; manifests of any
+  other version are discarded and rebuilt
+
+This is the reference for the format; the downloader writes the same
+manifest after extraction (downloader/engine/extraction/inventory_writer.py).
+
+Validation is a directory mtime check: one stat per directory, no file
+listing. Adding, removing or renaming a file changes the mtime of the
+directory holding it. The manifest is written to a temporary file and
+moved into place (never left half-written); the root directory's
+modification time is then set back to the walked value, since writing
+the manifest is not a change to the library.
+
+A missing, unreadable or stale manifest is rebuilt from the tree and
+rewritten, so libraries extracted before manifests existed heal on
+first use. When it cannot be written (e.g. read-only library), the
+rebuilt manifest is kept in memory and validated the same way.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+from library.core.logger import get_logger
+from library.constants import (
+    LOG_PROCESS,
+    LOG_OUTPUT,
+    LIBRARY_INVENTORY_FILENAME,
+    LIBRARY_INVENTORY_FORMAT_VERSION,
+)
+
+logger = get_logger(__name__, 'loaders')
+
+# Read size when hashing file contents
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class InventoryManifest:
+    """Inventory of one taxonomy library directory."""
+    file_count: int
+    total_bytes: int
+    content_digest: str
+    extracted_at: str
+    directories: Dict[str, int] = field(default_factory=dict)
+    format_version: int = LIBRARY_INVENTORY_FORMAT_VERSION
+
+
+class LibraryInventory:
+    """
+    Reads, validates and (re)builds library inventory manifests.
+
+    Example:
+        inventory = LibraryInventory()
+        manifest = inventory.read(library_dir)
+        if manifest and manifest.file_count > threshold:
+            ...
+    """
+
+    def __init__(self):
+        """Initialize inventory."""
+        # Manifests that could not be written, by library directory
+        self._unwritten: Dict[Path, InventoryManifest] = {}
+
+    def read(self, directory: Path) -> Optional[InventoryManifest]:
+        """
+        Get current manifest for directory, rebuilding it if stale.
+
+        Args:
+            directory: Taxonomy library directory
+
+        Returns:
+            InventoryManifest or None if directory does not exist
+        """
+        directory = Path(directory)
+
+        if not directory.is_dir():
+            return None
+
+        manifest = self._load(directory) or self._unwritten.get(directory)
+
+        if manifest and self.is_current(directory, manifest):
+            return manifest
+
+        logger.info(
+            f"{LOG_PROCESS} Inventory manifest missing or stale, rebuilding: {directory.name}"
+        )
+
+        extracted_at = manifest.extracted_at if manifest else None
+        return self.write(directory, extracted_at=extracted_at)
+
+    def get_file_count(self, directory: Path) -> int:
+        """
+        Get number of files in library directory.
+
+        Args:
+            directory: Taxonomy library directory
+
+        Returns:
+            File count (0 if directory does not exist)
+        """
+        manifest = self.read(directory)
+        return manifest.file_count if manifest else 0
+
+    def write(
+        self,
+        directory: Path,
+        extracted_at: Optional[str] = None
+    ) -> InventoryManifest:
+        """
+        Build manifest from the tree and write it into the directory.
+
+        Args:
+            directory: Taxonomy library directory
+            extracted_at: Extraction timestamp to record (default: now)
+
+        Returns:
+            InventoryManifest (kept in memory if it cannot be written)
+        """
+        directory = Path(directory)
+        manifest = self.build(directory, extracted_at=extracted_at)
+
+        try:
+            self._write_file(directory, manifest)
+        except OSError as e:
+            logger.warning(
+                f"Could not write inventory manifest for {directory}, keeping it in memory: {e}"
+            )
+            self._unwritten[directory] = manifest
+            return manifest
+
+        self._unwritten.pop(directory, None)
+        logger.info(
+            f"{LOG_OUTPUT} Inventory manifest written: {directory.name} "
+            f"({manifest.file_count} files, {manifest.total_bytes} bytes)"
+        )
+
+        return manifest
+
+    def build(
+        self,
+        directory: Path,
+        extracted_at: Optional[str] = None
+    ) -> InventoryManifest:
+        """
+        Walk directory once and build its manifest.
+
+        Args:
+            directory: Taxonomy library directory
+            extracted_at: Extraction timestamp to record (default: now)
+
+        Returns:
+            InventoryManifest (not written)
+        """
+        directory = Path(directory)
+        hasher = hashlib.sha256()
+        file_count = 0
+        total_bytes = 0
+        directories = {}
+
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+
+            directories[os.path.relpath(root, directory)] = os.stat(root).st_mtime_ns
+
+            for name in sorted(files):
+                # Manifest and temporary files of an interrupted write
+                if name.startswith(LIBRARY_INVENTORY_FILENAME) and root == str(directory):
+                    continue
+
+                file_path = os.path.join(root, name)
+                try:
+                    size = os.path.getsize(file_path)
+                    relative = os.path.relpath(file_path, directory)
+                    hasher.update(f"{relative}\0{size}\0".encode('utf-8'))
+                    with open(file_path, 'rb') as f:
+                        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                            hasher.update(chunk)
+                except OSError as e:
+                    logger.warning(f"Skipping unreadable file in inventory: {file_path}: {e}")
+                    continue
+
+                file_count += 1
+                total_bytes += size
+
+        return InventoryManifest(
+            file_count=file_count,
+            total_bytes=total_bytes,
+            content_digest=hasher.hexdigest(),
+            extracted_at=extracted_at or datetime.now(timezone.utc).isoformat(),
+            directories=directories,
+        )
+
+    def is_current(self, directory: Path, manifest: InventoryManifest) -> bool:
+        """
+        Check manifest against directory modification times.
+
+        Args:
+            directory: Taxonomy library directory
+            manifest: Manifest loaded from directory
+
+        Returns:
+            True if no directory changed since manifest was written
+        """
+        if not manifest.directories:
+            return False
+
+        try:
+            for relative_dir, mtime_ns in manifest.directories.items():
+                if os.stat(directory / relative_dir).st_mtime_ns != mtime_ns:
+                    return False
+        except OSError:
+            return False
+
+        return True
+
+    def _write_file(self, directory: Path, manifest: InventoryManifest) -> None:
+        """Write manifest atomically, keeping the recorded root mtime."""
+        manifest_path = directory / LIBRARY_INVENTORY_FILENAME
+        tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(asdict(manifest), f, indent=2, sort_keys=True)
+            os.replace(tmp_path, manifest_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # Creating and renaming the manifest changed the root mtime;
+        # writing it is not a change to the library
+        os.utime(directory, ns=(os.stat(directory).st_atime_ns, manifest.directories['.']))
+
+    def _load(self, directory: Path) -> Optional[InventoryManifest]:
+        """Load manifest file, or None if missing or unreadable."""
+        manifest_path = directory / LIBRARY_INVENTORY_FILENAME
+
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get('format_version') != LIBRARY_INVENTORY_FORMAT_VERSION:
+                return None
+
+            return InventoryManifest(
+                file_count=data['file_count'],
+                total_bytes=data['total_bytes'],
+                content_digest=data['content_digest'],
+                extracted_at=data['extracted_at'],
+                directories=data.get('directories', {}),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Discarding unreadable inventory manifest {manifest_path}: {e}")
+            return None
+
+
+__all__ = ['LibraryInventory', 'InventoryManifest']
@@ -7,13 +7,15 @@ Uses ParsedLoader to find files, then reads content.
 
 Architecture:
 - Uses parsed_loader.py to discover files
-- Reads JSON content
+- Streams JSON content until the namespace map is found
+  (full load only as fallback)
 - Extracts namespace URIs
 - Returns required taxonomy information
 - Does NOT resolve namespaces to library names (engine's job)
 """
 
 import json
+import re
 from pathlib import Path
 from typing import Set, Dict, Any, List, Optional
 from dataclasses import dataclass
@@ -54,6 +56,15 @@ class ParsedReader:
         'document.namespaces',
     ]
     
+    # Namespace map key (last component of NAMESPACE_SEARCH_PATHS)
+    NAMESPACE_KEY_PATTERN = re.compile(r'"namespaces"\s*:\s*')
+    
+    # Characters read per step while streaming parsed.json
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    # Largest value decoded as a candidate namespace map (characters)
+    MAX_NAMESPACE_MAP_SIZE = 1024 * 1024
+    
     # Standard namespaces to filter out
     STANDARD_NAMESPACES = {
         'http://www.w3.org/2001/XMLSchema',
@@ -110,12 +121,15 @@ class ParsedReader:
         logger.debug(f"{LOG_INPUT} Reading: {json_path}")
         
         try:
-            # Load JSON
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Stream until the namespace map is found
+            namespaces = self._stream_namespaces(json_path)
             
-            # Extract namespaces
-            namespaces = self._extract_namespaces(data)
+            if not namespaces:
+                # Fallback: load JSON and search the whole document
+                logger.debug(f"{LOG_PROCESS} No namespace map while streaming, loading {json_path}")
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                namespaces = self._extract_namespaces(data)
             
             # Filter standard namespaces
             taxonomy_namespaces = self._filter_standard_namespaces(namespaces)
@@ -152,6 +166,71 @@ class ParsedReader:
                 error=str(e)
             )
     
+    def _stream_namespaces(self, json_path: Path) -> Set[str]:
+        """
+        Read parsed.json incrementally and decode only the namespace map.
+        
+        Scans chunks for a "namespaces" key and decodes just its value.
+        Reading stops at the first value that is a non-empty namespace
+        map, so facts after it are never read or parsed.
+        
+        Args:
+            json_path: Path to parsed.json file
+            
+        Returns:
+            Set of namespace URIs (empty if no namespace map was found)
+        """
+        decoder = json.JSONDecoder()
+        buffer = ''
+        position = 0
+        eof = False
+        
+        with open(json_path, 'r', encoding='utf-8') as f:
+            while True:
+                match = self.NAMESPACE_KEY_PATTERN.search(buffer, position)
+                
+                if match and match.end() < len(buffer):
+                    # Key inside a string value is escaped - not a real key
+                    if match.start() > 0 and buffer[match.start() - 1] == '\\':
+                        position = match.end()
+                        continue
+                    
+                    try:
+                        value, _ = decoder.raw_decode(buffer, match.end())
+                    except json.JSONDecodeError:
+                        value = None
+                        complete = eof or len(buffer) - match.end() > self.MAX_NAMESPACE_MAP_SIZE
+                        if not complete:
+                            # Value continues in the next chunk
+                            buffer = buffer[match.start():]
+                            position = 0
+                            chunk = f.read(self.STREAM_CHUNK_SIZE)
+                            eof = not chunk
+                            buffer += chunk
+                            continue
+                    
+                    if isinstance(value, dict):
+                        namespace_uris = {
+                            uri for uri in value.values()
+                            if uri and isinstance(uri, str)
+                        }
+                        if namespace_uris:
+                            return namespace_uris
+                    
+                    position = match.end()
+                    continue
+                
+                if eof:
+                    return set()
+                
+                # Keep the unmatched tail: a key may span two chunks
+                start = match.start() if match else max(position, len(buffer) - 64)
+                buffer = buffer[start:]
+                position = 0
+                chunk = f.read(self.STREAM_CHUNK_SIZE)
+                eof = not chunk
+                buffer += chunk
+    
     def _extract_namespaces(self, data: Dict[str, Any]) -> Set[str]:
         """
         Extract namespace URIs from parsed data.
@@ -7,7 +7,7 @@ Uses TaxonomyLoader to find directories, then verifies content.
 
 Architecture:
 - Uses taxonomy_loader.py to discover directories
-- Counts files in each directory
+- Reads file counts from each directory's inventory manifest
 - Verifies against MIN_FILES_THRESHOLD
 - Returns verification status
 - Informs engine to update database
@@ -20,6 +20,7 @@ from dataclasses import dataclass
 from library.core.config_loader import LibraryConfig
 from library.core.logger import get_logger
 from library.loaders.taxonomy_loader import TaxonomyLoader, TaxonomyLocation
+from library.loaders.library_inventory import LibraryInventory
 from library.constants import (
     LOG_INPUT,
     LOG_PROCESS,
@@ -54,6 +55,7 @@ class TaxonomyReader:
         """Initialize taxonomy reader."""
         self.config = config if config else LibraryConfig()
         self.loader = TaxonomyLoader(self.config)
+        self.inventory = LibraryInventory()
         self.min_files_threshold = self.config.get('library_min_files_threshold')
         
         logger.info(
@@ -189,17 +191,16 @@ class TaxonomyReader:
     
     def _count_files(self, directory: Path) -> int:
         """
-        Count files recursively in directory.
+        Count files in directory using its inventory manifest.
         
         Args:
-            directory: Directory to scan
+            directory: Directory to check
             
         Returns:
             Number of files found
         """
         try:
-            file_count = sum(1 for _ in directory.rglob('*') if _.is_file())
-            return file_count
+            return self.inventory.get_file_count(directory)
         except Exception as e:
             logger.error(f"Error counting files in {directory}: {e}")
             return 0
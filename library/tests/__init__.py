@@ -0,0 +1,6 @@
+# Path: library/tests/__init__.py
+"""
+Library Tests
+
+Run from the repository root: python -m pytest library/tests
+"""
@@ -0,0 +1,71 @@
+# Path: library/tests/test_library_inventory.py
+"""
+Library inventory manifests: validation, atomic writes, read-only libraries.
+"""
+
+from library.constants import LIBRARY_INVENTORY_FILENAME
+from library.loaders.library_inventory import LibraryInventory
+
+
+def _library(tmp_path):
+    directory = tmp_path / 'us-gaap-2024'
+    (directory / 'elts').mkdir(parents=True)
+    (directory / 'elts' / 'us-gaap-2024.xsd').write_text('<schema/>')
+    (directory / 'entry.xsd').write_text('<schema/>')
+    return directory
+
+
+def test_written_manifest_is_current(tmp_path):
+    directory = _library(tmp_path)
+    inventory = LibraryInventory()
+
+    manifest = inventory.write(directory)
+
+    assert manifest.file_count == 2
+    assert (directory / LIBRARY_INVENTORY_FILENAME).is_file()
+    assert inventory.is_current(directory, manifest)
+    assert [p.name for p in directory.iterdir() if p.name.endswith('.tmp')] == []
+
+
+def test_added_file_makes_manifest_stale(tmp_path):
+    directory = _library(tmp_path)
+    inventory = LibraryInventory()
+    inventory.write(directory)
+
+    (directory / 'elts' / 'extra.xml').write_text('<linkbase/>')
+
+    assert inventory.read(directory).file_count == 3
+
+
+def test_downloader_manifest_is_accepted(tmp_path):
+    from downloader.engine.extraction.inventory_writer import InventoryWriter
+
+    directory = _library(tmp_path)
+    written = InventoryWriter().write(directory)
+
+    inventory = LibraryInventory()
+    inventory.build = None  # A rebuild would fail: the manifest must be used as written
+    manifest = inventory.read(directory)
+
+    assert manifest.content_digest == written['content_digest']
+    assert manifest.file_count == written['file_count'] == 2
+
+
+def test_unwritable_manifest_is_kept_in_memory(tmp_path):
+    directory = _library(tmp_path)
+    inventory = LibraryInventory()
+    builds = []
+    build = inventory.build
+    inventory.build = lambda *args, **kwargs: builds.append(1) or build(*args, **kwargs)
+
+    def read_only(*args):
+        raise PermissionError("Read-only file system")
+
+    inventory._write_file = read_only
+
+    first = inventory.read(directory)
+    second = inventory.read(directory)
+
+    assert first.file_count == second.file_count == 2
+    assert len(builds) == 1
+    assert not (directory / LIBRARY_INVENTORY_FILENAME).exists()
@@ -35,6 +35,13 @@ RESPONSIBILITY:
 - Build hypercube-dimension-member hierarchies
 - Validate context dimensions against definitions
 - Organize dimensional facts
+
+PERFORMANCE:
+A handler lives for one filing. Dimensional data of each context is
+extracted once and cached by context id, with hashable signatures built
+up front; signature comparisons replace dict rebuilds on every query.
+Primary items are indexed to their dimensions when the definition
+networks are read.
 """
 
 import logging
@@ -80,11 +87,23 @@ class Hypercube:
 
 @dataclass
 class DimensionalContext:
-    """Extracted dimensional information from a context."""
+    """
+    Extracted dimensional information from a context.
+    
+    signature and members are built once by DimensionHandler:
+    - signature: hashable (explicit pairs, typed pairs), sorted by dimension
+    - members: ('explicit'|'typed', dimension, value) triples for subset tests
+    - signature_key: string form used to group facts ("default" if none)
+    
+    Instances are shared through the handler's cache; treat as read-only.
+    """
     context_id: str
     explicit_dimensions: dict[str, str] = field(default_factory=dict)  # dimension -> member
     typed_dimensions: dict[str, any] = field(default_factory=dict)  # dimension -> value
     has_dimensions: bool = False
+    signature: tuple = ((), ())
+    members: frozenset = frozenset()
+    signature_key: str = "default"
 
 
 class DimensionHandler:
@@ -124,6 +143,12 @@ class DimensionHandler:
         self._hypercubes: dict[str, Hypercube] = {}
         self._dimensions: dict[str, DimensionAxis] = {}
         
+        # Primary item QName -> applicable dimensions (built with structures)
+        self._primary_item_dimensions: dict[str, list[DimensionAxis]] = {}
+        
+        # Context id -> extracted dimensions (contexts are immutable per filing)
+        self._context_cache: dict[str, DimensionalContext] = {}
+        
         if linkbase_set:
             self._build_dimension_structures()
             self.logger.info(
@@ -136,12 +161,18 @@ class DimensionHandler:
         """
         Extract all dimensional information from context.
         
+        Computed once per context id and cached for the handler's filing.
+        
         Args:
             context: XBRL context
             
         Returns:
             DimensionalContext with extracted dimensions
         """
+        cached = self._context_cache.get(context.id) if context.id else None
+        if cached is not None:
+            return cached
+        
         dim_context = DimensionalContext(context_id=context.id)
         
         # Extract from segment
@@ -155,9 +186,17 @@ class DimensionHandler:
         dim_context.has_dimensions = bool(
             dim_context.explicit_dimensions or dim_context.typed_dimensions
         )
+        self._build_signature(dim_context)
+        
+        if context.id:
+            self._context_cache[context.id] = dim_context
         
         return dim_context
     
+    def clear_context_cache(self) -> None:
+        """Forget cached context dimensions (e.g. before reusing for another filing)."""
+        self._context_cache.clear()
+    
     def is_dimensional_fact(self, concept: str, context: Context) -> bool:
         """
         Check if a fact is dimensional.
@@ -191,13 +230,7 @@ class DimensionHandler:
         Returns:
             List of applicable DimensionAxis
         """
-        applicable_dims = []
-        
-        for hypercube in self._hypercubes.values():
-            if concept in hypercube.primary_items:
-                applicable_dims.extend(hypercube.dimensions)
-        
-        return applicable_dims
+        return list(self._primary_item_dimensions.get(concept, []))
     
     def organize_by_dimensions(
         self,
@@ -223,8 +256,8 @@ class DimensionHandler:
             
             dim_context = self.extract_dimensions(context)
             
-            # Create signature from dimensions
-            signature = self._create_dimension_signature(dim_context)
+            # Signature is pre-built with the cached dimensional context
+            signature = dim_context.signature_key
             
             if signature not in organized:
                 organized[signature] = []
@@ -253,18 +286,10 @@ class DimensionHandler:
         dim2 = self.extract_dimensions(context2)
         
         if strict:
-            return (
-                dim1.explicit_dimensions == dim2.explicit_dimensions and
-                dim1.typed_dimensions == dim2.typed_dimensions
-            )
+            return dim1.signature == dim2.signature
         else:
             # Lenient: context1 dimensions subset of context2
-            return (
-                all(k in dim2.explicit_dimensions and v == dim2.explicit_dimensions[k]
-                    for k, v in dim1.explicit_dimensions.items()) and
-                all(k in dim2.typed_dimensions and v == dim2.typed_dimensions[k]
-                    for k, v in dim1.typed_dimensions.items())
-            )
+            return dim1.members <= dim2.members
     
     def get_dimension_value(
         self,
@@ -300,6 +325,19 @@ class DimensionHandler:
         
         for network in self.linkbase_set.definition_networks:
             self._process_definition_network(network)
+        
+        self._build_primary_item_index()
+    
+    def _build_primary_item_index(self) -> None:
+        """Index primary items to the dimensions of their hypercubes."""
+        self._primary_item_dimensions.clear()
+        
+        for hypercube in self._hypercubes.values():
+            for primary_item in hypercube.primary_items:
+                dimensions = self._primary_item_dimensions.setdefault(primary_item, [])
+                for dimension in hypercube.dimensions:
+                    if dimension not in dimensions:
+                        dimensions.append(dimension)
     
     def _process_definition_network(self, network: DefinitionNetwork) -> None:
         """
@@ -367,6 +405,14 @@ class DimensionHandler:
                 self._dimensions[dimension_qname].domain_qname = domain_qname
         
         # Extract domain-member relationships
+        dimensions_by_domain: dict[str, list[DimensionAxis]] = {}
+        for dimension in self._dimensions.values():
+            if dimension.domain_qname:
+                dimensions_by_domain.setdefault(dimension.domain_qname, []).append(dimension)
+        
+        # Also kept as parent -> children to expand primary items below
+        member_children: dict[str, list[str]] = {}
+        
         domain_member_arcs = arcs_by_role.get(DIMENSION_ARCROLES['domain-member'], [])
         for arc in domain_member_arcs:
             domain_locator = arc.get('from')
@@ -375,17 +421,44 @@ class DimensionHandler:
             if not domain_locator or not member_locator:
                 continue
             
+            domain_qname = self._extract_qname_from_locator(domain_locator)
             member_qname = self._extract_qname_from_locator(member_locator)
             
             if not member_qname:
                 continue
             
-            # Find dimension with this domain
-            for dimension in self._dimensions.values():
-                if dimension.domain_qname == self._extract_qname_from_locator(domain_locator):
-                    member = DimensionMember(member_qname=member_qname)
-                    if member not in dimension.members:
-                        dimension.members.append(member)
+            if domain_qname:
+                member_children.setdefault(domain_qname, []).append(member_qname)
+            
+            # Dimensions with this domain
+            for dimension in dimensions_by_domain.get(domain_qname, []):
+                member = DimensionMember(member_qname=member_qname)
+                if member not in dimension.members:
+                    dimension.members.append(member)
+        
+        # Extract primary item -> hypercube relationships (all)
+        all_arcs = arcs_by_role.get(DIMENSION_ARCROLES['all'], [])
+        for arc in all_arcs:
+            primary_qname = self._extract_qname_from_locator(arc.get('from'))
+            hypercube_qname = self._extract_qname_from_locator(arc.get('to'))
+            
+            if not primary_qname or not hypercube_qname:
+                continue
+            
+            if hypercube_qname not in self._hypercubes:
+                self._hypercubes[hypercube_qname] = Hypercube(
+                    hypercube_qname=hypercube_qname
+                )
+            
+            # Primary item and its domain-member descendants (line items)
+            hypercube = self._hypercubes[hypercube_qname]
+            pending = [primary_qname]
+            while pending:
+                item = pending.pop()
+                if item in hypercube.primary_items:
+                    continue
+                hypercube.primary_items.add(item)
+                pending.extend(member_children.get(item, []))
     
     def _extract_qname_from_locator(self, locator: str) -> Optional[str]:
         """
@@ -446,6 +519,39 @@ class DimensionHandler:
             else:
                 dim_context.typed_dimensions[key] = value
     
+    def _build_signature(self, dim_context: DimensionalContext) -> None:
+        """
+        Build hashable signatures of a dimensional context.
+        
+        Args:
+            dim_context: Dimensional context (signature fields set in place)
+        """
+        explicit = tuple(sorted(dim_context.explicit_dimensions.items()))
+        typed = tuple(sorted(
+            ((dim, self._freeze(value)) for dim, value in dim_context.typed_dimensions.items()),
+            key=lambda item: item[0]
+        ))
+        
+        dim_context.signature = (explicit, typed)
+        dim_context.members = frozenset(
+            [('explicit', dim, member) for dim, member in explicit] +
+            [('typed', dim, value) for dim, value in typed]
+        )
+        dim_context.signature_key = self._create_dimension_signature(dim_context)
+    
+    def _freeze(self, value: any) -> any:
+        """Hashable equivalent of a typed dimension value."""
+        if isinstance(value, dict):
+            return tuple(sorted(
+                ((key, self._freeze(item)) for key, item in value.items()),
+                key=lambda item: str(item[0])
+            ))
+        if isinstance(value, (list, tuple)):
+            return tuple(self._freeze(item) for item in value)
+        if isinstance(value, set):
+            return frozenset(self._freeze(item) for item in value)
+        return value
+    
     def _create_dimension_signature(self, dim_context: DimensionalContext) -> str:
         """
         Create unique signature for dimensional context.
@@ -10,6 +10,16 @@ DESIGN PRINCIPLES:
 - Follows company declarations exactly
 - Market and taxonomy agnostic
 
+INDEXES (built once from the linkbase set):
+- children / parents adjacency per (concept, role, linkbase type),
+  children sorted by arc order
+- relationship per (linkbase type, role, from, to)
+- relationship per (role, arcrole, from, to)
+- ancestor paths, cached on first query
+
+Every hop is a dictionary lookup; path queries are O(depth) once and
+O(1) afterwards.
+
 RESPONSIBILITY:
 - Navigate presentation hierarchies
 - Navigate calculation relationships (with weights)
@@ -115,8 +125,13 @@ class RelationshipNavigator:
         self._children_index: dict[tuple[str, str, str], list[str]] = {}  # (concept, role, type) -> children
         self._parents_index: dict[tuple[str, str, str], list[str]] = {}   # (concept, role, type) -> parents
         self._weight_index: dict[tuple[str, str, str], float] = {}        # (parent, child, role) -> weight
+        self._relationship_index: dict[tuple[str, str, str, str], Relationship] = {}  # (type, role, from, to)
+        self._arc_index: dict[tuple[str, str, str, str], Relationship] = {}           # (role, arcrole, from, to)
+        self._path_cache: dict[tuple[str, str, str], list[str]] = {}                  # (concept, role, type) -> path
+        self._cyclic_path_cache: dict[tuple[str, str, str], list[str]] = {}           # paths cut by a cycle
         
         self._build_relationships()
+        self._sort_children()
         
         self.logger.info(
             f"RelationshipNavigator initialized: "
@@ -235,8 +250,7 @@ class RelationshipNavigator:
         Returns:
             True if relationship exists
         """
-        children = self._get_children(parent, role_uri, linkbase_type)
-        return child in children
+        return (linkbase_type, role_uri, parent, child) in self._relationship_index
     
     def get_path_to_root(
         self,
@@ -247,6 +261,9 @@ class RelationshipNavigator:
         """
         Get path from concept to root.
         
+        Follows the first parent at each level. Paths are cached; a walk
+        that reaches a concept with a cached root path reuses it.
+        
         Args:
             concept: Starting concept
             role_uri: Role URI
@@ -255,9 +272,15 @@ class RelationshipNavigator:
         Returns:
             List of concepts from concept to root
         """
+        start_key = (concept, role_uri, linkbase_type)
+        cached = self._path_cache.get(start_key) or self._cyclic_path_cache.get(start_key)
+        if cached is not None:
+            return list(cached)
+        
         path = [concept]
         current = concept
         visited = {concept}
+        reached_root = True
         
         while True:
             parents = self.get_parents(current, role_uri, linkbase_type)
@@ -270,20 +293,39 @@ class RelationshipNavigator:
             
             if parent in visited:
                 # Cycle detected
+                reached_root = False
+                break
+            
+            suffix = self._path_cache.get((parent, role_uri, linkbase_type))
+            if suffix is not None:
+                # Root-terminated paths cannot revisit this walk
+                path.extend(suffix)
                 break
             
             path.append(parent)
             visited.add(parent)
             current = parent
         
-        return path
+        if reached_root:
+            # Every suffix of a root-terminated walk is that concept's path
+            for i, node in enumerate(path):
+                key = (node, role_uri, linkbase_type)
+                if key in self._path_cache:
+                    break
+                self._path_cache[key] = path[i:]
+        else:
+            # Cycle: the path depends on where the walk started
+            self._cyclic_path_cache[start_key] = path
+        
+        return list(path)
     
     def get_relationship(
         self,
         from_concept: str,
         to_concept: str,
         role_uri: str,
-        linkbase_type: str = 'presentation'
+        linkbase_type: str = 'presentation',
+        arcrole: Optional[str] = None
     ) -> Optional[Relationship]:
         """
         Get specific relationship.
@@ -293,23 +335,17 @@ class RelationshipNavigator:
             to_concept: To concept
             role_uri: Role URI
             linkbase_type: Type of linkbase
+            arcrole: Optional arcrole (e.g. a specific definition arcrole)
             
         Returns:
-            Relationship or None
+            Relationship or None (first declared if several match)
         """
-        rels = {
-            'presentation': self._presentation_rels,
-            'calculation': self._calculation_rels,
-            'definition': self._definition_rels
-        }.get(linkbase_type, [])
-        
-        for rel in rels:
-            if (rel.from_concept == from_concept and
-                rel.to_concept == to_concept and
-                rel.role_uri == role_uri):
-                return rel
-        
-        return None
+        if arcrole is not None:
+            return self._arc_index.get((role_uri, arcrole, from_concept, to_concept))
+        
+        return self._relationship_index.get(
+            (linkbase_type, role_uri, from_concept, to_concept)
+        )
     
     def _build_relationships(self) -> None:
         """Build relationship structures from linkbase set."""
@@ -355,7 +391,7 @@ class RelationshipNavigator:
             self._presentation_rels.append(rel)
             
             # Index for fast lookup
-            self._index_relationship(from_concept, to_concept, network.role_uri, 'presentation', rel.order)
+            self._index_relationship(rel, 'presentation')
     
     def _build_from_calculation(self, network: CalculationNetwork) -> None:
         """Build relationships from calculation network."""
@@ -389,7 +425,7 @@ class RelationshipNavigator:
             self._calculation_rels.append(rel)
             
             # Index for fast lookup
-            self._index_relationship(from_concept, to_concept, network.role_uri, 'calculation', rel.order)
+            self._index_relationship(rel, 'calculation')
             
             # Index weight
             if weight is not None:
@@ -425,17 +461,27 @@ class RelationshipNavigator:
             self._definition_rels.append(rel)
             
             # Index for fast lookup
-            self._index_relationship(from_concept, to_concept, network.role_uri, 'definition', rel.order)
+            self._index_relationship(rel, 'definition')
     
     def _index_relationship(
         self,
-        from_concept: str,
-        to_concept: str,
-        role_uri: str,
-        linkbase_type: str,
-        order: Optional[float]
+        rel: Relationship,
+        linkbase_type: str
     ) -> None:
         """Index relationship for fast lookup."""
+        from_concept = rel.from_concept
+        to_concept = rel.to_concept
+        role_uri = rel.role_uri
+        
+        # Relationship lookups (first declaration wins, as a scan would)
+        self._arc_index.setdefault((role_uri, rel.arcrole, from_concept, to_concept), rel)
+        
+        edge_key = (linkbase_type, role_uri, from_concept, to_concept)
+        if edge_key in self._relationship_index:
+            # Repeated arc: adjacency already indexed
+            return
+        self._relationship_index[edge_key] = rel
+        
         # Index children
         key = (from_concept, role_uri, linkbase_type)
         if key not in self._children_index:
@@ -448,6 +494,14 @@ class RelationshipNavigator:
             self._parents_index[key] = []
         self._parents_index[key].append(from_concept)
     
+    def _sort_children(self) -> None:
+        """Sort children by arc order (stable; arcs without order keep position, last)."""
+        for (concept, role_uri, linkbase_type), children in self._children_index.items():
+            def arc_order(child: str) -> tuple[int, float]:
+                order = self._relationship_index[(linkbase_type, role_uri, concept, child)].order
+                return (1, 0.0) if order is None else (0, order)
+            children.sort(key=arc_order)
+    
     def _get_children(
         self,
         concept: str,
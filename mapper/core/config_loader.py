@@ -38,6 +38,10 @@ DEFAULT_FUZZY_MATCHING_THRESHOLD: float = 0.85
 
 # Output Configuration Defaults
 DEFAULT_JSON_INDENT: int = 2
+# Parquet is opt-in (MAPPER_EXPORT_FORMATS=...,parquet): it needs pyarrow
+DEFAULT_EXPORT_FORMATS: str = 'json,csv,excel'
+DEFAULT_EXPORT_MAX_WORKERS: int = 4
+DEFAULT_JSON_LAYOUT: str = 'files'
 
 # Performance & Optimization Defaults
 DEFAULT_MEMORY_CLEANUP_THRESHOLD_MB: int = 3072
@@ -126,6 +130,7 @@ class ConfigLoader:
             # OUTPUT PATHS (WRITE - Mapped Statements)
             # ================================================================
             'output_mapped_dir': self._get_path('MAPPER_OUTPUT_MAPPED_DIR', required=True),
+            'filing_index_path': self._get_path('MAPPER_FILING_INDEX_PATH'),  # Default: output_mapped_dir/.filing_index.json
             
             # ================================================================
             # LOGGING CONFIGURATION
@@ -179,6 +184,9 @@ class ConfigLoader:
             'include_comparison_results': self._get_bool('MAPPER_INCLUDE_COMPARISON_RESULTS', False),
             'json_pretty_print': self._get_bool('MAPPER_JSON_PRETTY_PRINT', True),
             'json_indent': self._get_int('MAPPER_JSON_INDENT', DEFAULT_JSON_INDENT),
+            'export_formats': self._get_list('MAPPER_EXPORT_FORMATS', DEFAULT_EXPORT_FORMATS),
+            'export_max_workers': self._get_int('MAPPER_EXPORT_MAX_WORKERS', DEFAULT_EXPORT_MAX_WORKERS),
+            'json_layout': self._get_env('MAPPER_JSON_LAYOUT', DEFAULT_JSON_LAYOUT).lower(),
             
             # ================================================================
             # PERFORMANCE & OPTIMIZATION
@@ -193,7 +201,8 @@ class ConfigLoader:
             'enable_health_checks': self._get_bool('MAPPER_ENABLE_HEALTH_CHECKS', True),
             'health_check_interval': self._get_int('MAPPER_HEALTH_CHECK_INTERVAL', DEFAULT_HEALTH_CHECK_INTERVAL),
             'enable_metrics': self._get_bool('MAPPER_ENABLE_METRICS', False),
-            'metrics_format': self._get_env('MAPPER_METRICS_FORMAT', 'json'),
+            'metrics_format': self._get_env('MAPPER_METRICS_FORMAT', 'json'),  # json, openmetrics, all
+            'metrics_dir': self._get_path('MAPPER_METRICS_DIR'),  # Default: log_dir/metrics
             
             # ================================================================
             # ADVANCED
@@ -246,6 +255,11 @@ class ConfigLoader:
         except ValueError:
             return default
     
+    def _get_list(self, key: str, default: str) -> list[str]:
+        """Get comma-separated list environment variable (lowercased)."""
+        value = os.getenv(key, default)
+        return [item.strip().lower() for item in value.split(',') if item.strip()]
+    
     def _get_path(self, key: str, required: bool = False) -> Optional[Path]:
         """Get path environment variable."""
         value = os.getenv(key)
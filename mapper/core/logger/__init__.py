@@ -23,16 +23,26 @@ Example:
     # Use loggers
     logger = logging.getLogger('input.parser_output')
     logger.info("Loading parsed.json file")
+    
+    # Hot paths: lazy formatting, structured fields, sampled repeats
+    logger.debug("Extracted %d facts", n, extra={'fields': {'role': role_uri}})
+    sampler = LogSampler(logger)
 """
 
 from ...core.logger.ipo_logging import (
+    StructuredFormatter,
+    STRUCTURED_FIELDS_ATTR,
     setup_ipo_logging,
     get_input_logger,
     get_process_logger,
     get_output_logger
 )
+from ...core.logger.sampling import LogSampler
 
 __all__ = [
+    'StructuredFormatter',
+    'STRUCTURED_FIELDS_ATTR',
+    'LogSampler',
     'setup_ipo_logging',
     'get_input_logger',
     'get_process_logger',
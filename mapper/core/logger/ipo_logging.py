@@ -9,13 +9,30 @@ This module sets up logging with separate files for:
 - PROCESS layer (mapping engine)
 - OUTPUT layer (exporters, reports)
 - Full activity (everything combined)
+
+Structured records:
+Hot paths attach machine-readable fields to a record instead of
+formatting them into the message:
+
+    logger.debug("Extracted %d facts", n, extra={'fields': {'role': uri}})
+
+StructuredFormatter appends the fields as key=value pairs, or writes the
+whole record as one JSON object per line (log_format 'json').
 """
 
+import json
 import logging
 import sys
 from pathlib import Path
 
 
+# Record attribute carrying structured fields (set via extra={'fields': ...})
+STRUCTURED_FIELDS_ATTR = 'fields'
+
+# Line format for text output
+LOG_LINE_FORMAT = '[%(levelname)s] %(name)s - %(message)s'
+
+
 class IPOFilter(logging.Filter):
     """Filter logs by IPO layer prefix."""
     
@@ -52,10 +69,54 @@ class MapperFilter(logging.Filter):
         return record.name.startswith(self.mapper)
 
 
+class StructuredFormatter(logging.Formatter):
+    """
+    Formatter that renders structured fields attached to records.
+
+    Text mode: standard line followed by key=value pairs.
+    JSON mode: one JSON object per record (level, logger, message, fields).
+    """
+
+    def __init__(self, json_output: bool = False):
+        """
+        Initialize formatter.
+
+        Args:
+            json_output: Emit JSON lines instead of text
+        """
+        super().__init__(LOG_LINE_FORMAT)
+        self.json_output = json_output
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format record with its structured fields."""
+        fields = getattr(record, STRUCTURED_FIELDS_ATTR, None)
+
+        if self.json_output:
+            entry = {
+                'time': self.formatTime(record),
+                'level': record.levelname,
+                'logger': record.name,
+                'message': record.getMessage(),
+            }
+            if isinstance(fields, dict):
+                entry.update(fields)
+            if record.exc_info:
+                entry['exception'] = self.formatException(record.exc_info)
+            return json.dumps(entry, default=str)
+
+        line = super().format(record)
+        if isinstance(fields, dict) and fields:
+            pairs = ' '.join(f"{key}={value}" for key, value in fields.items())
+            line = f"{line} | {pairs}"
+        return line
+
+
 def setup_ipo_logging(
     log_dir: Path,
     log_level: str = 'INFO',
-    console_output: bool = True
+    console_output: bool = True,
+    structured: bool = False,
+    log_format: str = 'text'
 ) -> None:
     """
     Set up IPO-aware logging for mapper.
@@ -70,6 +131,8 @@ def setup_ipo_logging(
         log_dir: Directory for log files
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         console_output: Whether to also output to console
+        structured: Write log files as JSON lines when log_format is 'json'
+        log_format: 'json' or 'text' (console output is always text)
         
     Example:
         setup_ipo_logging(
@@ -88,10 +151,11 @@ def setup_ipo_logging(
     # Clear any existing handlers
     root_logger.handlers.clear()
     
-    # Standard format
-    formatter = logging.Formatter(
-        '[%(levelname)s] %(name)s - %(message)s'
+    # Standard format (structured fields appended / JSON lines for files)
+    formatter = StructuredFormatter(
+        json_output=structured and log_format.lower() == 'json'
     )
+    console_formatter = StructuredFormatter()
     
     # Full activity log (everything)
     full_handler = logging.FileHandler(log_dir / 'full_activity.log')
@@ -124,7 +188,7 @@ def setup_ipo_logging(
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(getattr(logging, log_level.upper()))
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(console_formatter)
         root_logger.addHandler(console_handler)
 
 
@@ -180,6 +244,8 @@ def get_output_logger(name: str) -> logging.Logger:
 
 
 __all__ = [
+    'StructuredFormatter',
+    'STRUCTURED_FIELDS_ATTR',
     'setup_ipo_logging',
     'get_input_logger',
     'get_process_logger',
@@ -0,0 +1,122 @@
+# Path: core/logger/sampling.py
+"""
+Log Sampling
+
+Rate limiting for repeated hot-path log messages.
+
+Per-fact and per-concept diagnostics repeat thousands of times per
+filing. LogSampler emits the first few occurrences of each message key,
+then only every Nth, and counts the rest so a single summary record can
+report what was suppressed.
+
+Arguments are formatted lazily by the logging module; a suppressed or
+disabled message costs a dictionary increment.
+
+Example:
+    sampler = LogSampler(logger, first=3, every=500)
+
+    for fact in facts:
+        sampler.log(logging.DEBUG, 'normalize_failed',
+                    "Failed to normalize concept %r: %s", name, error)
+
+    sampler.flush()  # "... suppressed 1204 repeats of 'normalize_failed'"
+"""
+
+import logging
+from typing import Optional
+
+
+# Defaults: first occurrences always logged, then one in every N
+DEFAULT_SAMPLE_FIRST = 5
+DEFAULT_SAMPLE_EVERY = 1000
+
+
+class LogSampler:
+    """
+    Emit the first occurrences of each message key, then every Nth.
+
+    Not thread-safe; use one sampler per worker (extractors and builders
+    already exist per filing).
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        first: int = DEFAULT_SAMPLE_FIRST,
+        every: int = DEFAULT_SAMPLE_EVERY
+    ):
+        """
+        Initialize sampler.
+
+        Args:
+            logger: Logger to emit through
+            first: Occurrences of each key always logged
+            every: After that, log one occurrence in this many (0 = never)
+        """
+        self.logger = logger
+        self.first = first
+        self.every = every
+        self._seen: dict[str, int] = {}
+        self._suppressed: dict[str, int] = {}
+
+    def log(self, level: int, key: str, msg: str, *args, **kwargs) -> bool:
+        """
+        Log message unless sampled out.
+
+        Args:
+            level: Logging level
+            key: Message key (occurrences are counted per key)
+            msg: Message format string (%-style, formatted lazily)
+            *args: Format arguments
+            **kwargs: Passed to Logger.log (e.g. extra)
+
+        Returns:
+            True if the message was emitted
+        """
+        if not self.logger.isEnabledFor(level):
+            return False
+
+        count = self._seen.get(key, 0) + 1
+        self._seen[key] = count
+
+        if count <= self.first or (self.every and count % self.every == 0):
+            self.logger.log(level, msg, *args, **kwargs)
+            return True
+
+        self._suppressed[key] = self._suppressed.get(key, 0) + 1
+        return False
+
+    def suppressed(self, key: Optional[str] = None) -> int:
+        """
+        Number of suppressed messages.
+
+        Args:
+            key: Message key, or None for all keys
+        """
+        if key is None:
+            return sum(self._suppressed.values())
+        return self._suppressed.get(key, 0)
+
+    def flush(self, level: int = logging.DEBUG) -> None:
+        """
+        Log one record per key with suppressed messages, then reset.
+
+        Args:
+            level: Level of the summary records
+        """
+        for key, count in self._suppressed.items():
+            self.logger.log(
+                level,
+                "Sampled log: suppressed %d repeats of %r",
+                count, key,
+                extra={'fields': {'sample_key': key, 'suppressed': count}}
+            )
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all counts."""
+        self._seen.clear()
+        self._suppressed.clear()
+
+
+__all__ = ['LogSampler', 'DEFAULT_SAMPLE_FIRST', 'DEFAULT_SAMPLE_EVERY']
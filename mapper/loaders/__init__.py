@@ -44,6 +44,8 @@ from .filing_analyzer import FilingAnalyzer
 
 # Data source loaders
 from .xbrl_filings import XBRLFilingsLoader
+from .filing_source import DirectoryFilingSource, ArchiveFilingSource
+from .filing_index import FilingDirectoryIndex
 from .taxonomy import TaxonomyLoader
 from .taxonomy_structure_reader import (
     TaxonomyStructureReader,
@@ -94,6 +96,9 @@ __all__ = [
     
     # Source data access
     'XBRLFilingsLoader',
+    'DirectoryFilingSource',
+    'ArchiveFilingSource',
+    'FilingDirectoryIndex',
     'TaxonomyLoader',
     'TaxonomyStructureReader',
     'TaxonomyStructure',
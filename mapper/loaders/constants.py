@@ -33,6 +33,38 @@ FILE_TYPE_PATTERNS = {
     'xsd': ['.xsd'],
 }
 
+# Extensions of XBRL filing content (instance, iXBRL, schema, linkbases)
+FILING_CONTENT_EXTENSIONS = ('.xml', '.xsd', '.xbrl', '.htm', '.html', '.xhtml')
+
+# Archives a filing may be stored as when it was not extracted (the
+# downloader stores any archive type it fetched; matched on the file name
+# end, as '.tar.gz' is not a single suffix)
+FILING_ZIP_EXTENSIONS = ('.zip',)
+FILING_TAR_EXTENSIONS = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+FILING_ARCHIVE_EXTENSIONS = FILING_ZIP_EXTENSIONS + FILING_TAR_EXTENSIONS
+
+# Source record written next to parsed.json (format:
+# parser/output/source_record.py)
+SOURCE_RECORD_FILENAME = 'source.json'
+
+# Filing catalog at the root of the filings tree (format:
+# downloader/engine/filing_catalog.py)
+FILING_CATALOG_FILENAME = '.filing_catalog.jsonl'
+FILING_CATALOG_FORMAT_VERSION = 1
+
+# Catalog 'date' of a filing: first instance file name carrying a YYYYMMDD
+# date, else the filing directory name (the parser names output folders
+# the same way)
+FILING_DATE_PATTERN = r'[-_](\d{8})[._]'
+FILING_DATE_FILE_SUFFIXES = ('.xml', '.htm', '.html')
+
+# Format of the mapper's persisted filing index (loaders/filing_index.py)
+FILING_INDEX_FORMAT_VERSION = 2
+
+# Filing discovery results kept per XBRLFilingsLoader while one filing is
+# mapped (a filing opened by several readers is scanned once)
+DISCOVERY_CACHE_SIZE = 32
+
 # ==============================================================================
 # XBRL SPECIFICATION CONSTANTS (From XBRL 2.1 Spec - Keep)
 # ==============================================================================
@@ -199,6 +231,17 @@ MAX_VALIDATION_WARNINGS = 1000
 __all__ = [
     # File detection
     'FILE_TYPE_PATTERNS',
+    'FILING_CONTENT_EXTENSIONS',
+    'FILING_ZIP_EXTENSIONS',
+    'FILING_TAR_EXTENSIONS',
+    'FILING_ARCHIVE_EXTENSIONS',
+    'SOURCE_RECORD_FILENAME',
+    'FILING_CATALOG_FILENAME',
+    'FILING_CATALOG_FORMAT_VERSION',
+    'FILING_DATE_PATTERN',
+    'FILING_DATE_FILE_SUFFIXES',
+    'FILING_INDEX_FORMAT_VERSION',
+    'DISCOVERY_CACHE_SIZE',
     
     # XBRL Specification Constants
     'XLINK_NAMESPACE',
@@ -0,0 +1,447 @@
+# Path: loaders/filing_index.py
+"""
+Filing Directory Index
+
+Resolves the XBRL filing directory a parsed.json was produced from.
+
+Resolution order (no directory walking when the first two succeed):
+1. Source record next to parsed.json (written by the parser at parse
+   time): exact filing directory
+2. Accession -> directory index: the filing catalog kept by the
+   downloader at the root of the filings tree, merged with the mapper's
+   own persisted index (filings downloaded before the catalog existed
+   are only in the latter)
+3. (company, form) lookup in the same index, taking the filing whose
+   date matches the parsed folder
+
+The mapper's index is built by listing market/company/filings/form/
+accession directories (no file walk) and persisted, so later runs start
+from it. Filing dates missing from it are read from the instance file
+names of the candidates of a lookup only, and persisted with it.
+
+A lookup that misses or finds no filing with the parsed folder's date
+rescans the tree first if the filing catalog or the filings root changed
+since the last scan (the downloader appends to the catalog for every
+filing), or if the index points at a removed directory. Only with an
+index current with the tree is the latest filing of the company and
+form returned in place of a dated match. Filings added while a
+long-running process is up are found through the catalog; without it,
+by the next process or an explicit refresh().
+
+DESIGN PRINCIPLES:
+- NO parsing - just filing locations
+- Filings tree is READ-ONLY (the mapper's index lives in its own location)
+- Market-agnostic
+
+RESPONSIBILITY: Map parsed filings to their source filing directories.
+"""
+
+import json
+import logging
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from .constants import (
+    SOURCE_RECORD_FILENAME,
+    FILING_CATALOG_FILENAME,
+    FILING_DATE_PATTERN,
+    FILING_DATE_FILE_SUFFIXES,
+    FILING_INDEX_FORMAT_VERSION,
+)
+
+
+class FilingDirectoryIndex:
+    """
+    Accession and (company, form) index of the XBRL filings tree.
+
+    Example:
+        index = FilingDirectoryIndex(xbrl_path, index_path)
+        filing_dir = index.resolve(parsed_json_path)
+    """
+
+    def __init__(self, xbrl_path: Path, index_path: Optional[Path] = None):
+        """
+        Initialize index.
+
+        Args:
+            xbrl_path: Root of the XBRL filings tree
+            index_path: Persisted mapper index (None = not persisted)
+        """
+        self.root = Path(xbrl_path)
+        self.catalog_path = self.root / FILING_CATALOG_FILENAME
+        self.index_path = Path(index_path) if index_path else None
+        self.logger = logging.getLogger('input.filing_index')
+
+        self._by_accession: Optional[dict[str, dict]] = None
+        self._by_filing: dict[tuple[str, str], list[dict]] = {}
+        # Scanned records by path (persisted index); catalog records by path
+        self._scanned_records: dict[str, dict] = {}
+        self._catalog_records: dict[str, dict] = {}
+        self._date_pattern = re.compile(FILING_DATE_PATTERN)
+        self._dates_read = False
+        # Catalog and root state at the last scan (None: not scanned);
+        # indexed paths found missing since, so they are not rescanned for
+        self._scan_signature: Optional[tuple] = None
+        self._missing: set[str] = set()
+
+    def resolve(self, parsed_json_path: Path) -> Optional[Path]:
+        """
+        Find source filing directory of a parsed filing.
+
+        Args:
+            parsed_json_path: Path to parsed.json
+                (.../company/form/date/parsed.json)
+
+        Returns:
+            Filing directory, or None if not found
+        """
+        parsed_json_path = Path(parsed_json_path)
+        source = self.read_source_record(parsed_json_path.parent)
+
+        if source:
+            source_path = source.get('source_path')
+            if source_path and Path(source_path).is_dir():
+                self.logger.debug(f"Filing from source record: {source_path}")
+                return Path(source_path)
+
+            accession = source.get('accession')
+            if accession:
+                filing_dir = self.find_by_accession(accession)
+                if filing_dir:
+                    return filing_dir
+
+        parts = parsed_json_path.parts
+        if len(parts) < 4:
+            self.logger.error(f"Invalid path structure: {parsed_json_path}")
+            return None
+
+        # .../company/form/date/parsed.json
+        return self.find(company=parts[-4], form=parts[-3], date=parts[-2])
+
+    def read_source_record(self, parsed_dir: Path) -> Optional[dict]:
+        """
+        Read source record written next to parsed.json.
+
+        Args:
+            parsed_dir: Parsed output folder
+
+        Returns:
+            Record, or None if absent or unreadable
+        """
+        record_file = Path(parsed_dir) / SOURCE_RECORD_FILENAME
+
+        try:
+            with open(record_file, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Cannot read source record {record_file}: {e}")
+            return None
+
+        return record if isinstance(record, dict) else None
+
+    def find_by_accession(self, accession: str) -> Optional[Path]:
+        """
+        Look up filing directory by accession.
+
+        Args:
+            accession: Accession (directory name)
+
+        Returns:
+            Filing directory, or None if not indexed
+        """
+        record = self._lookup(lambda current: self._by_accession.get(accession))
+        return self._path(record) if record else None
+
+    def find(self, company: str, form: str, date: Optional[str] = None) -> Optional[Path]:
+        """
+        Look up filing directory by company and form.
+
+        Args:
+            company: Company folder name (parser output naming)
+            form: Form type directory name
+            date: Parsed folder date (YYYY-MM-DD); a filing with this date
+                is required unless the index is current with the tree
+
+        Returns:
+            Filing directory, or None if not indexed
+        """
+        def select(current: bool) -> Optional[dict]:
+            candidates = self._by_filing.get((_company_key(company), form), [])
+            if not candidates:
+                return None
+            if date:
+                dated = [r for r in candidates if self._date(r) == date]
+                if dated:
+                    return _latest(dated)
+                if not current:
+                    return None
+                self.logger.warning(
+                    f"No {company}/{form} filing dated {date}, using latest filing"
+                )
+            return _latest(candidates)
+
+        record = self._lookup(select)
+
+        if record is None:
+            self.logger.error(f"Could not find XBRL filing for {company}/{form}")
+            return None
+
+        filing_dir = self._path(record)
+        self.logger.info(f"Found XBRL filing: {filing_dir}")
+        return filing_dir
+
+    def refresh(self) -> int:
+        """
+        Rebuild index from the filings tree and persist it.
+
+        The filing catalog is re-read; dates already known for a filing
+        directory are kept.
+
+        Returns:
+            Number of filings indexed
+        """
+        self._catalog_records = self._read_catalog() or {}
+        if self._by_accession is None:
+            self._scanned_records = self._read_index() or {}
+
+        known = self._scanned_records
+        # Taken before the scan: changes made during it trigger another
+        self._scan_signature = self._tree_signature()
+        self._missing = set()
+        records = self._scan()
+        for path, record in records.items():
+            if path in known and known[path].get('date'):
+                record['date'] = known[path]['date']
+
+        self._scanned_records = records
+        self._index_records()
+        self._save()
+        return len(records)
+
+    def _lookup(self, select) -> Optional[dict]:
+        """Run lookup, rescanning if it misses and the tree changed since the last scan."""
+        if self._by_accession is None:
+            self._load()
+
+        record = self._select(select, current=False)
+        if record is not None and self._path(record).is_dir():
+            return record
+
+        removed = record is not None and record['path'] not in self._missing
+        if removed or self._scan_signature != self._tree_signature():
+            self.logger.info("Filing index miss, rescanning filings tree")
+            self.refresh()
+        else:
+            self.logger.debug("Filing index miss, filings tree unchanged since last scan")
+
+        record = self._select(select, current=True)
+        if record is None:
+            return None
+        if not self._path(record).is_dir():
+            # Still indexed (e.g. by the catalog) after the rescan
+            self._missing.add(record['path'])
+            return None
+        return record
+
+    def _select(self, select, current: bool) -> Optional[dict]:
+        """Run selector, persisting dates it read from the tree."""
+        self._dates_read = False
+        record = select(current)
+        if self._dates_read:
+            self._save()
+        return record
+
+    def _load(self) -> None:
+        """Load catalog and persisted index records, or scan the tree."""
+        index_records = self._read_index()
+
+        if index_records is None:
+            self.refresh()
+            return
+
+        self._catalog_records = self._read_catalog() or {}
+        self._scanned_records = index_records
+        self._index_records()
+        self.logger.info(
+            f"Filing index loaded: {len(self._catalog_records)} cataloged, "
+            f"{len(index_records)} scanned filings"
+        )
+
+    def _index_records(self) -> None:
+        """Build lookup dictionaries (catalog records win per path)."""
+        self._by_accession = {}
+        self._by_filing = {}
+
+        merged = {**self._scanned_records, **self._catalog_records}
+        for record in merged.values():
+            # Catalog accessions may be formatted differently from the
+            # directory name the parser records; index both
+            for accession in (record.get('accession'), Path(record['path']).name):
+                if accession:
+                    self._by_accession[accession] = record
+            key = (_company_key(record.get('company') or ''), record.get('form') or '')
+            self._by_filing.setdefault(key, []).append(record)
+
+    def _date(self, record: dict) -> Optional[str]:
+        """Catalog date of a record, read from its instance file names if unknown."""
+        if not record.get('date'):
+            record['date'] = self._filing_date(self._path(record))
+            self._dates_read = True
+        return record['date']
+
+    def _filing_date(self, filing_dir: Path) -> str:
+        """First dated instance file name, else the directory name."""
+        # Instance files sit at the top of extracted filings; walk the
+        # subdirectories only if none is there
+        for files in (filing_dir.glob('*'), filing_dir.rglob('*')):
+            for f in files:
+                if f.suffix in FILING_DATE_FILE_SUFFIXES and f.is_file():
+                    match = self._date_pattern.search(f.name)
+                    if match:
+                        d = match.group(1)
+                        return f"{d[0:4]}-{d[4:6]}-{d[6:8]}"
+
+        return filing_dir.name
+
+    def _tree_signature(self) -> tuple:
+        """State of the filing catalog and the filings root."""
+        return (_stat_signature(self.catalog_path), _stat_signature(self.root))
+
+    def _read_catalog(self) -> Optional[dict[str, dict]]:
+        """Filing catalog records by path (last record per path wins)."""
+        records: dict[str, dict] = {}
+
+        try:
+            with open(self.catalog_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict) and record.get('path'):
+                        records[record['path']] = record
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.warning(f"Cannot read filing catalog {self.catalog_path}: {e}")
+            return None
+
+        return records
+
+    def _read_index(self) -> Optional[dict[str, dict]]:
+        """Persisted mapper index records by path, for this filings root."""
+        if self.index_path is None:
+            return None
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Cannot read filing index {self.index_path}: {e}")
+            return None
+
+        if (
+            not isinstance(data, dict)
+            or data.get('format_version') != FILING_INDEX_FORMAT_VERSION
+            or data.get('root') != str(self.root)
+        ):
+            return None
+
+        return {
+            r['path']: r for r in data.get('filings', [])
+            if isinstance(r, dict) and r.get('path')
+        }
+
+    def _save(self) -> None:
+        """Persist scanned records (atomic)."""
+        if self.index_path is None:
+            return
+
+        data = {
+            'format_version': FILING_INDEX_FORMAT_VERSION,
+            'root': str(self.root),
+            'indexed_at': datetime.now(timezone.utc).isoformat(),
+            'filings': list(self._scanned_records.values()),
+        }
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            tmp_path.replace(self.index_path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            self.logger.warning(f"Cannot write filing index {self.index_path}: {e}")
+
+    def _scan(self) -> dict[str, dict]:
+        """List market/company/filings/form/accession directories."""
+        from ..mapping.constants import FILINGS_SUBDIRECTORY
+
+        records = {}
+
+        for market_dir in _subdirectories(self.root):
+            for company_dir in _subdirectories(market_dir):
+                filings_dir = company_dir / FILINGS_SUBDIRECTORY
+                for form_dir in _subdirectories(filings_dir):
+                    for filing_dir in _subdirectories(form_dir):
+                        path = filing_dir.relative_to(self.root).as_posix()
+                        records[path] = {
+                            'market': market_dir.name,
+                            'company': company_dir.name,
+                            'form': form_dir.name,
+                            'date': None,
+                            'accession': filing_dir.name,
+                            'path': path,
+                        }
+
+        self.logger.info(f"Filing index scanned: {len(records)} filings under {self.root}")
+        return records
+
+    def _path(self, record: dict) -> Path:
+        """Absolute filing directory of a record."""
+        return self.root / record['path']
+
+
+def _subdirectories(directory: Path) -> list[Path]:
+    """Non-hidden subdirectories (empty if directory is missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                Path(entry.path) for entry in entries
+                if not entry.name.startswith('.') and entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        return []
+
+
+def _stat_signature(path: Path) -> Optional[tuple[int, int]]:
+    """Modification time and size of a path (None if missing)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _latest(records: list[dict]) -> dict:
+    """Record with the highest accession."""
+    return max(records, key=lambda r: r.get('accession') or '')
+
+
+def _company_key(company: str) -> str:
+    """Company name as the parser names output folders."""
+    return company.replace(" ", "_").replace(",", "").replace(".", "")
+
+
+__all__ = ['FilingDirectoryIndex']
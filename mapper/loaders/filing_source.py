@@ -0,0 +1,193 @@
+# Path: loaders/filing_source.py
+"""
+Filing Source
+
+Read access to the files of one XBRL filing, wherever they are stored:
+- DirectoryFilingSource: extracted filing directory (files on disk)
+- ArchiveFilingSource: filing archive(s) stored without extraction
+
+Archive members are served straight from the archive. The ZIP central
+directory (or the tar member headers) is read once when the source is
+opened and kept as a name -> member index; nothing is written to disk.
+Members of compressed tars are decompressed from the start of the stream
+on each open, so a filing read often is better stored as ZIP or
+extracted.
+
+Files are identified by Path. For archives this is a virtual path
+(archive path / member name), so callers can keep reporting and
+collecting Paths without knowing where the bytes come from.
+
+DESIGN PRINCIPLES:
+- NO parsing or interpretation - just listing and opening
+- Callers select files by extension, same as with directory walks
+- Market-agnostic
+
+RESPONSIBILITY: List and open filing files. That's it.
+"""
+
+import logging
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional, Union
+
+from .constants import FILING_TAR_EXTENSIONS
+
+
+class DirectoryFilingSource:
+    """
+    Filing files in an extracted directory.
+
+    Example:
+        with DirectoryFilingSource(filing_dir, files) as filing:
+            for path in filing.list_files(['.xml']):
+                with filing.open(path) as f:
+                    tree = ET.parse(f)
+    """
+
+    def __init__(self, directory: Path, files: list[Path]):
+        """
+        Initialize directory source.
+
+        Args:
+            directory: Filing directory
+            files: Files discovered below directory
+        """
+        self.location = directory
+        self._files = files
+
+    def list_files(self, extensions: Optional[Iterable[str]] = None) -> list[Path]:
+        """
+        List filing files, optionally by extension.
+
+        Args:
+            extensions: Lowercase extensions to keep (e.g. ['.xml']), None for all
+
+        Returns:
+            List of file paths
+        """
+        if extensions is None:
+            return list(self._files)
+
+        wanted = tuple(extensions)
+        return [f for f in self._files if f.suffix.lower() in wanted]
+
+    def open(self, path: Path) -> BinaryIO:
+        """Open filing file for binary reading."""
+        return open(path, 'rb')
+
+    def close(self) -> None:
+        """Nothing to release for directories."""
+
+    def __enter__(self) -> 'DirectoryFilingSource':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class ArchiveFilingSource:
+    """
+    Filing files served from stored ZIP or tar archives without extraction.
+
+    Example:
+        with ArchiveFilingSource([filing_dir / 'filing.zip']) as filing:
+            for path in filing.list_files(['.xsd']):
+                with filing.open(path) as f:
+                    tree = ET.parse(f)
+    """
+
+    def __init__(self, archives: list[Path], max_file_size: Optional[int] = None):
+        """
+        Open archives and index their members.
+
+        Args:
+            archives: ZIP or tar archives holding the filing
+            max_file_size: Skip members larger than this (uncompressed bytes)
+        """
+        self.logger = logging.getLogger('input.filing_source')
+        self.location = archives[0].parent if archives else None
+
+        self._archives: list[Union[zipfile.ZipFile, tarfile.TarFile]] = []
+        self._index: dict[Path, tuple] = {}
+
+        for archive_path in archives:
+            try:
+                if archive_path.name.lower().endswith(FILING_TAR_EXTENSIONS):
+                    archive = tarfile.open(archive_path, 'r:*')
+                    members = [
+                        (info, info.name, info.size)
+                        for info in archive.getmembers() if info.isfile()
+                    ]
+                else:
+                    archive = zipfile.ZipFile(archive_path, 'r')
+                    members = [
+                        (info, info.filename, info.file_size)
+                        for info in archive.infolist() if not info.is_dir()
+                    ]
+            except (OSError, EOFError, zipfile.BadZipFile, tarfile.TarError) as e:
+                self.logger.warning(f"Cannot open filing archive {archive_path}: {e}")
+                continue
+
+            self._archives.append(archive)
+
+            for info, name, size in members:
+                if max_file_size is not None and size > max_file_size:
+                    self.logger.warning(f"Skipping large archive member: {name}")
+                    continue
+                self._index[archive_path / name] = (archive, info)
+
+        self.logger.info(
+            f"Indexed {len(self._index)} members from {len(self._archives)} filing archive(s)"
+        )
+
+    def list_files(self, extensions: Optional[Iterable[str]] = None) -> list[Path]:
+        """
+        List archive members as virtual paths, optionally by extension.
+
+        Args:
+            extensions: Lowercase extensions to keep (e.g. ['.xml']), None for all
+
+        Returns:
+            List of virtual member paths (archive path / member name)
+        """
+        if extensions is None:
+            return list(self._index)
+
+        wanted = tuple(extensions)
+        return [p for p in self._index if p.suffix.lower() in wanted]
+
+    def open(self, path: Path) -> BinaryIO:
+        """
+        Open archive member for binary reading (decompressed on the fly).
+
+        Args:
+            path: Virtual member path from list_files()
+
+        Raises:
+            FileNotFoundError: If path is not a member of the archives
+        """
+        entry = self._index.get(path)
+        if entry is None:
+            raise FileNotFoundError(f"Not in filing archive: {path}")
+
+        archive, info = entry
+        if isinstance(archive, tarfile.TarFile):
+            return archive.extractfile(info)
+        return archive.open(info, 'r')
+
+    def close(self) -> None:
+        """Close archive handles."""
+        for archive in self._archives:
+            archive.close()
+        self._archives = []
+        self._index = {}
+
+    def __enter__(self) -> 'ArchiveFilingSource':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+__all__ = ['DirectoryFilingSource', 'ArchiveFilingSource']
@@ -5,7 +5,8 @@ Linkbase Locator and Reader
 Discovers and reads XBRL linkbase files from company filings.
 
 DESIGN PRINCIPLES:
-- Uses XBRLFilingsLoader for file access (NO direct file system access)
+- Uses XBRLFilingsLoader for file access (NO direct file system access);
+  reads extracted directories and stored archives alike
 - Discovers linkbase types by reading XML content (NO filename patterns)
 - NO hardcoded concept names or role URIs
 - Market and taxonomy agnostic
@@ -26,7 +27,7 @@ NOT RESPONSIBLE FOR:
 import logging
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 from dataclasses import dataclass, field
 
 from ..loaders.xbrl_filings import XBRLFilingsLoader
@@ -117,22 +118,22 @@ class LinkbaseLocator:
         """
         self.logger.info(f"Discovering linkbases in: {filing_subdirectory}")
         
-        # Get all files in filing directory
-        all_files = self.xbrl_loader.discover_all_files(subdirectory=filing_subdirectory)
-        
-        # Filter to XML files only
-        xml_files = [f for f in all_files if f.suffix.lower() == '.xml']
-        
-        self.logger.info(f"Found {len(xml_files)} XML files to examine")
-        
         linkbase_set = LinkbaseSet()
         
-        # Examine each XML file to discover linkbases
-        for xml_file in xml_files:
-            try:
-                self._examine_xml_file(xml_file, linkbase_set)
-            except Exception as e:
-                self.logger.warning(f"Could not read {xml_file.name}: {e}")
+        # Filing files come from the directory or the stored archive
+        with self.xbrl_loader.open_filing(filing_subdirectory) as filing:
+            # Filter to XML files only
+            xml_files = filing.list_files(['.xml'])
+            
+            self.logger.info(f"Found {len(xml_files)} XML files to examine")
+            
+            # Examine each XML file to discover linkbases
+            for xml_file in xml_files:
+                try:
+                    with filing.open(xml_file) as f:
+                        self._examine_xml_file(xml_file, linkbase_set, f)
+                except Exception as e:
+                    self.logger.warning(f"Could not read {xml_file.name}: {e}")
         
         self.logger.info(
             f"Discovery complete: "
@@ -144,16 +145,22 @@ class LinkbaseLocator:
         
         return linkbase_set
     
-    def _examine_xml_file(self, xml_file: Path, linkbase_set: LinkbaseSet) -> None:
+    def _examine_xml_file(
+        self,
+        xml_file: Path,
+        linkbase_set: LinkbaseSet,
+        stream: Optional[BinaryIO] = None
+    ) -> None:
         """
         Examine XML file to determine if it's a linkbase and extract content.
         
         Args:
-            xml_file: Path to XML file
+            xml_file: Path to XML file (virtual path for archive members)
             linkbase_set: LinkbaseSet to populate
+            stream: Open file to read instead of xml_file
         """
         try:
-            tree = ET.parse(xml_file)
+            tree = ET.parse(stream if stream is not None else xml_file)
             root = tree.getroot()
             
             # Discover namespaces from the actual file
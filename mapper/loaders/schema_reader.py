@@ -27,7 +27,7 @@ NOT RESPONSIBLE FOR:
 import logging
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 from dataclasses import dataclass, field
 
 from ..loaders.xbrl_filings import XBRLFilingsLoader
@@ -126,30 +126,32 @@ class SchemaReader:
         # Create schema set
         schema_set = SchemaSet()
         
-        # Discover all files in filing directory
+        # Open filing (extracted directory or stored archive)
         try:
-            all_files = self.xbrl_loader.discover_all_files(filing_subdirectory)
+            filing = self.xbrl_loader.open_filing(filing_subdirectory)
         except FileNotFoundError as e:
             self.logger.error(f"Filing directory not found: {e}")
             raise
         
-        # Filter for schema files (.xsd extension)
-        schema_files = [f for f in all_files if f.suffix.lower() == '.xsd']
-        
-        if not schema_files:
-            self.logger.warning(f"No schema files found in {filing_subdirectory}")
-            return schema_set
-        
-        self.logger.info(f"Found {len(schema_files)} schema files")
-        schema_set.schema_files = schema_files
-        
-        # Read each schema file
-        for schema_file in schema_files:
-            try:
-                self._read_schema_file(schema_file, schema_set)
-            except Exception as e:
-                self.logger.error(f"Error reading schema {schema_file}: {e}")
-                continue
+        with filing:
+            # Filter for schema files (.xsd extension)
+            schema_files = filing.list_files(['.xsd'])
+            
+            if not schema_files:
+                self.logger.warning(f"No schema files found in {filing_subdirectory}")
+                return schema_set
+            
+            self.logger.info(f"Found {len(schema_files)} schema files")
+            schema_set.schema_files = schema_files
+            
+            # Read each schema file
+            for schema_file in schema_files:
+                try:
+                    with filing.open(schema_file) as f:
+                        self._read_schema_file(schema_file, schema_set, f)
+                except Exception as e:
+                    self.logger.error(f"Error reading schema {schema_file}: {e}")
+                    continue
         
         self.logger.info(
             f"Schema reading completed: "
@@ -185,18 +187,24 @@ class SchemaReader:
         """
         return schema_set.element_definitions.get(qname)
     
-    def _read_schema_file(self, schema_file: Path, schema_set: SchemaSet) -> None:
+    def _read_schema_file(
+        self,
+        schema_file: Path,
+        schema_set: SchemaSet,
+        stream: Optional[BinaryIO] = None
+    ) -> None:
         """
         Read a single schema file and extract definitions.
         
         Args:
-            schema_file: Path to schema file
+            schema_file: Path to schema file (virtual path for archive members)
             schema_set: SchemaSet to populate
+            stream: Open file to read instead of schema_file
         """
         self.logger.debug(f"Reading schema: {schema_file.name}")
         
         try:
-            tree = ET.parse(schema_file)
+            tree = ET.parse(stream if stream is not None else schema_file)
             root = tree.getroot()
         except ET.ParseError as e:
             self.logger.error(f"XML parse error in {schema_file}: {e}")
@@ -14,14 +14,29 @@ DESIGN PRINCIPLES:
 RESPONSIBILITY: Provide access to XBRL files. That's it.
 Calling mechanisms decide what to do with the files.
 
+Filings may be stored extracted (directory) or as the downloaded archive
+(no extraction). open_filing() returns a filing source for either, so
+readers do not walk the directory themselves.
+
+Discovery results are cached per loader: the schema reader and linkbase
+locator open the same filing during one mapping, and the directory is
+listed once (os.scandir, no per-entry stat for type checks).
+
 DOORKEEPER: Single entry point for XBRL filing file access.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Optional
 
 from ..core.config_loader import ConfigLoader
+from .filing_source import DirectoryFilingSource, ArchiveFilingSource
+from .constants import (
+    FILING_CONTENT_EXTENSIONS,
+    FILING_ARCHIVE_EXTENSIONS,
+    DISCOVERY_CACHE_SIZE,
+)
 
 
 class XBRLFilingsLoader:
@@ -54,6 +69,10 @@ class XBRLFilingsLoader:
             )
         
         self.logger = logging.getLogger('input.xbrl_filings')
+        
+        # (search directory, depth) -> discovered files, oldest first
+        self._discovery_cache: dict[tuple[Path, int], list[Path]] = {}
+        
         self.logger.info(f"XBRLFilingsLoader initialized: {self.xbrl_path}")
     
     def discover_all_files(
@@ -66,6 +85,10 @@ class XBRLFilingsLoader:
         
         NO filtering - returns everything. Caller decides what to use.
         
+        Filing (subdirectory) results are cached until clear_cache(); a
+        discovery of the whole XBRL root is never cached, as the tree
+        keeps growing under a long-running process.
+        
         Args:
             subdirectory: Optional subdirectory to search in
             max_depth: Optional depth limit (default: 25)
@@ -80,13 +103,63 @@ class XBRLFilingsLoader:
         
         depth = max_depth if max_depth is not None else self.MAX_DEPTH
         
+        cache_key = (search_dir, depth)
+        cached = self._discovery_cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug(f"File discovery cached: {search_dir} ({len(cached)} files)")
+            return list(cached)
+        
         self.logger.info(f"File discovery started: {search_dir} (max depth: {depth})")
         
         files = self._recursive_discover(search_dir, current_depth=0, max_depth=depth)
         
         self.logger.info(f"File discovery completed: {len(files)} files found")
         
-        return files
+        if not subdirectory:
+            return files
+        
+        if len(self._discovery_cache) >= DISCOVERY_CACHE_SIZE:
+            self._discovery_cache.pop(next(iter(self._discovery_cache)))
+        self._discovery_cache[cache_key] = files
+        
+        return list(files)
+    
+    def clear_cache(self) -> None:
+        """Forget cached discovery results (called before each filing is mapped)."""
+        self._discovery_cache.clear()
+    
+    def open_filing(self, subdirectory: str):
+        """
+        Open a filing for reading, extracted or archived.
+        
+        A filing whose directory holds no XBRL content but holds archive(s)
+        (stored without extraction), or a path that is itself an archive,
+        is served from the archive's central directory without extracting.
+        
+        Args:
+            subdirectory: Filing path relative to XBRL root (or absolute)
+            
+        Returns:
+            DirectoryFilingSource or ArchiveFilingSource (use as context manager)
+            
+        Raises:
+            FileNotFoundError: If filing does not exist
+        """
+        filing_path = self.xbrl_path / subdirectory
+        
+        if filing_path.is_file() and filing_path.name.lower().endswith(FILING_ARCHIVE_EXTENSIONS):
+            return ArchiveFilingSource([filing_path], max_file_size=self.MAX_FILE_SIZE)
+        
+        files = self.discover_all_files(subdirectory=subdirectory)
+        
+        has_content = any(f.suffix.lower() in FILING_CONTENT_EXTENSIONS for f in files)
+        archives = sorted(f for f in files if f.name.lower().endswith(FILING_ARCHIVE_EXTENSIONS))
+        
+        if not has_content and archives:
+            self.logger.info(f"Reading filing from archive (not extracted): {filing_path}")
+            return ArchiveFilingSource(archives, max_file_size=self.MAX_FILE_SIZE)
+        
+        return DirectoryFilingSource(filing_path, files)
     
     def get_filing_directory(self, relative_path: str) -> Path:
         """
@@ -135,24 +208,27 @@ class XBRLFilingsLoader:
         discovered = []
         
         try:
-            for item in directory.iterdir():
-                if item.is_symlink():
-                    continue
-                
-                if item.is_dir():
-                    discovered.extend(
-                        self._recursive_discover(item, current_depth + 1, max_depth)
-                    )
-                
-                elif item.is_file():
-                    try:
-                        if item.stat().st_size > self.MAX_FILE_SIZE:
-                            self.logger.warning(f"Skipping large file: {item}")
-                            continue
-                    except OSError:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_symlink():
                         continue
                     
-                    discovered.append(item)
+                    item = Path(entry.path)
+                    
+                    if entry.is_dir(follow_symlinks=False):
+                        discovered.extend(
+                            self._recursive_discover(item, current_depth + 1, max_depth)
+                        )
+                    
+                    elif entry.is_file(follow_symlinks=False):
+                        try:
+                            if entry.stat(follow_symlinks=False).st_size > self.MAX_FILE_SIZE:
+                                self.logger.warning(f"Skipping large file: {item}")
+                                continue
+                        except OSError:
+                            continue
+                        
+                        discovered.append(item)
         
         except PermissionError:
             self.logger.warning(f"Permission denied: {directory}")
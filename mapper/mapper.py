@@ -28,6 +28,9 @@ from .core.logger.ipo_logging import setup_ipo_logging
 # Statement extraction orchestrator
 from .mapping.orchestrator import MappingOrchestrator
 
+# Per-run metrics report
+from .observability.instrumentation import configure_instrumentation
+
 
 def main():
     """Main CLI workflow."""
@@ -44,8 +47,10 @@ def main():
     
     setup_ipo_logging(
         log_dir=log_dir,
-        log_level='INFO',
-        console_output=True
+        log_level=config.get('log_level', 'INFO'),
+        console_output=True,
+        structured=config.get('structured_logging', False),
+        log_format=config.get('log_format', 'text')
     )
     
     logger = logging.getLogger(__name__)
@@ -94,8 +99,12 @@ def main():
         
         orchestrator = MappingOrchestrator(config=config)
         
+        instrumentation = configure_instrumentation(config, run_name='mapper')
         start_time = datetime.now()
-        result = orchestrator.extract_and_export(parsed_json_path=parsed_json_path)
+        try:
+            result = orchestrator.extract_and_export(parsed_json_path=parsed_json_path)
+        finally:
+            instrumentation.write_report()
         total_time = (datetime.now() - start_time).total_seconds()
         
         print(f"\nExtraction completed in {total_time:.2f} seconds")
@@ -124,6 +133,8 @@ def main():
         
         print(f"\nPerformance:")
         print(f"  Processing time: {total_time:.2f} seconds")
+        for format_type, seconds in stats.get('export_timings', {}).items():
+            print(f"  {format_type.upper()} export: {seconds:.2f} seconds")
         
         print("\n" + "=" * 80)
         print("EXTRACTION COMPLETE")
@@ -118,8 +118,41 @@ OUTPUT_FORMAT_DIRECTORIES: list[str] = [
     'json',
     'csv',
     'excel',
+    'parquet',
 ]
 
+# Export formats handled by MappingOrchestrator._export_statements
+# (each format writes into the directory of the same name)
+EXPORT_FORMAT_JSON: str = 'json'
+EXPORT_FORMAT_CSV: str = 'csv'
+EXPORT_FORMAT_EXCEL: str = 'excel'
+EXPORT_FORMAT_PARQUET: str = 'parquet'
+
+# Formats whose failure (e.g. missing optional library) never fails a filing
+OPTIONAL_EXPORT_FORMATS: list[str] = [
+    EXPORT_FORMAT_EXCEL,
+    EXPORT_FORMAT_PARQUET,
+]
+
+# JSON statement layout (MAPPER_JSON_LAYOUT)
+# - files:  one JSON file per statement under core_statements/details/other
+# - bundle: one indexed bundle file per filing (see output/statement_bundle.py)
+# - both:   write both layouts
+JSON_LAYOUT_FILES: str = 'files'
+JSON_LAYOUT_BUNDLE: str = 'bundle'
+JSON_LAYOUT_BOTH: str = 'both'
+JSON_LAYOUTS: list[str] = [JSON_LAYOUT_FILES, JSON_LAYOUT_BUNDLE, JSON_LAYOUT_BOTH]
+
+# Statement bundle file (written in the json/ format directory)
+STATEMENT_BUNDLE_FILENAME: str = 'MAPPED_STATEMENTS.bundle'
+STATEMENT_BUNDLE_MAGIC: bytes = b'MPBUNDLE'
+STATEMENT_BUNDLE_VERSION: int = 1
+
+# Statement folders (by classification category) inside json/csv/excel
+STATEMENT_FOLDER_CORE: str = 'core_statements'
+STATEMENT_FOLDER_DETAILS: str = 'details'
+STATEMENT_FOLDER_OTHER: str = 'other'
+
 # Directory patterns to ignore when searching
 IGNORE_DIRECTORY_PATTERNS: list[str] = [
     '.',      # Hidden directories
@@ -131,6 +164,10 @@ IGNORE_DIRECTORY_PATTERNS: list[str] = [
 # Standard subdirectory name for filings
 FILINGS_SUBDIRECTORY: str = 'filings'
 
+# Persisted accession -> filing directory index (in output_mapped_dir
+# unless MAPPER_FILING_INDEX_PATH is set)
+FILING_INDEX_FILENAME: str = '.filing_index.json'
+
 # ============================================================================
 # DATE HANDLING (Universal - Keep)
 # ============================================================================
@@ -383,8 +420,24 @@ __all__ = [
     
     # Output Configuration
     'OUTPUT_FORMAT_DIRECTORIES',
+    'EXPORT_FORMAT_JSON',
+    'EXPORT_FORMAT_CSV',
+    'EXPORT_FORMAT_EXCEL',
+    'EXPORT_FORMAT_PARQUET',
+    'OPTIONAL_EXPORT_FORMATS',
+    'JSON_LAYOUT_FILES',
+    'JSON_LAYOUT_BUNDLE',
+    'JSON_LAYOUT_BOTH',
+    'JSON_LAYOUTS',
+    'STATEMENT_BUNDLE_FILENAME',
+    'STATEMENT_BUNDLE_MAGIC',
+    'STATEMENT_BUNDLE_VERSION',
+    'STATEMENT_FOLDER_CORE',
+    'STATEMENT_FOLDER_DETAILS',
+    'STATEMENT_FOLDER_OTHER',
     'IGNORE_DIRECTORY_PATTERNS',
     'FILINGS_SUBDIRECTORY',
+    'FILING_INDEX_FILENAME',
     
     # Date Handling
     'DATE_SEPARATORS',
@@ -138,7 +138,7 @@ class NetworkClassifier:
             if role_uri in self.schema_set.role_definitions:
                 role_def = self.schema_set.role_definitions[role_uri]
                 if role_def.definition:
-                    self.logger.debug(f"Found role in schema: {role_uri}")
+                    self.logger.debug("Found role in schema: %s", role_uri)
                     return role_def.definition, "schema_definition"
         
         # SOURCE 2: Check linkbase files second (SECONDARY)
@@ -146,11 +146,11 @@ class NetworkClassifier:
             if role_uri in self.linkbase_set.role_definitions:
                 role_def = self.linkbase_set.role_definitions[role_uri]
                 if role_def.definition:
-                    self.logger.debug(f"Found role in linkbase: {role_uri}")
+                    self.logger.debug("Found role in linkbase: %s", role_uri)
                     return role_def.definition, "linkbase_definition"
         
         # Not found in any source
-        self.logger.debug(f"No role definition found: {role_uri}")
+        self.logger.debug("No role definition found: %s", role_uri)
         return None, "not_found"
     
     def _classify_from_role_definition(
@@ -230,7 +230,7 @@ class NetworkClassifier:
         Returns:
             NetworkClassification with source tracking
         """
-        self.logger.debug(f"Classifying network: {role_uri}")
+        self.logger.debug("Classifying network: %s", role_uri)
         
         # Get role definition from sources
         retrieved_definition, definition_source = self._get_role_definition(role_uri)
@@ -291,8 +291,8 @@ class NetworkClassifier:
             fallback_used = True
             
             self.logger.warning(
-                f" Using FALLBACK pattern matching for {role_uri} "
-                f"(no role definition available)"
+                "Using FALLBACK pattern matching for %s (no role definition available)",
+                role_uri
             )
         
         # Calculate confidence
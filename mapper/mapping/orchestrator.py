@@ -9,23 +9,33 @@ Delegates to specialized modules for clean separation of concerns.
 import logging
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
-from ..core.config_loader import ConfigLoader
+from ..core.config_loader import ConfigLoader, DEFAULT_EXPORT_FORMATS
 from ..loaders.parser_output import ParserOutputDeserializer
 from ..loaders.linkbase_locator import LinkbaseLocator
 from ..loaders.xbrl_filings import XBRLFilingsLoader
+from ..loaders.filing_index import FilingDirectoryIndex
 from ..mapping.statement import StatementBuilder
 from ..mapping.filing_extractor import FilingCharacteristicsExtractor
 from ..mapping.output_manager import OutputManager
 from ..output.statement_exporter import StatementSetExporter
+from ..observability.instrumentation import get_instrumentation
 from ..mapping.constants import (
-    FILINGS_SUBDIRECTORY,
+    FILING_INDEX_FILENAME,
     PARSED_FOLDER_DELIMITER,
     IGNORE_DIRECTORY_PATTERNS,
     DEBUG_SEPARATOR,
+    OUTPUT_FORMAT_DIRECTORIES,
+    EXPORT_FORMAT_JSON,
+    EXPORT_FORMAT_CSV,
+    EXPORT_FORMAT_EXCEL,
+    EXPORT_FORMAT_PARQUET,
+    OPTIONAL_EXPORT_FORMATS,
+    JSON_LAYOUT_FILES,
 )
 
 
@@ -59,13 +69,20 @@ class MappingOrchestrator:
             MappingOrchestrator._logging_configured = True
 
         self.logger = logging.getLogger('mapping.orchestrator')
+        self.instrumentation = get_instrumentation()
 
         # Initialize components
         self.deserializer = ParserOutputDeserializer()
         self.xbrl_loader = XBRLFilingsLoader()
         self.linkbase_locator = LinkbaseLocator(self.xbrl_loader)
+        self.filing_index = FilingDirectoryIndex(
+            self.xbrl_loader.xbrl_path,
+            self._filing_index_path()
+        )
         self.statement_builder = StatementBuilder()
-        self.statement_exporter = StatementSetExporter()
+        self.statement_exporter = StatementSetExporter(
+            json_layout=self.config.get('json_layout', JSON_LAYOUT_FILES)
+        )
 
         # Initialize new modules
         self.filing_extractor = FilingCharacteristicsExtractor()
@@ -85,7 +102,9 @@ class MappingOrchestrator:
             setup_ipo_logging(
                 log_dir=log_dir,
                 log_level=self.config.get('log_level', 'INFO'),
-                console_output=True
+                console_output=True,
+                structured=self.config.get('structured_logging', False),
+                log_format=self.config.get('log_format', 'text')
             )
         else:
             # No log directory configured - console only
@@ -96,27 +115,52 @@ class MappingOrchestrator:
             console_handler.setLevel(logging.INFO)
             root_logger.addHandler(console_handler)
     
-    def extract_and_export(self, parsed_json_path: Path) -> dict[str, any]:
+    def extract_and_export(
+        self,
+        parsed_json_path: Path,
+        formats: Optional[list[str]] = None
+    ) -> dict[str, any]:
         """
         Run complete extraction workflow.
         
         Args:
             parsed_json_path: Path to parsed.json file
+            formats: Export formats for this run (e.g. ['json']).
+                     Defaults to MAPPER_EXPORT_FORMATS.
             
         Returns:
             Results dictionary
         """
+        # Filing identity for metrics: company/form/date of the parsed folder
+        filing_id = '/'.join(parsed_json_path.parts[-4:-1]) or str(parsed_json_path)
+        
+        with self.instrumentation.filing(filing_id):
+            with self.instrumentation.span('mapping.extract_and_export'):
+                return self._extract_and_export(parsed_json_path, formats)
+    
+    def _extract_and_export(
+        self,
+        parsed_json_path: Path,
+        formats: Optional[list[str]]
+    ) -> dict[str, any]:
+        """Run extraction steps 1-6 (see extract_and_export)."""
         start_time = datetime.now()
+        formats = self._resolve_export_formats(formats)
+        
+        # Discovery results are reused within one filing only
+        self.xbrl_loader.clear_cache()
         
         # Step 1: Load parsed filing
         self.logger.info("Step 1: Loading parsed filing")
-        with open(parsed_json_path, 'r') as f:
-            parsed_data = json.load(f)
-        parsed_filing = self.deserializer.deserialize(parsed_data, parsed_json_path)
+        with self.instrumentation.span('mapping.load_parsed'):
+            with open(parsed_json_path, 'r') as f:
+                parsed_data = json.load(f)
+            parsed_filing = self.deserializer.deserialize(parsed_data, parsed_json_path)
         
         # Step 2: Extract filing characteristics
         self.logger.info("Step 2: Extracting filing characteristics")
-        characteristics = self.filing_extractor.extract(parsed_filing)
+        with self.instrumentation.span('mapping.characteristics'):
+            characteristics = self.filing_extractor.extract(parsed_filing)
         
         # Override entity_name with folder name if extraction failed
         # Extract company from path: .../company/form/date/parsed.json
@@ -129,33 +173,35 @@ class MappingOrchestrator:
                 characteristics['entity_name'] = company_from_path
                 self.logger.info(f"Using company name from folder: {company_from_path}")
         
-        # DEBUG: Log what we extracted
-        self.logger.warning(DEBUG_SEPARATOR)
-        self.logger.warning("DEBUG: Extracted characteristics:")
-        self.logger.warning(f"  entity_name: {characteristics.get('entity_name')}")
-        self.logger.warning(f"  filing_type: {characteristics.get('filing_type')}")
-        self.logger.warning(f"  period_end: {characteristics.get('period_end')}")
-        self.logger.warning(f"  filing_date: {characteristics.get('filing_date')}")
-        self.logger.warning(DEBUG_SEPARATOR)
-        
         self.logger.info(
-            f"Filing: {characteristics['entity_name']} - {characteristics['filing_type']} - "
-            f"Period: {characteristics.get('period_end', 'unknown')}"
+            "Filing: %s - %s - Period: %s",
+            characteristics['entity_name'],
+            characteristics['filing_type'],
+            characteristics.get('period_end', 'unknown'),
+            extra={'fields': {
+                'entity_name': characteristics.get('entity_name'),
+                'filing_type': characteristics.get('filing_type'),
+                'period_end': characteristics.get('period_end'),
+                'filing_date': characteristics.get('filing_date'),
+            }}
         )
         
         # Step 3: Find XBRL filing and discover linkbases
         self.logger.info("Step 3: Discovering linkbases")
-        xbrl_filing_path = self._find_xbrl_filing(parsed_json_path)
+        with self.instrumentation.span('mapping.find_filing'):
+            xbrl_filing_path = self._find_xbrl_filing(parsed_json_path)
         
         if not xbrl_filing_path:
             raise FileNotFoundError(f"No XBRL filing found for {parsed_json_path}")
         
-        linkbase_set = self.linkbase_locator.discover_linkbases(str(xbrl_filing_path))
+        with self.instrumentation.span('mapping.linkbase_discovery'):
+            linkbase_set = self.linkbase_locator.discover_linkbases(str(xbrl_filing_path))
         self.logger.info(f"Discovered {len(linkbase_set.presentation_networks)} presentation networks")
         
         # Step 4: Build statements
         self.logger.info("Step 4: Building statements")
-        statement_set = self.statement_builder.build_statements(linkbase_set, parsed_filing)
+        with self.instrumentation.span('mapping.build_statements'):
+            statement_set = self.statement_builder.build_statements(linkbase_set, parsed_filing)
         self.logger.info(
             f"Built {len(statement_set.statements)} statements with "
             f"{sum(len(s.facts) for s in statement_set.statements)} fact placements"
@@ -163,22 +209,29 @@ class MappingOrchestrator:
         
         # Step 5: Create output structure
         self.logger.info("Step 5: Creating output structure")
-        output_folder = self.output_manager.create_output_structure(characteristics)
+        with self.instrumentation.span('mapping.output_structure'):
+            output_folder = self.output_manager.create_output_structure(characteristics, formats)
         
         # Step 6: Export statements
-        self.logger.info("Step 6: Exporting statements")
-        export_paths = self._export_statements(statement_set, parsed_filing, output_folder)
+        self.logger.info(f"Step 6: Exporting statements ({', '.join(formats)})")
+        with self.instrumentation.span('mapping.export'):
+            export_paths, export_timings = self._export_statements(
+                statement_set, parsed_filing, output_folder, formats
+            )
         
         # Calculate timing
         elapsed = (datetime.now() - start_time).total_seconds()
         
+        self.instrumentation.count('filings_mapped')
+        
         # Build result
         result = {
             'export_paths': export_paths,
             'statistics': {
                 'total_statements': len(statement_set.statements),
                 'total_fact_placements': sum(len(s.facts) for s in statement_set.statements),
-                'processing_time_seconds': elapsed
+                'processing_time_seconds': elapsed,
+                'export_timings': export_timings
             },
             'filing_info': characteristics,
             'output_folder': str(output_folder)
@@ -190,11 +243,23 @@ class MappingOrchestrator:
         
         return result
     
+    def _filing_index_path(self) -> Optional[Path]:
+        """Persisted filing index location (MAPPER_FILING_INDEX_PATH)."""
+        index_path = self.config.get('filing_index_path')
+        if index_path:
+            return Path(index_path)
+        
+        output_dir = self.config.get('output_mapped_dir')
+        return Path(output_dir) / FILING_INDEX_FILENAME if output_dir else None
+    
     def _find_xbrl_filing(self, parsed_json_path: Path) -> Optional[Path]:
         """
         Find corresponding XBRL filing for a parsed filing.
         
-        Extracts company name from parsed folder path structure.
+        Uses the source record the parser writes next to parsed.json,
+        then the accession/company index of the filings tree
+        (FilingDirectoryIndex); the tree is only listed on an index miss
+        after the filing catalog or the filings root changed.
         Expected path: .../company/form/date/parsed.json
         
         Args:
@@ -203,101 +268,103 @@ class MappingOrchestrator:
         Returns:
             Path to XBRL filing directory, or None if not found
         """
-        # Extract company/form/date from path structure
-        # Path structure: .../company/form/date/parsed.json
-        parts = parsed_json_path.parts
-        if len(parts) < 4:
-            self.logger.error(f"Invalid path structure: {parsed_json_path}")
-            return None
-        
-        # Extract from path (parsed.json is the file, so parent directories are:)
-        # parts[-1] = parsed.json (file)
-        # parts[-2] = date directory
-        # parts[-3] = form directory
-        # parts[-4] = company directory
-        company = parts[-4]
-        form = parts[-3]
-        date = parts[-2]
-        
-        self.logger.info(f"Searching for XBRL filing: {company}/{form}")
-        
-        # Search for EXACT company directory match in XBRL filings
-        for market_dir in self.xbrl_loader.xbrl_path.iterdir():
-            if not market_dir.is_dir() or market_dir.name.startswith('.'):
-                continue
-            
-            # Look for exact company directory name match
-            company_dir = market_dir / company
-            if not company_dir.exists() or not company_dir.is_dir():
-                continue
-            
-            # Found company directory - now look for filings
-            filings_dir = company_dir / FILINGS_SUBDIRECTORY
-            if not filings_dir.exists():
-                continue
-            
-            # Look for form type directory
-            form_dir = filings_dir / form
-            if not form_dir.exists() or not form_dir.is_dir():
-                continue
+        return self.filing_index.resolve(parsed_json_path)
+    
+    def _resolve_export_formats(self, formats: Optional[list[str]]) -> list[str]:
+        """
+        Resolve and validate export formats for a run.
+        
+        Args:
+            formats: Requested formats, or None for the configured default
             
-            # Get most recent filing in this form directory
-            filings = sorted(
-                [f for f in form_dir.iterdir() if f.is_dir()],
-                reverse=True
-            )
+        Returns:
+            Ordered list of unique, known format names
             
-            if filings:
-                self.logger.info(f"Found XBRL filing: {filings[0]}")
-                return filings[0]
+        Raises:
+            ValueError: If an unknown format is requested
+        """
+        requested = formats if formats is not None else self.config.get(
+            'export_formats', DEFAULT_EXPORT_FORMATS.split(',')
+        )
         
-        self.logger.error(f"Could not find XBRL filing for {company}/{form}")
-        return None
+        resolved = []
+        for fmt in requested:
+            fmt = fmt.strip().lower()
+            if fmt not in OUTPUT_FORMAT_DIRECTORIES:
+                raise ValueError(
+                    f"Unknown export format '{fmt}'. "
+                    f"Supported: {', '.join(OUTPUT_FORMAT_DIRECTORIES)}"
+                )
+            if fmt not in resolved:
+                resolved.append(fmt)
+        
+        return resolved
     
     def _export_statements(
         self,
         statement_set,
         parsed_filing,
-        output_folder: Path
-    ) -> dict[str, list]:
-        """Export statements to all formats."""
+        output_folder: Path,
+        formats: list[str]
+    ) -> tuple[dict[str, list], dict[str, float]]:
+        """
+        Export statements to the selected formats concurrently.
+        
+        Each format writes into its own subdirectory, so exports are
+        dispatched to a bounded thread pool and overlap their I/O.
+        
+        Args:
+            statement_set: Set of statements to export
+            parsed_filing: Parsed filing data
+            output_folder: Filing output folder
+            formats: Formats to export
+            
+        Returns:
+            Tuple of (export paths by format, export seconds by format)
+        """
+        exporters = {
+            EXPORT_FORMAT_JSON: self.statement_exporter.export_json,
+            EXPORT_FORMAT_CSV: self.statement_exporter.export_csv,
+            EXPORT_FORMAT_EXCEL: self.statement_exporter.export_excel,
+            EXPORT_FORMAT_PARQUET: self.statement_exporter.export_parquet,
+        }
+        
+        def run_export(fmt: str) -> tuple[list, float]:
+            started = time.perf_counter()
+            paths = exporters[fmt](statement_set, parsed_filing, output_folder / fmt)
+            return paths, time.perf_counter() - started
+        
         export_paths = {}
+        export_timings = {}
         
-        # Export to json/
-        json_folder = output_folder / 'json'
-        json_paths = self.statement_exporter.export_json(
-            statement_set,
-            parsed_filing,
-            json_folder
-        )
-        export_paths['json'] = json_paths
-        self.logger.info(f"Exported {len(json_paths)} JSON files")
-        
-        # Export to csv/
-        csv_folder = output_folder / 'csv'
-        csv_paths = self.statement_exporter.export_csv(
-            statement_set,
-            parsed_filing,
-            csv_folder
-        )
-        export_paths['csv'] = csv_paths
-        self.logger.info(f"Exported {len(csv_paths)} CSV files")
-        
-        # Export to excel/
-        try:
-            excel_folder = output_folder / 'excel'
-            excel_paths = self.statement_exporter.export_excel(
-                statement_set,
-                parsed_filing,
-                excel_folder
-            )
-            if excel_paths:
-                export_paths['excel'] = excel_paths
-                self.logger.info(f"Exported {len(excel_paths)} Excel files")
-        except Exception as e:
-            self.logger.warning(f"Excel export failed: {e}")
+        if not formats:
+            return export_paths, export_timings
+        
+        max_workers = max(1, min(len(formats), self.config.get('export_max_workers', len(formats))))
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='export') as pool:
+            futures = {fmt: pool.submit(run_export, fmt) for fmt in formats}
+            
+            for fmt, future in futures.items():
+                try:
+                    paths, seconds = future.result()
+                except Exception as e:
+                    self.instrumentation.count(f'export_failures_{fmt}')
+                    # Optional outputs never fail the filing
+                    if fmt in OPTIONAL_EXPORT_FORMATS:
+                        self.logger.warning(f"{fmt.capitalize()} export failed: {e}")
+                        continue
+                    raise
+                
+                # Timed in the worker thread, recorded here for this filing
+                self.instrumentation.record(f'mapping.export.{fmt}', seconds)
+                self.instrumentation.count(f'export_files_{fmt}', len(paths))
+                export_timings[fmt] = round(seconds, 3)
+                if paths or fmt not in OPTIONAL_EXPORT_FORMATS:
+                    export_paths[fmt] = paths
+                self.logger.info(f"Exported {len(paths)} {fmt.upper()} files in {seconds:.2f}s")
         
-        return export_paths
+        return export_paths, export_timings
     
     def _log_summary(self, result: dict[str, any], elapsed: float):
         """Log extraction summary."""
@@ -311,6 +378,8 @@ class MappingOrchestrator:
         self.logger.info(f"Total statements: {stats['total_statements']}")
         self.logger.info(f"Total fact placements: {stats['total_fact_placements']}")
         self.logger.info(f"Processing time: {elapsed:.2f}s")
+        for fmt, seconds in stats.get('export_timings', {}).items():
+            self.logger.info(f"  {fmt} export: {seconds:.2f}s")
         self.logger.info(f"Output folder: {result['output_folder']}")
         self.logger.info(DEBUG_SEPARATOR)
 
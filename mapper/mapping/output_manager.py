@@ -55,7 +55,21 @@ class OutputManager:
         self.base_dir = base_output_dir
         self.logger = logging.getLogger('mapping.output_manager')
     
-    def create_output_structure(self, characteristics: dict[str, any]) -> Path:
+    def create_output_structure(
+        self,
+        characteristics: dict[str, any],
+        formats: Optional[list[str]] = None
+    ) -> Path:
+        """
+        Create the filing output folder and its format subdirectories.
+        
+        Args:
+            characteristics: Filing characteristics
+            formats: Format subdirectories to create (defaults to all)
+            
+        Returns:
+            Path to filing output folder
+        """
         # Build hierarchical path
         market = self._safe_str(characteristics.get('market', 'unknown'))
         entity = self._safe_str(characteristics.get('entity_name'), max_len=MAX_ENTITY_NAME_LENGTH)
@@ -69,7 +83,7 @@ class OutputManager:
         output_folder.mkdir(parents=True, exist_ok=True)
         
         # Create format subdirectories
-        for format_dir in OUTPUT_FORMAT_DIRECTORIES:
+        for format_dir in (formats if formats is not None else OUTPUT_FORMAT_DIRECTORIES):
             (output_folder / format_dir).mkdir(exist_ok=True)
         
         self.logger.info(f"Created output structure: {output_folder}")
@@ -16,6 +16,13 @@ RESPONSIBILITY:
 - Format values with currency symbols and separators
 - Handle edge cases (missing decimals, non-numeric values, INF precision)
 
+PERFORMANCE:
+Enrichment depends only on (value, decimals, unit_ref). Results are
+cached per enricher (one filing), so a fact placed in several networks
+is computed once. Parsed decimals, scaling factors and currency checks
+are memoized as well. enrich_facts() applies the caches to a whole
+network's facts in one pass.
+
 XBRL SPECIFICATION FORMULAS:
 - Formula source: xbrl_mathematics.decimals module
 - Specification: XBRL 2.1 Section 4.6.5 "The @decimals attribute"
@@ -50,6 +57,13 @@ from ...xbrl_mathematics.decimals import (
 )
 
 
+# Currency markers in unit references
+CURRENCY_UNIT_MARKERS = ('usd', 'eur', 'gbp', 'jpy', 'cny', 'currency')
+
+# Memo marker for decimals attributes that failed to parse
+_INVALID_DECIMALS = object()
+
+
 class FactEnricher:
     """
     Enriches facts with calculated values for verification.
@@ -84,6 +98,47 @@ class FactEnricher:
     def __init__(self):
         """Initialize fact enricher."""
         self.logger = logging.getLogger('mapping.fact_enricher')
+        
+        # (value, decimals, unit_ref) -> (display_value, scaling_factor, formatted_value)
+        self._enrichment_cache: dict[tuple, tuple] = {}
+        self._decimals_cache: dict[str, object] = {}
+        self._scaling_cache: dict[str, Optional[float]] = {}
+        self._currency_cache: dict[str, bool] = {}
+    
+    def enrich_facts(self, facts: list[StatementFact]) -> list[StatementFact]:
+        """
+        Enrich all facts of a network in one pass.
+        
+        Args:
+            facts: Statement facts to enrich
+            
+        Returns:
+            The same facts, enriched
+        """
+        cache = self._enrichment_cache
+        
+        for fact in facts:
+            if not fact.value:
+                fact.display_value = None
+                fact.formatted_value = None
+                fact.scaling_factor = None
+                continue
+            
+            key = (fact.value, fact.decimals, fact.unit_ref)
+            try:
+                cached = cache.get(key)
+            except TypeError:
+                # Unhashable raw value: compute without caching
+                self.enrich_fact(fact)
+                continue
+            
+            if cached is None:
+                cached = self._compute_enrichment(fact.value, fact.decimals, fact.unit_ref)
+                cache[key] = cached
+            
+            fact.display_value, fact.scaling_factor, fact.formatted_value = cached
+        
+        return facts
     
     def enrich_fact(self, fact: StatementFact) -> StatementFact:
         """
@@ -107,23 +162,76 @@ class FactEnricher:
             fact.scaling_factor = None
             return fact
         
+        try:
+            key = (fact.value, fact.decimals, fact.unit_ref)
+            enrichment = self._enrichment_cache.get(key)
+            if enrichment is None:
+                enrichment = self._compute_enrichment(fact.value, fact.decimals, fact.unit_ref)
+                self._enrichment_cache[key] = enrichment
+        except TypeError:
+            # Unhashable raw value: compute without caching
+            enrichment = self._compute_enrichment(fact.value, fact.decimals, fact.unit_ref)
+        
+        fact.display_value, fact.scaling_factor, fact.formatted_value = enrichment
+        
+        return fact
+    
+    def _compute_enrichment(
+        self,
+        value: str,
+        decimals: Optional[str],
+        unit_ref: Optional[str]
+    ) -> tuple:
+        """
+        Compute display value, scaling factor and formatted value.
+        
+        Args:
+            value: Raw XBRL value (non-empty)
+            decimals: XBRL decimals attribute
+            unit_ref: Unit reference
+            
+        Returns:
+            Tuple (display_value, scaling_factor, formatted_value)
+        """
         # Calculate display value and scaling factor
-        if fact.decimals is not None:
-            fact.display_value = self._calculate_display_value(
-                fact.value, fact.decimals
-            )
-            fact.scaling_factor = self._calculate_scaling_factor(fact.decimals)
+        if decimals is not None:
+            display_value = self._calculate_display_value(value, decimals)
+            scaling_factor = self._calculate_scaling_factor(decimals)
         else:
             # No decimals means value is already scaled
-            fact.display_value = fact.value
-            fact.scaling_factor = 1
+            display_value = value
+            scaling_factor = 1
         
         # Format for human display
-        fact.formatted_value = self._format_value(
-            fact.display_value, fact.unit_ref
-        )
+        formatted_value = self._format_value(display_value, unit_ref)
         
-        return fact
+        return display_value, scaling_factor, formatted_value
+    
+    def _parse_decimals(self, decimals: str) -> Optional[int]:
+        """
+        Parse decimals attribute (memoized).
+        
+        Args:
+            decimals: XBRL decimals attribute (string, may be "INF")
+            
+        Returns:
+            Integer decimals, or None for "INF"
+            
+        Raises:
+            ValueError: If the attribute is not valid
+        """
+        try:
+            parsed = self._decimals_cache[decimals]
+        except KeyError:
+            try:
+                parsed = parse_decimals_attribute(decimals)
+            except (ValueError, TypeError):
+                parsed = _INVALID_DECIMALS
+            self._decimals_cache[decimals] = parsed
+        
+        if parsed is _INVALID_DECIMALS:
+            raise ValueError(f"Invalid @decimals value: {decimals}")
+        return parsed
     
     def _calculate_display_value(self, value: str, decimals: str) -> Optional[str]:
         """
@@ -154,7 +262,7 @@ class FactEnricher:
             raw_value = Decimal(str(value).replace(',', ''))
             
             # Parse decimals attribute (handles "INF" and integer values)
-            decimals_int = parse_decimals_attribute(decimals)
+            decimals_int = self._parse_decimals(decimals)
             
             # Special case: INF means exact value (no scaling needed)
             if decimals_int is None:
@@ -169,7 +277,8 @@ class FactEnricher:
             
         except (InvalidOperation, ValueError, TypeError) as e:
             self.logger.debug(
-                f"Cannot calculate display value for {value} with decimals {decimals}: {e}"
+                "Cannot calculate display value for %s with decimals %s: %s",
+                value, decimals, e
             )
             return value  # Return raw value if calculation fails
     
@@ -195,19 +304,25 @@ class FactEnricher:
         Returns:
             Scaling factor as float, or None if calculation fails
         """
+        if decimals in self._scaling_cache:
+            return self._scaling_cache[decimals]
+        
         try:
             # Parse decimals attribute (handles "INF" and integer values)
-            decimals_int = parse_decimals_attribute(decimals)
+            decimals_int = self._parse_decimals(decimals)
             
             # Special case: INF means no scaling (factor = 1)
             if decimals_int is None:
-                return 1.0
-            
-            # Calculate: 10^(-decimals)
-            return 10 ** (-decimals_int)
+                factor = 1.0
+            else:
+                # Calculate: 10^(-decimals)
+                factor = 10 ** (-decimals_int)
             
         except (ValueError, TypeError):
-            return None
+            factor = None
+        
+        self._scaling_cache[decimals] = factor
+        return factor
     
     def _format_value(
         self,
@@ -237,10 +352,7 @@ class FactEnricher:
             num_value = float(value)
             
             # Determine if this is a currency unit
-            is_currency = unit_ref and any(
-                curr in unit_ref.lower()
-                for curr in ['usd', 'eur', 'gbp', 'jpy', 'cny', 'currency']
-            )
+            is_currency = self._is_currency(unit_ref)
             
             # Format negative values with parentheses (accounting style)
             if num_value < 0:
@@ -257,9 +369,21 @@ class FactEnricher:
                     return f"{num_value:,.0f}"
                     
         except (ValueError, TypeError) as e:
-            self.logger.debug(f"Cannot format value {value}: {e}")
+            self.logger.debug("Cannot format value %s: %s", value, e)
             return str(value)  # Return as-is if formatting fails
     
+    def _is_currency(self, unit_ref: Optional[str]) -> bool:
+        """Check if unit reference is a currency (memoized)."""
+        if not unit_ref:
+            return False
+        
+        is_currency = self._currency_cache.get(unit_ref)
+        if is_currency is None:
+            lowered = unit_ref.lower()
+            is_currency = any(marker in lowered for marker in CURRENCY_UNIT_MARKERS)
+            self._currency_cache[unit_ref] = is_currency
+        return is_currency
+    
     def verify_calculation(
         self,
         value: str,
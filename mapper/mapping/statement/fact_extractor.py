@@ -10,10 +10,12 @@ import logging
 from typing import Optional
 from collections import defaultdict
 
+from ...core.logger.sampling import LogSampler
 from ...loaders.parser_output import ParsedFiling
 from ...components.qname_utils import QNameUtils
 from ...mapping.statement.models import StatementFact
 from ...mapping.statement.fact_enricher import FactEnricher
+from ...observability.instrumentation import get_instrumentation
 
 
 class FactExtractor:
@@ -36,9 +38,16 @@ class FactExtractor:
             get_attr_func: Function to safely get attributes from data objects
         """
         self.logger = logging.getLogger('mapping.fact_extractor')
+        self.instrumentation = get_instrumentation()
         self._get_attr = get_attr_func
         self.fact_enricher = FactEnricher()  # Initialize enricher
         self._context_cache: dict[str, dict] = {}  # Cache context_id -> period info
+        self._concept_facts_map: dict[str, list] = {}
+        self._indexed_filing: Optional[ParsedFiling] = None  # Filing the two maps belong to
+        
+        # Per-fact / per-concept messages repeat thousands of times per filing
+        self.log_sampler = LogSampler(self.logger)
+        self._filing_diagnostics_logged = False
     
     def extract_facts_in_order(
         self,
@@ -62,71 +71,96 @@ class FactExtractor:
         """
         statement_facts = []
         
-        # DEBUG logging
-        self.logger.warning(f"DEBUG: Starting fact extraction for role: {role_uri}")
-        self.logger.warning(f"DEBUG: Total facts in filing: {len(parsed_filing.facts)}")
-        
-        # Sample a few facts to see their format
-        if parsed_filing.facts:
-            sample_facts = parsed_filing.facts[:3]
-            self.logger.warning("DEBUG: Sample fact concepts:")
-            for i, fact in enumerate(sample_facts, 1):
-                concept_name = self._get_attr(fact, 'name')
-                self.logger.warning(f"  {i}. '{concept_name}' (type: {type(concept_name)})")
+        # Filing-level diagnostics: once per filing, not once per network
+        if not self._filing_diagnostics_logged:
+            self._filing_diagnostics_logged = True
+            self._log_filing_diagnostics(parsed_filing)
         
-        # Build context cache for period lookup (CRITICAL for calculation verification)
-        self._build_context_cache(parsed_filing)
-        self.logger.info(f"Built context cache with {len(self._context_cache)} contexts")
+        # Context cache and concept map are per filing, not per network
+        if self._indexed_filing is not parsed_filing:
+            with self.instrumentation.span('fact_extractor.index'):
+                # Build context cache for period lookup (CRITICAL for calculation verification)
+                self._build_context_cache(parsed_filing)
 
-        # Build concept-to-facts map with normalized local names
-        concept_facts_map = self._build_concept_facts_map(parsed_filing)
-        
-        self.logger.warning(
-            f"DEBUG: Built concept map: {len(concept_facts_map)} unique local names "
-            f"from {len(parsed_filing.facts)} facts"
-        )
+                # Build concept-to-facts map with normalized local names
+                self._concept_facts_map = self._build_concept_facts_map(parsed_filing)
+            self._indexed_filing = parsed_filing
+        concept_facts_map = self._concept_facts_map
         
-        if concept_facts_map:
-            sample_keys = list(concept_facts_map.keys())[:5]
-            self.logger.warning(f"DEBUG: Sample concept map keys: {sample_keys}")
-        else:
-            self.logger.error("DEBUG: CRITICAL - concept_facts_map is EMPTY!")
-        
-        # DEBUG hierarchy
-        if hierarchy['roots']:
-            self.logger.warning(f"DEBUG: Hierarchy has {len(hierarchy['roots'])} roots")
-            sample_roots = hierarchy['roots'][:3]
-            self.logger.warning(f"DEBUG: Sample hierarchy roots: {sample_roots}")
+        if not concept_facts_map:
+            self.log_sampler.log(
+                logging.WARNING, 'empty_concept_map',
+                "Concept map is empty: no facts can be placed (role %s)", role_uri
+            )
         
         # Traverse hierarchy depth-first
         visited = set()
         
-        for root in hierarchy['roots']:
-            self._traverse_and_extract(
-                root,
-                hierarchy,
-                concept_facts_map,
-                parsed_filing,
-                statement_facts,
-                visited,
-                level=0,
-                parent=None
-            )
+        with self.instrumentation.span('fact_extractor.traverse'):
+            for root in hierarchy['roots']:
+                self._traverse_and_extract(
+                    root,
+                    hierarchy,
+                    concept_facts_map,
+                    parsed_filing,
+                    statement_facts,
+                    visited,
+                    level=0,
+                    parent=None
+                )
         
-        self.logger.warning(
-            f"DEBUG: Extracted {len(statement_facts)} facts for this statement"
-        )
+        # ENRICH facts with calculated values for verification (cached per filing)
+        with self.instrumentation.span('fact_extractor.enrich'):
+            enriched_facts = self.fact_enricher.enrich_facts(statement_facts)
         
-        # ENRICH facts with calculated values for verification
-        enriched_facts = []
-        for fact in statement_facts:
-            enriched_fact = self.fact_enricher.enrich_fact(fact)
-            enriched_facts.append(enriched_fact)
+        self.instrumentation.count('facts_extracted', len(enriched_facts))
         
-        self.logger.info(f"Enriched {len(enriched_facts)} facts with calculated values")
+        # One summary record per network
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Extracted %d facts for %s (%d concepts, %d roots)",
+                len(enriched_facts), role_uri,
+                len(concept_facts_map), len(hierarchy['roots']),
+                extra={'fields': {
+                    'role': role_uri,
+                    'facts_in_filing': len(parsed_filing.facts),
+                    'contexts': len(self._context_cache),
+                    'concept_map_size': len(concept_facts_map),
+                    'roots': len(hierarchy['roots']),
+                    'sample_roots': list(hierarchy['roots'][:3]),
+                    'extracted': len(statement_facts),
+                    'enriched': len(enriched_facts),
+                }}
+            )
         
         return enriched_facts
     
+    def flush_logs(self) -> None:
+        """Log counts of sampled-out messages (call once the filing is done)."""
+        self.log_sampler.flush()
+    
+    def _log_filing_diagnostics(self, parsed_filing: ParsedFiling) -> None:
+        """
+        Log sample fact concepts of the filing (DEBUG only).
+        
+        Args:
+            parsed_filing: Parsed filing with facts
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        sample_concepts = [
+            self._get_attr(fact, 'name') for fact in parsed_filing.facts[:3]
+        ]
+        self.logger.debug(
+            "Filing has %d facts; sample concepts: %s",
+            len(parsed_filing.facts), sample_concepts,
+            extra={'fields': {
+                'facts_in_filing': len(parsed_filing.facts),
+                'contexts': len(parsed_filing.contexts),
+            }}
+        )
+    
     def _build_concept_facts_map(self, parsed_filing: ParsedFiling) -> dict[str, list]:
         """
         Build map from normalized concept names to facts.
@@ -151,8 +185,9 @@ class FactExtractor:
                     local_name = QNameUtils.get_local_name(concept_name)
                     concept_facts_map[local_name].append(fact)
                 except Exception as e:
-                    self.logger.warning(
-                        f"DEBUG: Failed to normalize concept '{concept_name}': {e}"
+                    self.log_sampler.log(
+                        logging.WARNING, 'normalize_failed',
+                        "Failed to normalize concept %r: %s", concept_name, e
                     )
         
         return concept_facts_map
@@ -198,9 +233,7 @@ class FactExtractor:
                     'period_end': period_end,
                 }
 
-            self.logger.debug(
-                f"Built context cache: {len(self._context_cache)} contexts"
-            )
+            self.logger.debug("Built context cache: %d contexts", len(self._context_cache))
 
         except Exception as e:
             self.logger.warning(f"Failed to build context cache: {e}")
@@ -262,9 +295,10 @@ class FactExtractor:
         facts = concept_facts_map.get(concept_local, [])
         
         if facts:
-            self.logger.debug(
-                f"Matched {len(facts)} facts for concept '{concept}' "
-                f"(normalized to '{concept_local}')"
+            self.log_sampler.log(
+                logging.DEBUG, 'concept_matched',
+                "Matched %d facts for concept %r (normalized to %r)",
+                len(facts), concept, concept_local
             )
         
         # Get order for this concept
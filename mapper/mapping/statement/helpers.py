@@ -60,8 +60,8 @@ def determine_statement_date(
     most_common_date, count = date_counts.most_common(1)[0]
     
     logger.debug(
-        f"Statement date determined: {most_common_date} "
-        f"(appears in {count}/{len(dates)} contexts)"
+        "Statement date determined: %s (appears in %d/%d contexts)",
+        most_common_date, count, len(dates)
     )
     
     return most_common_date
@@ -91,7 +91,7 @@ def determine_period_type(
     concept_facts = [f for f in parsed_filing.facts if f.name == concept]
     
     if not concept_facts:
-        logger.debug(f"No facts found for concept: {concept}")
+        logger.debug("No facts found for concept: %s", concept)
         return None
     
     # Build context map
@@ -105,7 +105,7 @@ def determine_period_type(
             period_types.append(context.period_type)
     
     if not period_types:
-        logger.debug(f"No contexts found for concept facts: {concept}")
+        logger.debug("No contexts found for concept facts: %s", concept)
         return None
     
     # Return most common period type
@@ -113,8 +113,8 @@ def determine_period_type(
     most_common_type, count = type_counts.most_common(1)[0]
     
     logger.debug(
-        f"Period type for {concept}: {most_common_type} "
-        f"({count}/{len(period_types)} facts)"
+        "Period type for %s: %s (%d/%d facts)",
+        concept, most_common_type, count, len(period_types)
     )
     
     return most_common_type
@@ -140,7 +140,7 @@ def build_context_map(parsed_filing: ParsedFiling) -> dict[str, Context]:
         if isinstance(context, Context):
             context_map[context.id] = context
     
-    logger.debug(f"Built context map with {len(context_map)} contexts")
+    logger.debug("Built context map with %d contexts", len(context_map))
     
     return context_map
 
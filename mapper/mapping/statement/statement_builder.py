@@ -35,6 +35,7 @@ from ...mapping.network_classifier import NetworkClassifier
 from ...mapping.statement.models import Statement, StatementSet, StatementFact
 from ...mapping.statement.hierarchy_builder import HierarchyBuilder
 from ...mapping.statement.fact_extractor import FactExtractor
+from ...observability.instrumentation import get_instrumentation
 
 
 class StatementBuilder:
@@ -55,6 +56,7 @@ class StatementBuilder:
     def __init__(self):
         """Initialize statement builder."""
         self.logger = logging.getLogger('mapping.statement_builder')
+        self.instrumentation = get_instrumentation()
         
         # Components (initialized in build_statements when data is available)
         self.dimension_handler = None
@@ -105,7 +107,8 @@ class StatementBuilder:
         )
         
         # Initialize components with actual data
-        self._initialize_components(linkbase_set, parsed_filing)
+        with self.instrumentation.span('statement_builder.initialize_components'):
+            self._initialize_components(linkbase_set, parsed_filing)
         
         statement_set = StatementSet()
         
@@ -119,6 +122,8 @@ class StatementBuilder:
             statement_set.statements.append(statement)
             statement_set.role_uri_to_statement[statement.role_uri] = statement
         
+        self.fact_extractor.flush_logs()
+        
         # Track which concepts appear in which roles
         self._track_concept_appearances(statement_set)
         
@@ -131,6 +136,8 @@ class StatementBuilder:
         # Finalize statistics
         self.statistics.total_statements_built = len(statement_set.statements)
         self.statistics.total_facts_mapped = statement_set.metadata['total_facts']
+        self.instrumentation.count('statements_built', len(statement_set.statements))
+        self.instrumentation.count('fact_placements', statement_set.metadata['total_facts'])
         
         self.logger.info(
             f"Built {len(statement_set.statements)} statements with "
@@ -191,17 +198,17 @@ class StatementBuilder:
         )
         
         # STEP 1: Build locator map (delegate to HierarchyBuilder)
-        locator_map = self.hierarchy_builder.build_locator_map(
-            network.arcs,
-            self._get_attr
-        )
-        
         # STEP 2: Build hierarchy from arcs (delegate to HierarchyBuilder)
-        hierarchy = self.hierarchy_builder.build_hierarchy(
-            network.arcs,
-            locator_map,
-            self._get_attr
-        )
+        with self.instrumentation.span('statement_builder.hierarchy'):
+            locator_map = self.hierarchy_builder.build_locator_map(
+                network.arcs,
+                self._get_attr
+            )
+            hierarchy = self.hierarchy_builder.build_hierarchy(
+                network.arcs,
+                locator_map,
+                self._get_attr
+            )
         statement.hierarchy = hierarchy
         
         # STEP 3: Extract facts in hierarchical order (delegate to FactExtractor)
@@ -220,21 +227,32 @@ class StatementBuilder:
         }
         
         # STEP 5: Classify network using structural analysis
-        classification = self.classifier.classify(
-            network.role_uri,
-            network.role_definition,
-            network_structure
-        )
+        with self.instrumentation.span('statement_builder.classify'):
+            classification = self.classifier.classify(
+                network.role_uri,
+                network.role_definition,
+                network_structure
+            )
         
-        # Log classification results for transparency
+        # Log classification results for transparency (one record per network)
         self.logger.info(
-            f"Network: {network.role_uri.split('/')[-1][:60]}... | "
-            f"Category: {classification.category} | "
-            f"Facts: {network_structure['fact_count']} | "
-            f"Depth: {network_structure['max_depth']} | "
-            f"Roots: {network_structure['root_count']} | "
-            f"Source: {classification.source} | "
-            f"Signals: {classification.structural_signals.get('structure_score', 'N/A')}"
+            "Network: %s... | Category: %s | Facts: %d | Depth: %s | "
+            "Roots: %d | Source: %s | Signals: %s",
+            network.role_uri.split('/')[-1][:60],
+            classification.category,
+            network_structure['fact_count'],
+            network_structure['max_depth'],
+            network_structure['root_count'],
+            classification.source,
+            classification.structural_signals.get('structure_score', 'N/A'),
+            extra={'fields': {
+                'role': network.role_uri,
+                'category': classification.category,
+                'facts': network_structure['fact_count'],
+                'max_depth': network_structure['max_depth'],
+                'roots': network_structure['root_count'],
+                'source': classification.source,
+            }}
         )
         
         # Store classification in metadata
@@ -255,8 +273,8 @@ class StatementBuilder:
             statement.statement_type = classification.statement_type
         
         self.logger.debug(
-            f"Built statement {network.role_uri}: "
-            f"{len(statement.facts)} facts in hierarchy"
+            "Built statement %s: %d facts in hierarchy",
+            network.role_uri, len(statement.facts)
         )
         
         return statement
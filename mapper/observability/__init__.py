@@ -10,6 +10,7 @@ Components:
 - Profiler: Performance profiling
 - DebugArtifacts: Debug output generation
 - AlertingSystem: Alert generation
+- Instrumentation: Pipeline spans and counters, written per run
 
 Example:
     from ..observability import HealthCheck, MetricsCollector
@@ -30,6 +31,11 @@ from .metrics import MetricsCollector
 from .profiler import Profiler
 from .debug_artifacts import DebugArtifacts
 from .alerting import AlertingSystem
+from .instrumentation import (
+    Instrumentation,
+    get_instrumentation,
+    configure_instrumentation,
+)
 
 __all__ = [
     'HealthCheck',
@@ -37,4 +43,7 @@ __all__ = [
     'Profiler',
     'DebugArtifacts',
     'AlertingSystem',
+    'Instrumentation',
+    'get_instrumentation',
+    'configure_instrumentation',
 ]
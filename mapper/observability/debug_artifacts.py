@@ -8,11 +8,9 @@ Generates debug outputs for troubleshooting.
 import logging
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from datetime import datetime
 
-from ..mapping.models.mapping_result import MappingResult
-
 
 class DebugArtifacts:
     """
@@ -43,7 +41,7 @@ class DebugArtifacts:
     
     def save_mapping_state(
         self,
-        mapping_result: MappingResult,
+        mapping_result: Any,
         stage: str
     ) -> Path:
         """
@@ -95,7 +93,7 @@ class DebugArtifacts:
     
     def save_conflicts(
         self,
-        mapping_result: MappingResult
+        mapping_result: Any
     ) -> Optional[Path]:
         """
         Save conflict details.
@@ -0,0 +1,423 @@
+# Path: observability/instrumentation.py
+"""
+Pipeline Instrumentation
+
+Timing spans and counters for the end-to-end pipeline (workflow phases,
+mapping, statement building, fact extraction, export, verification),
+collected per stage and per filing and written once per run as JSON
+and/or OpenMetrics text.
+
+One process-wide instance (get_instrumentation()) is shared by all
+modules. It is disabled by default: span() then returns a shared no-op
+context manager and count() returns immediately, so instrumented code
+pays one method call per span.
+
+Example:
+    instrumentation = configure_instrumentation(config, run_name='mapper')
+
+    with instrumentation.filing('acme/10-K/2024-12-31'):
+        with instrumentation.span('mapping.build_statements'):
+            ...
+        instrumentation.count('statements_built', 12)
+
+    instrumentation.write_report()
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from .metrics import MetricsCollector
+
+
+# Output formats (MAPPER_METRICS_FORMAT / VERIFICATION_METRICS_FORMAT)
+METRICS_FORMAT_JSON = 'json'
+METRICS_FORMAT_OPENMETRICS = 'openmetrics'
+METRICS_FORMAT_ALL = 'all'
+
+# Report directory below log_dir when no metrics_dir is configured
+METRICS_DIRNAME = 'metrics'
+
+# Prefix of every OpenMetrics metric name
+OPENMETRICS_PREFIX = 'map_pro'
+
+_UNSAFE_METRIC_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
+
+class _NullSpan:
+    """Span used while instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Times one stage and records it on exit."""
+
+    __slots__ = ('_owner', '_stage', '_started')
+
+    def __init__(self, owner: 'Instrumentation', stage: str):
+        self._owner = owner
+        self._stage = stage
+        self._started = 0.0
+
+    def __enter__(self) -> '_Span':
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._owner.record(
+            self._stage,
+            time.perf_counter() - self._started,
+            success=exc_type is None
+        )
+
+
+class _FilingScope:
+    """Attributes spans and counters to a filing while active."""
+
+    __slots__ = ('_owner', '_filing_id', '_previous')
+
+    def __init__(self, owner: 'Instrumentation', filing_id: str):
+        self._owner = owner
+        self._filing_id = filing_id
+        self._previous = None
+
+    def __enter__(self) -> '_FilingScope':
+        self._previous = self._owner.current_filing
+        self._owner.current_filing = self._filing_id
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._owner.current_filing = self._previous
+
+
+class Instrumentation:
+    """
+    Run-level span and counter collection.
+
+    Stage statistics are kept by a MetricsCollector; per-filing totals
+    are aggregated here. Recording is thread-safe (exports run in a
+    thread pool). Filing attribution uses one current filing per
+    process, matching the one-filing-at-a-time pipeline.
+    """
+
+    def __init__(self):
+        """Initialize disabled instrumentation."""
+        self.logger = logging.getLogger('observability.instrumentation')
+        self.enabled = False
+        self.output_dir: Optional[Path] = None
+        self.metrics_format = METRICS_FORMAT_JSON
+        self.run_name = 'run'
+        self.current_filing: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._reset_data()
+
+    def configure(
+        self,
+        enabled: bool,
+        output_dir: Optional[Path] = None,
+        metrics_format: str = METRICS_FORMAT_JSON,
+        run_name: str = 'run'
+    ) -> None:
+        """
+        Enable or disable collection and set report destination.
+
+        Args:
+            enabled: Collect spans and counters
+            output_dir: Directory for run reports
+            metrics_format: 'json', 'openmetrics' or 'all'
+            run_name: Report file name prefix (e.g. 'workflow', 'verification')
+        """
+        self.enabled = bool(enabled)
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.metrics_format = (metrics_format or METRICS_FORMAT_JSON).lower()
+        self.run_name = run_name
+
+    def reset(self) -> None:
+        """Drop collected data and start a new run."""
+        with self._lock:
+            self._reset_data()
+
+    def span(self, stage: str):
+        """
+        Context manager timing a stage.
+
+        Args:
+            stage: Dotted stage name (e.g. 'mapping.export.json')
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage)
+
+    def filing(self, filing_id: str):
+        """
+        Context manager attributing spans and counters to a filing.
+
+        Args:
+            filing_id: Filing identifier (e.g. company/form/date)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _FilingScope(self, filing_id)
+
+    def record(
+        self,
+        stage: str,
+        duration: float,
+        success: bool = True,
+        filing_id: Optional[str] = None
+    ) -> None:
+        """
+        Record a completed stage measured elsewhere.
+
+        Args:
+            stage: Stage name
+            duration: Duration in seconds
+            success: Whether the stage succeeded
+            filing_id: Filing to attribute to (default: current filing)
+        """
+        if not self.enabled:
+            return
+
+        filing_id = filing_id or self.current_filing
+
+        with self._lock:
+            self._collector.record_operation(
+                stage, duration, success=success,
+                metadata={'filing': filing_id} if filing_id else None
+            )
+            if filing_id:
+                totals = self._filing_stages[filing_id][stage]
+                totals[0] += 1
+                totals[1] += duration
+                if not success:
+                    totals[2] += 1
+
+    def count(self, name: str, value: int = 1, filing_id: Optional[str] = None) -> None:
+        """
+        Increment a counter for the run (and the current filing).
+
+        Args:
+            name: Counter name (e.g. 'facts_extracted')
+            value: Increment
+            filing_id: Filing to attribute to (default: current filing)
+        """
+        if not self.enabled:
+            return
+
+        filing_id = filing_id or self.current_filing
+
+        with self._lock:
+            self._collector.increment(name, value)
+            if filing_id:
+                self._filing_counters[filing_id][name] += value
+
+    def get_report(self) -> dict:
+        """
+        Build run report.
+
+        Returns:
+            Dictionary with run info, per-stage statistics, counters and
+            per-filing stage totals and counters
+        """
+        with self._lock:
+            summary = self._collector.get_summary()
+            filings = {
+                filing_id: {
+                    'stages': {
+                        stage: {
+                            'count': totals[0],
+                            'total_duration': round(totals[1], 6),
+                            'failure_count': totals[2],
+                        }
+                        for stage, totals in sorted(stages.items())
+                    },
+                    'counters': dict(self._filing_counters.get(filing_id, {})),
+                }
+                for filing_id, stages in self._filing_stages.items()
+            }
+            for filing_id, counters in self._filing_counters.items():
+                if filing_id not in filings:
+                    filings[filing_id] = {'stages': {}, 'counters': dict(counters)}
+
+        return {
+            'run': self.run_name,
+            'started_at': self._started_at.isoformat(),
+            'finished_at': datetime.now().isoformat(),
+            'duration_seconds': round(summary['total_duration'], 3),
+            'stages': dict(sorted(summary['operation_stats'].items())),
+            'counters': summary['counters'],
+            'filings': filings,
+        }
+
+    def write_report(self, output_dir: Optional[Path] = None) -> list[Path]:
+        """
+        Write run report in the configured format(s).
+
+        Args:
+            output_dir: Override configured output directory
+
+        Returns:
+            Written file paths (empty if disabled or nothing to write)
+        """
+        if not self.enabled:
+            return []
+
+        output_dir = Path(output_dir) if output_dir else self.output_dir
+        if output_dir is None:
+            self.logger.warning("Metrics enabled but no output directory configured")
+            return []
+
+        report = self.get_report()
+        stem = f"{self.run_name}_{self._started_at.strftime('%Y%m%d_%H%M%S')}"
+        written = []
+
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            if self.metrics_format in (METRICS_FORMAT_JSON, METRICS_FORMAT_ALL):
+                json_path = output_dir / f"{stem}.json"
+                with open(json_path, 'w', encoding='utf-8') as f:
+                    json.dump(report, f, indent=2, default=str)
+                written.append(json_path)
+
+            if self.metrics_format in (METRICS_FORMAT_OPENMETRICS, METRICS_FORMAT_ALL):
+                prom_path = output_dir / f"{stem}.prom"
+                with open(prom_path, 'w', encoding='utf-8') as f:
+                    f.write(self.to_openmetrics(report))
+                written.append(prom_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write metrics report to {output_dir}: {e}")
+
+        for path in written:
+            self.logger.info(f"Metrics report written: {path}")
+
+        return written
+
+    def to_openmetrics(self, report: dict) -> str:
+        """
+        Render report as OpenMetrics text exposition.
+
+        Args:
+            report: Report from get_report()
+
+        Returns:
+            OpenMetrics text (terminated by '# EOF')
+        """
+        prefix = OPENMETRICS_PREFIX
+        run = self._label(report['run'])
+        lines = []
+
+        lines.append(f"# TYPE {prefix}_run_duration_seconds gauge")
+        lines.append(f'{prefix}_run_duration_seconds{{run="{run}"}} {report["duration_seconds"]}')
+
+        lines.append(f"# TYPE {prefix}_stage_duration_seconds summary")
+        for stage, stats in report['stages'].items():
+            labels = f'run="{run}",stage="{self._label(stage)}"'
+            lines.append(f"{prefix}_stage_duration_seconds_count{{{labels}}} {stats.get('count', 0)}")
+            lines.append(f"{prefix}_stage_duration_seconds_sum{{{labels}}} {stats.get('total_duration', 0)}")
+
+        lines.append(f"# TYPE {prefix}_stage_failures counter")
+        for stage, stats in report['stages'].items():
+            labels = f'run="{run}",stage="{self._label(stage)}"'
+            lines.append(f"{prefix}_stage_failures_total{{{labels}}} {stats.get('failure_count', 0)}")
+
+        lines.append(f"# TYPE {prefix}_filing_stage_duration_seconds gauge")
+        for filing_id, data in report['filings'].items():
+            for stage, totals in data['stages'].items():
+                labels = (
+                    f'run="{run}",filing="{self._label(filing_id)}",'
+                    f'stage="{self._label(stage)}"'
+                )
+                lines.append(f"{prefix}_filing_stage_duration_seconds{{{labels}}} {totals['total_duration']}")
+
+        for name in sorted(report['counters']):
+            metric = f"{prefix}_{_UNSAFE_METRIC_CHARS.sub('_', name)}"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f'{metric}_total{{run="{run}"}} {report["counters"][name]}')
+            for filing_id, data in report['filings'].items():
+                if name in data['counters']:
+                    labels = f'run="{run}",filing="{self._label(filing_id)}"'
+                    lines.append(f"{metric}_total{{{labels}}} {data['counters'][name]}")
+
+        lines.append("# EOF")
+        return '\n'.join(lines) + '\n'
+
+    def _reset_data(self) -> None:
+        """Initialize collections for a new run."""
+        self._collector = MetricsCollector()
+        # filing -> stage -> [count, total seconds, failures]
+        self._filing_stages: dict[str, dict[str, list]] = defaultdict(
+            lambda: defaultdict(lambda: [0, 0.0, 0])
+        )
+        self._filing_counters: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._started_at = datetime.now()
+
+    @staticmethod
+    def _label(value: str) -> str:
+        """Escape OpenMetrics label value."""
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+_instrumentation = Instrumentation()
+
+
+def get_instrumentation() -> Instrumentation:
+    """Get the process-wide instrumentation instance."""
+    return _instrumentation
+
+
+def configure_instrumentation(config, run_name: str) -> Instrumentation:
+    """
+    Configure process-wide instrumentation from a module config.
+
+    Reads enable_metrics, metrics_format, metrics_dir and log_dir
+    (report goes to log_dir/metrics when metrics_dir is not set).
+    Collected data is reset.
+
+    Args:
+        config: ConfigLoader of the running module (mapper, verification)
+        run_name: Report file name prefix
+
+    Returns:
+        Process-wide Instrumentation
+    """
+    output_dir = config.get('metrics_dir')
+    if output_dir is None and config.get('log_dir'):
+        output_dir = Path(config.get('log_dir')) / METRICS_DIRNAME
+
+    _instrumentation.configure(
+        enabled=config.get('enable_metrics', False),
+        output_dir=output_dir,
+        metrics_format=config.get('metrics_format', METRICS_FORMAT_JSON),
+        run_name=run_name
+    )
+    _instrumentation.reset()
+
+    return _instrumentation
+
+
+__all__ = [
+    'Instrumentation',
+    'get_instrumentation',
+    'configure_instrumentation',
+    'METRICS_FORMAT_JSON',
+    'METRICS_FORMAT_OPENMETRICS',
+    'METRICS_FORMAT_ALL',
+]
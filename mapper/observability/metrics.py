@@ -3,6 +3,10 @@
 Metrics Collector
 
 Collects performance and operational metrics.
+
+Completed operations are folded into per-operation aggregates (count,
+successes, total/min/max duration), so memory stays constant however many
+operations a long-running process records.
 """
 
 import logging
@@ -24,6 +28,43 @@ class OperationMetric:
     metadata: dict = field(default_factory=dict)
 
 
+@dataclass
+class OperationStats:
+    """Aggregate of completed operations with one name."""
+    count: int = 0
+    success_count: int = 0
+    total_duration: float = 0.0
+    min_duration: Optional[float] = None
+    max_duration: Optional[float] = None
+
+    def add(self, duration: float, success: bool) -> None:
+        """Fold one completed operation into the aggregate."""
+        self.count += 1
+        if success:
+            self.success_count += 1
+        self.total_duration += duration
+        if self.min_duration is None or duration < self.min_duration:
+            self.min_duration = duration
+        if self.max_duration is None or duration > self.max_duration:
+            self.max_duration = duration
+
+    def as_dict(self) -> dict:
+        """Statistics as reported by get_operation_stats."""
+        if not self.count:
+            return {'count': 0}
+
+        return {
+            'count': self.count,
+            'success_count': self.success_count,
+            'failure_count': self.count - self.success_count,
+            'success_rate': self.success_count / self.count,
+            'avg_duration': self.total_duration / self.count,
+            'min_duration': self.min_duration,
+            'max_duration': self.max_duration,
+            'total_duration': self.total_duration
+        }
+
+
 class MetricsCollector:
     """
     Collects operational metrics.
@@ -53,8 +94,8 @@ class MetricsCollector:
         # Active operations
         self._active: dict[str, OperationMetric] = {}
         
-        # Completed operations
-        self._completed: list[OperationMetric] = []
+        # Completed operations, aggregated per operation name
+        self._stats: dict[str, OperationStats] = defaultdict(OperationStats)
         
         # Counters
         self._counters: dict[str, int] = defaultdict(int)
@@ -112,7 +153,7 @@ class MetricsCollector:
         if metadata:
             metric.metadata.update(metadata)
         
-        self._completed.append(metric)
+        self._stats[operation].add(metric.duration, success)
         
         self.logger.debug(
             f"Completed operation: {operation} "
@@ -121,6 +162,30 @@ class MetricsCollector:
         
         return metric.duration
     
+    def record_operation(
+        self,
+        operation: str,
+        duration: float,
+        success: bool = True,
+        metadata: Optional[dict] = None
+    ) -> None:
+        """
+        Record an operation timed by the caller.
+
+        Unlike start/end_operation, any number of operations with the
+        same name may overlap (nested or concurrent spans).
+
+        Args:
+            operation: Operation name
+            duration: Duration in seconds
+            success: Whether operation succeeded
+            metadata: Optional metadata (logged, not retained)
+        """
+        self._stats[operation].add(duration, success)
+
+        if metadata:
+            self.logger.debug(f"Recorded operation: {operation} ({duration:.2f}s) {metadata}")
+
     def increment(self, counter: str, value: int = 1) -> None:
         """Increment counter."""
         self._counters[counter] += value
@@ -131,39 +196,21 @@ class MetricsCollector:
     
     def get_operation_stats(self, operation: str) -> dict:
         """Get statistics for specific operation."""
-        ops = [m for m in self._completed if m.operation == operation]
-        
-        if not ops:
-            return {'count': 0}
-        
-        durations = [m.duration for m in ops if m.duration]
-        successes = sum(1 for m in ops if m.success)
-        
-        return {
-            'count': len(ops),
-            'success_count': successes,
-            'failure_count': len(ops) - successes,
-            'success_rate': successes / len(ops) if ops else 0,
-            'avg_duration': sum(durations) / len(durations) if durations else 0,
-            'min_duration': min(durations) if durations else 0,
-            'max_duration': max(durations) if durations else 0,
-            'total_duration': sum(durations) if durations else 0
-        }
+        stats = self._stats.get(operation)
+        return stats.as_dict() if stats else {'count': 0}
     
     def get_summary(self) -> dict:
         """Get overall metrics summary."""
         total_duration = time.time() - self._start_time
         
-        # Group by operation
-        operations = set(m.operation for m in self._completed)
         operation_stats = {
-            op: self.get_operation_stats(op)
-            for op in operations
+            op: stats.as_dict()
+            for op, stats in self._stats.items()
         }
         
         return {
             'total_duration': total_duration,
-            'operations_completed': len(self._completed),
+            'operations_completed': sum(stats.count for stats in self._stats.values()),
             'operations_active': len(self._active),
             'operation_stats': operation_stats,
             'counters': dict(self._counters)
@@ -172,10 +219,10 @@ class MetricsCollector:
     def reset(self) -> None:
         """Reset all metrics."""
         self._active.clear()
-        self._completed.clear()
+        self._stats.clear()
         self._counters.clear()
         self._start_time = time.time()
         self.logger.info("Metrics reset")
 
 
-__all__ = ['MetricsCollector', 'OperationMetric']
+__all__ = ['MetricsCollector', 'OperationMetric', 'OperationStats']
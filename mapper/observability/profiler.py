@@ -8,6 +8,7 @@ Performance profiling for mapper operations.
 import logging
 import time
 import functools
+from typing import Callable
 from dataclasses import dataclass, field
 from collections import defaultdict
 
@@ -11,6 +11,7 @@ from .catalog_generator import CatalogGenerator
 from .json_exporter import JSONExporter
 from .csv_exporter import CSVExporter
 from .excel_exporter import ExcelExporter
+from .parquet_exporter import ParquetExporter
 
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     'JSONExporter',
     'CSVExporter',
     'ExcelExporter',
+    'ParquetExporter',
 ]
\ No newline at end of file
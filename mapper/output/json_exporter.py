@@ -2,7 +2,8 @@
 """
 JSON Exporter
 
-Exports financial statements to JSON format with hierarchical folder structure.
+Exports financial statements to JSON format with hierarchical folder structure,
+or as a single indexed statement bundle per filing.
 """
 
 import logging
@@ -13,7 +14,17 @@ from typing import Callable
 
 from ..loaders.parser_output import ParsedFiling
 from ..mapping.statement.models import Statement, StatementSet
-from ..mapping.constants import NetworkCategory
+from ..mapping.constants import (
+    NetworkCategory,
+    JSON_LAYOUT_FILES,
+    JSON_LAYOUT_BUNDLE,
+    JSON_LAYOUT_BOTH,
+    STATEMENT_BUNDLE_FILENAME,
+    STATEMENT_FOLDER_CORE,
+    STATEMENT_FOLDER_DETAILS,
+    STATEMENT_FOLDER_OTHER,
+)
+from ..output.statement_bundle import StatementBundleWriter
 
 
 class JSONExporter:
@@ -48,7 +59,8 @@ class JSONExporter:
         parsed_filing: ParsedFiling,
         output_folder: Path,
         filename_creator: Callable,
-        pretty: bool = True
+        pretty: bool = True,
+        layout: str = JSON_LAYOUT_FILES
     ) -> list[Path]:
         """
         Export statements to JSON with folder structure.
@@ -59,10 +71,15 @@ class JSONExporter:
             output_folder: Base output folder
             filename_creator: Function to create filenames
             pretty: Whether to format JSON with indentation
+            layout: 'files' (one file per statement), 'bundle' (one indexed
+                    bundle file) or 'both'
             
         Returns:
-            List of created JSON file paths
+            List of created JSON file paths (and bundle path, if written)
         """
+        write_files = layout in (JSON_LAYOUT_FILES, JSON_LAYOUT_BOTH)
+        write_bundle = layout in (JSON_LAYOUT_BUNDLE, JSON_LAYOUT_BOTH)
+        
         # Track filenames to ensure uniqueness
         filename_counters = {}
         
@@ -96,74 +113,116 @@ class JSONExporter:
             f"{len(detail_statements)} details, {len(other_statements)} other"
         )
         
+        groups = [
+            (STATEMENT_FOLDER_CORE, core_statements),
+            (STATEMENT_FOLDER_DETAILS, detail_statements),
+            (STATEMENT_FOLDER_OTHER, other_statements),
+        ]
+        
+        # The output folder is reused when a filing is re-mapped: remove
+        # outputs of earlier runs (other statement names or another
+        # layout) so readers never pick up stale statements
+        self._remove_previous_outputs(output_folder, groups, remove_bundle=not write_bundle)
+        
         # Create folders
-        core_folder = output_folder / 'core_statements'
-        details_folder = output_folder / 'details'
-        other_folder = output_folder / 'other'
+        if write_files:
+            for folder_name, _ in groups:
+                (output_folder / folder_name).mkdir(exist_ok=True)
         
-        core_folder.mkdir(exist_ok=True)
-        details_folder.mkdir(exist_ok=True)
-        other_folder.mkdir(exist_ok=True)
+        bundle = StatementBundleWriter() if write_bundle else None
+        paths_by_folder = {folder_name: [] for folder_name, _ in groups}
         
-        # Export core statements
-        core_paths = []
-        for statement in core_statements:
-            base_filename = filename_creator(statement)
-            filename = get_unique_filename(base_filename)
-            path = self._export_file(statement, core_folder, filename)
-            core_paths.append(path)
-        
-        # Export detail statements
-        detail_paths = []
-        for statement in detail_statements:
-            base_filename = filename_creator(statement)
-            filename = get_unique_filename(base_filename)
-            path = self._export_file(statement, details_folder, filename)
-            detail_paths.append(path)
-        
-        # Export other statements
-        other_paths = []
-        for statement in other_statements:
-            base_filename = filename_creator(statement)
-            filename = get_unique_filename(base_filename)
-            path = self._export_file(statement, other_folder, filename)
-            other_paths.append(path)
+        # Export statements (core, details, other)
+        for folder_name, statements in groups:
+            for statement in statements:
+                filename = get_unique_filename(filename_creator(statement))
+                document = self._encode_statement(statement)
+                
+                if write_files:
+                    path = output_folder / folder_name / f"{filename}.json"
+                    path.write_bytes(document)
+                    paths_by_folder[folder_name].append(path)
+                
+                if bundle is not None:
+                    bundle.add(
+                        folder_name,
+                        filename,
+                        statement.role_uri,
+                        len(statement.facts),
+                        document
+                    )
         
         # Export aggregated core statements
+        main_path = output_folder / 'MAIN_FINANCIAL_STATEMENTS.json'
         if core_statements:
-            self.export_aggregated_core(
-                core_statements,
-                parsed_filing,
-                output_folder / 'MAIN_FINANCIAL_STATEMENTS.json'
+            self.export_aggregated_core(core_statements, parsed_filing, main_path)
+        else:
+            main_path.unlink(missing_ok=True)
+        
+        all_paths = (
+            paths_by_folder[STATEMENT_FOLDER_CORE] +
+            paths_by_folder[STATEMENT_FOLDER_DETAILS] +
+            paths_by_folder[STATEMENT_FOLDER_OTHER]
+        )
+        
+        if bundle is not None:
+            bundle_path = bundle.write(
+                output_folder / STATEMENT_BUNDLE_FILENAME,
+                self._extract_filing_info(parsed_filing)
             )
+            all_paths.append(bundle_path)
         
-        all_paths = core_paths + detail_paths + other_paths
         self.logger.info(
-            f"Exported {len(core_paths)} core, {len(detail_paths)} details, "
-            f"{len(other_paths)} other JSON files"
+            f"Exported {len(core_statements)} core, {len(detail_statements)} details, "
+            f"{len(other_statements)} other statements (layout: {layout})"
         )
         
         return all_paths
     
-    def _export_file(
+    def _remove_previous_outputs(
         self,
-        statement: Statement,
         output_folder: Path,
-        filename: str
-    ) -> Path:
+        groups: list[tuple[str, list]],
+        remove_bundle: bool
+    ) -> None:
         """
-        Export single statement to JSON file.
+        Remove statement files (and the bundle) written by an earlier export.
         
         Args:
-            statement: Statement to export
-            output_folder: Folder to save to
-            filename: Filename (without extension)
+            output_folder: Base output folder
+            groups: (statement folder, statements) pairs
+            remove_bundle: Also remove the statement bundle
+        """
+        removed = 0
+        
+        for folder_name, _ in groups:
+            folder = output_folder / folder_name
+            if folder.is_dir():
+                for path in folder.glob('*.json'):
+                    path.unlink(missing_ok=True)
+                    removed += 1
+        
+        if remove_bundle:
+            bundle_path = output_folder / STATEMENT_BUNDLE_FILENAME
+            if bundle_path.exists():
+                bundle_path.unlink()
+                removed += 1
+        
+        if removed:
+            self.logger.info(f"Removed {removed} statement outputs of a previous export")
+    
+    def _encode_statement(self, statement: Statement) -> bytes:
+        """
+        Encode single statement as JSON document.
+        
+        Same bytes are used for the standalone file and the bundle entry.
+        
+        Args:
+            statement: Statement to encode
             
         Returns:
-            Path to created file
+            UTF-8 encoded JSON document
         """
-        output_path = output_folder / f"{filename}.json"
-        
         data = {
             'role_uri': statement.role_uri,
             'role_definition': statement.role_definition,
@@ -194,26 +253,10 @@ class JSONExporter:
             ]
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        return output_path
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
     
-    def export_aggregated_core(
-        self,
-        core_statements: list[Statement],
-        parsed_filing: ParsedFiling,
-        output_path: Path
-    ):
-        """
-        Export all core statements in one file.
-        
-        Args:
-            core_statements: List of core statements
-            parsed_filing: Parsed filing data
-            output_path: Path to save aggregated file
-        """
-        # Extract metadata flexibly
+    def _extract_filing_info(self, parsed_filing: ParsedFiling) -> dict[str, any]:
+        """Extract filing metadata flexibly (shared by aggregated file and bundle)."""
         filing_date = (
             self._get_attr(parsed_filing.characteristics, 'filing_date') or
             self._get_attr(parsed_filing.raw_data, 'filing_date') or
@@ -233,14 +276,30 @@ class JSONExporter:
             self._get_attr(parsed_filing.raw_data, 'period_end')
         )
         
+        return {
+            'entity_name': entity_name,
+            'filing_type': filing_type,
+            'period_end': str(period_end) if period_end else None,
+            'filing_date': str(filing_date) if filing_date else None,
+        }
+    
+    def export_aggregated_core(
+        self,
+        core_statements: list[Statement],
+        parsed_filing: ParsedFiling,
+        output_path: Path
+    ):
+        """
+        Export all core statements in one file.
+        
+        Args:
+            core_statements: List of core statements
+            parsed_filing: Parsed filing data
+            output_path: Path to save aggregated file
+        """
         aggregated = {
             'generated_at': datetime.now().isoformat(),
-            'filing_info': {
-                'entity_name': entity_name,
-                'filing_type': filing_type,
-                'period_end': str(period_end) if period_end else None,
-                'filing_date': str(filing_date) if filing_date else None,
-            },
+            'filing_info': self._extract_filing_info(parsed_filing),
             'core_statement_count': len(core_statements),
             'statements': []
         }
@@ -0,0 +1,149 @@
+# Path: output/parquet_exporter.py
+"""
+Parquet Exporter
+
+Exports mapped statement lines to a single columnar Parquet file.
+
+One row per statement fact across all statements of the filing, with
+typed numeric/decimals/period columns and dictionary-encoded concept,
+context and role strings for cross-filing scans.
+"""
+
+import logging
+from pathlib import Path
+
+from ..loaders.parser_output import ParsedFiling
+from ..mapping.statement.models import StatementSet
+from ..mapping.constants import NetworkCategory
+from .value_coercion import to_float, to_int, to_date
+
+
+# Output file name (written in the parquet/ format directory)
+STATEMENT_LINES_FILENAME = 'statement_lines.parquet'
+
+
+class ParquetExporter:
+    """
+    Exports statement lines to Parquet format.
+
+    Creates one file:
+    - statement_lines.parquet
+
+    Columns:
+    role_uri, role_definition, category, statement_type, concept, value,
+    value_numeric, display_value_numeric, context_ref, unit_ref, decimals,
+    scaling_factor, level, order, parent_concept, period_type,
+    period_start, period_end
+    """
+
+    # Columns stored as dictionary-encoded strings
+    DICTIONARY_COLUMNS: tuple[str, ...] = (
+        'role_uri', 'role_definition', 'category', 'statement_type',
+        'concept', 'context_ref', 'unit_ref', 'parent_concept', 'period_type',
+    )
+
+    def __init__(self):
+        """Initialize Parquet exporter."""
+        self.logger = logging.getLogger('output.parquet_exporter')
+
+        # Check if pyarrow is available
+        try:
+            import pyarrow
+            import pyarrow.parquet
+            self.pa = pyarrow
+            self.pq = pyarrow.parquet
+            self.pyarrow_available = True
+        except ImportError:
+            self.pa = None
+            self.pq = None
+            self.pyarrow_available = False
+            self.logger.warning("pyarrow not available, Parquet export will be skipped")
+
+    def export(
+        self,
+        statement_set: StatementSet,
+        parsed_filing: ParsedFiling,
+        output_folder: Path
+    ) -> list[str]:
+        """
+        Export all statement lines to one Parquet file.
+
+        Args:
+            statement_set: Set of statements to export
+            parsed_filing: Parsed filing data
+            output_folder: Base output folder
+
+        Returns:
+            List of created Parquet file paths
+        """
+        if not self.pyarrow_available:
+            self.logger.warning("Skipping Parquet export - pyarrow not available")
+            return []
+
+        rows = {name: [] for name in (
+            'role_uri', 'role_definition', 'category', 'statement_type',
+            'concept', 'value', 'value_numeric', 'display_value_numeric',
+            'context_ref', 'unit_ref', 'decimals', 'scaling_factor',
+            'level', 'order', 'parent_concept', 'period_type',
+            'period_start', 'period_end',
+        )}
+
+        for statement in statement_set.statements:
+            classification = statement.metadata.get('classification', {})
+            category = classification.get('category', NetworkCategory.UNKNOWN)
+            statement_type = classification.get('statement_type', statement.statement_type)
+
+            for fact in statement.facts:
+                rows['role_uri'].append(statement.role_uri)
+                rows['role_definition'].append(statement.role_definition)
+                rows['category'].append(category)
+                rows['statement_type'].append(statement_type)
+                rows['concept'].append(fact.concept)
+                rows['value'].append(None if fact.value is None else str(fact.value))
+                rows['value_numeric'].append(to_float(fact.value))
+                rows['display_value_numeric'].append(to_float(fact.display_value))
+                rows['context_ref'].append(fact.context_ref)
+                rows['unit_ref'].append(fact.unit_ref)
+                rows['decimals'].append(to_int(fact.decimals))
+                rows['scaling_factor'].append(to_int(fact.scaling_factor))
+                rows['level'].append(fact.level)
+                rows['order'].append(fact.order)
+                rows['parent_concept'].append(fact.parent_concept)
+                rows['period_type'].append(fact.period_type)
+                rows['period_start'].append(to_date(fact.period_start))
+                rows['period_end'].append(to_date(fact.period_end))
+
+        pa = self.pa
+        types = {
+            'value_numeric': pa.float64(),
+            'display_value_numeric': pa.float64(),
+            'decimals': pa.int32(),
+            'scaling_factor': pa.int64(),
+            'level': pa.int32(),
+            'order': pa.float64(),
+            'period_start': pa.date32(),
+            'period_end': pa.date32(),
+        }
+
+        columns = {}
+        for name, values in rows.items():
+            array = pa.array(values, types.get(name, pa.string()))
+            if name in self.DICTIONARY_COLUMNS:
+                array = array.dictionary_encode()
+            columns[name] = array
+
+        output_folder.mkdir(parents=True, exist_ok=True)
+        parquet_path = output_folder / STATEMENT_LINES_FILENAME
+
+        self.pq.write_table(
+            pa.table(columns),
+            parquet_path,
+            use_dictionary=list(self.DICTIONARY_COLUMNS),
+            compression='zstd',
+        )
+
+        self.logger.info(f"Exported {len(rows['concept'])} statement lines to {parquet_path}")
+        return [str(parquet_path)]
+
+
+__all__ = ['ParquetExporter', 'STATEMENT_LINES_FILENAME']
@@ -0,0 +1,127 @@
+# Path: output/statement_bundle.py
+"""
+Statement Bundle Writer
+
+Writes every statement of a filing into one indexed bundle file instead of
+hundreds of small JSON files.
+
+Bundle layout:
+    MAGIC      8 bytes   STATEMENT_BUNDLE_MAGIC
+    VERSION    4 bytes   big-endian unsigned int
+    TOC_LENGTH 8 bytes   big-endian unsigned int
+    TOC        JSON      {'version', 'filing_info', 'statements': [...]}
+    DATA       bytes     statement documents, back to back
+
+Each TOC entry records folder, filename, role_uri, fact_count and the
+offset/length of its document inside DATA. Documents are byte-identical
+to the standalone statement JSON files, so readers can load any subset
+with one seek per statement.
+"""
+
+import json
+import logging
+import struct
+from pathlib import Path
+
+from ..mapping.constants import (
+    STATEMENT_BUNDLE_MAGIC,
+    STATEMENT_BUNDLE_VERSION,
+)
+
+
+# Header: magic, version, TOC length
+BUNDLE_HEADER_FORMAT = '>8sIQ'
+
+
+class StatementBundleWriter:
+    """
+    Collects encoded statement documents and writes them as one bundle.
+
+    Example:
+        writer = StatementBundleWriter()
+        writer.add('core_statements', 'balance_sheet', role_uri, 42, payload)
+        writer.write(output_folder / STATEMENT_BUNDLE_FILENAME, filing_info)
+    """
+
+    def __init__(self):
+        """Initialize empty bundle."""
+        self.logger = logging.getLogger('output.statement_bundle')
+        self._entries: list[dict[str, any]] = []
+        self._documents: list[bytes] = []
+        self._offset = 0
+
+    def add(
+        self,
+        folder: str,
+        filename: str,
+        role_uri: str,
+        fact_count: int,
+        document: bytes
+    ) -> None:
+        """
+        Add an encoded statement document.
+
+        Args:
+            folder: Classification folder (core_statements, details, other)
+            filename: Statement filename without extension
+            role_uri: Statement role URI
+            fact_count: Number of facts in statement
+            document: Encoded statement JSON
+        """
+        self._entries.append({
+            'folder': folder,
+            'filename': filename,
+            'role_uri': role_uri,
+            'fact_count': fact_count,
+            'offset': self._offset,
+            'length': len(document),
+        })
+        self._documents.append(document)
+        self._offset += len(document)
+
+    def __len__(self) -> int:
+        """Number of statements in bundle."""
+        return len(self._entries)
+
+    def write(self, output_path: Path, filing_info: dict[str, any]) -> Path:
+        """
+        Write bundle to disk.
+
+        Written to a temporary file and renamed, so readers never see a
+        partially written bundle.
+
+        Args:
+            output_path: Bundle file path
+            filing_info: Filing metadata stored in the TOC
+
+        Returns:
+            Path to bundle file
+        """
+        toc = json.dumps({
+            'version': STATEMENT_BUNDLE_VERSION,
+            'filing_info': filing_info,
+            'statements': self._entries,
+        }, ensure_ascii=False, default=str).encode('utf-8')
+
+        header = struct.pack(
+            BUNDLE_HEADER_FORMAT,
+            STATEMENT_BUNDLE_MAGIC,
+            STATEMENT_BUNDLE_VERSION,
+            len(toc)
+        )
+
+        tmp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            f.write(toc)
+            for document in self._documents:
+                f.write(document)
+        tmp_path.replace(output_path)
+
+        self.logger.info(
+            f"Wrote statement bundle with {len(self._entries)} statements: {output_path}"
+        )
+        return output_path
+
+
+__all__ = ['StatementBundleWriter', 'BUNDLE_HEADER_FORMAT']
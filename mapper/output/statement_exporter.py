@@ -3,7 +3,7 @@
 Statement Exporter with Network Classification Support
 
 Exports statements organized by classification category.
-Delegates to format-specific exporters for JSON, CSV, and Excel.
+Delegates to format-specific exporters for JSON, CSV, Excel and Parquet.
 """
 
 import logging
@@ -15,7 +15,9 @@ from ..output.catalog_generator import CatalogGenerator
 from ..output.json_exporter import JSONExporter
 from ..output.csv_exporter import CSVExporter
 from ..output.excel_exporter import ExcelExporter
-from ..mapping.constants import NetworkCategory
+from ..output.parquet_exporter import ParquetExporter
+from ..mapping.constants import NetworkCategory, JSON_LAYOUT_FILES, JSON_LAYOUTS
+from ..observability.instrumentation import get_instrumentation
 
 
 class StatementSetExporter:
@@ -23,14 +25,29 @@ class StatementSetExporter:
     Export statement sets with classification-based organization.
     """
     
-    def __init__(self):
+    def __init__(self, json_layout: str = JSON_LAYOUT_FILES):
+        """
+        Initialize statement exporter.
+        
+        Args:
+            json_layout: JSON statement layout ('files', 'bundle' or 'both')
+        """
+        if json_layout not in JSON_LAYOUTS:
+            raise ValueError(
+                f"Unknown JSON layout '{json_layout}'. "
+                f"Supported: {', '.join(JSON_LAYOUTS)}"
+            )
+        
         self.logger = logging.getLogger('output.statement_exporter')
+        self.instrumentation = get_instrumentation()
+        self.json_layout = json_layout
         self.catalog_generator = CatalogGenerator()
         
         # Initialize format-specific exporters
         self.json_exporter = JSONExporter(self._get_attr)
         self.csv_exporter = CSVExporter()
         self.excel_exporter = ExcelExporter()
+        self.parquet_exporter = ParquetExporter()
     
     @staticmethod
     def _get_attr(data, attr, default=None):
@@ -139,16 +156,19 @@ class StatementSetExporter:
             List of created JSON file paths
         """
         # Delegate to JSON exporter
-        json_paths = self.json_exporter.export(
-            statement_set,
-            parsed_filing,
-            output_folder,
-            filename_creator=self._create_filename,
-            pretty=pretty
-        )
+        with self.instrumentation.span('export.json.statements'):
+            json_paths = self.json_exporter.export(
+                statement_set,
+                parsed_filing,
+                output_folder,
+                filename_creator=self._create_filename,
+                pretty=pretty,
+                layout=self.json_layout
+            )
         
         # Generate catalog
-        self._export_catalog(statement_set, parsed_filing, output_folder)
+        with self.instrumentation.span('export.json.catalog'):
+            self._export_catalog(statement_set, parsed_filing, output_folder)
         
         return json_paths
     
@@ -303,4 +323,24 @@ class StatementSetExporter:
             parsed_filing,
             output_folder,
             filename_creator=self._create_filename
-        )
\ No newline at end of file
+        )
+    
+    def export_parquet(self, statement_set, parsed_filing, output_folder):
+        """
+        Export statement lines to columnar Parquet format.
+        
+        Delegates to ParquetExporter for actual export logic.
+        
+        Args:
+            statement_set: Set of statements to export
+            parsed_filing: Parsed filing data
+            output_folder: Base output folder path
+            
+        Returns:
+            List of created Parquet file paths
+        """
+        return self.parquet_exporter.export(
+            statement_set,
+            parsed_filing,
+            output_folder
+        )
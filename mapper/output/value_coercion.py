@@ -0,0 +1,50 @@
+# Path: output/value_coercion.py
+"""
+Value Coercion
+
+Typed conversions of fact values and attributes for columnar exports
+(numeric value, integer decimals, date periods). Values that do not
+convert become None (null) instead of failing the export.
+"""
+
+from datetime import date, datetime
+from typing import Optional
+
+
+def to_float(value: any) -> Optional[float]:
+    """Parse numeric value, returning None for non-numeric values."""
+    if value is None or value == '' or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).strip().replace(',', ''))
+    except ValueError:
+        return None
+
+
+def to_int(value: any) -> Optional[int]:
+    """Parse integer attribute ('INF' and invalid values become None)."""
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_date(value: any) -> Optional[date]:
+    """Parse ISO date (or datetime) string into a date."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+__all__ = ['to_float', 'to_int', 'to_date']
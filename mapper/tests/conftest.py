@@ -0,0 +1,11 @@
+# Path: tests/conftest.py
+"""
+Mapper test setup.
+
+Run from the repository root: python -m pytest mapper/tests
+
+mapper.output and mapper.mapping import each other; load them in the
+order mapper.py does (mapping first).
+"""
+
+import mapper.mapping  # noqa: F401
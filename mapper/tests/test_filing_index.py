@@ -0,0 +1,133 @@
+# Path: tests/test_filing_index.py
+"""
+Filing directory resolution from the catalog and the mapper's own index.
+"""
+
+import json
+
+from mapper.loaders.filing_index import FilingDirectoryIndex
+from mapper.loaders.constants import FILING_CATALOG_FILENAME, SOURCE_RECORD_FILENAME
+
+
+def _filing(root, company, form, accession, instance):
+    filing_dir = root / 'sec' / company / 'filings' / form / accession
+    filing_dir.mkdir(parents=True)
+    (filing_dir / instance).write_text('<xbrl/>')
+    return filing_dir
+
+
+def _catalog(root, filing_dir, date):
+    record = {
+        'market': 'sec',
+        'company': filing_dir.parents[2].name,
+        'form': filing_dir.parent.name,
+        'date': date,
+        'accession': filing_dir.name,
+        'path': filing_dir.relative_to(root).as_posix(),
+    }
+    with open(root / FILING_CATALOG_FILENAME, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + '\n')
+
+
+def _counting_scans(index):
+    scans = []
+    scan = index._scan
+
+    def counted():
+        scans.append(1)
+        return scan()
+
+    index._scan = counted
+    return scans
+
+
+def test_catalog_merged_with_persisted_index(tmp_path):
+    root = tmp_path / 'entities'
+    index_path = tmp_path / 'mapped' / '.filing_index.json'
+    old = _filing(root, 'Acme', '10-K', '0001-22-000001', 'acme-20221231_htm.xml')
+
+    # First run: persisted index of the pre-catalog filing
+    assert FilingDirectoryIndex(root, index_path).refresh() == 1
+
+    # Catalog started afterwards: only new filings are cataloged
+    new = _filing(root, 'Acme', '10-K', '0001-23-000001', 'acme-20231231_htm.xml')
+    _catalog(root, new, '2023-12-31')
+
+    index = FilingDirectoryIndex(root, index_path)
+    scans = _counting_scans(index)
+
+    assert index.find('Acme', '10-K', '2023-12-31') == new
+    assert index.find('Acme', '10-K', '2022-12-31') == old
+    assert index.find_by_accession('0001-22-000001') == old
+    assert scans == []
+
+    # Dates read for the lookup are persisted
+    data = json.loads(index_path.read_text())
+    assert [r['date'] for r in data['filings'] if r['path'].endswith('000001')] == ['2022-12-31']
+
+
+def test_undated_match_rescans_before_falling_back(tmp_path):
+    root = tmp_path / 'entities'
+    older = _filing(root, 'Acme', '10-K', '0001-22-000001', 'acme-20221231_htm.xml')
+    _catalog(root, older, '2022-12-31')
+
+    index = FilingDirectoryIndex(root)
+    scans = _counting_scans(index)
+    assert index.find_by_accession('0001-22-000001') == older
+    loaded = len(scans)
+
+    # Filed (and cataloged) after the index was loaded: found by the rescan
+    newer = _filing(root, 'Acme', '10-K', '0001-24-000001', 'acme-20241231_htm.xml')
+    _catalog(root, newer, '2024-12-31')
+    assert index.find('Acme', '10-K', '2024-12-31') == newer
+    assert len(scans) == loaded + 1
+
+    assert index.find('Acme', '10-K', '2022-12-31') == older
+    assert len(scans) == loaded + 1
+
+    # No filing has the date and the tree is unchanged: latest filing
+    assert index.find('Acme', '10-K', '2020-12-31') == newer
+    assert len(scans) == loaded + 1
+
+
+def test_misses_rescan_only_after_tree_changes(tmp_path):
+    root = tmp_path / 'entities'
+    filing_dir = _filing(root, 'Acme', '10-K', '0001-23-000001', 'acme-20231231_htm.xml')
+    _catalog(root, filing_dir, '2023-12-31')
+
+    index = FilingDirectoryIndex(root)
+    scans = _counting_scans(index)
+    assert index.find('Acme', '10-K', '2023-12-31') == filing_dir
+    loaded = len(scans)
+
+    # Repeated misses on an unchanged tree do not rescan
+    for _ in range(3):
+        assert index.find('Other', '10-K', '2023-12-31') is None
+        assert index.find_by_accession('0009-23-000009') is None
+    assert len(scans) == loaded
+
+    # Indexed directory removed: rescanned
+    (filing_dir / 'acme-20231231_htm.xml').unlink()
+    filing_dir.rmdir()
+    assert index.find_by_accession('0001-23-000001') is None
+    assert len(scans) == loaded + 1
+
+    # Still cataloged, but known to be missing: not rescanned again
+    assert index.find_by_accession('0001-23-000001') is None
+    assert len(scans) == loaded + 1
+
+
+def test_source_record_resolves_without_index(tmp_path):
+    root = tmp_path / 'entities'
+    filing_dir = _filing(root, 'Acme', '10-K', '0001-23-000001', 'acme-20231231_htm.xml')
+    parsed_dir = tmp_path / 'parsed' / 'sec' / 'Acme' / '10-K' / '2023-12-31'
+    parsed_dir.mkdir(parents=True)
+    (parsed_dir / SOURCE_RECORD_FILENAME).write_text(
+        json.dumps({'source_path': str(filing_dir), 'accession': filing_dir.name})
+    )
+
+    index = FilingDirectoryIndex(root)
+    scans = _counting_scans(index)
+
+    assert index.resolve(parsed_dir / 'parsed.json') == filing_dir
+    assert scans == []
@@ -0,0 +1,82 @@
+# Path: tests/test_filing_source.py
+"""
+Filings stored as archives (not extracted) are read in place.
+"""
+
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from mapper.loaders.filing_source import ArchiveFilingSource, DirectoryFilingSource
+from mapper.loaders.xbrl_filings import XBRLFilingsLoader
+
+MEMBERS = {
+    'acme-20231231.xsd': b'<schema/>',
+    'acme-20231231_pre.xml': b'<linkbase/>',
+}
+
+
+class _Config:
+    def __init__(self, xbrl_path):
+        self.values = {'xbrl_filings_path': xbrl_path}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+def _write_tar(path, mode):
+    with tarfile.open(path, mode) as tf:
+        for name, data in MEMBERS.items():
+            info = tarfile.TarInfo(f"./{name}")
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+
+def _write_zip(path):
+    with zipfile.ZipFile(path, 'w') as zf:
+        for name, data in MEMBERS.items():
+            zf.writestr(name, data)
+
+
+@pytest.mark.parametrize('name, mode', [
+    ('filing.tar', 'w'),
+    ('filing.tar.gz', 'w:gz'),
+    ('filing.tgz', 'w:gz'),
+    ('filing.tar.xz', 'w:xz'),
+])
+def test_tar_archive_members(tmp_path, name, mode):
+    archive = tmp_path / name
+    _write_tar(archive, mode)
+
+    with ArchiveFilingSource([archive]) as filing:
+        schemas = filing.list_files(['.xsd'])
+        assert schemas == [archive / 'acme-20231231.xsd']
+        with filing.open(schemas[0]) as f:
+            assert f.read() == b'<schema/>'
+        assert len(filing.list_files()) == 2
+
+
+def test_open_filing_reads_stored_archives(tmp_path):
+    filing_dir = tmp_path / 'sec' / 'Acme' / 'filings' / '10-K' / '0001-23-000001'
+    filing_dir.mkdir(parents=True)
+    _write_tar(filing_dir / 'filing.tar.gz', 'w:gz')
+    _write_zip(filing_dir / 'exhibits.zip')
+
+    loader = XBRLFilingsLoader(_Config(tmp_path))
+    relative = filing_dir.relative_to(tmp_path)
+
+    with loader.open_filing(relative) as filing:
+        assert isinstance(filing, ArchiveFilingSource)
+        names = sorted(Path(p).name for p in filing.list_files(['.xml']))
+        assert names == ['acme-20231231_pre.xml', 'acme-20231231_pre.xml']
+
+    with loader.open_filing(relative / 'filing.tar.gz') as filing:
+        assert isinstance(filing, ArchiveFilingSource)
+
+    (filing_dir / 'acme-20231231.xsd').write_bytes(b'<schema/>')
+    loader.clear_cache()
+    with loader.open_filing(relative) as filing:
+        assert isinstance(filing, DirectoryFilingSource)
@@ -0,0 +1,44 @@
+# Path: tests/test_json_exporter.py
+"""
+Re-exporting a filing leaves no statements of an earlier export behind.
+"""
+
+from types import SimpleNamespace
+
+from mapper.mapping.constants import (
+    JSON_LAYOUT_BUNDLE,
+    JSON_LAYOUT_FILES,
+    STATEMENT_BUNDLE_FILENAME,
+    STATEMENT_FOLDER_OTHER,
+)
+from mapper.mapping.statement.models import Statement, StatementSet
+from mapper.output.json_exporter import JSONExporter
+
+
+def _get_attr(obj, name, default=None):
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _export(folder, names, layout):
+    statements = StatementSet(statements=[Statement(role_uri=f"http://x/{n}") for n in names])
+    filing = SimpleNamespace(characteristics={}, raw_data={})
+    return JSONExporter(_get_attr).export(
+        statements, filing, folder, lambda s: s.role_uri.rsplit('/', 1)[-1], layout=layout
+    )
+
+
+def _files(folder):
+    return sorted(p.relative_to(folder).as_posix() for p in folder.rglob('*') if p.is_file())
+
+
+def test_layout_switch_removes_previous_outputs(tmp_path):
+    _export(tmp_path, ['Old'], JSON_LAYOUT_BUNDLE)
+    assert (tmp_path / STATEMENT_BUNDLE_FILENAME).exists()
+
+    _export(tmp_path, ['New'], JSON_LAYOUT_FILES)
+    assert _files(tmp_path) == [f"{STATEMENT_FOLDER_OTHER}/New.json"]
+
+    _export(tmp_path, ['Newer'], JSON_LAYOUT_BUNDLE)
+    assert _files(tmp_path) == [STATEMENT_BUNDLE_FILENAME]
@@ -0,0 +1,29 @@
+# Path: tests/test_metrics.py
+"""
+Operation metrics are aggregated, not kept per operation.
+"""
+
+from mapper.observability.metrics import MetricsCollector
+
+
+def test_recorded_operations_aggregate():
+    metrics = MetricsCollector()
+    for duration in (0.5, 2.0, 1.0):
+        metrics.record_operation('mapping.export', duration)
+    metrics.record_operation('mapping.export', 0.25, success=False, metadata={'format': 'csv'})
+
+    stats = metrics.get_operation_stats('mapping.export')
+    assert stats['count'] == 4
+    assert stats['failure_count'] == 1
+    assert stats['min_duration'] == 0.25
+    assert stats['max_duration'] == 2.0
+    assert stats['total_duration'] == 3.75
+    assert stats['avg_duration'] == 3.75 / 4
+
+    summary = metrics.get_summary()
+    assert summary['operations_completed'] == 4
+    assert list(summary['operation_stats']) == ['mapping.export']
+    assert metrics.get_operation_stats('mapping.load_parsed') == {'count': 0}
+
+    metrics.reset()
+    assert metrics.get_summary()['operations_completed'] == 0
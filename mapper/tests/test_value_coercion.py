@@ -0,0 +1,40 @@
+# Path: tests/test_value_coercion.py
+"""
+Typed conversions used by the Parquet export.
+"""
+
+from datetime import date, datetime
+
+from mapper.core.config_loader import DEFAULT_EXPORT_FORMATS
+from mapper.output.value_coercion import to_float, to_int, to_date
+
+
+def test_to_float():
+    assert to_float('1,234.5') == 1234.5
+    assert to_float(' -7 ') == -7.0
+    assert to_float(3) == 3.0
+    assert to_float('') is None
+    assert to_float(None) is None
+    assert to_float(True) is None
+    assert to_float('n/a') is None
+
+
+def test_to_int():
+    assert to_int('-3') == -3
+    assert to_int(2) == 2
+    assert to_int('INF') is None
+    assert to_int('') is None
+    assert to_int(None) is None
+
+
+def test_to_date():
+    assert to_date('2024-09-28') == date(2024, 9, 28)
+    assert to_date('2024-09-28T00:00:00Z') == date(2024, 9, 28)
+    assert to_date(datetime(2024, 9, 28, 12)) == date(2024, 9, 28)
+    assert to_date(date(2024, 9, 28)) == date(2024, 9, 28)
+    assert to_date('') is None
+    assert to_date('28/09/2024') is None
+
+
+def test_parquet_export_is_opt_in():
+    assert 'parquet' not in DEFAULT_EXPORT_FORMATS.split(',')
@@ -213,6 +213,9 @@ class ConfigLoader:
             'json_pretty_print': self._get_bool('PARSER_JSON_PRETTY_PRINT', True),
             'json_indent': self._get_int('PARSER_JSON_INDENT', 2),
             'enable_output_compression': self._get_bool('PARSER_ENABLE_OUTPUT_COMPRESSION', False),
+            'enable_columnar_export': self._get_bool('PARSER_ENABLE_COLUMNAR_EXPORT', True),
+            'output_profile': self._get_env('PARSER_OUTPUT_PROFILE', 'full'),
+            'workflow_output_profile': self._get_env('PARSER_WORKFLOW_OUTPUT_PROFILE', 'minimal'),
             
             # ================================================================
             # FEATURE FLAGS
@@ -1,10 +1,18 @@
 # Path: core/ui/cli.py
-"""CLI for XBRL Filing Selection - Uses XBRLFilingsLoader to get filing info."""
+"""CLI for XBRL Filing Selection - Uses XBRLFilingsLoader to get filing info.
+
+Filings are listed from the filing catalog (FilingCatalog) kept current by
+the downloader. The file-by-file walk of the filings tree only runs while
+the catalog is not seeded yet (it then seeds it, keeping records the
+downloader already appended) or on explicit rebuild.
+"""
 
 from dataclasses import dataclass
 from pathlib import Path
-import re
-from ...loaders import XBRLFilingsLoader
+from typing import Optional
+from ...loaders import XBRLFilingsLoader, FilingCatalog
+from ...loaders.filing_catalog import filing_date
+from ..config_loader import ConfigLoader
 import logging 
 
 @dataclass
@@ -19,13 +27,65 @@ class FilingEntry:
 class FilingCLI:
     """Interactive filing selector - delegates file discovery to loader."""
     
-    def __init__(self):
-        self.loader = XBRLFilingsLoader()
+    def __init__(self, use_catalog: bool = True, config: Optional[ConfigLoader] = None):
+        self.loader = XBRLFilingsLoader(config)
+        self.catalog = FilingCatalog(self.loader.xbrl_path)
+        self.use_catalog = use_catalog
         self.filings: list[FilingEntry] = []
         self.logger = logging.getLogger('input.cli') 
         self.logger.info("FilingCLI initialized")  
     
     def discover(self) -> list[FilingEntry]:
+        """List filings from the catalog (walks the tree until it is seeded)."""
+        if self.use_catalog and self.catalog.is_complete():
+            filings = [self._entry_from_record(r) for r in self.catalog.load()]
+            filings.sort(key=lambda f: (f.company, f.form, f.date))
+            self.filings = filings
+            self.logger.info(f"Filings discovered from catalog: {len(filings)}")
+            return filings
+        
+        filings = self.discover_from_files()
+        
+        if self.use_catalog:
+            # First run on this tree (or on a catalog the downloader started
+            # before the tree was listed): seed it, downloader keeps it current
+            self._write_catalog(filings)
+        
+        return filings
+    
+    def rebuild_catalog(self) -> list[FilingEntry]:
+        """Rebuild the catalog from a full walk of the filings tree."""
+        filings = self.discover_from_files()
+        self._write_catalog(filings)
+        return filings
+    
+    def query(
+        self,
+        market: Optional[str] = None,
+        company: Optional[str] = None,
+        form: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        pattern: Optional[str] = None
+    ) -> list[FilingEntry]:
+        """Select filings by catalog fields or path glob (see FilingCatalog.query)."""
+        if not self.catalog.is_complete():
+            self.discover()
+        
+        records = self.catalog.query(
+            market=market, company=company, form=form,
+            since=since, until=until, pattern=pattern
+        )
+        return [self._entry_from_record(r) for r in records]
+    
+    def entry_for_path(self, filing_dir: Path) -> Optional[FilingEntry]:
+        """Filing entry for a filing directory (catalog first, then path layout)."""
+        record = self.catalog.find(filing_dir)
+        if record:
+            return self._entry_from_record(record)
+        return self._build_filing_entry(Path(filing_dir))
+    
+    def discover_from_files(self) -> list[FilingEntry]:
         """Use loader to discover filings, then organize them."""
         # Get ALL files from loader
         all_files = self.loader.discover_all_files()
@@ -50,6 +110,30 @@ class FilingCLI:
         self.logger.info(f"Filings discovered: {len(filings)}")
         return filings
     
+    def _entry_from_record(self, record: dict) -> FilingEntry:
+        """Convert catalog record to filing entry."""
+        return FilingEntry(
+            market=record.get('market', ''),
+            company=record.get('company', ''),
+            form=record.get('form', ''),
+            date=record.get('date', ''),
+            path=self.catalog.resolve(record)
+        )
+    
+    def _write_catalog(self, filings: list[FilingEntry]) -> None:
+        """Write catalog from a full listing (downloader records kept)."""
+        records = []
+        for f in filings:
+            # Downloader records carry accession number and filing date
+            record = self.catalog.find(f.path)
+            if record is None:
+                try:
+                    record = self.catalog.make_record(f.market, f.company, f.form, f.date, f.path)
+                except ValueError:
+                    continue  # Outside catalog root
+            records.append(record)
+        self.catalog.write(records)
+    
     def _find_filing_directory(self, file_path: Path) -> Path:
         """Find the filing directory from a file path.
         
@@ -98,17 +182,7 @@ class FilingCLI:
     
     def _extract_date(self, filing_dir: Path) -> str:
         """Extract date from instance file names in this directory."""
-        date_pattern = re.compile(r'[-_](\d{8})[._]')
-        
-        # Look through files in this directory
-        for f in filing_dir.rglob('*'):
-            if f.is_file() and f.suffix in ['.xml', '.htm', '.html']:
-                match = date_pattern.search(f.name)
-                if match:
-                    d = match.group(1)
-                    return f"{d[0:4]}-{d[4:6]}-{d[6:8]}"
-        
-        return filing_dir.name
+        return filing_date(filing_dir)
     
     def display(self) -> None:
         """Display numbered list of filings."""
@@ -154,7 +228,7 @@ class FilingCLI:
                 
             except ValueError:
                 print(f"[ERROR] '{user_input}' is not a number.\n")
-                self.logger.warning(f"User input error: {f"Invalid input: {user_input}"}")
+                self.logger.warning(f"User input error: Invalid input: {user_input}")
             except KeyboardInterrupt:
                 print("\n\nCancelled.")
                 raise
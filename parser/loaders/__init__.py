@@ -11,5 +11,6 @@ Calling code decides what to do with the files.
 
 from .xbrl_filings import XBRLFilingsLoader
 from .taxonomy import TaxonomyLoader
+from .filing_catalog import FilingCatalog
 
-__all__ = ['XBRLFilingsLoader', 'TaxonomyLoader']
\ No newline at end of file
+__all__ = ['XBRLFilingsLoader', 'TaxonomyLoader', 'FilingCatalog']
\ No newline at end of file
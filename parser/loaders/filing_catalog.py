@@ -0,0 +1,304 @@
+# Path: loaders/filing_catalog.py
+"""
+Filing Catalog
+
+Persistent index of downloaded filings (market, company, form, date,
+path) at the root of the XBRL filings tree.
+
+The downloader appends one record per filing it downloads, so listing
+filings is one file read instead of a walk over every file of the
+archive. Catalog format: see downloader/engine/filing_catalog.py.
+
+Only a seeded catalog (header line written from a full listing of the
+tree, see FilingCLI) is complete; until then listings fall back to the
+filesystem walk, which seeds it.
+
+DESIGN PRINCIPLES:
+- NO parsing - just filing metadata and locations
+- Market-agnostic
+
+RESPONSIBILITY: Read, query and write the filing catalog.
+"""
+
+import fnmatch
+import json
+import logging
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+CATALOG_FILENAME = '.filing_catalog.jsonl'
+CATALOG_FORMAT_VERSION = 1
+
+# Header field marking a catalog seeded from a full listing of the tree
+CATALOG_SEEDED_FIELD = 'seeded_at'
+
+# Catalog 'date' rule: YYYYMMDD in instance file names (e.g. aapl-20240928.htm)
+FILING_DATE_PATTERN = re.compile(r'[-_](\d{8})[._]')
+FILING_DATE_FILE_SUFFIXES = ('.xml', '.htm', '.html')
+
+
+def filing_date(filing_dir: Path) -> str:
+    """
+    Catalog date of a filing directory.
+
+    Args:
+        filing_dir: Filing (accession) directory
+
+    Returns:
+        YYYY-MM-DD from the first dated instance file name, or the
+        directory name if none is dated
+    """
+    filing_dir = Path(filing_dir)
+    for f in filing_dir.rglob('*'):
+        if f.is_file() and f.suffix in FILING_DATE_FILE_SUFFIXES:
+            match = FILING_DATE_PATTERN.search(f.name)
+            if match:
+                d = match.group(1)
+                return f"{d[0:4]}-{d[4:6]}-{d[6:8]}"
+
+    return filing_dir.name
+
+
+class FilingCatalog:
+    """
+    Filing catalog stored at the root of the filings tree.
+
+    Example:
+        catalog = FilingCatalog(filings_root)
+        if catalog.exists():
+            for record in catalog.query(form='10-K', since='2024-01-01'):
+                print(catalog.resolve(record))
+    """
+
+    def __init__(self, root: Path):
+        """
+        Initialize catalog.
+
+        Args:
+            root: Root of the XBRL filings tree
+        """
+        self.root = Path(root)
+        self.path = self.root / CATALOG_FILENAME
+        self.logger = logging.getLogger('input.filing_catalog')
+        self._resolved_root = self.root.resolve()
+
+        # Records by path and header, reread only when the file changes
+        self._records: dict[str, dict] = {}
+        self._header: Optional[dict] = None
+        self._signature: Optional[tuple] = None
+
+    def exists(self) -> bool:
+        """Check if a catalog has been written."""
+        return self.path.is_file()
+
+    def is_complete(self) -> bool:
+        """Check if the catalog was seeded from a full listing of the tree."""
+        self._read()
+        return self._header is not None
+
+    def load(self, verify_paths: bool = True) -> list[dict]:
+        """
+        Read current catalog records.
+
+        Args:
+            verify_paths: Drop records whose filing directory is gone
+                (one stat per filing)
+
+        Returns:
+            One record per filing path, last written wins
+        """
+        self._read()
+        result = list(self._records.values())
+
+        if verify_paths:
+            result = [r for r in result if self.resolve(r).is_dir()]
+
+        self.logger.info(f"Filing catalog loaded: {len(result)} filings")
+        return result
+
+    def query(
+        self,
+        market: Optional[str] = None,
+        company: Optional[str] = None,
+        form: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        pattern: Optional[str] = None,
+        verify_paths: bool = True
+    ) -> list[dict]:
+        """
+        Select catalog records.
+
+        Args:
+            market: Market (case-insensitive)
+            company: Company directory name, glob allowed (case-insensitive)
+            form: Form type (case-insensitive)
+            since: Earliest date, inclusive (YYYY-MM-DD)
+            until: Latest date, inclusive (YYYY-MM-DD)
+            pattern: Glob over the relative filing path
+                (e.g. 'sec/*/filings/10-K/*')
+            verify_paths: Drop records whose filing directory is gone
+
+        Returns:
+            Matching records sorted by company, form, date
+        """
+        selected = []
+
+        for record in self.load(verify_paths=verify_paths):
+            if market and (record.get('market') or '').lower() != market.lower():
+                continue
+            if company and not fnmatch.fnmatch(
+                (record.get('company') or '').lower(), company.lower()
+            ):
+                continue
+            if form and (record.get('form') or '').lower() != form.lower():
+                continue
+            date = record.get('date') or ''
+            if since and date < since:
+                continue
+            if until and date > until:
+                continue
+            if pattern and not fnmatch.fnmatch(record['path'], pattern):
+                continue
+            selected.append(record)
+
+        selected.sort(key=lambda r: (r.get('company', ''), r.get('form', ''), r.get('date', '')))
+        return selected
+
+    def find(self, filing_dir: Path) -> Optional[dict]:
+        """
+        Get record for a filing directory.
+
+        Args:
+            filing_dir: Filing (accession) directory
+
+        Returns:
+            Record or None if not cataloged
+        """
+        try:
+            relative = Path(filing_dir).resolve().relative_to(self._resolved_root).as_posix()
+        except ValueError:
+            return None
+
+        self._read()
+        return self._records.get(relative)
+
+    def resolve(self, record: dict) -> Path:
+        """Absolute filing directory of a record."""
+        return self.root / record['path']
+
+    def make_record(
+        self,
+        market: str,
+        company: str,
+        form: str,
+        date: str,
+        filing_dir: Path
+    ) -> dict:
+        """
+        Build catalog record for a filing directory.
+
+        Args:
+            market: Market
+            company: Company directory name
+            form: Form type
+            date: Filing date (YYYY-MM-DD, or directory name if unknown)
+            filing_dir: Filing (accession) directory below root
+
+        Returns:
+            Record dictionary
+        """
+        filing_dir = Path(filing_dir)
+        return {
+            'format_version': CATALOG_FORMAT_VERSION,
+            'market': market,
+            'company': company,
+            'form': form,
+            'date': date,
+            'accession': filing_dir.name,
+            'path': filing_dir.relative_to(self.root).as_posix(),
+            'filing_date': None,
+            'cataloged_at': datetime.now(timezone.utc).isoformat(),
+        }
+
+    def write(self, records: list[dict]) -> bool:
+        """
+        Replace catalog with the records of a full listing (atomic).
+
+        Writes the seeded header, so the catalog counts as complete.
+
+        Args:
+            records: Complete list of records
+
+        Returns:
+            True if written
+        """
+        header = {
+            'format_version': CATALOG_FORMAT_VERSION,
+            CATALOG_SEEDED_FIELD: datetime.now(timezone.utc).isoformat(),
+            'filings': len(records),
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(header) + '\n')
+                for record in records:
+                    f.write(json.dumps(record) + '\n')
+            tmp_path.replace(self.path)
+        except OSError as e:
+            self.logger.warning(f"Cannot write filing catalog {self.path}: {e}")
+            return False
+
+        self.logger.info(f"Filing catalog written: {len(records)} filings")
+        return True
+
+    def _read(self) -> None:
+        """Read catalog into records by path (skipped while unchanged)."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            self._records, self._header, self._signature = {}, None, None
+            return
+
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if signature == self._signature:
+            return
+
+        records: dict[str, dict] = {}
+        header = None
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if not isinstance(record, dict):
+                        continue
+                    if record.get('path'):
+                        records[record['path']] = record
+                    elif CATALOG_SEEDED_FIELD in record:
+                        header = record
+        except OSError as e:
+            self.logger.warning(f"Cannot read filing catalog {self.path}: {e}")
+            self._records, self._header, self._signature = {}, None, None
+            return
+
+        self._records, self._header, self._signature = records, header, signature
+
+
+__all__ = [
+    'FilingCatalog',
+    'filing_date',
+    'CATALOG_FILENAME',
+    'CATALOG_FORMAT_VERSION',
+    'CATALOG_SEEDED_FIELD',
+]
@@ -14,6 +14,10 @@ from .formats import (
 from .extracted_data import DataExtractor
 from .parsed_report import ReportGenerator
 from .excel_exporter import ExcelExporter
+from .columnar_exporter import ColumnarExporter
+from .parsed_json import write_parsed_json
+from .profiles import OutputProfile, OUTPUT_PROFILES, get_output_profile
+from .source_record import write_source_record, SOURCE_RECORD_FILENAME
 
 __all__ = [
     'OutputFormat',
@@ -23,4 +27,11 @@ __all__ = [
     'DataExtractor',
     'ReportGenerator',
     'ExcelExporter',
+    'ColumnarExporter',
+    'write_parsed_json',
+    'OutputProfile',
+    'OUTPUT_PROFILES',
+    'get_output_profile',
+    'write_source_record',
+    'SOURCE_RECORD_FILENAME',
 ]
\ No newline at end of file
@@ -0,0 +1,215 @@
+# Path: xbrl_parser/output/columnar_exporter.py
+"""
+Columnar Export Utilities
+
+Export facts and contexts to Parquet files for cross-filing analytics.
+
+Columns are typed (numeric value, integer decimals, date periods) and the
+repeating strings (concept, context, unit, entity) are dictionary-encoded,
+so scans across thousands of filings can use predicate pushdown instead
+of re-reading parsed.json or facts.csv.
+
+Requires pyarrow package for Parquet file creation.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+from xbrl_parser.models.parsed_filing import ParsedFiling
+from output.extracted_data.data_extractor import DataExtractor
+from output.value_coercion import to_str, to_float, to_int, to_date
+
+
+# Output file names (written next to parsed.json)
+FACTS_PARQUET_FILENAME = "facts.parquet"
+CONTEXTS_PARQUET_FILENAME = "contexts.parquet"
+
+# XBRL decimals value meaning "exact" - stored as null in the integer column
+DECIMALS_INFINITE = "INF"
+
+
+class ColumnarExporter:
+    """
+    Export XBRL facts and contexts to Parquet.
+
+    Produces two files:
+    - facts.parquet: One row per fact with typed value/decimals/period columns
+    - contexts.parquet: One row per context with typed period columns
+
+    Example:
+        exporter = ColumnarExporter()
+        if exporter.has_pyarrow:
+            exporter.export(filing, filing_folder)
+    """
+
+    # Columns stored as dictionary-encoded strings
+    FACT_DICTIONARY_COLUMNS: tuple[str, ...] = (
+        'concept', 'context_ref', 'unit_ref', 'fact_type',
+        'entity_identifier', 'period_type', 'unit_measures',
+    )
+    CONTEXT_DICTIONARY_COLUMNS: tuple[str, ...] = (
+        'context_id', 'entity_scheme', 'entity_identifier', 'period_type',
+    )
+
+    def __init__(self):
+        """Initialize columnar exporter."""
+        self.logger = logging.getLogger(__name__)
+        self.extractor = DataExtractor()
+
+        # Check if pyarrow available
+        try:
+            import pyarrow
+            import pyarrow.parquet
+            self.pa = pyarrow
+            self.pq = pyarrow.parquet
+            self.has_pyarrow = True
+        except ImportError:
+            self.pa = None
+            self.pq = None
+            self.has_pyarrow = False
+            self.logger.warning(
+                "pyarrow not available. Columnar export disabled. "
+                "Install with: pip install pyarrow"
+            )
+
+    def export(self, filing: ParsedFiling, output_folder: Path) -> list[Path]:
+        """
+        Export facts and contexts to Parquet files in output_folder.
+
+        Args:
+            filing: Parsed filing
+            output_folder: Folder to write Parquet files into
+
+        Returns:
+            list of created file paths
+
+        Raises:
+            ImportError: If pyarrow not installed
+        """
+        output_folder = Path(output_folder)
+        paths = [
+            self.save_facts_parquet(filing, output_folder / FACTS_PARQUET_FILENAME),
+            self.save_contexts_parquet(filing, output_folder / CONTEXTS_PARQUET_FILENAME),
+        ]
+        return [p for p in paths if p is not None]
+
+    def save_facts_parquet(self, filing: ParsedFiling, output_path: Path) -> Optional[Path]:
+        """
+        Save facts to a Parquet file.
+
+        Args:
+            filing: Parsed filing
+            output_path: Output Parquet file path
+
+        Returns:
+            Path written, or None if filing has no facts
+        """
+        self._require_pyarrow()
+        facts_data = self.extractor.extract_facts(filing)
+
+        if not facts_data:
+            self.logger.warning("No facts to save")
+            return None
+
+        pa = self.pa
+        columns = {
+            'concept': pa.array([f['concept'] for f in facts_data], pa.string()),
+            'value': pa.array([to_str(f['value']) for f in facts_data], pa.string()),
+            'value_numeric': pa.array([to_float(f['value']) for f in facts_data], pa.float64()),
+            'decimals': pa.array([to_int(f['decimals']) for f in facts_data], pa.int32()),
+            'decimals_infinite': pa.array([_is_infinite(f['decimals']) for f in facts_data], pa.bool_()),
+            'precision': pa.array([to_int(f['precision']) for f in facts_data], pa.int32()),
+            'context_ref': pa.array([f['context_ref'] for f in facts_data], pa.string()),
+            'unit_ref': pa.array([f['unit_ref'] for f in facts_data], pa.string()),
+            'unit_measures': pa.array([f.get('unit_measures') for f in facts_data], pa.string()),
+            'fact_id': pa.array([f['fact_id'] for f in facts_data], pa.string()),
+            'is_nil': pa.array([bool(f['is_nil']) for f in facts_data], pa.bool_()),
+            'fact_type': pa.array([f['fact_type'] for f in facts_data], pa.string()),
+            'language': pa.array([f['language'] for f in facts_data], pa.string()),
+            'entity_identifier': pa.array([f.get('entity_identifier') for f in facts_data], pa.string()),
+            'period_type': pa.array([f.get('period_type') for f in facts_data], pa.string()),
+            'period_instant': pa.array([to_date(f.get('period_instant')) for f in facts_data], pa.date32()),
+            'period_start': pa.array([to_date(f.get('period_start')) for f in facts_data], pa.date32()),
+            'period_end': pa.array([to_date(f.get('period_end')) for f in facts_data], pa.date32()),
+        }
+
+        self._write_table(columns, self.FACT_DICTIONARY_COLUMNS, output_path)
+        self.logger.info(f"Saved {len(facts_data)} facts to {output_path}")
+        return Path(output_path)
+
+    def save_contexts_parquet(self, filing: ParsedFiling, output_path: Path) -> Optional[Path]:
+        """
+        Save contexts to a Parquet file.
+
+        Args:
+            filing: Parsed filing
+            output_path: Output Parquet file path
+
+        Returns:
+            Path written, or None if filing has no contexts
+        """
+        self._require_pyarrow()
+        contexts_data = self.extractor.extract_contexts(filing)
+
+        if not contexts_data:
+            self.logger.warning("No contexts to save")
+            return None
+
+        pa = self.pa
+        columns = {
+            'context_id': pa.array([c['context_id'] for c in contexts_data], pa.string()),
+            'entity_scheme': pa.array([c['entity_scheme'] for c in contexts_data], pa.string()),
+            'entity_identifier': pa.array([c['entity_identifier'] for c in contexts_data], pa.string()),
+            'period_type': pa.array([c['period_type'] for c in contexts_data], pa.string()),
+            'instant': pa.array([to_date(c.get('instant')) for c in contexts_data], pa.date32()),
+            'start_date': pa.array([to_date(c.get('start_date')) for c in contexts_data], pa.date32()),
+            'end_date': pa.array([to_date(c.get('end_date')) for c in contexts_data], pa.date32()),
+            'dimension_count': pa.array([c['dimension_count'] for c in contexts_data], pa.int32()),
+            'dimensions': pa.array([c['dimensions'] for c in contexts_data], pa.string()),
+        }
+
+        self._write_table(columns, self.CONTEXT_DICTIONARY_COLUMNS, output_path)
+        self.logger.info(f"Saved {len(contexts_data)} contexts to {output_path}")
+        return Path(output_path)
+
+    def _write_table(
+        self,
+        columns: dict[str, any],
+        dictionary_columns: tuple[str, ...],
+        output_path: Path
+    ) -> None:
+        """Dictionary-encode string columns and write table to Parquet."""
+        for name in dictionary_columns:
+            columns[name] = columns[name].dictionary_encode()
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        table = self.pa.table(columns)
+        self.pq.write_table(
+            table,
+            output_path,
+            use_dictionary=list(dictionary_columns),
+            compression='zstd',
+        )
+
+    def _require_pyarrow(self) -> None:
+        """Raise if pyarrow is not installed."""
+        if not self.has_pyarrow:
+            raise ImportError(
+                "pyarrow required for columnar export. "
+                "Install with: pip install pyarrow"
+            )
+
+
+def _is_infinite(value: any) -> bool:
+    """Check whether decimals attribute is 'INF'."""
+    return value is not None and str(value).strip().upper() == DECIMALS_INFINITE
+
+
+__all__ = [
+    'ColumnarExporter',
+    'FACTS_PARQUET_FILENAME',
+    'CONTEXTS_PARQUET_FILENAME',
+]
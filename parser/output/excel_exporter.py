@@ -4,12 +4,19 @@ Excel Export Utilities
 
 Export XBRL data to Excel workbooks with multiple sheets and formatting.
 
+Workbooks are written in openpyxl's write-only mode: rows are streamed to
+disk as they are produced and styles are created once per export, so
+memory stays flat as the fact count grows. Sheets longer than the row cap
+continue on overflow sheets ("Facts (2)", ...) with the header repeated.
+
 Requires openpyxl package for Excel file creation.
 """
 
 import logging
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
+from typing import Iterable, Optional
 
 from xbrl_parser.models.parsed_filing import ParsedFiling
 from output.extracted_data.data_extractor import DataExtractor
@@ -26,6 +33,9 @@ class ExcelExporter:
     - Units: Unit definitions
     - Errors: Parsing errors and warnings
 
+    Facts and contexts beyond max_rows_per_sheet continue on overflow
+    sheets.
+
     Example:
         exporter = ExcelExporter()
         exporter.export(filing, 'output.xlsx')
@@ -38,10 +48,27 @@ class ExcelExporter:
     COLUMN_WIDTH_EXTRA_WIDE: int = 40
     COLUMN_WIDTH_VERY_WIDE: int = 50
 
-    def __init__(self):
-        """Initialize Excel exporter."""
+    # Excel sheet limit (1,048,576 rows, header included)
+    MAX_ROWS_PER_SHEET: int = 1048576
+
+    # Header style
+    HEADER_FILL_COLOR: str = "CCCCCC"
+    TITLE_FONT_SIZE: int = 14
+
+    def __init__(self, max_rows_per_sheet: Optional[int] = None):
+        """
+        Initialize Excel exporter.
+
+        Args:
+            max_rows_per_sheet: Data rows per sheet before an overflow
+                sheet is started (default: Excel limit)
+        """
         self.logger = logging.getLogger(__name__)
         self.extractor = DataExtractor()
+        self.max_rows_per_sheet = min(
+            max_rows_per_sheet or self.MAX_ROWS_PER_SHEET - 1,
+            self.MAX_ROWS_PER_SHEET - 1
+        )
         
         # Check if openpyxl available
         try:
@@ -82,18 +109,21 @@ class ExcelExporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Create workbook
-        wb = self.openpyxl.Workbook()
-        
-        # Remove default sheet
-        if 'Sheet' in wb.sheetnames:
-            wb.remove(wb['Sheet'])
+        # Create write-only workbook (no default sheet)
+        wb = self.openpyxl.Workbook(write_only=True)
+        self._init_styles()
         
         # Add sheets
         self._create_summary_sheet(wb, filing)
-        self._create_facts_sheet(wb, filing)
-        self._create_contexts_sheet(wb, filing)
-        self._create_units_sheet(wb, filing)
+        self._create_table_sheets(
+            wb, "Facts", self.extractor.iter_facts(filing), "No facts found"
+        )
+        self._create_table_sheets(
+            wb, "Contexts", self.extractor.iter_contexts(filing), "No contexts found"
+        )
+        self._create_table_sheets(
+            wb, "Units", self.extractor.extract_units(filing), "No units found"
+        )
         
         if include_errors and len(filing.errors.errors) > 0:
             self._create_errors_sheet(wb, filing)
@@ -102,17 +132,56 @@ class ExcelExporter:
         wb.save(output_path)
         self.logger.info(f"Excel workbook saved: {output_path}")
     
+    def _init_styles(self) -> None:
+        """Create the shared cell styles once per export."""
+        styles = self.openpyxl.styles
+        self._bold_font = styles.Font(bold=True)
+        self._title_font = styles.Font(size=self.TITLE_FONT_SIZE, bold=True)
+        self._header_fill = styles.PatternFill(
+            start_color=self.HEADER_FILL_COLOR,
+            end_color=self.HEADER_FILL_COLOR,
+            fill_type="solid"
+        )
+    
+    def _styled_cell(self, ws, value, font=None, fill=None):
+        """Write-only cell with shared font/fill."""
+        cell = self.openpyxl.cell.WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        return cell
+    
+    def _header_row(self, ws, headers: list) -> list:
+        """Header row cells (bold, grey fill)."""
+        return [
+            self._styled_cell(ws, header, self._bold_font, self._header_fill)
+            for header in headers
+        ]
+    
     def _create_summary_sheet(self, wb, filing: ParsedFiling) -> None:
         """Create summary sheet."""
-        ws = wb.create_sheet("Summary", 0)
+        ws = wb.create_sheet("Summary")
         metadata = filing.metadata
         
+        # set column widths (before any row is written)
+        ws.column_dimensions['A'].width = self.COLUMN_WIDTH_MEDIUM
+        ws.column_dimensions['B'].width = self.COLUMN_WIDTH_EXTRA_WIDE
+        
         # Title
-        ws['A1'] = "XBRL Filing Summary"
-        ws['A1'].font = self.openpyxl.styles.Font(size=14, bold=True)
+        ws.append([self._styled_cell(ws, "XBRL Filing Summary", self._title_font)])
+        ws.append([])
+        
+        # Error counts in one pass
+        errors = 0
+        warnings = 0
+        for e in filing.errors.errors:
+            if e.severity.value in ['ERROR', 'CRITICAL']:
+                errors += 1
+            elif e.severity.value == 'WARNING':
+                warnings += 1
         
         # Filing information
-        row = 3
         info = [
             ("Filing ID", metadata.filing_id),
             ("Company", metadata.company_name or "N/A"),
@@ -126,146 +195,102 @@ class ExcelExporter:
             ("Contexts", len(filing.instance.contexts)),
             ("Units", len(filing.instance.units)),
             ("", ""),
-            ("Errors", len([e for e in filing.errors.errors if e.severity.value in ['ERROR', 'CRITICAL']])),
-            ("Warnings", len([e for e in filing.errors.errors if e.severity.value == 'WARNING'])),
+            ("Errors", errors),
+            ("Warnings", warnings),
         ]
         
         for label, value in info:
-            ws[f'A{row}'] = label
-            ws[f'B{row}'] = value
             if label:
-                ws[f'A{row}'].font = self.openpyxl.styles.Font(bold=True)
-            row += 1
-        
-        # set column widths
-        ws.column_dimensions['A'].width = self.COLUMN_WIDTH_MEDIUM
-        ws.column_dimensions['B'].width = self.COLUMN_WIDTH_EXTRA_WIDE
+                ws.append([self._styled_cell(ws, label, self._bold_font), value])
+            else:
+                ws.append([label, value])
     
-    def _create_facts_sheet(self, wb, filing: ParsedFiling) -> None:
-        """Create facts sheet."""
-        ws = wb.create_sheet("Facts")
-        
-        # Extract facts
-        facts_data = self.extractor.extract_facts(filing)
-        
-        if not facts_data:
-            ws['A1'] = "No facts found"
-            return
-        
-        # Headers
-        headers = list(facts_data[0].keys())
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(1, col, header)
-            cell.font = self.openpyxl.styles.Font(bold=True)
-            cell.fill = self.openpyxl.styles.PatternFill(
-                start_color="CCCCCC",
-                end_color="CCCCCC",
-                fill_type="solid"
-            )
+    def _create_table_sheets(
+        self,
+        wb,
+        title: str,
+        rows: Iterable[dict],
+        empty_message: str
+    ) -> int:
+        """
+        Stream dictionaries to a sheet, continuing on overflow sheets.
         
-        # Data
-        for row, fact_dict in enumerate(facts_data, 2):
-            for col, header in enumerate(headers, 1):
-                ws.cell(row, col, fact_dict.get(header))
+        Columns are the keys of the first row.
         
-        # Auto-size columns (approximate)
-        for col in range(1, len(headers) + 1):
-            ws.column_dimensions[self.openpyxl.utils.get_column_letter(col)].width = self.COLUMN_WIDTH_NARROW
-    
-    def _create_contexts_sheet(self, wb, filing: ParsedFiling) -> None:
-        """Create contexts sheet."""
-        ws = wb.create_sheet("Contexts")
+        Args:
+            wb: Write-only workbook
+            title: Sheet title (overflow sheets get " (2)", " (3)", ...)
+            rows: Row dictionaries
+            empty_message: Text written when there are no rows
+            
+        Returns:
+            Number of data rows written
+        """
+        rows = iter(rows)
+        first = next(rows, None)
         
-        # Extract contexts
-        contexts_data = self.extractor.extract_contexts(filing)
+        if first is None:
+            ws = wb.create_sheet(title)
+            ws.append([empty_message])
+            return 0
         
-        if not contexts_data:
-            ws['A1'] = "No contexts found"
-            return
+        headers = list(first.keys())
+        ws = None
+        sheet_number = 0
+        sheet_rows = self.max_rows_per_sheet
+        count = 0
         
-        # Headers
-        headers = list(contexts_data[0].keys())
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(1, col, header)
-            cell.font = self.openpyxl.styles.Font(bold=True)
-            cell.fill = self.openpyxl.styles.PatternFill(
-                start_color="CCCCCC",
-                end_color="CCCCCC",
-                fill_type="solid"
-            )
+        for row_dict in chain([first], rows):
+            if sheet_rows >= self.max_rows_per_sheet:
+                sheet_number += 1
+                ws = self._start_table_sheet(
+                    wb,
+                    title if sheet_number == 1 else f"{title} ({sheet_number})",
+                    headers
+                )
+                sheet_rows = 0
+            
+            ws.append([row_dict.get(header) for header in headers])
+            sheet_rows += 1
+            count += 1
         
-        # Data
-        for row, context_dict in enumerate(contexts_data, 2):
-            for col, header in enumerate(headers, 1):
-                ws.cell(row, col, context_dict.get(header))
+        if sheet_number > 1:
+            self.logger.info(f"{title}: {count:,} rows split over {sheet_number} sheets")
         
-        # Auto-size columns
-        for col in range(1, len(headers) + 1):
-            ws.column_dimensions[self.openpyxl.utils.get_column_letter(col)].width = self.COLUMN_WIDTH_NARROW
+        return count
     
-    def _create_units_sheet(self, wb, filing: ParsedFiling) -> None:
-        """Create units sheet."""
-        ws = wb.create_sheet("Units")
-        
-        # Extract units
-        units_data = self.extractor.extract_units(filing)
-        
-        if not units_data:
-            ws['A1'] = "No units found"
-            return
+    def _start_table_sheet(self, wb, title: str, headers: list):
+        """Create table sheet with column widths and header row."""
+        ws = wb.create_sheet(title)
         
-        # Headers
-        headers = list(units_data[0].keys())
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(1, col, header)
-            cell.font = self.openpyxl.styles.Font(bold=True)
-            cell.fill = self.openpyxl.styles.PatternFill(
-                start_color="CCCCCC",
-                end_color="CCCCCC",
-                fill_type="solid"
-            )
-        
-        # Data
-        for row, unit_dict in enumerate(units_data, 2):
-            for col, header in enumerate(headers, 1):
-                ws.cell(row, col, unit_dict.get(header))
-        
-        # Auto-size columns
+        # Auto-size columns (approximate)
         for col in range(1, len(headers) + 1):
             ws.column_dimensions[self.openpyxl.utils.get_column_letter(col)].width = self.COLUMN_WIDTH_NARROW
+        
+        ws.append(self._header_row(ws, headers))
+        return ws
     
     def _create_errors_sheet(self, wb, filing: ParsedFiling) -> None:
         """Create errors sheet."""
         ws = wb.create_sheet("Errors")
         
-        # Headers
-        ws['A1'] = "Severity"
-        ws['B1'] = "Message"
-        ws['C1'] = "Location"
-        ws['D1'] = "Category"
-        
-        for cell in [ws['A1'], ws['B1'], ws['C1'], ws['D1']]:
-            cell.font = self.openpyxl.styles.Font(bold=True)
-            cell.fill = self.openpyxl.styles.PatternFill(
-                start_color="CCCCCC",
-                end_color="CCCCCC",
-                fill_type="solid"
-            )
-        
-        # Data
-        row = 2
-        for error in filing.errors.errors:
-            ws[f'A{row}'] = error.severity.value
-            ws[f'B{row}'] = error.message
-            ws[f'C{row}'] = error.source_file or ""
-            ws[f'D{row}'] = error.category.value
-            row += 1
-        
         # set column widths
         ws.column_dimensions['A'].width = self.COLUMN_WIDTH_NARROW
         ws.column_dimensions['B'].width = self.COLUMN_WIDTH_VERY_WIDE
         ws.column_dimensions['C'].width = self.COLUMN_WIDTH_WIDE
         ws.column_dimensions['D'].width = self.COLUMN_WIDTH_MEDIUM
+        
+        # Headers
+        ws.append(self._header_row(ws, ["Severity", "Message", "Location", "Category"]))
+        
+        # Data
+        for error in filing.errors.errors:
+            ws.append([
+                error.severity.value,
+                error.message,
+                error.source_file or "",
+                error.category.value,
+            ])
 
 
 __all__ = ['ExcelExporter']
\ No newline at end of file
@@ -12,6 +12,7 @@ import logging
 import csv
 from pathlib import Path
 from datetime import date, datetime
+from typing import Iterator
 
 from xbrl_parser.models.parsed_filing import ParsedFiling
 from xbrl_parser.models.fact import Fact
@@ -57,7 +58,23 @@ class DataExtractor:
         Returns:
             list of fact dictionaries
         """
-        facts_data = []
+        facts_data = list(self.iter_facts(filing))
+        
+        self.logger.debug(f"Extracted {len(facts_data)} facts")
+        return facts_data
+    
+    def iter_facts(self, filing: ParsedFiling) -> Iterator[dict[str, any]]:
+        """
+        Yield fact dictionaries one at a time (see extract_facts).
+        
+        Args:
+            filing: Parsed filing
+            
+        Yields:
+            Fact dictionary
+        """
+        contexts = filing.instance.contexts
+        units = filing.instance.units
         
         for fact in filing.instance.facts:
             fact_dict = {
@@ -74,20 +91,17 @@ class DataExtractor:
             }
             
             # Add context details if available
-            if fact.context_ref and fact.context_ref in filing.instance.contexts:
-                context = filing.instance.contexts[fact.context_ref]
+            if fact.context_ref and fact.context_ref in contexts:
+                context = contexts[fact.context_ref]
                 fact_dict.update(self._extract_context_details(context))
             
             # Add unit details - ALWAYS add field even if None
             fact_dict['unit_measures'] = None
-            if fact.unit_ref and fact.unit_ref in filing.instance.units:
-                unit = filing.instance.units[fact.unit_ref]
+            if fact.unit_ref and fact.unit_ref in units:
+                unit = units[fact.unit_ref]
                 fact_dict['unit_measures'] = ', '.join(unit.measures) if unit.measures else None
             
-            facts_data.append(fact_dict)
-        
-        self.logger.debug(f"Extracted {len(facts_data)} facts")
-        return facts_data
+            yield fact_dict
     
     def extract_contexts(self, filing: ParsedFiling) -> list[dict[str, any]]:
         """
@@ -99,8 +113,21 @@ class DataExtractor:
         Returns:
             list of context dictionaries
         """
-        contexts_data = []
+        contexts_data = list(self.iter_contexts(filing))
         
+        self.logger.debug(f"Extracted {len(contexts_data)} contexts")
+        return contexts_data
+    
+    def iter_contexts(self, filing: ParsedFiling) -> Iterator[dict[str, any]]:
+        """
+        Yield context dictionaries one at a time (see extract_contexts).
+        
+        Args:
+            filing: Parsed filing
+            
+        Yields:
+            Context dictionary
+        """
         for context_id, context in filing.instance.contexts.items():
             context_dict = {
                 'context_id': context_id,
@@ -127,10 +154,7 @@ class DataExtractor:
                 context_dict['dimension_count'] = 0
                 context_dict['dimensions'] = None
             
-            contexts_data.append(context_dict)
-        
-        self.logger.debug(f"Extracted {len(contexts_data)} contexts")
-        return contexts_data
+            yield context_dict
     
     def extract_units(self, filing: ParsedFiling) -> list[dict[str, any]]:
         """
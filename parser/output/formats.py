@@ -16,6 +16,7 @@ class OutputFormat(Enum):
     XLSX = "xlsx"
     TXT = "txt"
     HTML = "html"
+    PARQUET = "parquet"
     
     @classmethod
     def from_extension(cls, path: Path) -> 'OutputFormat':
@@ -60,6 +61,7 @@ FORMAT_EXTENSIONS: dict[OutputFormat, str] = {
     OutputFormat.XLSX: ".xlsx",
     OutputFormat.TXT: ".txt",
     OutputFormat.HTML: ".html",
+    OutputFormat.PARQUET: ".parquet",
 }
 
 # MIME types for each format
@@ -69,6 +71,7 @@ FORMAT_MIME_TYPES: dict[OutputFormat, str] = {
     OutputFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     OutputFormat.TXT: "text/plain",
     OutputFormat.HTML: "text/html",
+    OutputFormat.PARQUET: "application/vnd.apache.parquet",
 }
 
 # CSV field size limit (avoid issues with large text blocks)
@@ -0,0 +1,57 @@
+# Path: xbrl_parser/output/parsed_json.py
+"""
+Parsed JSON Output
+
+Writes parsed.json atomically: the serializer's output goes to a
+temporary file in the same folder, which is then moved into place, so an
+interrupted run never leaves a truncated parsed.json for the mapper,
+verification or library to read.
+
+The bytes written are exactly JSONSerializer.serialize(filing).
+"""
+
+import os
+from pathlib import Path
+
+
+def write_parsed_json(serializer, filing, json_file: Path) -> Path:
+    """
+    Serialize a parsed filing and write it atomically.
+
+    Args:
+        serializer: JSONSerializer instance
+        filing: ParsedFiling object
+        json_file: Output path (e.g. parsed.json)
+
+    Returns:
+        Path of written file
+    """
+    return write_text_atomic(serializer.serialize(filing), json_file)
+
+
+def write_text_atomic(text: str, path: Path) -> Path:
+    """
+    Write text (UTF-8) through a temporary file moved into place.
+
+    Args:
+        text: File content
+        path: Output path
+
+    Returns:
+        Path of written file
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return path
+
+
+__all__ = ['write_parsed_json', 'write_text_atomic']
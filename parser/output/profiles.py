@@ -0,0 +1,109 @@
+# Path: xbrl_parser/output/profiles.py
+"""
+Output Profiles
+
+Named sets of artifacts written for each parsed filing.
+
+Automated runs only consume parsed.json downstream; the CSV, summary,
+workbook and Parquet files are for people reading a filing. A profile
+selects which artifacts are produced so unused ones cost nothing:
+
+- minimal: parsed.json only
+- analyst: parsed.json, facts.csv, summary.txt, workbook.xlsx
+- full:    everything, including Parquet files and printed statistics
+
+Also provides the single-pass fact statistics printed by the parser CLI.
+"""
+
+from dataclasses import dataclass
+
+
+PROFILE_MINIMAL = "minimal"
+PROFILE_ANALYST = "analyst"
+PROFILE_FULL = "full"
+
+
+@dataclass(frozen=True)
+class OutputProfile:
+    """Artifacts written for a parsed filing (parsed.json is always written)."""
+    name: str
+    csv: bool = False
+    summary: bool = False
+    excel: bool = False
+    columnar: bool = False
+    statistics: bool = False
+
+
+OUTPUT_PROFILES: dict[str, OutputProfile] = {
+    PROFILE_MINIMAL: OutputProfile(PROFILE_MINIMAL),
+    PROFILE_ANALYST: OutputProfile(
+        PROFILE_ANALYST, csv=True, summary=True, excel=True
+    ),
+    PROFILE_FULL: OutputProfile(
+        PROFILE_FULL, csv=True, summary=True, excel=True, columnar=True, statistics=True
+    ),
+}
+
+
+def get_output_profile(name: str) -> OutputProfile:
+    """
+    Get output profile by name.
+
+    Args:
+        name: Profile name (case-insensitive)
+
+    Returns:
+        OutputProfile
+
+    Raises:
+        ValueError: If profile unknown
+    """
+    try:
+        return OUTPUT_PROFILES[(name or '').strip().lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown output profile: {name}. "
+            f"Supported profiles: {', '.join(OUTPUT_PROFILES)}"
+        )
+
+
+@dataclass
+class FactStatistics:
+    """Fact attribute counts for the parser's statistics report."""
+    total: int = 0
+    with_ids: int = 0
+    with_footnote_refs: int = 0
+    with_source: int = 0
+
+    @classmethod
+    def collect(cls, facts) -> 'FactStatistics':
+        """
+        Count fact attributes in one pass over the facts.
+
+        Args:
+            facts: Facts of a parsed filing
+
+        Returns:
+            FactStatistics
+        """
+        stats = cls()
+        for fact in facts:
+            stats.total += 1
+            if fact.id:
+                stats.with_ids += 1
+            if fact.footnote_refs:
+                stats.with_footnote_refs += 1
+            if fact.source_line:
+                stats.with_source += 1
+        return stats
+
+
+__all__ = [
+    'OutputProfile',
+    'OUTPUT_PROFILES',
+    'PROFILE_MINIMAL',
+    'PROFILE_ANALYST',
+    'PROFILE_FULL',
+    'get_output_profile',
+    'FactStatistics',
+]
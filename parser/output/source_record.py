@@ -0,0 +1,81 @@
+# Path: xbrl_parser/output/source_record.py
+"""
+Source Record
+
+Small JSON file written next to parsed.json naming the filing it was
+parsed from (source directory and accession).
+
+The mapper needs the source filing's linkbases. With the source record it
+opens the filing directly instead of searching the filings tree for a
+matching company and form (mapper/loaders/filing_index.py).
+
+Record format (source.json):
+- source_path: absolute filing (accession) directory
+- accession: accession directory name
+- market, company, form: filing coordinates in the filings tree
+- recorded_at, format_version
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+# The mapper reads the record (format above)
+SOURCE_RECORD_FILENAME = "source.json"
+SOURCE_RECORD_FORMAT_VERSION = 1
+
+
+def write_source_record(
+    output_dir: Path,
+    filing_dir: Path,
+    market: Optional[str] = None,
+    company: Optional[str] = None,
+    form: Optional[str] = None
+) -> Optional[Path]:
+    """
+    Write source record for a parsed filing (atomic).
+
+    Args:
+        output_dir: Parsed output folder (holds parsed.json)
+        filing_dir: Filing (accession) directory that was parsed
+        market: Market
+        company: Company directory name
+        form: Form type
+
+    Returns:
+        Path of written record, or None if it could not be written
+    """
+    logger = logging.getLogger(__name__)
+
+    filing_dir = Path(filing_dir).resolve()
+    record = {
+        'format_version': SOURCE_RECORD_FORMAT_VERSION,
+        'source_path': str(filing_dir),
+        'accession': filing_dir.name,
+        'market': market,
+        'company': company,
+        'form': form,
+        'recorded_at': datetime.now(timezone.utc).isoformat(),
+    }
+
+    record_file = Path(output_dir) / SOURCE_RECORD_FILENAME
+    tmp_path = record_file.with_name(f"{record_file.name}.{os.getpid()}.tmp")
+
+    try:
+        tmp_path.write_text(json.dumps(record, indent=2), encoding='utf-8')
+        tmp_path.replace(record_file)
+    except OSError as e:
+        logger.warning(f"Cannot write source record {record_file}: {e}")
+        return None
+
+    return record_file
+
+
+__all__ = [
+    'write_source_record',
+    'SOURCE_RECORD_FILENAME',
+    'SOURCE_RECORD_FORMAT_VERSION',
+]
@@ -4,12 +4,22 @@
 XBRL Parser - Main CLI Entry Point
 
 Command-line interface that orchestrates the complete XBRL parsing workflow.
+
+Usage:
+    python parser.py                                   # interactive selection
+    python parser.py /path/to/filings/10-K/0001234...  # parse given filings
+    python parser.py --glob 'sec/*/filings/10-K/*'     # glob over the catalog
+    python parser.py --market sec --form 10-K --since 2024-01-01
+    python parser.py --rebuild-catalog
+    python parser.py --form 10-K --profile minimal     # parsed.json only
 """
 
 import sys
+import argparse
 import logging
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 # Core components
 from ..core.ui.cli import FilingCLI
@@ -24,12 +34,24 @@ from xbrl_parser.orchestrator import XBRLParser
 from xbrl_parser.serialization.json_serializer import JSONSerializer
 from output.extracted_data.data_extractor import DataExtractor
 from output.parsed_report.report_generator import ReportGenerator
+from output.parsed_json import write_parsed_json
+from output.source_record import write_source_record
+from output.profiles import OUTPUT_PROFILES, OutputProfile, FactStatistics, get_output_profile
 
 
-def main():
-    """Main CLI workflow."""
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Main CLI workflow.
+    
+    Without filing arguments the filing is chosen interactively. With
+    filing paths, --glob or catalog filters (--market, --company, --form,
+    --since, --until) every selected filing is parsed without prompts.
+    """
+    args = _parse_args(argv)
+    
     # Load configuration FIRST
     config = ConfigLoader()
+    profile = get_output_profile(args.profile or config.get('output_profile', 'full'))
     
     # Configure IPO-aware logging using config
     setup_ipo_logging(
@@ -51,111 +73,272 @@ def main():
         result = manager.ensure_all_directories()
         print(f"Output ready ({len(result['existing'])} directories verified)")
         
+        cli = FilingCLI(use_catalog=not args.no_catalog)
+        
+        if args.rebuild_catalog:
+            filings = cli.rebuild_catalog()
+            print(f"\nFiling catalog rebuilt: {len(filings)} filings")
+            if not _is_batch(args):
+                return 0
+        
+        # Batch mode: parse every selected filing, no prompts
+        if _is_batch(args):
+            filing_entries = _select_batch_filings(cli, args)
+            if not filing_entries:
+                print("\nNo filings matched the selection.")
+                return 1
+            return _run_batch(filing_entries, config, profile, fail_fast=args.fail_fast)
+        
         # Step 2: Select filing using CLI
         print("\n" + "=" * 80)
         print("SELECT FILING")
         print("=" * 80)
         
-        cli = FilingCLI()
         filing_entry = cli.run()
         
-        # Step 3: Parse filing using orchestrator
-        print("\n" + "=" * 80)
-        print("PARSING FILING")
-        print("=" * 80)
-        print(f"Filing: {filing_entry.market} | {filing_entry.company} | {filing_entry.form}")
-        print(f"Path: {filing_entry.path}\n")
-        
-        parser = XBRLParser()
-        start_time = datetime.now()
-        filing = parser.parse(filing_entry.path)
-        parse_time = (datetime.now() - start_time).total_seconds()
-        
-        print(f"\nParsing completed in {parse_time:.2f} seconds")
-        print(f"Extracted {len(filing.instance.facts):,} facts")
-        
-        # Step 3.5: Populate metadata from filing_entry
-        filing.metadata.market = filing_entry.market
-        filing.metadata.company_name = filing_entry.company.replace("_", " ")
-        filing.metadata.document_type = filing_entry.form
+        return _parse_single_filing(filing_entry, config, profile)
         
-        # Parse date string to datetime
-        try:
-            from datetime import datetime as dt
-            filing.metadata.filing_date = dt.strptime(filing_entry.date, '%Y-%m-%d')
-        except (ValueError, AttributeError):
-            filing.metadata.filing_date = None
-        
-        # Step 3.6: Extract entity_identifier and period_end_date from contexts
-        if filing.instance.contexts:
-            # Get entity identifier from first context
-            first_context = next(iter(filing.instance.contexts.values()))
-            filing.metadata.entity_identifier = first_context.entity.value
-            
-            # Find latest period end date
-            end_dates = []
-            for context in filing.instance.contexts.values():
-                if context.period.end_date:
-                    end_dates.append(context.period.end_date)
-                elif context.period.instant:
-                    end_dates.append(context.period.instant)
-            
-            if end_dates:
-                filing.metadata.period_end_date = max(end_dates)
-        
-        # Step 4: Generate nested output folder structure: company/form/date/
-        company = (filing.metadata.company_name or "Unknown_Company").replace(" ", "_").replace(",", "").replace(".", "")
-        doc_type = filing.metadata.document_type or "Filing"
-        date_str = filing.metadata.filing_date.strftime('%Y-%m-%d') if filing.metadata.filing_date else "unknown"
-        
-        # Create nested structure matching mapper's expected input
-        market = filing.metadata.market or "unknown"
-        filing_folder = Path(config.get("output_parsed_dir")) / market / company / doc_type / date_str
-        filing_folder.mkdir(parents=True, exist_ok=True)
+    except KeyboardInterrupt:
+        print("\n\nCancelled by user.")
+        return 1
         
-        # Step 5: Save outputs to filing folder
+    except Exception as e:
+        logger.error(f"Parsing failed: {e}", exc_info=True)
+        print(f"\nERROR: {e}")
+        return 1
+
+
+def _parse_args(argv: Optional[list[str]]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    arg_parser = argparse.ArgumentParser(
+        description="Parse XBRL filings (interactive without selection arguments)."
+    )
+    arg_parser.add_argument(
+        'filings', nargs='*', type=Path,
+        help="Filing directories to parse (market/company/filings/form/accession)"
+    )
+    arg_parser.add_argument(
+        '--glob', dest='pattern',
+        help="Glob over catalog filing paths, e.g. 'sec/*/filings/10-K/*'"
+    )
+    arg_parser.add_argument('--market', help="Catalog query: market")
+    arg_parser.add_argument('--company', help="Catalog query: company (glob allowed)")
+    arg_parser.add_argument('--form', help="Catalog query: form type")
+    arg_parser.add_argument('--since', help="Catalog query: earliest date (YYYY-MM-DD)")
+    arg_parser.add_argument('--until', help="Catalog query: latest date (YYYY-MM-DD)")
+    arg_parser.add_argument(
+        '--rebuild-catalog', action='store_true',
+        help="Rebuild the filing catalog from the filings tree"
+    )
+    arg_parser.add_argument(
+        '--no-catalog', action='store_true',
+        help="List filings by walking the filings tree instead of the catalog"
+    )
+    arg_parser.add_argument(
+        '--profile', choices=list(OUTPUT_PROFILES),
+        help="Output profile: minimal (parsed.json only), analyst, full "
+             "(default: PARSER_OUTPUT_PROFILE)"
+    )
+    arg_parser.add_argument(
+        '--fail-fast', action='store_true',
+        help="Batch mode: stop at the first failed filing"
+    )
+    return arg_parser.parse_args(argv)
+
+
+def _is_batch(args: argparse.Namespace) -> bool:
+    """Check if any non-interactive selection was given."""
+    return bool(
+        args.filings or args.pattern or args.market or args.company
+        or args.form or args.since or args.until
+    )
+
+
+def _select_batch_filings(cli: FilingCLI, args: argparse.Namespace) -> list:
+    """Resolve filing paths and catalog queries to filing entries."""
+    filing_entries = []
+    
+    for filing_dir in args.filings:
+        entry = cli.entry_for_path(filing_dir)
+        if entry is None:
+            print(f"Skipping {filing_dir}: not a filing directory (market/company/filings/form/accession)")
+            continue
+        filing_entries.append(entry)
+    
+    if args.pattern or args.market or args.company or args.form or args.since or args.until:
+        filing_entries.extend(cli.query(
+            market=args.market,
+            company=args.company,
+            form=args.form,
+            since=args.since,
+            until=args.until,
+            pattern=args.pattern
+        ))
+    
+    # Same filing selected twice: parse once
+    unique = {}
+    for entry in filing_entries:
+        unique.setdefault(Path(entry.path), entry)
+    return list(unique.values())
+
+
+def _run_batch(
+    filing_entries: list,
+    config: ConfigLoader,
+    profile: OutputProfile,
+    fail_fast: bool = False
+) -> int:
+    """Parse filings one after another; failures do not stop the batch."""
+    logger = logging.getLogger(__name__)
+    
+    print(f"\nBatch: {len(filing_entries)} filings")
+    failed = []
+    
+    for index, filing_entry in enumerate(filing_entries, 1):
         print("\n" + "=" * 80)
-        print("SAVING OUTPUTS")
+        print(f"FILING {index}/{len(filing_entries)}")
         print("=" * 80)
         
-        # 5a. JSON report
-        json_file = filing_folder / "parsed.json"
-        print(f"\n1. JSON Report:")
-        print(f"   {json_file}")
-        
-        serializer = JSONSerializer()
-        json_output = serializer.serialize(filing)
-        json_file.write_text(json_output)
-        
-        print(f"   Size: {json_file.stat().st_size / 1024:.1f} KB")
-        print(f"   Facts: {len(filing.instance.facts):,}")
-        print(f"   ✓ Saved")
-        
-        # 5b. CSV export
+        try:
+            _parse_single_filing(filing_entry, config, profile)
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:
+            logger.error(f"Parsing failed for {filing_entry.path}: {e}", exc_info=True)
+            print(f"\nERROR: {filing_entry.path}: {e}")
+            failed.append(filing_entry)
+            if fail_fast:
+                break
+    
+    print("\n" + "=" * 80)
+    print("BATCH COMPLETE")
+    print("=" * 80)
+    print(f"  Parsed: {len(filing_entries) - len(failed)}")
+    print(f"  Failed: {len(failed)}")
+    for filing_entry in failed:
+        print(f"    {filing_entry.path}")
+    
+    return 1 if failed else 0
+
+
+def _parse_single_filing(filing_entry, config: ConfigLoader, profile: OutputProfile) -> int:
+    """Parse one filing and write the profile's outputs to its output folder."""
+    # Step 3: Parse filing using orchestrator
+    print("\n" + "=" * 80)
+    print("PARSING FILING")
+    print("=" * 80)
+    print(f"Filing: {filing_entry.market} | {filing_entry.company} | {filing_entry.form}")
+    print(f"Path: {filing_entry.path}\n")
+    
+    parser = XBRLParser()
+    start_time = datetime.now()
+    filing = parser.parse(filing_entry.path)
+    parse_time = (datetime.now() - start_time).total_seconds()
+    
+    print(f"\nParsing completed in {parse_time:.2f} seconds")
+    print(f"Extracted {len(filing.instance.facts):,} facts")
+    
+    # Step 3.5: Populate metadata from filing_entry
+    filing.metadata.market = filing_entry.market
+    filing.metadata.company_name = filing_entry.company.replace("_", " ")
+    filing.metadata.document_type = filing_entry.form
+    
+    # Parse date string to datetime
+    try:
+        from datetime import datetime as dt
+        filing.metadata.filing_date = dt.strptime(filing_entry.date, '%Y-%m-%d')
+    except (ValueError, AttributeError):
+        filing.metadata.filing_date = None
+    
+    # Step 3.6: Extract entity_identifier and period_end_date from contexts
+    if filing.instance.contexts:
+        # Get entity identifier from first context
+        first_context = next(iter(filing.instance.contexts.values()))
+        filing.metadata.entity_identifier = first_context.entity.value
+        
+        # Find latest period end date
+        end_dates = []
+        for context in filing.instance.contexts.values():
+            if context.period.end_date:
+                end_dates.append(context.period.end_date)
+            elif context.period.instant:
+                end_dates.append(context.period.instant)
+        
+        if end_dates:
+            filing.metadata.period_end_date = max(end_dates)
+    
+    # Step 4: Generate nested output folder structure: company/form/date/
+    company = (filing.metadata.company_name or "Unknown_Company").replace(" ", "_").replace(",", "").replace(".", "")
+    doc_type = filing.metadata.document_type or "Filing"
+    date_str = filing.metadata.filing_date.strftime('%Y-%m-%d') if filing.metadata.filing_date else "unknown"
+    
+    # Create nested structure matching mapper's expected input
+    market = filing.metadata.market or "unknown"
+    filing_folder = Path(config.get("output_parsed_dir")) / market / company / doc_type / date_str
+    filing_folder.mkdir(parents=True, exist_ok=True)
+    
+    # Step 5: Save outputs to filing folder
+    print("\n" + "=" * 80)
+    print("SAVING OUTPUTS")
+    print("=" * 80)
+    
+    # 5a. JSON report
+    json_file = filing_folder / "parsed.json"
+    print(f"\n1. JSON Report:")
+    print(f"   {json_file}")
+    
+    write_parsed_json(JSONSerializer(), filing, json_file)
+    
+    # Record source filing so the mapper opens it without searching
+    write_source_record(
+        filing_folder,
+        filing_entry.path,
+        market=filing_entry.market,
+        company=filing_entry.company,
+        form=filing_entry.form
+    )
+    
+    print(f"   Size: {json_file.stat().st_size / 1024:.1f} KB")
+    print(f"   Facts: {len(filing.instance.facts):,}")
+    print(f"   ✓ Saved")
+    
+    output_files = [("JSON", json_file)]
+    summary = None
+    step = 1
+    
+    # 5b. CSV export
+    if profile.csv:
+        step += 1
         csv_file = filing_folder / "facts.csv"
-        print(f"\n2. CSV Export:")
+        print(f"\n{step}. CSV Export:")
         print(f"   {csv_file}")
         
         extractor = DataExtractor()
         extractor.save_facts_csv(filing, csv_file, include_context_details=True)
+        output_files.append(("CSV", csv_file))
         
         print(f"   Size: {csv_file.stat().st_size / 1024:.1f} KB")
         print(f"   ✓ Saved")
-        
-        # 5c. Summary report
+    
+    # 5c. Summary report
+    if profile.summary:
+        step += 1
         summary_file = filing_folder / "summary.txt"
-        print(f"\n3. Summary Report:")
+        print(f"\n{step}. Summary Report:")
         print(f"   {summary_file}")
         
         generator = ReportGenerator()
         summary = generator.generate_summary(filing, parse_time=parse_time)  
         summary_file.write_text(summary)
+        output_files.append(("Summary", summary_file))
         
         print(f"   ✓ Saved")
-        
-        # 5d. Excel export
+    
+    # 5d. Excel export
+    if profile.excel:
+        step += 1
         excel_file = filing_folder / "workbook.xlsx"
-        print(f"\n4. Excel Workbook:")
+        print(f"\n{step}. Excel Workbook:")
         print(f"   {excel_file}")
         
         try:
@@ -164,63 +347,74 @@ def main():
             
             if excel_exporter.has_openpyxl:
                 excel_exporter.export(filing, excel_file, include_errors=True)
+                output_files.append(("Excel", excel_file))
                 print(f"   Size: {excel_file.stat().st_size / 1024:.1f} KB")
                 print(f"   ✓ Saved")
             else:
                 print(f"   ⚠ Skipped (install: pip install openpyxl)")
         except Exception as e:
             print(f"   ⚠ Excel export failed: {e}")
+    
+    # 5e. Columnar (Parquet) export
+    if profile.columnar and config.get('enable_columnar_export', True):
+        step += 1
+        print(f"\n{step}. Columnar Export:")
         
-        # Step 6: Display summary
+        try:
+            from output.columnar_exporter import ColumnarExporter
+            columnar_exporter = ColumnarExporter()
+            
+            if columnar_exporter.has_pyarrow:
+                parquet_files = columnar_exporter.export(filing, filing_folder)
+                for parquet_file in parquet_files:
+                    output_files.append(("Parquet", parquet_file))
+                    print(f"   {parquet_file} ({parquet_file.stat().st_size / 1024:.1f} KB)")
+                print(f"   ✓ Saved")
+            else:
+                print(f"   ⚠ Skipped (install: pip install pyarrow)")
+        except Exception as e:
+            print(f"   ⚠ Columnar export failed: {e}")
+    
+    # Step 6: Display summary
+    if summary is not None:
         print("\n" + "=" * 80)
         print(summary)
-        
-        # Step 7: Display statistics
+    
+    # Step 7: Display statistics
+    if profile.statistics:
         print("\n" + "=" * 80)
         print("STATISTICS")
         print("=" * 80)
         
-        facts_with_ids = sum(1 for f in filing.instance.facts if f.id)
-        facts_with_footnotes = sum(1 for f in filing.instance.facts if f.footnote_refs and len(f.footnote_refs) > 0)
-        facts_with_source = sum(1 for f in filing.instance.facts if f.source_line)
+        fact_stats = FactStatistics.collect(filing.instance.facts)
         total_footnotes = len(filing.instance.footnotes) if hasattr(filing.instance, 'footnotes') and filing.instance.footnotes else 0
         
         print(f"\nPerformance:")
         print(f"  Parse time: {parse_time:.2f} seconds")
-        print(f"  Facts/second: {len(filing.instance.facts) / parse_time:,.0f}" if parse_time > 0 else "  Facts/second: N/A")
+        print(f"  Facts/second: {fact_stats.total / parse_time:,.0f}" if parse_time > 0 else "  Facts/second: N/A")
         
         print(f"\nFact Attributes:")
-        print(f"  With IDs: {facts_with_ids:,}")
-        print(f"  With footnote refs: {facts_with_footnotes:,}")
-        print(f"  With source tracking: {facts_with_source:,}")
+        print(f"  With IDs: {fact_stats.with_ids:,}")
+        print(f"  With footnote refs: {fact_stats.with_footnote_refs:,}")
+        print(f"  With source tracking: {fact_stats.with_source:,}")
         print(f"\nFootnotes:")
         print(f"  Total extracted: {total_footnotes:,}")
-        
-        print(f"\nOutput Structure:")
-        print(f"  Location: {filing_folder}")
-        print(f"  Company: {company}")
-        print(f"  Form: {doc_type}")
-        print(f"  Date: {date_str}")
-        print(f"\nOutput Files:")
-        print(f"  JSON: {json_file.name}")
-        print(f"  CSV: {csv_file.name}")
-        print(f"  Summary: {summary_file.name}")
-        print(f"  Excel: {excel_file.name}")
-        
-        print("\n" + "=" * 80)
-        print("PARSING COMPLETE")
-        print("=" * 80)
-        
-        return 0
-        
-    except KeyboardInterrupt:
-        print("\n\nCancelled by user.")
-        return 1
-        
-    except Exception as e:
-        logger.error(f"Parsing failed: {e}", exc_info=True)
-        print(f"\nERROR: {e}")
-        return 1
+    
+    print(f"\nOutput Structure:")
+    print(f"  Location: {filing_folder}")
+    print(f"  Company: {company}")
+    print(f"  Form: {doc_type}")
+    print(f"  Date: {date_str}")
+    print(f"  Profile: {profile.name}")
+    print(f"\nOutput Files:")
+    for label, output_file in output_files:
+        print(f"  {label}: {output_file.name}")
+    
+    print("\n" + "=" * 80)
+    print("PARSING COMPLETE")
+    print("=" * 80)
+    
+    return 0
 
 
 if __name__ == '__main__':
@@ -0,0 +1,105 @@
+# Path: tests/test_filing_catalog.py
+"""
+Filing catalog completeness and lookups.
+
+Run from the repository root: python -m pytest parser/tests
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+from parser.loaders.filing_catalog import FilingCatalog, CATALOG_FILENAME, filing_date
+
+
+def _load_cli_module():
+    """Load core/ui/cli.py directly (core/ui/__init__ imports through the parent package)."""
+    path = Path(__file__).resolve().parents[1] / 'core' / 'ui' / 'cli.py'
+    spec = importlib.util.spec_from_file_location('parser.core.ui.cli', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Config:
+    def __init__(self, root: Path):
+        self.values = {'xbrl_filings_path': root}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+def _make_filing(root: Path, company: str, accession: str, instance: str) -> Path:
+    filing_dir = root / 'sec' / company / 'filings' / '10-K' / accession
+    filing_dir.mkdir(parents=True)
+    (filing_dir / instance).write_text('<xbrl/>')
+    return filing_dir
+
+
+def _append(root: Path, record: dict) -> None:
+    with open(root / CATALOG_FILENAME, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + '\n')
+
+
+def test_filing_date_from_instance_name(tmp_path):
+    filing_dir = _make_filing(tmp_path, 'Apple_Inc', '0000320193-24-000123', 'aapl-20240928.htm')
+    undated = _make_filing(tmp_path, 'Other', 'acc-1', 'report.htm')
+
+    assert filing_date(filing_dir) == '2024-09-28'
+    assert filing_date(undated) == 'acc-1'
+
+
+def test_appended_catalog_is_not_complete(tmp_path):
+    filing_dir = _make_filing(tmp_path, 'Apple_Inc', 'acc-2', 'aapl-20240928.htm')
+    catalog = FilingCatalog(tmp_path)
+    _append(tmp_path, catalog.make_record('sec', 'Apple_Inc', '10-K', '2024-09-28', filing_dir))
+
+    assert catalog.exists()
+    assert not catalog.is_complete()
+
+
+def test_written_catalog_is_complete_and_header_skipped(tmp_path):
+    filing_dir = _make_filing(tmp_path, 'Apple_Inc', 'acc-2', 'aapl-20240928.htm')
+    catalog = FilingCatalog(tmp_path)
+
+    assert catalog.write([catalog.make_record('sec', 'Apple_Inc', '10-K', '2024-09-28', filing_dir)])
+
+    assert catalog.is_complete()
+    records = catalog.load()
+    assert [r['path'] for r in records] == ['sec/Apple_Inc/filings/10-K/acc-2']
+
+
+def test_find_uses_loaded_records_until_catalog_changes(tmp_path):
+    first = _make_filing(tmp_path, 'Apple_Inc', 'acc-1', 'aapl-20230930.htm')
+    second = _make_filing(tmp_path, 'Apple_Inc', 'acc-2', 'aapl-20240928.htm')
+    catalog = FilingCatalog(tmp_path)
+    catalog.write([catalog.make_record('sec', 'Apple_Inc', '10-K', '2023-09-30', first)])
+
+    assert catalog.find(first)['accession'] == 'acc-1'
+    assert catalog.find(second) is None
+
+    _append(tmp_path, catalog.make_record('sec', 'Apple_Inc', '10-K', '2024-09-28', second))
+
+    assert catalog.find(second)['date'] == '2024-09-28'
+
+
+def test_discover_seeds_catalog_keeping_earlier_filings(tmp_path):
+    cli_module = _load_cli_module()
+    old = _make_filing(tmp_path, 'Apple_Inc', 'acc-old', 'aapl-20230930.htm')
+    new = _make_filing(tmp_path, 'Apple_Inc', 'acc-new', 'aapl-20240928.htm')
+
+    # Catalog started by a download after the upgrade: lists only the new filing
+    record = FilingCatalog(tmp_path).make_record('sec', 'Apple_Inc', '10-K', '2024-09-28', new)
+    record['filing_date'] = '2024-11-01'
+    _append(tmp_path, record)
+
+    cli = cli_module.FilingCLI(config=_Config(tmp_path))
+    filings = cli.discover()
+
+    assert sorted(f.path for f in filings) == sorted([old, new])
+    assert cli.catalog.is_complete()
+    assert cli.catalog.find(new)['filing_date'] == '2024-11-01'
+
+    # Seeded: next listing comes from the catalog alone
+    cli.loader.discover_all_files = None
+    assert sorted(f.path for f in cli.discover()) == sorted([old, new])
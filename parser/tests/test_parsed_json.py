@@ -0,0 +1,55 @@
+# Path: tests/test_parsed_json.py
+"""
+parsed.json is the serializer's output, written atomically.
+
+Run from the repository root: python -m pytest parser/tests
+"""
+
+import importlib.util
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+
+def _load_parsed_json():
+    """Load output/parsed_json.py alone (output/__init__ needs xbrl_parser)."""
+    path = Path(__file__).resolve().parents[1] / 'output' / 'parsed_json.py'
+    spec = importlib.util.spec_from_file_location('parser.output.parsed_json', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+parsed_json = _load_parsed_json()
+
+
+class _Serializer:
+    """Serializer with its own layout (not json.dumps defaults)."""
+
+    def serialize(self, filing):
+        return json.dumps(filing, indent=4, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def test_write_is_serializer_output(tmp_path):
+    filing = {'period': date(2024, 9, 28), 'company': 'Société Générale', 'lines': 'a\r\nb'}
+    serializer = _Serializer()
+
+    path = parsed_json.write_parsed_json(serializer, filing, tmp_path / 'parsed.json')
+
+    assert path == tmp_path / 'parsed.json'
+    assert path.read_bytes() == serializer.serialize(filing).encode('utf-8')
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    json_file = tmp_path / 'parsed.json'
+    json_file.write_text('{"previous": true}')
+
+    # Fails after the temporary file is opened
+    with pytest.raises(TypeError):
+        parsed_json.write_text_atomic(b'{"partial"', json_file)
+
+    assert json_file.read_text() == '{"previous": true}'
+    assert list(tmp_path.iterdir()) == [json_file]
@@ -42,6 +42,7 @@ DEFAULT_LIBRARY_WEIGHT: float = 0.20
 # Performance Defaults
 DEFAULT_MAX_CONCURRENT_JOBS: int = 3
 DEFAULT_BATCH_SIZE: int = 10
+DEFAULT_FILING_TIMEOUT_SECONDS: int = 900
 
 
 class ConfigLoader:
@@ -186,6 +187,19 @@ class ConfigLoader:
                 'VERIFICATION_MAX_CONCURRENT_JOBS', DEFAULT_MAX_CONCURRENT_JOBS
             ),
             'batch_size': self._get_int('VERIFICATION_BATCH_SIZE', DEFAULT_BATCH_SIZE),
+            'parallel_verification': self._get_bool('VERIFICATION_PARALLEL', False),
+            'enable_result_cache': self._get_bool('VERIFICATION_ENABLE_RESULT_CACHE', True),
+            'result_cache_dir': self._get_path('VERIFICATION_RESULT_CACHE_DIR'),
+            'filing_timeout_seconds': self._get_int(
+                'VERIFICATION_FILING_TIMEOUT_SECONDS', DEFAULT_FILING_TIMEOUT_SECONDS
+            ),
+
+            # ================================================================
+            # OBSERVABILITY
+            # ================================================================
+            'enable_metrics': self._get_bool('VERIFICATION_ENABLE_METRICS', False),
+            'metrics_format': self._get_env('VERIFICATION_METRICS_FORMAT', 'json'),  # json, openmetrics, all
+            'metrics_dir': self._get_path('VERIFICATION_METRICS_DIR'),  # Default: log_dir/metrics
         }
 
         return config
@@ -11,6 +11,8 @@ Subpackages:
 """
 
 from .coordinator import VerificationCoordinator, VerificationResult
+from .parallel_verifier import ParallelVerifier
+from .result_cache import ResultCache, InputFingerprint
 from .checks import HorizontalChecker, VerticalChecker, LibraryChecker, CheckResult
 from .scoring import ScoreCalculator, VerificationScores, QualityClassifier, QualityClassification
 from .taxonomy_manager import TaxonomyManager
@@ -19,6 +21,9 @@ from .formula_registry import FormulaRegistry, CalculationTree, FormulaCompariso
 __all__ = [
     'VerificationCoordinator',
     'VerificationResult',
+    'ParallelVerifier',
+    'ResultCache',
+    'InputFingerprint',
     'HorizontalChecker',
     'VerticalChecker',
     'LibraryChecker',
@@ -60,6 +60,9 @@ class HorizontalChecker:
     No hardcoded formulas.
     """
 
+    # Bump when check logic changes; part of the verification result cache key
+    RULES_VERSION: str = '1'
+
     def __init__(self):
         """Initialize horizontal checker with required components."""
         self.c_equal = CEqual()
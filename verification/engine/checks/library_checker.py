@@ -46,6 +46,9 @@ class LibraryChecker:
                 print(f"{result.check_name}: {result.message}")
     """
 
+    # Bump when check logic changes; part of the verification result cache key
+    RULES_VERSION: str = '1'
+
     def __init__(self):
         """Initialize library checker."""
         self.logger = logging.getLogger('process.library_checker')
@@ -57,6 +57,9 @@ class VerticalChecker:
                 print(f"{result.check_name}: {result.message}")
     """
 
+    # Bump when check logic changes; part of the verification result cache key
+    RULES_VERSION: str = '1'
+
     def __init__(
         self,
         calculation_tolerance: float = DEFAULT_CALCULATION_TOLERANCE,
@@ -12,7 +12,9 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+from mapper.observability.instrumentation import get_instrumentation
 
 from ..core.config_loader import ConfigLoader
 from ..core.data_paths import DataPathsManager
@@ -29,6 +31,7 @@ from .checks.sign_weight_handler import SignWeightHandler
 from .scoring.score_calculator import ScoreCalculator, VerificationScores
 from .scoring.quality_classifier import QualityClassifier, QualityClassification
 from .taxonomy_manager import TaxonomyManager
+from .result_cache import ResultCache, InputFingerprint
 from .formula_registry import FormulaRegistry
 from .markets import get_statement_identifier, MainStatements
 from ..constants import LOG_INPUT, LOG_PROCESS, LOG_OUTPUT
@@ -57,6 +60,7 @@ class VerificationResult:
         processing_time_seconds: Time taken to verify
         statement_info: Information about statements verified
         taxonomy_status: Status of taxonomy availability
+        from_cache: True if result was loaded from the result cache
     """
     filing_id: str
     market: str
@@ -76,6 +80,7 @@ class VerificationResult:
     statement_info: dict = field(default_factory=dict)
     taxonomy_status: dict = field(default_factory=dict)
     formula_registry_summary: dict = field(default_factory=dict)
+    from_cache: bool = False
 
     def __post_init__(self):
         if self.verified_at is None:
@@ -114,6 +119,7 @@ class VerificationCoordinator:
         """
         self.config = config if config else ConfigLoader()
         self.logger = logging.getLogger('process.coordinator')
+        self.instrumentation = get_instrumentation()
 
         self.logger.info(f"{LOG_PROCESS} Initializing verification coordinator")
 
@@ -167,6 +173,9 @@ class VerificationCoordinator:
         self.enable_library_checks = self.config.get('enable_library_checks', True)
         self.continue_on_error = self.config.get('continue_on_error', True)
 
+        # Persistent per-filing result cache (keyed by input fingerprint)
+        self.result_cache = self._create_result_cache()
+
         self.logger.info(f"{LOG_OUTPUT} Verification coordinator initialized")
 
     def _setup_logging(self) -> None:
@@ -182,6 +191,17 @@ class VerificationCoordinator:
                 console_output=True
             )
 
+    def _create_result_cache(self) -> Optional[ResultCache]:
+        """Create result cache (data_root/cache/results unless configured)."""
+        if not self.config.get('enable_result_cache', True):
+            return None
+
+        cache_dir = self.config.get('result_cache_dir')
+        if not cache_dir and self.config.get('data_root'):
+            cache_dir = self.config.get('data_root') / 'cache' / 'results'
+
+        return ResultCache(cache_dir) if cache_dir else None
+
     def _ensure_directories(self) -> None:
         """Ensure all required directories exist."""
         try:
@@ -201,9 +221,16 @@ class VerificationCoordinator:
         Returns:
             VerificationResult with all check results and scores
         """
-        start_time = datetime.now()
         filing_id = f"{filing.market}/{filing.company}/{filing.form}/{filing.date}"
 
+        with self.instrumentation.filing(filing_id):
+            with self.instrumentation.span('verification.verify_filing'):
+                return self._verify_filing(filing, filing_id)
+
+    def _verify_filing(self, filing: MappedFilingEntry, filing_id: str) -> VerificationResult:
+        """Run all verification steps for a filing (see verify_filing)."""
+        start_time = datetime.now()
+
         self.logger.info(f"{LOG_INPUT} Verifying filing: {filing_id}")
 
         result = VerificationResult(
@@ -215,9 +242,41 @@ class VerificationCoordinator:
         )
 
         try:
+            # Step 0: Ensure taxonomies are available (if library checks enabled).
+            # Runs before the cache lookup: it may add taxonomies, and
+            # library results are only cached while taxonomies are ready
+            if self.enable_library_checks:
+                self.logger.info(f"{LOG_PROCESS} Checking taxonomy availability")
+                result.taxonomy_status = self.taxonomy_manager.ensure_taxonomies_available(
+                    filing.market, filing.company, filing.form, filing.date
+                )
+
+                if result.taxonomy_status.get('ready', False):
+                    self.logger.info(f"{LOG_OUTPUT} Taxonomies ready for library checks")
+                else:
+                    self.logger.info(
+                        f"{LOG_OUTPUT} Taxonomies not ready: {result.taxonomy_status.get('message', '')}"
+                    )
+
+            # Return cached result when none of the inputs changed
+            fingerprint = None
+            taxonomies_ready = (
+                not self.enable_library_checks
+                or result.taxonomy_status.get('ready', False)
+            )
+            if self.result_cache and taxonomies_ready:
+                fingerprint = self._fingerprint_inputs(filing)
+                cached = self.result_cache.get(filing_id, fingerprint) if fingerprint else None
+                if cached is not None:
+                    cached.from_cache = True
+                    cached.taxonomy_status = result.taxonomy_status
+                    self.instrumentation.count('verification_cache_hits')
+                    return cached
+
             # Step 1: Load mapped statements
             self.logger.info(f"{LOG_INPUT} Loading mapped statements")
-            statements = self.mapped_reader.read_statements(filing)
+            with self.instrumentation.span('verification.load_statements'):
+                statements = self.mapped_reader.read_statements(filing)
 
             if not statements or not statements.statements:
                 self.logger.warning(f"{LOG_OUTPUT} No statements found for {filing_id}")
@@ -267,13 +326,14 @@ class VerificationCoordinator:
 
             # Step 2: Load company XBRL linkbases
             self.logger.info(f"{LOG_INPUT} Loading XBRL linkbases")
-            xbrl_path = self.xbrl_loader.find_filing_for_company(
-                filing.market,
-                filing.company,
-                filing.form,
-                filing.date
-            )
-            calc_networks = self._load_calculation_linkbase_from_path(xbrl_path)
+            with self.instrumentation.span('verification.load_linkbases'):
+                xbrl_path = self.xbrl_loader.find_filing_for_company(
+                    filing.market,
+                    filing.company,
+                    filing.form,
+                    filing.date
+                )
+                calc_networks = self._load_calculation_linkbase_from_path(xbrl_path)
             self.logger.info(f"{LOG_OUTPUT} Loaded {len(calc_networks)} calculation networks")
 
             # Step 2b: Parse sign corrections from XBRL instance document
@@ -303,16 +363,18 @@ class VerificationCoordinator:
 
             # Step 3: Run horizontal checks (sign handler already set)
             self.logger.info(f"{LOG_PROCESS} Running horizontal checks")
-            result.horizontal_results = self.horizontal_checker.check_all(
-                statements, calc_networks, filing_path=xbrl_path
-            )
+            with self.instrumentation.span('verification.horizontal_checks'):
+                result.horizontal_results = self.horizontal_checker.check_all(
+                    statements, calc_networks, filing_path=xbrl_path
+                )
 
             # Step 4: Run vertical checks (sign handler already set)
             # VerticalChecker now automatically uses XBRL-sourced verification
             # when formula_registry has formulas loaded (preferred method)
             # Otherwise falls back to legacy pattern-based checks
             self.logger.info(f"{LOG_PROCESS} Running vertical checks")
-            result.vertical_results = self.vertical_checker.check_all(statements)
+            with self.instrumentation.span('verification.vertical_checks'):
+                result.vertical_results = self.vertical_checker.check_all(statements)
 
             # Store company XBRL calculation results separately for detailed analysis
             result.xbrl_calculation_results = [
@@ -320,29 +382,16 @@ class VerificationCoordinator:
                 if r.check_name in ('xbrl_calculation_company', 'xbrl_calculation_comparison')
             ]
 
-            # Step 5: Ensure taxonomies are available (if library checks enabled)
-            if self.enable_library_checks:
-                self.logger.info(f"{LOG_PROCESS} Checking taxonomy availability")
-                result.taxonomy_status = self.taxonomy_manager.ensure_taxonomies_available(
-                    filing.market, filing.company, filing.form, filing.date
-                )
-
-                if result.taxonomy_status.get('ready', False):
-                    self.logger.info(f"{LOG_OUTPUT} Taxonomies ready for library checks")
-                else:
-                    self.logger.info(
-                        f"{LOG_OUTPUT} Taxonomies not ready: {result.taxonomy_status.get('message', '')}"
-                    )
-
-            # Step 6: Run library checks (optional)
+            # Step 5: Run library checks (optional)
             if self.enable_library_checks:
                 self.logger.info(f"{LOG_PROCESS} Running library checks")
-                taxonomy_id = self._detect_taxonomy(statements)
-                result.library_results = self.library_checker.check_all(
-                    statements, taxonomy_id
-                )
+                with self.instrumentation.span('verification.library_checks'):
+                    taxonomy_id = self._detect_taxonomy(statements)
+                    result.library_results = self.library_checker.check_all(
+                        statements, taxonomy_id
+                    )
 
-            # Step 7: Calculate scores
+            # Step 6: Calculate scores
             # Note: vertical_results already includes xbrl/taxonomy calculation results
             # so we don't add them again to avoid double-counting
             self.logger.info(f"{LOG_PROCESS} Calculating scores")
@@ -353,7 +402,7 @@ class VerificationCoordinator:
             )
             result.scores = self.score_calculator.calculate_scores(all_results)
 
-            # Step 8: Classify quality
+            # Step 7: Classify quality
             self.logger.info(f"{LOG_PROCESS} Classifying quality")
             result.quality = self.quality_classifier.classify(result.scores)
             result.recommendation = result.quality.recommendation
@@ -374,6 +423,9 @@ class VerificationCoordinator:
                 f"(score: {result.scores.overall_score:.1f}) in {elapsed:.2f}s"
             )
 
+            if fingerprint:
+                self.result_cache.put(filing_id, fingerprint, result)
+
         except Exception as e:
             self.logger.error(f"Error verifying {filing_id}: {e}")
             result.recommendation = f"Verification failed: {str(e)}"
@@ -383,17 +435,43 @@ class VerificationCoordinator:
 
         return result
 
-    def verify_all_filings(self) -> list[VerificationResult]:
+    def verify_all_filings(
+        self,
+        filings: Optional[list[MappedFilingEntry]] = None,
+        on_result: Optional[Callable[[VerificationResult], None]] = None
+    ) -> list[VerificationResult]:
         """
         Verify all available mapped filings.
 
+        When parallel verification is enabled (VERIFICATION_PARALLEL), filings
+        are spread over max_concurrent_jobs worker processes with a per-filing
+        timeout. In both modes each result is passed to on_result as soon as
+        it is available, so reports can be written while verification runs.
+
+        Args:
+            filings: Filings to verify (default: discover all mapped filings)
+            on_result: Optional callback invoked with each finished result
+
         Returns:
             List of VerificationResult for each filing
         """
-        self.logger.info(f"{LOG_INPUT} Discovering mapped filings")
+        if filings is None:
+            self.logger.info(f"{LOG_INPUT} Discovering mapped filings")
+            filings = self.mapped_loader.discover_all_mapped_filings()
+            self.logger.info(f"{LOG_OUTPUT} Found {len(filings)} mapped filings")
 
-        filings = self.mapped_loader.discover_all_mapped_filings()
-        self.logger.info(f"{LOG_OUTPUT} Found {len(filings)} mapped filings")
+        callback = self._guard_callback(on_result)
+        workers = self.config.get('max_concurrent_jobs', 1)
+
+        if self.config.get('parallel_verification', False) and workers > 1 and len(filings) > 1:
+            # Imported here: parallel_verifier imports VerificationResult from this module
+            from .parallel_verifier import ParallelVerifier
+
+            verifier = ParallelVerifier(
+                workers=min(workers, len(filings)),
+                timeout_seconds=self.config.get('filing_timeout_seconds')
+            )
+            return verifier.run(filings, on_result=self._record_worker_result(callback))
 
         results = []
         for filing in filings:
@@ -404,11 +482,53 @@ class VerificationCoordinator:
                 self.logger.error(f"Failed to verify {filing.company}: {e}")
                 if not self.continue_on_error:
                     raise
+                continue
+
+            if callback:
+                callback(result)
 
         self.logger.info(f"{LOG_OUTPUT} Verified {len(results)} filings")
 
         return results
 
+    def _record_worker_result(
+        self,
+        on_result: Optional[Callable[[VerificationResult], None]]
+    ) -> Optional[Callable[[VerificationResult], None]]:
+        """Record filing timings from worker processes (their spans stay in the worker)."""
+        if not self.instrumentation.enabled:
+            return on_result
+
+        def record(result: VerificationResult) -> None:
+            # Cached results carry the timing of the run that computed them
+            self.instrumentation.record(
+                'verification.verify_filing',
+                0.0 if result.from_cache else result.processing_time_seconds,
+                filing_id=result.filing_id
+            )
+            if on_result:
+                on_result(result)
+
+        return record
+
+    def _guard_callback(
+        self,
+        on_result: Optional[Callable[[VerificationResult], None]]
+    ) -> Optional[Callable[[VerificationResult], None]]:
+        """Wrap result callback so a failing writer respects continue_on_error."""
+        if on_result is None:
+            return None
+
+        def guarded(result: VerificationResult) -> None:
+            try:
+                on_result(result)
+            except Exception as e:
+                self.logger.error(f"Error handling result for {result.filing_id}: {e}")
+                if not self.continue_on_error:
+                    raise
+
+        return guarded
+
     def verify_by_id(
         self,
         market: str,
@@ -436,6 +556,78 @@ class VerificationCoordinator:
 
         return self.verify_filing(filing)
 
+    def _fingerprint_inputs(self, filing: MappedFilingEntry) -> Optional[str]:
+        """
+        Fingerprint everything verify_filing() reads for a filing.
+
+        Covers the mapped output directory, the calculation linkbase and
+        iXBRL instance document, the content digest of every taxonomy
+        library (from its inventory manifest), the rules versions of
+        checkers and scoring, and result-affecting settings.
+
+        Args:
+            filing: Filing entry
+
+        Returns:
+            Hex fingerprint string, or None (do not cache) when library
+            checks are enabled and a taxonomy has no current inventory
+            manifest, so its content cannot be fingerprinted unread
+        """
+        fingerprint = InputFingerprint()
+
+        fingerprint.add_value('rules', {
+            'horizontal': HorizontalChecker.RULES_VERSION,
+            'vertical': VerticalChecker.RULES_VERSION,
+            'library': LibraryChecker.RULES_VERSION,
+            'score': ScoreCalculator.RULES_VERSION,
+            'quality': QualityClassifier.RULES_VERSION,
+        })
+        fingerprint.add_value('config', {
+            key: self.config.get(key)
+            for key in (
+                'calculation_tolerance', 'rounding_tolerance',
+                'horizontal_weight', 'vertical_weight', 'library_weight',
+                'excellent_threshold', 'good_threshold', 'fair_threshold', 'poor_threshold',
+                'enable_library_checks', 'enable_xbrl_verification',
+            )
+        })
+
+        fingerprint.add_directory('mapped', filing.filing_folder)
+
+        xbrl_path = self.xbrl_loader.find_filing_for_company(
+            filing.market,
+            filing.company,
+            filing.form,
+            filing.date
+        )
+        fingerprint.add_value('xbrl_path', str(xbrl_path) if xbrl_path else None)
+        if xbrl_path:
+            fingerprint.add_file(
+                'calculation_linkbase', self.xbrl_reader.find_calculation_linkbase(xbrl_path)
+            )
+            fingerprint.add_file('instance', self._find_instance_document(xbrl_path))
+
+        if self.enable_library_checks:
+            taxonomy_loader = self.taxonomy_reader.taxonomy_loader
+            try:
+                taxonomy_dirs = taxonomy_loader.list_taxonomies()
+            except Exception:
+                taxonomy_dirs = []
+
+            taxonomies = {}
+            for taxonomy_dir in taxonomy_dirs:
+                digest = taxonomy_loader.get_content_digest(taxonomy_dir)
+                if digest is None:
+                    self.logger.info(
+                        f"{LOG_PROCESS} No current inventory for taxonomy {taxonomy_dir.name}, "
+                        f"result not cached"
+                    )
+                    return None
+                taxonomies[taxonomy_dir.name] = digest
+            fingerprint.add_value('taxonomies', sorted(taxonomies.items()))
+
+        return fingerprint.hexdigest()
+
     def _load_calculation_linkbase(
         self,
         filing: MappedFilingEntry
@@ -687,6 +879,7 @@ class VerificationCoordinator:
             'by_market': self._count_by_field(filings, 'market'),
             'by_form': self._count_by_field(filings, 'form'),
             'companies': list(set(f.company for f in filings)),
+            'result_cache': self.result_cache.get_statistics() if self.result_cache else None,
         }
 
     def _count_by_field(
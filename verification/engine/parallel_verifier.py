@@ -0,0 +1,269 @@
+# Path: verification/engine/parallel_verifier.py
+"""
+Parallel Verifier
+
+Spreads filing verification over a process pool.
+
+Each worker process builds its own VerificationCoordinator once and
+verifies filings one at a time. The parent process only schedules work
+and hands every finished VerificationResult to a callback as soon as it
+arrives, so report writers run while other filings are still verifying.
+
+Isolation:
+- A filing that exceeds the per-filing timeout is recorded as failed and
+  its worker is killed. The pool is rebuilt and the other in-flight
+  filings are requeued as they were: the culprit is known, so they keep
+  their retries and run in parallel again.
+- A worker crash (segfault, OOM kill) breaks the pool without telling
+  which filing caused it; every filing that was in flight is retried
+  once on its own, and recorded as failed if it crashes again.
+
+Every requeue after a crash counts against the filing's retries, and
+such a filing runs alone, so it is never requeued a second time because
+of another filing. Worker processes are tracked through the pool's
+multiprocessing context, so hung workers are killed without reaching
+into the executor.
+"""
+
+import logging
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+from ..loaders.mapped_data import MappedFilingEntry
+from .coordinator import VerificationResult
+from ..constants import LOG_PROCESS, LOG_OUTPUT
+
+
+# Times a filing is requeued after the pool broke while it was in flight
+MAX_CRASH_RETRIES = 1
+
+
+class _WorkerTrackingContext:
+    """Multiprocessing context that remembers the processes it starts."""
+
+    def __init__(self):
+        self._context = multiprocessing.get_context()
+        self.processes: list[multiprocessing.process.BaseProcess] = []
+
+    def Process(self, *args, **kwargs):
+        process = self._context.Process(*args, **kwargs)
+        self.processes.append(process)
+        return process
+
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+# Coordinator owned by a worker process (created by _init_worker)
+_worker_coordinator = None
+
+
+def _init_worker() -> None:
+    """Create the coordinator used by this worker process."""
+    global _worker_coordinator
+    from .coordinator import VerificationCoordinator
+    _worker_coordinator = VerificationCoordinator()
+
+
+def _verify_in_worker(filing: MappedFilingEntry) -> VerificationResult:
+    """Verify one filing inside a worker process."""
+    return _worker_coordinator.verify_filing(filing)
+
+
+class ParallelVerifier:
+    """
+    Verifies filings concurrently in separate processes.
+
+    Example:
+        verifier = ParallelVerifier(workers=8, timeout_seconds=900)
+        results = verifier.run(filings, on_result=report_generator.generate_report)
+    """
+
+    def __init__(self, workers: int, timeout_seconds: Optional[float] = None):
+        """
+        Initialize parallel verifier.
+
+        Args:
+            workers: Number of worker processes
+            timeout_seconds: Per-filing time limit (None or <= 0 disables it)
+        """
+        self.workers = max(1, workers)
+        self.timeout_seconds = timeout_seconds if timeout_seconds and timeout_seconds > 0 else None
+        self.logger = logging.getLogger('process.parallel_verifier')
+
+    def run(
+        self,
+        filings: list[MappedFilingEntry],
+        on_result: Optional[Callable[[VerificationResult], None]] = None
+    ) -> list[VerificationResult]:
+        """
+        Verify filings and stream results as they complete.
+
+        Args:
+            filings: Filings to verify
+            on_result: Called in this process with each finished result
+
+        Returns:
+            List of VerificationResult in the same order as filings
+        """
+        self.logger.info(
+            f"{LOG_PROCESS} Verifying {len(filings)} filings with {self.workers} workers"
+        )
+
+        results: dict[int, VerificationResult] = {}
+        pending = deque((index, filing, 0) for index, filing in enumerate(filings))
+
+        def emit(index: int, result: VerificationResult) -> None:
+            results[index] = result
+            if on_result:
+                on_result(result)
+
+        while pending:
+            context = _WorkerTrackingContext()
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_worker
+            )
+            in_flight = {}
+            pool_broken = False
+            crashed = False
+
+            try:
+                while (pending or in_flight) and not pool_broken:
+                    # Keep at most one filing per worker in flight, so submit
+                    # time is effectively start time for the timeout.
+                    # Filings retried after a crash run alone, so a second
+                    # crash is attributed to the right filing.
+                    while pending and len(in_flight) < self.workers:
+                        if pending[0][2] > 0 and in_flight:
+                            break
+                        index, filing, crashes = pending.popleft()
+                        future = executor.submit(_verify_in_worker, filing)
+                        in_flight[future] = (index, filing, crashes, time.monotonic())
+                        if crashes > 0:
+                            break
+
+                    done, _ = wait(
+                        in_flight,
+                        timeout=self._time_to_next_deadline(in_flight),
+                        return_when=FIRST_COMPLETED
+                    )
+
+                    for future in done:
+                        index, filing, crashes, started = in_flight.pop(future)
+                        try:
+                            emit(index, future.result())
+                        except BrokenProcessPool:
+                            pool_broken = crashed = True
+                            self._requeue_or_fail(
+                                pending, index, filing, crashes, emit,
+                                "Worker crashed while verifying"
+                            )
+                        except Exception as e:
+                            self.logger.error(f"Worker error verifying {self._filing_id(filing)}: {e}")
+                            emit(index, self._failed_result(filing, f"Verification failed: {e}"))
+
+                    for future in self._expired(in_flight):
+                        index, filing, _, _ = in_flight.pop(future)
+                        pool_broken = True
+                        self.logger.error(
+                            f"Verification of {self._filing_id(filing)} timed out "
+                            f"after {self.timeout_seconds}s"
+                        )
+                        emit(index, self._failed_result(
+                            filing,
+                            f"Verification failed: timed out after {self.timeout_seconds}s"
+                        ))
+
+            except BaseException:
+                self._terminate(executor, context)
+                raise
+
+            if pool_broken:
+                # Filings still in flight are run again. After a crash the
+                # culprit is unknown, so they count a retry and run alone;
+                # after a timeout only the expired filing was at fault
+                for future, (index, filing, crashes, _) in in_flight.items():
+                    if future.done() and future.exception() is None:
+                        emit(index, future.result())
+                    elif crashed:
+                        self._requeue_or_fail(
+                            pending, index, filing, crashes, emit,
+                            "Worker pool crashed while verifying"
+                        )
+                    else:
+                        pending.appendleft((index, filing, crashes))
+                self._terminate(executor, context)
+            else:
+                executor.shutdown(wait=True)
+
+        self.logger.info(f"{LOG_OUTPUT} Verified {len(results)} filings in parallel")
+
+        return [results[index] for index in range(len(filings))]
+
+    def _requeue_or_fail(
+        self,
+        pending: deque,
+        index: int,
+        filing: MappedFilingEntry,
+        crashes: int,
+        emit: Callable[[int, VerificationResult], None],
+        message: str
+    ) -> None:
+        """Requeue a filing whose worker pool broke, or record it as failed."""
+        if crashes < MAX_CRASH_RETRIES:
+            self.logger.warning(f"{message} {self._filing_id(filing)}, retrying")
+            pending.append((index, filing, crashes + 1))
+        else:
+            self.logger.error(f"{message} {self._filing_id(filing)}")
+            emit(index, self._failed_result(filing, "Verification failed: worker process crashed"))
+
+    def _time_to_next_deadline(self, in_flight: dict) -> Optional[float]:
+        """Seconds until the earliest in-flight filing times out."""
+        if self.timeout_seconds is None or not in_flight:
+            return None
+        earliest = min(started for _, _, _, started in in_flight.values())
+        return max(0.0, earliest + self.timeout_seconds - time.monotonic())
+
+    def _expired(self, in_flight: dict) -> list:
+        """Futures of in-flight filings that exceeded the timeout."""
+        if self.timeout_seconds is None:
+            return []
+        now = time.monotonic()
+        return [
+            future for future, (_, _, _, started) in in_flight.items()
+            if not future.done() and now - started >= self.timeout_seconds
+        ]
+
+    def _terminate(
+        self,
+        executor: ProcessPoolExecutor,
+        context: _WorkerTrackingContext
+    ) -> None:
+        """Kill worker processes (hung or crashed) and discard the pool."""
+        for process in context.processes:
+            if process.is_alive():
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _failed_result(self, filing: MappedFilingEntry, reason: str) -> VerificationResult:
+        """Build result for a filing that could not be verified."""
+        return VerificationResult(
+            filing_id=self._filing_id(filing),
+            market=filing.market,
+            company=filing.company,
+            form=filing.form,
+            date=filing.date,
+            recommendation=reason,
+        )
+
+    def _filing_id(self, filing: MappedFilingEntry) -> str:
+        """Filing identifier matching VerificationCoordinator.verify_filing."""
+        return f"{filing.market}/{filing.company}/{filing.form}/{filing.date}"
+
+
+__all__ = ['ParallelVerifier']
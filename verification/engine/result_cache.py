@@ -0,0 +1,197 @@
+# Path: verification/engine/result_cache.py
+"""
+Verification Result Cache
+
+Persists VerificationResult objects per filing, keyed by a fingerprint of
+everything the verification read:
+- mapped statement files of the filing
+- company calculation linkbase
+- iXBRL instance document (sign corrections)
+- content digest of each taxonomy library, from its inventory manifest
+  (library checks; no entry is cached while a manifest is missing or
+  stale, or while taxonomies are not ready)
+- rules versions of the checkers, ScoreCalculator and QualityClassifier
+- configuration values that change results (tolerances, weights, thresholds)
+
+Files are fingerprinted by path, size and modification time, so a
+re-verification of an unchanged archive does not read file contents.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+
+from ..constants import LOG_INPUT, LOG_OUTPUT
+
+if TYPE_CHECKING:
+    from .coordinator import VerificationResult
+
+
+# Bump when the cache entry layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Cache entry file extension
+CACHE_ENTRY_EXTENSION = '.pkl'
+
+
+class InputFingerprint:
+    """
+    Incremental SHA-256 fingerprint of verification inputs.
+
+    Example:
+        fingerprint = InputFingerprint()
+        fingerprint.add_value('rules', {'horizontal': '1'})
+        fingerprint.add_directory('mapped', filing.filing_folder)
+        key = fingerprint.hexdigest()
+    """
+
+    def __init__(self):
+        """Initialize empty fingerprint."""
+        self._hasher = hashlib.sha256()
+
+    def add_value(self, label: str, value: any) -> None:
+        """Add a labelled value (repr is hashed)."""
+        self._hasher.update(f"{label}={value!r}\n".encode('utf-8'))
+
+    def add_file(self, label: str, path: Optional[Path]) -> None:
+        """Add file identity (path, size, mtime) or a marker if missing."""
+        if path is None:
+            self.add_value(label, None)
+            return
+        try:
+            stat = os.stat(path)
+            self.add_value(label, (str(path), stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            self.add_value(label, (str(path), None))
+
+    def add_directory(self, label: str, directory: Optional[Path]) -> None:
+        """Add identity of every file below directory, in sorted order."""
+        if directory is None or not os.path.isdir(directory):
+            self.add_value(label, None)
+            return
+
+        entries = []
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                relative = os.path.relpath(file_path, directory)
+                entries.append((relative, stat.st_size, stat.st_mtime_ns))
+
+        self.add_value(label, entries)
+
+    def hexdigest(self) -> str:
+        """Return fingerprint as hex string."""
+        return self._hasher.hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk cache of verification results.
+
+    One entry per filing, replaced whenever the fingerprint changes.
+
+    Example:
+        cache = ResultCache(cache_dir)
+        result = cache.get(filing_id, fingerprint)
+        if result is None:
+            result = coordinator.verify_filing(filing)
+            cache.put(filing_id, fingerprint, result)
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize result cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.logger = logging.getLogger('process.result_cache')
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, filing_id: str, fingerprint: str) -> Optional['VerificationResult']:
+        """
+        Get cached result if inputs are unchanged.
+
+        Args:
+            filing_id: Filing identifier
+            fingerprint: Current input fingerprint
+
+        Returns:
+            Cached VerificationResult or None
+        """
+        entry_path = self._entry_path(filing_id)
+
+        try:
+            with open(entry_path, 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            self.logger.warning(f"Discarding unreadable cache entry for {filing_id}: {e}")
+            self.misses += 1
+            return None
+
+        if (
+            entry.get('format_version') != CACHE_FORMAT_VERSION
+            or entry.get('fingerprint') != fingerprint
+        ):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.logger.info(f"{LOG_INPUT} Using cached verification result for {filing_id}")
+        return entry.get('result')
+
+    def put(self, filing_id: str, fingerprint: str, result: 'VerificationResult') -> None:
+        """
+        Store result for filing.
+
+        Args:
+            filing_id: Filing identifier
+            fingerprint: Input fingerprint the result was computed from
+            result: Verification result
+        """
+        entry_path = self._entry_path(filing_id)
+        entry = {
+            'format_version': CACHE_FORMAT_VERSION,
+            'filing_id': filing_id,
+            'fingerprint': fingerprint,
+            'result': result,
+        }
+
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(entry_path)
+            self.logger.debug(f"{LOG_OUTPUT} Cached verification result for {filing_id}")
+        except Exception as e:
+            self.logger.warning(f"Could not cache verification result for {filing_id}: {e}")
+
+    def get_statistics(self) -> dict:
+        """Get hit/miss counts for this process."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def _entry_path(self, filing_id: str) -> Path:
+        """Cache entry path for a filing (hashed to avoid unsafe characters)."""
+        digest = hashlib.sha256(filing_id.encode('utf-8')).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}{CACHE_ENTRY_EXTENSION}"
+
+
+__all__ = ['ResultCache', 'InputFingerprint', 'CACHE_FORMAT_VERSION']
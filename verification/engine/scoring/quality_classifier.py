@@ -69,6 +69,9 @@ class QualityClassifier:
         print(f"Recommendation: {classification.recommendation}")
     """
 
+    # Bump when classification logic changes; part of the verification result cache key
+    RULES_VERSION: str = '1'
+
     def __init__(
         self,
         excellent_threshold: int = DEFAULT_EXCELLENT_THRESHOLD,
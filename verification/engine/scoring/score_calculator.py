@@ -77,6 +77,9 @@ class ScoreCalculator:
         print(f"Overall score: {scores.overall_score}")
     """
 
+    # Bump when scoring logic changes; part of the verification result cache key
+    RULES_VERSION: str = '1'
+
     def __init__(
         self,
         horizontal_weight: float = DEFAULT_HORIZONTAL_WEIGHT,
@@ -13,6 +13,7 @@ Architecture:
 
 - Readers: Load and interpret file contents
   - MappedReader: Read mapped statement JSON files
+  - MappedBundleReader: Read indexed mapped statement bundles
   - XBRLReader: Read calculation/presentation linkbases
   - TaxonomyReader: Read taxonomy definitions
 """
@@ -25,6 +26,7 @@ from .taxonomy import TaxonomyLoader
 
 # Readers (content interpretation)
 from .mapped_reader import MappedReader, MappedStatements, Statement, StatementFact
+from .mapped_bundle import MappedBundleReader, BundleIndex, BundleEntry
 from .xbrl_reader import (
     XBRLReader,
     CalculationNetwork,
@@ -54,6 +56,9 @@ __all__ = [
     'MappedStatements',
     'Statement',
     'StatementFact',
+    'MappedBundleReader',
+    'BundleIndex',
+    'BundleEntry',
     'XBRLReader',
     'CalculationNetwork',
     'CalculationArc',
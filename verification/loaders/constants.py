@@ -35,6 +35,16 @@ MAPPED_STATEMENT_MARKERS = [
 # Subdirectories within mapped statement output
 MAPPED_OUTPUT_SUBDIRS = ['json', 'csv', 'excel']
 
+# Statement folders (by classification category) inside json/
+MAPPED_STATEMENT_FOLDERS = ['core_statements', 'details', 'other']
+
+# Indexed statement bundle written by the mapper (MAPPER_JSON_LAYOUT=bundle|both)
+MAPPED_BUNDLE_FILENAME = 'MAPPED_STATEMENTS.bundle'
+MAPPED_BUNDLE_MAGIC = b'MPBUNDLE'
+MAPPED_BUNDLE_SUPPORTED_VERSIONS = [1]
+# Header: magic (8 bytes), version (uint32), TOC length (uint64), big-endian
+MAPPED_BUNDLE_HEADER_FORMAT = '>8sIQ'
+
 # ==============================================================================
 # PARSED OUTPUT DETECTION
 # ==============================================================================
@@ -42,6 +52,11 @@ MAPPED_OUTPUT_SUBDIRS = ['json', 'csv', 'excel']
 # Main parsed output file
 PARSED_JSON_FILE = 'parsed.json'
 
+# Inventory manifest inside each taxonomy library directory (format:
+# library/loaders/library_inventory.py)
+LIBRARY_INVENTORY_FILENAME = '.library_inventory.json'
+LIBRARY_INVENTORY_FORMAT_VERSION = 1
+
 # ==============================================================================
 # XBRL FILING DETECTION
 # ==============================================================================
@@ -83,6 +98,13 @@ SCHEMA_FILE_PATTERNS = ['.xsd']
 # Instance document patterns
 INSTANCE_FILE_PATTERNS = ['.xml', '.xbrl', '.xhtml', '.htm', '.html']
 
+# Archives a filing is stored as when the downloader did not extract it
+# (DOWNLOADER_EXTRACT_FILINGS=false; format: mapper/loaders/constants.py).
+# Matched on the file name end, as '.tar.gz' is not a single suffix
+FILING_ARCHIVE_EXTENSIONS = (
+    '.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz',
+)
+
 # ==============================================================================
 # XBRL SPECIFICATION CONSTANTS
 # ==============================================================================
@@ -272,9 +294,16 @@ __all__ = [
     # Mapped statements
     'MAPPED_STATEMENT_MARKERS',
     'MAPPED_OUTPUT_SUBDIRS',
+    'MAPPED_STATEMENT_FOLDERS',
+    'MAPPED_BUNDLE_FILENAME',
+    'MAPPED_BUNDLE_MAGIC',
+    'MAPPED_BUNDLE_SUPPORTED_VERSIONS',
+    'MAPPED_BUNDLE_HEADER_FORMAT',
 
     # Parsed output
     'PARSED_JSON_FILE',
+    'LIBRARY_INVENTORY_FILENAME',
+    'LIBRARY_INVENTORY_FORMAT_VERSION',
 
     # XBRL patterns
     'CALCULATION_LINKBASE_PATTERNS',
@@ -283,6 +312,7 @@ __all__ = [
     'LABEL_LINKBASE_PATTERNS',
     'SCHEMA_FILE_PATTERNS',
     'INSTANCE_FILE_PATTERNS',
+    'FILING_ARCHIVE_EXTENSIONS',
 
     # XBRL namespaces
     'XLINK_NAMESPACE',
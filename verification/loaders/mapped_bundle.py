@@ -0,0 +1,185 @@
+# Path: verification/loaders/mapped_bundle.py
+"""
+Mapped Statement Bundle Reader for Verification Module
+
+Reads the indexed statement bundle written by the mapper
+(MAPPED_STATEMENTS.bundle) instead of hundreds of per-statement files.
+
+RESPONSIBILITY: Read the bundle table of contents and return raw
+statement documents by offset. Interpretation of the documents stays
+in mapped_reader.py.
+
+Bundle layout:
+    MAGIC      8 bytes   MAPPED_BUNDLE_MAGIC
+    VERSION    4 bytes   big-endian unsigned int
+    TOC_LENGTH 8 bytes   big-endian unsigned int
+    TOC        JSON      {'version', 'filing_info', 'statements': [...]}
+    DATA       bytes     statement documents, back to back
+"""
+
+import json
+import logging
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from .constants import (
+    MAPPED_BUNDLE_MAGIC,
+    MAPPED_BUNDLE_SUPPORTED_VERSIONS,
+    MAPPED_BUNDLE_HEADER_FORMAT,
+)
+
+
+@dataclass
+class BundleEntry:
+    """
+    Table of contents entry for one statement in a bundle.
+
+    Attributes:
+        folder: Classification folder (core_statements, details, other)
+        filename: Statement filename without extension
+        role_uri: Statement role URI
+        fact_count: Number of facts in statement
+        offset: Offset of document inside bundle data section
+        length: Document length in bytes
+    """
+    folder: str
+    filename: str
+    role_uri: Optional[str] = None
+    fact_count: int = 0
+    offset: int = 0
+    length: int = 0
+
+
+@dataclass
+class BundleIndex:
+    """
+    Parsed bundle table of contents.
+
+    Attributes:
+        path: Path to bundle file
+        version: Bundle format version
+        filing_info: Filing metadata recorded by the mapper
+        entries: Statement entries in write order
+        data_offset: Absolute file offset of the data section
+    """
+    path: Path
+    version: int
+    filing_info: dict = field(default_factory=dict)
+    entries: list[BundleEntry] = field(default_factory=list)
+    data_offset: int = 0
+
+
+class MappedBundleReader:
+    """
+    Reads statement documents from a mapped statement bundle.
+
+    Only the header and table of contents are read up front; statement
+    documents are read on demand, one seek each, so callers can load a
+    subset (e.g. only core statements).
+
+    Example:
+        reader = MappedBundleReader()
+        index = reader.read_index(bundle_path)
+        for entry, data in reader.iter_documents(index, folders=['core_statements']):
+            print(entry.filename, len(data['facts']))
+    """
+
+    def __init__(self):
+        """Initialize bundle reader."""
+        self.logger = logging.getLogger('input.mapped_bundle')
+        self._header_size = struct.calcsize(MAPPED_BUNDLE_HEADER_FORMAT)
+
+    def read_index(self, bundle_path: Path) -> Optional[BundleIndex]:
+        """
+        Read bundle header and table of contents.
+
+        Args:
+            bundle_path: Path to bundle file
+
+        Returns:
+            BundleIndex or None if the file is not a readable bundle
+        """
+        try:
+            with open(bundle_path, 'rb') as f:
+                header = f.read(self._header_size)
+                if len(header) < self._header_size:
+                    self.logger.warning(f"Truncated bundle header: {bundle_path}")
+                    return None
+
+                magic, version, toc_length = struct.unpack(MAPPED_BUNDLE_HEADER_FORMAT, header)
+
+                if magic != MAPPED_BUNDLE_MAGIC:
+                    self.logger.warning(f"Not a statement bundle: {bundle_path}")
+                    return None
+
+                if version not in MAPPED_BUNDLE_SUPPORTED_VERSIONS:
+                    self.logger.warning(
+                        f"Unsupported bundle version {version}: {bundle_path}"
+                    )
+                    return None
+
+                toc = json.loads(f.read(toc_length).decode('utf-8'))
+
+        except (OSError, ValueError, struct.error) as e:
+            self.logger.warning(f"Error reading bundle index {bundle_path}: {e}")
+            return None
+
+        entries = [
+            BundleEntry(
+                folder=item.get('folder', ''),
+                filename=item.get('filename', ''),
+                role_uri=item.get('role_uri'),
+                fact_count=item.get('fact_count', 0),
+                offset=item.get('offset', 0),
+                length=item.get('length', 0),
+            )
+            for item in toc.get('statements', [])
+        ]
+
+        return BundleIndex(
+            path=Path(bundle_path),
+            version=version,
+            filing_info=toc.get('filing_info', {}),
+            entries=entries,
+            data_offset=self._header_size + toc_length,
+        )
+
+    def iter_documents(
+        self,
+        index: BundleIndex,
+        folders: Optional[list[str]] = None
+    ):
+        """
+        Yield (entry, parsed document) for selected statements.
+
+        Args:
+            index: Bundle index from read_index()
+            folders: Classification folders to load (None = all)
+
+        Yields:
+            Tuple of (BundleEntry, statement dict)
+        """
+        selected = [
+            entry for entry in index.entries
+            if folders is None or entry.folder in folders
+        ]
+
+        # Read in offset order so access stays sequential on disk
+        selected.sort(key=lambda e: e.offset)
+
+        with open(index.path, 'rb') as f:
+            for entry in selected:
+                f.seek(index.data_offset + entry.offset)
+                raw = f.read(entry.length)
+
+                try:
+                    yield entry, json.loads(raw.decode('utf-8'))
+                except (ValueError, UnicodeDecodeError) as e:
+                    self.logger.warning(
+                        f"Corrupt bundle entry {entry.folder}/{entry.filename}: {e}"
+                    )
+
+
+__all__ = ['MappedBundleReader', 'BundleIndex', 'BundleEntry']
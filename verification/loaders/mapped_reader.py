@@ -13,6 +13,7 @@ IMPROVEMENTS:
 - Tracks source files for each statement
 - Identifies main statements by file size (>50KB typically)
 - Handles SEC vs ESEF structure differences
+- Reads the indexed statement bundle (one file per filing) when present
 """
 
 import json
@@ -22,6 +23,8 @@ from pathlib import Path
 from typing import Optional
 
 from .mapped_data import MappedFilingEntry
+from .mapped_bundle import MappedBundleReader
+from .constants import MAPPED_BUNDLE_FILENAME, MAPPED_STATEMENT_FOLDERS
 
 # Size threshold for identifying main statements (50KB)
 MAIN_STATEMENT_SIZE_THRESHOLD = 50 * 1024
@@ -135,13 +138,19 @@ class MappedReader:
     def __init__(self):
         """Initialize mapped reader."""
         self.logger = logging.getLogger('input.mapped_reader')
+        self.bundle_reader = MappedBundleReader()
 
-    def read_statements(self, filing: MappedFilingEntry) -> Optional[MappedStatements]:
+    def read_statements(
+        self,
+        filing: MappedFilingEntry,
+        folders: Optional[list[str]] = None
+    ) -> Optional[MappedStatements]:
         """
         Read all statements from a mapped filing.
 
         Strategy (LOAD ALL STATEMENTS for complete verification):
-        1. First, look for ALL statement files (core_statements + details + other)
+        0. If the filing has a statement bundle, read statements from it
+        1. Otherwise look for ALL statement files (core_statements + details + other)
         2. If found, read ALL of them for complete fact discovery
         3. Fall back to combined file if no individual files exist
 
@@ -151,6 +160,8 @@ class MappedReader:
 
         Args:
             filing: MappedFilingEntry from MappedDataLoader
+            folders: Statement folders to load (e.g. ['core_statements']).
+                     None loads all folders.
 
         Returns:
             MappedStatements object or None if reading fails
@@ -168,9 +179,23 @@ class MappedReader:
             self.logger.warning(f"No JSON files found for {filing.filing_folder}")
             return None
 
+        # Strategy 0: Indexed bundle (single file, selective loading)
+        bundle_path = self._find_bundle_file(filing)
+
+        if bundle_path:
+            self._read_bundle(bundle_path, result, folders)
+
+            if result.statements:
+                self._identify_main_statements(result)
+                self.logger.info(
+                    f"Loaded {len(result.statements)} statements from bundle, "
+                    f"{len(result.main_statements)} main statements"
+                )
+                return result
+
         # Strategy 1: Load ALL statement files (core_statements + details + other)
         # This ensures we have all facts for c-equal verification
-        all_statement_files = self._find_all_statement_files(filing)
+        all_statement_files = self._find_all_statement_files(filing, folders)
 
         if all_statement_files:
             self.logger.info(
@@ -246,7 +271,72 @@ class MappedReader:
 
         return core_files
 
-    def _find_all_statement_files(self, filing: MappedFilingEntry) -> list[Path]:
+    def _find_bundle_file(self, filing: MappedFilingEntry) -> Optional[Path]:
+        """
+        Find the statement bundle for a filing.
+
+        Args:
+            filing: MappedFilingEntry
+
+        Returns:
+            Path to bundle file, or None if the filing has no bundle
+        """
+        candidates = []
+        if filing.json_folder:
+            candidates.append(filing.json_folder / MAPPED_BUNDLE_FILENAME)
+        if filing.filing_folder:
+            candidates.append(filing.filing_folder / MAPPED_BUNDLE_FILENAME)
+
+        for candidate in candidates:
+            if candidate.is_file():
+                return candidate
+
+        return None
+
+    def _read_bundle(
+        self,
+        bundle_path: Path,
+        result: MappedStatements,
+        folders: Optional[list[str]] = None
+    ) -> None:
+        """Read statements from an indexed bundle file."""
+        index = self.bundle_reader.read_index(bundle_path)
+        if index is None:
+            return
+
+        result.total_statement_files = len(index.entries)
+        if not result.filing_info:
+            result.filing_info = index.filing_info
+
+        documents = list(self.bundle_reader.iter_documents(index, folders))
+
+        # Same order as individual files: largest statement first
+        documents.sort(key=lambda item: item[0].length, reverse=True)
+
+        for entry, data in documents:
+            name = self._extract_statement_name(Path(entry.filename))
+
+            if not result.namespaces and 'namespaces' in data:
+                result.namespaces = data['namespaces']
+
+            stmt = self._parse_single_statement(
+                data,
+                name,
+                source_file=f"{bundle_path}#{entry.folder}/{entry.filename}.json",
+                file_size=entry.length
+            )
+            if stmt:
+                result.statements.append(stmt)
+
+        self.logger.info(
+            f"Read {len(documents)} of {len(index.entries)} statements from {bundle_path.name}"
+        )
+
+    def _find_all_statement_files(
+        self,
+        filing: MappedFilingEntry,
+        folders: Optional[list[str]] = None
+    ) -> list[Path]:
         """
         Find ALL statement files across all folders.
 
@@ -260,13 +350,14 @@ class MappedReader:
 
         Args:
             filing: MappedFilingEntry
+            folders: Statement folders to include (None = all)
 
         Returns:
             List of Path objects for ALL statement JSON files
         """
         all_files = []
         found_paths = set()  # Track to avoid duplicates
-        folders_to_check = ['core_statements', 'details', 'other']
+        folders_to_check = folders if folders is not None else MAPPED_STATEMENT_FOLDERS
 
         # Location 1: Check json folder structure (filing_folder/json/core_statements/)
         if filing.json_folder and filing.json_folder.exists():
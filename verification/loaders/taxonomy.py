@@ -15,11 +15,14 @@ RESPONSIBILITY: Provide access to taxonomy files. That's it.
 Calling mechanisms decide what to do with the files.
 """
 
+import json
 import logging
+import os
 from pathlib import Path
 from typing import Optional
 
 from ..core.config_loader import ConfigLoader
+from .constants import LIBRARY_INVENTORY_FILENAME, LIBRARY_INVENTORY_FORMAT_VERSION
 
 
 class TaxonomyLoader:
@@ -78,6 +81,41 @@ class TaxonomyLoader:
 
         return taxonomy_dir
 
+    def get_content_digest(self, taxonomy_dir: Path) -> Optional[str]:
+        """
+        Content digest of a taxonomy library from its inventory manifest.
+
+        The manifest is only trusted while every directory it records
+        still has the recorded modification time (the library's own
+        validation rule); no files are read or hashed here.
+
+        Args:
+            taxonomy_dir: Taxonomy library directory
+
+        Returns:
+            content_digest, or None if the manifest is missing, of another
+            format version, or stale
+        """
+        manifest_path = Path(taxonomy_dir) / LIBRARY_INVENTORY_FILENAME
+
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+
+            if manifest.get('format_version') != LIBRARY_INVENTORY_FORMAT_VERSION:
+                return None
+
+            directories = manifest.get('directories') or {}
+            if not directories:
+                return None
+            for relative_dir, mtime_ns in directories.items():
+                if os.stat(Path(taxonomy_dir) / relative_dir).st_mtime_ns != mtime_ns:
+                    return None
+
+            return manifest['content_digest']
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
     def discover_all_files(
         self,
         taxonomy_id: str = None,
@@ -22,6 +22,7 @@ from typing import Optional
 
 from ..core.config_loader import ConfigLoader
 from .constants import (
+    FILING_ARCHIVE_EXTENSIONS,
     FORM_NAME_VARIATIONS,
     normalize_form_name,
     get_form_variations,
@@ -163,6 +164,9 @@ class XBRLFilingsLoader:
 
         Returns:
             Path to filing directory or None if not found
+
+        Raises:
+            FileNotFoundError: If the filing is stored as archives only
         """
         self.logger.info(
             f"Searching for filing: market={market}, company={company}, "
@@ -276,6 +280,7 @@ class XBRLFilingsLoader:
 
         # Search within form directories for the actual filing
         candidates = []
+        archived = []
         for form_dir in form_dirs:
             # Look for subdirectories (the actual filings)
             for sub in form_dir.iterdir():
@@ -284,24 +289,16 @@ class XBRLFilingsLoader:
                     # (contains XBRL files like .xsd, _cal.xml, etc.)
                     if self._is_filing_directory(sub):
                         candidates.append(sub)
+                    elif self._is_archived_filing(sub):
+                        archived.append(sub)
 
             # Also check if form_dir itself is the filing
             if self._is_filing_directory(form_dir):
                 candidates.append(form_dir)
+            elif self._is_archived_filing(form_dir):
+                archived.append(form_dir)
 
-        if not candidates:
-            return None
-
-        # Filter by date if provided
-        if date:
-            for candidate in candidates:
-                # Check if date appears in path or directory name
-                if date in str(candidate) or date in candidate.name:
-                    return candidate
-
-        # Return most recent (sorted by name, descending)
-        candidates.sort(key=lambda p: p.name, reverse=True)
-        return candidates[0]
+        return self._select_filing(candidates, archived, date)
 
     def _find_latest_filing_dir(
         self,
@@ -319,21 +316,88 @@ class XBRLFilingsLoader:
             Path to filing directory or None
         """
         candidates = []
+        archived = []
 
         for item in parent_dir.rglob('*'):
-            if item.is_dir() and self._is_filing_directory(item):
-                if date:
-                    if date in str(item) or date in item.name:
-                        candidates.append(item)
-                else:
-                    candidates.append(item)
-
-        if not candidates:
+            if not item.is_dir():
+                continue
+            if date and date not in str(item) and date not in item.name:
+                continue
+            if self._is_filing_directory(item):
+                candidates.append(item)
+            elif self._is_archived_filing(item):
+                archived.append(item)
+
+        return self._select_filing(candidates, archived, date)
+
+    def _select_filing(
+        self,
+        candidates: list[Path],
+        archived: list[Path],
+        date: str = None
+    ) -> Optional[Path]:
+        """
+        Pick the filing matching the date, or the most recent one.
+
+        Filings stored as archives (DOWNLOADER_EXTRACT_FILINGS=false) can
+        not be read here. Selecting one raises instead of returning another
+        filing or None, so the XBRL checks are not silently skipped.
+
+        Args:
+            candidates: Extracted filing directories
+            archived: Directories holding only filing archives
+            date: Optional specific date or accession number
+
+        Returns:
+            Path to filing directory or None
+
+        Raises:
+            FileNotFoundError: If the selected filing is not extracted
+        """
+        # Filter by date if provided
+        if date:
+            matching = [
+                p for p in candidates + archived
+                if date in str(p) or date in p.name
+            ]
+            if matching:
+                candidates = [p for p in matching if p in candidates]
+                archived = [p for p in matching if p in archived]
+
+        # Most recent (sorted by name, descending)
+        ranked = sorted(candidates + archived, key=lambda p: p.name, reverse=True)
+        if not ranked:
             return None
 
-        # Return most recent
-        candidates.sort(key=lambda p: p.name, reverse=True)
-        return candidates[0]
+        if ranked[0] in archived:
+            raise FileNotFoundError(
+                f"Filing is stored as archives, not extracted: {ranked[0]}. "
+                f"XBRL verification needs extracted filings "
+                f"(set DOWNLOADER_EXTRACT_FILINGS=true and download it again)"
+            )
+
+        return ranked[0]
+
+    def _is_archived_filing(self, directory: Path) -> bool:
+        """
+        Check if a directory holds a filing stored as archives (checked
+        after _is_filing_directory, so extracted filings keeping their
+        archive are not matched).
+
+        Args:
+            directory: Directory to check
+
+        Returns:
+            True if directory contains filing archives
+        """
+        try:
+            return any(
+                file_path.is_file()
+                and file_path.name.lower().endswith(FILING_ARCHIVE_EXTENSIONS)
+                for file_path in directory.iterdir()
+            )
+        except PermissionError:
+            return False
 
     def _is_filing_directory(self, directory: Path) -> bool:
         """
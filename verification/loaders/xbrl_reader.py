@@ -170,6 +170,18 @@ class XBRLReader:
             all_arcs.extend(network.arcs)
         return all_arcs
 
+    def find_calculation_linkbase(self, filing_path: Path) -> Optional[Path]:
+        """
+        Find the calculation linkbase file read_calculation_linkbase() uses.
+
+        Args:
+            filing_path: Path to filing directory
+
+        Returns:
+            Path to calculation linkbase or None
+        """
+        return self._find_linkbase_file(filing_path, CALCULATION_LINKBASE_PATTERNS)
+
     def _find_linkbase_file(self, filing_path: Path, patterns: list[str]) -> Optional[Path]:
         """
         Find a linkbase file matching the given patterns.
@@ -30,6 +30,7 @@ from verification.loaders.mapped_reader import MappedReader
 from verification.output.report_generator import ReportGenerator
 from verification.output.summary_exporter import SummaryExporter
 from verification.output.statement_simplifier import StatementSimplifier
+from mapper.observability.instrumentation import configure_instrumentation
 
 
 class VerificationCLI:
@@ -42,6 +43,8 @@ class VerificationCLI:
     def __init__(self):
         """Initialize CLI components."""
         self.config = ConfigLoader()
+        # Per-run metrics report (VERIFICATION_ENABLE_METRICS)
+        self.instrumentation = configure_instrumentation(self.config, run_name='verification')
         self.coordinator = VerificationCoordinator(self.config)
         self.report_generator = ReportGenerator(self.config)
         self.summary_exporter = SummaryExporter(self.config)
@@ -55,6 +58,13 @@ class VerificationCLI:
         # Ensure directories exist
         ensure_data_paths()
 
+        try:
+            self._run_menu()
+        finally:
+            self.instrumentation.write_report()
+
+    def _run_menu(self) -> None:
+        """Filing selection loop."""
         while True:
             # Get available filings
             filings = self.coordinator.get_available_filings()
@@ -159,18 +169,26 @@ class VerificationCLI:
         """
         print(f'\nVerifying {len(filings)} filings...\n')
 
-        results = []
-        for i, filing in enumerate(filings, 1):
-            print(f'[{i}/{len(filings)}] {filing.company} | {filing.form}...')
+        filings_by_id = {
+            f'{f.market}/{f.company}/{f.form}/{f.date}': f for f in filings
+        }
+        completed = 0
+
+        def on_result(result: VerificationResult) -> None:
+            nonlocal completed
+            completed += 1
+            print(f'[{completed}/{len(filings)}] {result.company} | {result.form}...')
 
-            result = self.coordinator.verify_filing(filing)
-            results.append(result)
+            # Save outputs as soon as each filing completes
+            self._save_outputs(filings_by_id.get(result.filing_id), result, quiet=True)
 
-            # Save outputs
-            self._save_outputs(filing, result, quiet=True)
+            if result.scores:
+                print(f'        Quality: {result.quality.level if result.quality else "N/A"} '
+                      f'(Score: {result.scores.overall_score:.1f})')
+            else:
+                print(f'        {result.recommendation}')
 
-            print(f'        Quality: {result.quality.level if result.quality else "N/A"} '
-                  f'(Score: {result.scores.overall_score:.1f})')
+        results = self.coordinator.verify_all_filings(filings, on_result=on_result)
 
         # Show summary
         self._display_batch_summary(results)
@@ -12,6 +12,7 @@ ValidationStatus,
 WellFormednessValidator,
 SchemaValidator,
 CustomRulesValidator,
+BatchReportWriter,
 validate_batch
 )
 __all__ = [
@@ -23,6 +24,7 @@ __all__ = [
 'WellFormednessValidator',
 'SchemaValidator',
 'CustomRulesValidator',
+'BatchReportWriter',
 'validate_batch'
 ]
 __version__ = '1.0.0'
\ No newline at end of file
@@ -8,6 +8,7 @@ Useful for XBRL filing directories organized by company/form/period/filing_id.
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import List, Optional
@@ -18,7 +19,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.table import Table
 from rich.panel import Panel
 
-from xml_validator import XMLValidator, ValidationResult
+from xml_validator import XMLValidator, ValidationResult, ValidationStatus, BatchReportWriter, validate_batch
 
 console = Console()
 
@@ -68,7 +69,9 @@ def validate_recursive(
     max_depth: Optional[int] = None,
     fail_fast: bool = True,
     verbose: bool = False,
-    show_tree: bool = False
+    show_tree: bool = False,
+    workers: int = 1,
+    state_path: Optional[Path] = None
 ) -> dict:
     """
     Recursively validate all XML files in directory tree.
@@ -82,6 +85,8 @@ def validate_recursive(
         fail_fast: Stop validation on first error in each file
         verbose: Show detailed progress
         show_tree: Show directory tree structure
+        workers: Number of worker processes (1 = single process)
+        state_path: Optional state file enabling skip-unchanged mode
         
     Returns:
         Dictionary of validation results
@@ -127,15 +132,26 @@ def validate_recursive(
     )
     
     # Validate all files
-    results = {}
     stats = {
         'total': len(xml_files),
         'valid': 0,
         'invalid': 0,
+        'skipped': 0,
         'errors_by_type': defaultdict(int),
         'errors_by_directory': defaultdict(int)
     }
     
+    # Detailed report is streamed in sorted file order as files complete
+    report = None
+    if output_report:
+        report = BatchReportWriter(
+            output_report,
+            "RECURSIVE XML VALIDATION REPORT",
+            {"Root Directory": root_dir, "Total Files": stats['total']},
+            file_paths=xml_files,
+            include_file_path=True
+        )
+    
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -145,36 +161,62 @@ def validate_recursive(
     ) as progress:
         task = progress.add_task("Validating files...", total=len(xml_files))
         
-        for xml_file in xml_files:
+        def on_result(result: ValidationResult) -> None:
             if verbose:
-                progress.update(task, description=f"Validating {xml_file.name}...")
-            
-            result = validator.validate_file(xml_file)
-            results[xml_file] = result
+                progress.update(task, description=f"Validated {result.file_path.name}")
             
             # Update statistics
+            if result.status == ValidationStatus.SKIPPED:
+                stats['skipped'] += 1
+            
             if result.is_valid:
                 stats['valid'] += 1
             else:
                 stats['invalid'] += 1
-                stats['errors_by_directory'][xml_file.parent] += len(result.errors)
+                stats['errors_by_directory'][result.file_path.parent] += len(result.errors)
                 
                 for error in result.errors:
                     stats['errors_by_type'][error.error_type] += 1
             
+            if report:
+                report.write(result)
+            
             progress.advance(task)
+        
+        try:
+            results = validate_batch(
+                xml_files,
+                validator,
+                workers=workers,
+                state_path=state_path,
+                on_result=on_result,
+                print_summaries=False
+            )
+        finally:
+            if report:
+                report.close(footer=report_footer(stats))
     
     # Display summary
     display_summary(stats, results, root_dir)
     
-    # Save detailed report
     if output_report:
-        save_report(results, stats, root_dir, output_report)
         console.print(f"\n[green]Detailed report saved to:[/green] {output_report}")
     
     return results
 
 
+def report_footer(stats: dict) -> dict:
+    """Build report footer with final counts."""
+    footer = {
+        "Valid": stats['valid'],
+        "Invalid": stats['invalid'],
+        "Skipped (unchanged)": stats['skipped'],
+    }
+    if stats['total'] > 0:
+        footer["Success Rate"] = f"{(stats['valid']/stats['total']*100):.1f}%"
+    return footer
+
+
 def display_summary(stats: dict, results: dict, root_dir: Path):
     """Display validation summary."""
     console.print(f"\n[bold cyan]{'='*70}[/bold cyan]")
@@ -189,6 +231,8 @@ def display_summary(stats: dict, results: dict, root_dir: Path):
     summary_table.add_row("Total Files", str(stats['total']))
     summary_table.add_row("Valid", f"[green]{stats['valid']}[/green]")
     summary_table.add_row("Invalid", f"[red]{stats['invalid']}[/red]")
+    if stats.get('skipped'):
+        summary_table.add_row("Skipped (unchanged)", str(stats['skipped']))
     
     if stats['total'] > 0:
         success_rate = (stats['valid'] / stats['total']) * 100
@@ -244,28 +288,6 @@ def display_summary(stats: dict, results: dict, root_dir: Path):
         console.print(invalid_table)
 
 
-def save_report(results: dict, stats: dict, root_dir: Path, output_path: Path):
-    """Save detailed validation report to file."""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("="*70 + "\n")
-        f.write("RECURSIVE XML VALIDATION REPORT\n")
-        f.write("="*70 + "\n\n")
-        
-        f.write(f"Root Directory: {root_dir}\n")
-        f.write(f"Total Files: {stats['total']}\n")
-        f.write(f"Valid: {stats['valid']}\n")
-        f.write(f"Invalid: {stats['invalid']}\n")
-        f.write(f"Success Rate: {(stats['valid']/stats['total']*100):.1f}%\n" if stats['total'] > 0 else "")
-        f.write("\n" + "="*70 + "\n\n")
-        
-        # Write detailed results
-        for file_path, result in sorted(results.items()):
-            f.write(f"\nFile: {file_path}\n")
-            f.write("-" * 70 + "\n")
-            f.write(result.summary())
-            f.write("\n")
-
-
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -295,6 +317,10 @@ Examples:
   # Verbose output
   python validate_recursive.py /mnt/map_pro/ \\
       --verbose
+  
+  # Use 8 worker processes, skip files unchanged since they last passed
+  python validate_recursive.py /mnt/map_pro/ \\
+      --workers 8 --skip-unchanged validation_state.json
         """
     )
     
@@ -346,6 +372,21 @@ Examples:
         help='Show directory tree structure'
     )
     
+    parser.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of worker processes (default: number of CPUs)'
+    )
+    
+    parser.add_argument(
+        '--skip-unchanged',
+        type=Path,
+        metavar='STATE_FILE',
+        help='Skip files whose content hash is unchanged since they last passed '
+             '(hashes are kept in STATE_FILE)'
+    )
+    
     args = parser.parse_args()
     
     # Validate inputs
@@ -366,7 +407,9 @@ Examples:
             max_depth=args.max_depth,
             fail_fast=not args.no_fail_fast,
             verbose=args.verbose,
-            show_tree=args.show_tree
+            show_tree=args.show_tree,
+            workers=args.workers,
+            state_path=args.skip_unchanged
         )
         
         # Return non-zero if any validation failed
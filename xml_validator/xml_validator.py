@@ -12,11 +12,17 @@ Python: 3.12+
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 from datetime import datetime
 
 from lxml import etree
@@ -45,6 +51,14 @@ class ValidationStatus(str, Enum):
     SKIPPED = "skipped"
 
 
+# Compiled XSD schemas shared by all SchemaValidator instances in a process,
+# keyed by (resolved schema path, modification time)
+_COMPILED_SCHEMAS: dict[tuple[str, int], etree.XMLSchema] = {}
+
+# Read size used when hashing files for skip-unchanged batch mode
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
@@ -78,6 +92,7 @@ class ValidationResult:
     errors: list[ValidationError] = field(default_factory=list)
     warnings: list[ValidationError] = field(default_factory=list)
     levels_completed: list[ValidationLevel] = field(default_factory=list)
+    stage_timings: dict[str, float] = field(default_factory=dict)
     
     def add_error(self, error: ValidationError) -> None:
         """Add an error to the result."""
@@ -98,6 +113,15 @@ class ValidationResult:
             f"Status: {status_symbol} {self.status.value.upper()}",
             f"Timestamp: {self.validation_time.isoformat()}",
             f"Levels Completed: {', '.join(l.value for l in self.levels_completed)}",
+        ]
+        
+        if self.stage_timings:
+            lines.append(
+                "Stage Timings: "
+                + ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in self.stage_timings.items())
+            )
+        
+        lines += [
             f"\nErrors: {len(self.errors)}",
             f"Warnings: {len(self.warnings)}",
         ]
@@ -139,21 +163,40 @@ class WellFormednessValidator:
         Returns:
             List of validation errors (empty if well-formed)
         """
+        _, errors = self.parse(xml_content)
+        return errors
+    
+    def parse(
+        self,
+        xml_content: Union[str, bytes, Path]
+    ) -> tuple[Optional[etree._ElementTree], list[ValidationError]]:
+        """
+        Parse XML once, checking well-formedness.
+        
+        The returned tree is shared with the schema and custom-rules
+        stages so the document is not parsed again.
+        
+        Args:
+            xml_content: XML content as string, bytes, or file path
+            
+        Returns:
+            Tuple of (parsed tree or None if not well-formed, validation errors)
+        """
         errors = []
+        tree = None
         
         try:
+            parser = etree.XMLParser(recover=False)
             if isinstance(xml_content, Path):
                 self.logger.debug(f"Parsing XML file: {xml_content}")
-                parser = etree.XMLParser(recover=False)
-                etree.parse(str(xml_content), parser)
+                tree = etree.parse(str(xml_content), parser)
             else:
                 self.logger.debug("Parsing XML content from string/bytes")
-                parser = etree.XMLParser(recover=False)
                 if isinstance(xml_content, str):
                     xml_content = xml_content.encode('utf-8')
-                etree.fromstring(xml_content, parser)
+                tree = etree.ElementTree(etree.fromstring(xml_content, parser))
             
-            self.logger.info("✓ XML is well-formed")
+            self.logger.debug("✓ XML is well-formed")
             
         except XMLSyntaxError as e:
             self.logger.error(f"✗ XML syntax error: {e}")
@@ -174,7 +217,7 @@ class WellFormednessValidator:
                 error_type=type(e).__name__
             ))
         
-        return errors
+        return tree, errors
 
 
 class SchemaValidator:
@@ -186,23 +229,38 @@ class SchemaValidator:
         self._schema: Optional[etree.XMLSchema] = None
     
     def load_schema(self, schema_path: Path) -> None:
-        """Load and compile XSD schema."""
+        """
+        Load and compile XSD schema.
+        
+        Compiled schemas are cached per process, so validators created for
+        the same schema (e.g. one per batch worker task) compile it once.
+        """
         self.schema_path = schema_path
         try:
-            self.logger.debug(f"Loading schema: {schema_path}")
-            schema_doc = etree.parse(str(schema_path))
-            self._schema = etree.XMLSchema(schema_doc)
-            self.logger.info(f"✓ Schema loaded: {schema_path.name}")
+            schema_path = Path(schema_path)
+            cache_key = (str(schema_path.resolve()), schema_path.stat().st_mtime_ns)
+            schema = _COMPILED_SCHEMAS.get(cache_key)
+            if schema is None:
+                self.logger.debug(f"Loading schema: {schema_path}")
+                schema_doc = etree.parse(str(schema_path))
+                schema = etree.XMLSchema(schema_doc)
+                _COMPILED_SCHEMAS[cache_key] = schema
+                self.logger.info(f"✓ Schema loaded: {schema_path.name}")
+            self._schema = schema
         except Exception as e:
             self.logger.error(f"✗ Failed to load schema: {e}")
             raise ValueError(f"Invalid schema file: {e}") from e
     
-    def validate(self, xml_content: Union[str, bytes, Path]) -> list[ValidationError]:
+    def validate(
+        self,
+        xml_content: Union[str, bytes, Path, etree._ElementTree, etree._Element]
+    ) -> list[ValidationError]:
         """
         Validate XML against loaded schema.
         
         Args:
-            xml_content: XML content as string, bytes, or file path
+            xml_content: XML content as string, bytes, file path, or an
+                already parsed tree (avoids parsing the document again)
             
         Returns:
             List of validation errors (empty if valid)
@@ -222,7 +280,9 @@ class SchemaValidator:
         errors = []
         
         try:
-            if isinstance(xml_content, Path):
+            if isinstance(xml_content, (etree._ElementTree, etree._Element)):
+                doc = xml_content
+            elif isinstance(xml_content, Path):
                 doc = etree.parse(str(xml_content))
             else:
                 if isinstance(xml_content, str):
@@ -232,7 +292,7 @@ class SchemaValidator:
             is_valid = self._schema.validate(doc)
             
             if is_valid:
-                self.logger.info("✓ XML is schema-valid")
+                self.logger.debug("✓ XML is schema-valid")
             else:
                 self.logger.error("✗ XML schema validation failed")
                 for error in self._schema.error_log:
@@ -393,9 +453,7 @@ class XMLValidator:
             ))
             return result
         
-        self.logger.info(f"\n{'='*70}")
-        self.logger.info(f"Starting validation: {file_path.name}")
-        self.logger.info(f"{'='*70}")
+        self.logger.debug(f"Starting validation: {file_path.name}")
         
         result = ValidationResult(
             file_path=file_path,
@@ -403,55 +461,7 @@ class XMLValidator:
             status=ValidationStatus.PASSED
         )
         
-        # Stage 1: Well-formedness
-        self.logger.info("\n[STAGE 1] Checking well-formedness...")
-        errors = self.wellformedness_validator.validate(file_path)
-        for error in errors:
-            result.add_error(error)
-        
-        if errors:
-            result.levels_completed.append(ValidationLevel.WELLFORMEDNESS)
-            if self.fail_fast:
-                self.logger.warning("Stopping validation (fail-fast enabled)")
-                return result
-        else:
-            result.levels_completed.append(ValidationLevel.WELLFORMEDNESS)
-        
-        # Stage 2: Schema validation
-        if self.schema_validator:
-            self.logger.info("\n[STAGE 2] Validating against schema...")
-            errors = self.schema_validator.validate(file_path)
-            for error in errors:
-                result.add_error(error)
-            
-            if errors:
-                result.levels_completed.append(ValidationLevel.SCHEMA)
-                if self.fail_fast:
-                    self.logger.warning("Stopping validation (fail-fast enabled)")
-                    return result
-            else:
-                result.levels_completed.append(ValidationLevel.SCHEMA)
-        
-        # Stage 3: Custom rules
-        if self.custom_validator.rules:
-            self.logger.info("\n[STAGE 3] Applying custom rules...")
-            try:
-                tree = etree.parse(str(file_path))
-                errors = self.custom_validator.validate(tree.getroot())
-                for error in errors:
-                    result.add_error(error)
-                result.levels_completed.append(ValidationLevel.CUSTOM)
-            except Exception as e:
-                self.logger.error(f"Failed to apply custom rules: {e}")
-                result.add_error(ValidationError(
-                    level=ValidationLevel.CUSTOM,
-                    line=None,
-                    column=None,
-                    message=f"Failed to parse XML for custom rules: {str(e)}",
-                    error_type="CustomRuleSetupError"
-                ))
-        
-        return result
+        return self._run_stages(file_path, result)
     
     def validate_string(self, xml_string: str) -> ValidationResult:
         """
@@ -469,44 +479,67 @@ class XMLValidator:
             status=ValidationStatus.PASSED
         )
         
-        # Stage 1: Well-formedness
-        self.logger.info("\n[STAGE 1] Checking well-formedness...")
-        errors = self.wellformedness_validator.validate(xml_string)
+        return self._run_stages(xml_string, result)
+    
+    def _run_stages(
+        self,
+        xml_content: Union[str, bytes, Path],
+        result: ValidationResult
+    ) -> ValidationResult:
+        """
+        Run all validation stages over one parsed tree.
+        
+        The document is parsed once in the well-formedness stage; the
+        schema and custom-rules stages reuse that tree. Time spent in each
+        stage is recorded in result.stage_timings.
+        
+        Args:
+            xml_content: XML file path, string, or bytes
+            result: Result to populate
+            
+        Returns:
+            The populated ValidationResult
+        """
+        # Stage 1: Well-formedness (parses the document)
+        self.logger.debug("[STAGE 1] Checking well-formedness...")
+        started = time.perf_counter()
+        tree, errors = self.wellformedness_validator.parse(xml_content)
+        result.stage_timings[ValidationLevel.WELLFORMEDNESS.value] = time.perf_counter() - started
         for error in errors:
             result.add_error(error)
+        result.levels_completed.append(ValidationLevel.WELLFORMEDNESS)
         
         if errors and self.fail_fast:
+            self.logger.warning("Stopping validation (fail-fast enabled)")
+            return result
+        
+        if tree is None:
+            # Later stages need a parsed document
             return result
-        result.levels_completed.append(ValidationLevel.WELLFORMEDNESS)
         
         # Stage 2: Schema validation
         if self.schema_validator:
-            self.logger.info("\n[STAGE 2] Validating against schema...")
-            errors = self.schema_validator.validate(xml_string)
+            self.logger.debug("[STAGE 2] Validating against schema...")
+            started = time.perf_counter()
+            errors = self.schema_validator.validate(tree)
+            result.stage_timings[ValidationLevel.SCHEMA.value] = time.perf_counter() - started
             for error in errors:
                 result.add_error(error)
+            result.levels_completed.append(ValidationLevel.SCHEMA)
             
             if errors and self.fail_fast:
+                self.logger.warning("Stopping validation (fail-fast enabled)")
                 return result
-            result.levels_completed.append(ValidationLevel.SCHEMA)
         
         # Stage 3: Custom rules
         if self.custom_validator.rules:
-            self.logger.info("\n[STAGE 3] Applying custom rules...")
-            try:
-                tree = etree.fromstring(xml_string.encode('utf-8'))
-                errors = self.custom_validator.validate(tree)
-                for error in errors:
-                    result.add_error(error)
-                result.levels_completed.append(ValidationLevel.CUSTOM)
-            except Exception as e:
-                result.add_error(ValidationError(
-                    level=ValidationLevel.CUSTOM,
-                    line=None,
-                    column=None,
-                    message=f"Failed to parse XML for custom rules: {str(e)}",
-                    error_type="CustomRuleSetupError"
-                ))
+            self.logger.debug("[STAGE 3] Applying custom rules...")
+            started = time.perf_counter()
+            errors = self.custom_validator.validate(tree.getroot())
+            result.stage_timings[ValidationLevel.CUSTOM.value] = time.perf_counter() - started
+            for error in errors:
+                result.add_error(error)
+            result.levels_completed.append(ValidationLevel.CUSTOM)
         
         return result
 
@@ -516,41 +549,397 @@ class XMLValidator:
 # ============================================================================
 
 
+class BatchReportWriter:
+    """
+    Streams validation summaries to a report file as results arrive.
+    
+    Given the batch's file paths, summaries are written in sorted path
+    order whatever order results arrive in: a result is held back until
+    the results of all paths sorting before it are written. The report is
+    therefore identical between runs and complete up to the last file in
+    order that has finished.
+    
+    Example:
+        with BatchReportWriter(path, "Batch Validation Report", {"Total Files": 10}, files) as report:
+            report.write(result)
+    """
+    
+    def __init__(
+        self,
+        output_path: Path,
+        title: str,
+        header: dict[str, object],
+        file_paths: Optional[list[Path]] = None,
+        include_file_path: bool = False
+    ):
+        """
+        Open report and write header.
+        
+        Args:
+            output_path: Report file path
+            title: Report title line
+            header: Header fields written as "Key: value" lines
+            file_paths: Files of the batch (None = write in arrival order)
+            include_file_path: Write a "File: <path>" line before each summary
+        """
+        self.output_path = Path(output_path)
+        self.include_file_path = include_file_path
+        self._order = sorted(Path(p) for p in file_paths) if file_paths is not None else None
+        self._next = 0
+        self._held: dict[Path, ValidationResult] = {}
+        self._file = open(self.output_path, 'w', encoding='utf-8')
+        
+        # Each summary opens with its own rule line
+        self._file.write(f"{title}\n")
+        for key, value in header.items():
+            self._file.write(f"{key}: {value}\n")
+        self._file.flush()
+    
+    def write(self, result: ValidationResult) -> None:
+        """Add one result; write every summary now due in order and flush."""
+        if self._order is None:
+            self._write_entry(result)
+        else:
+            self._held[Path(result.file_path)] = result
+            while self._next < len(self._order) and self._order[self._next] in self._held:
+                self._write_entry(self._held.pop(self._order[self._next]))
+                self._next += 1
+        self._file.flush()
+    
+    def _write_entry(self, result: ValidationResult) -> None:
+        """Write one result summary."""
+        if self.include_file_path:
+            self._file.write(f"\nFile: {result.file_path}\n")
+            self._file.write("-" * 70 + "\n")
+        self._file.write(result.summary())
+        self._file.write("\n")
+    
+    def close(self, footer: Optional[dict[str, object]] = None) -> None:
+        """Write held results and optional footer fields, close the report."""
+        if self._file.closed:
+            return
+        # Results behind a file that never finished (interrupted run)
+        for file_path in sorted(self._held):
+            self._write_entry(self._held[file_path])
+        self._held.clear()
+        if footer:
+            self._file.write(f"\n{'='*70}\n")
+            for key, value in footer.items():
+                self._file.write(f"{key}: {value}\n")
+        self._file.close()
+    
+    def __enter__(self) -> BatchReportWriter:
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def file_digest(file_path: Path) -> str:
+    """Compute SHA-256 hex digest of a file."""
+    hasher = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _validate_one(
+    validator: XMLValidator,
+    file_path: Path,
+    previous_digest: Optional[str] = None
+) -> tuple[ValidationResult, Optional[str]]:
+    """
+    Validate one file, skipping it if its content hash is unchanged.
+    
+    Args:
+        validator: Validator to use
+        file_path: File to validate
+        previous_digest: Digest recorded when the file last passed (skip-unchanged mode)
+        
+    Returns:
+        Tuple of (result, current file digest or None when not hashing)
+    """
+    digest = None
+    if previous_digest is not None:
+        try:
+            digest = file_digest(file_path)
+        except OSError:
+            digest = None
+        
+        if digest == previous_digest:
+            result = ValidationResult(
+                file_path=Path(file_path),
+                is_valid=True,
+                status=ValidationStatus.SKIPPED
+            )
+            return result, digest
+    
+    result = validator.validate_file(file_path)
+    return result, digest
+
+
+def _error_result(file_path: Path, error: BaseException) -> ValidationResult:
+    """Failed result for a file whose validation raised instead of returning."""
+    result = ValidationResult(
+        file_path=Path(file_path),
+        is_valid=False,
+        status=ValidationStatus.FAILED
+    )
+    result.add_error(ValidationError(
+        level=ValidationLevel.WELLFORMEDNESS,
+        line=None,
+        column=None,
+        message=f"Validation failed: {error}",
+        error_type=type(error).__name__
+    ))
+    return result
+
+
+# Validator owned by a batch worker process (created by _init_batch_worker)
+_batch_validator: Optional[XMLValidator] = None
+
+
+def _init_batch_worker(schema_path: Optional[Path], fail_fast: bool, rules: list) -> None:
+    """Create this worker's validator; its compiled schema is reused for every file."""
+    global _batch_validator
+    _batch_validator = XMLValidator(schema_path=schema_path, fail_fast=fail_fast)
+    for rule_name, rule_function in rules:
+        _batch_validator.add_custom_rule(rule_function, rule_name)
+    if _batch_validator.schema_validator:
+        _batch_validator.schema_validator.load_schema(schema_path)
+
+
+def _validate_in_worker(
+    file_path: Path,
+    previous_digest: Optional[str]
+) -> tuple[ValidationResult, Optional[str]]:
+    """Validate one file inside a batch worker process."""
+    return _validate_one(_batch_validator, file_path, previous_digest)
+
+
+def _load_batch_state(state_path: Path, state_key: str) -> dict[str, str]:
+    """Load digests of previously valid files (empty if the key changed)."""
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if state.get('key') != state_key:
+        return {}
+    return state.get('files', {})
+
+
+def _save_batch_state(state_path: Path, state_key: str, digests: dict[str, str]) -> None:
+    """Write digests of valid files atomically."""
+    tmp_path = Path(f"{state_path}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'key': state_key, 'files': digests}, f, indent=2, sort_keys=True)
+    tmp_path.replace(state_path)
+
+
+def _batch_state_key(validator: XMLValidator) -> str:
+    """Key invalidating skip-unchanged state when schema or rules change."""
+    schema_path = validator.schema_validator.schema_path if validator.schema_validator else None
+    parts = [
+        file_digest(schema_path) if schema_path else '',
+        ','.join(name for name, _ in validator.custom_validator.rules),
+        str(validator.fail_fast),
+    ]
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _validate_in_pool(
+    file_paths: list[Path],
+    validator: XMLValidator,
+    workers: int,
+    previous_digest: Callable[[Path], Optional[str]],
+    handle: Callable[[Path, ValidationResult, Optional[str]], None]
+) -> None:
+    """
+    Validate files in a process pool, surviving worker crashes.
+    
+    At most one file per worker is in flight. A worker crash breaks the
+    pool and fails every in-flight file, so the pool is rebuilt and those
+    files are validated again one at a time; a file whose lone worker
+    crashes too is recorded as failed. Files not yet submitted are not
+    affected.
+    
+    Args:
+        file_paths: Files to validate
+        validator: Validator the workers are configured from
+        workers: Number of worker processes
+        previous_digest: Digest to pass for a file (skip-unchanged mode)
+        handle: Called with each file's result and digest
+    """
+    logger = logging.getLogger(__name__)
+    schema_path = validator.schema_validator.schema_path if validator.schema_validator else None
+    initargs = (schema_path, validator.fail_fast, list(validator.custom_validator.rules))
+    
+    pending = deque(file_paths)
+    # Files in flight when a pool broke; each runs alone in the next pool
+    suspects: deque[Path] = deque()
+    
+    while pending or suspects:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=initargs
+        )
+        in_flight = {}
+        pool_broken = False
+        
+        def submit(file_path: Path, alone: bool) -> None:
+            future = executor.submit(_validate_in_worker, file_path, previous_digest(file_path))
+            in_flight[future] = (file_path, alone)
+        
+        try:
+            while (pending or suspects or in_flight) and not pool_broken:
+                if suspects:
+                    if not in_flight:
+                        submit(suspects.popleft(), alone=True)
+                else:
+                    while pending and len(in_flight) < workers:
+                        submit(pending.popleft(), alone=False)
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    file_path, alone = in_flight.pop(future)
+                    try:
+                        result, digest = future.result()
+                    except BrokenProcessPool as e:
+                        pool_broken = True
+                        if not alone:
+                            suspects.append(file_path)
+                            continue
+                        logger.error(f"Worker crashed validating {file_path}")
+                        result, digest = _error_result(file_path, e), None
+                    except Exception as e:
+                        logger.error(f"Validation of {file_path} failed: {e}")
+                        result, digest = _error_result(file_path, e), None
+                    handle(file_path, result, digest)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        
+        if not pool_broken:
+            executor.shutdown(wait=True)
+            continue
+        
+        logger.warning("Validation worker crashed, restarting pool")
+        for future, (file_path, _) in in_flight.items():
+            if future.done() and future.exception() is None:
+                result, digest = future.result()
+                handle(file_path, result, digest)
+            else:
+                suspects.append(file_path)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def validate_batch(
     file_paths: list[Path],
     validator: XMLValidator,
-    output_report: Optional[Path] = None
+    output_report: Optional[Path] = None,
+    workers: int = 1,
+    state_path: Optional[Path] = None,
+    on_result: Optional[Callable[[ValidationResult], None]] = None,
+    print_summaries: bool = True
 ) -> dict[Path, ValidationResult]:
     """
     Validate multiple XML files in batch.
     
+    With workers > 1 files are validated in a process pool; every worker
+    builds one validator (compiling the schema once) and reuses it for all
+    of its files. Each summary is written to the report as soon as its file
+    completes, so the report is complete up to the last finished file even
+    if the run is interrupted.
+    
+    With state_path set, files whose SHA-256 digest matches the digest
+    recorded when they last passed are skipped (status SKIPPED). The state
+    is discarded when the schema, custom rules or fail-fast setting change.
+    
+    A file whose validation raises is recorded as failed with the
+    exception as its error; the rest of the batch carries on. A worker
+    crash fails every file in flight at that moment, so those files are
+    validated again one at a time in a new pool, and only a file that
+    crashes its worker on its own is recorded as failed (see
+    _validate_in_pool). Report entries are in sorted path order.
+    
+    Custom rules are sent to worker processes, so in parallel mode they
+    must be picklable (module-level functions).
+    
     Args:
         file_paths: List of XML file paths
-        validator: Configured XMLValidator instance
+        validator: Configured XMLValidator instance (template for workers)
         output_report: Optional path to save combined report
+        workers: Number of worker processes (1 = validate in this process)
+        state_path: Optional JSON file enabling skip-unchanged mode
+        on_result: Optional callback invoked with each finished result
+        print_summaries: Print each summary to stdout
         
     Returns:
-        Dictionary mapping file paths to validation results
+        Dictionary mapping file paths to validation results (in file_paths order)
     """
+    logger = logging.getLogger(__name__)
     results = {}
     
-    for file_path in file_paths:
-        result = validator.validate_file(file_path)
-        results[file_path] = result
-        print(result.summary())
+    state_key = _batch_state_key(validator) if state_path else None
+    known_digests = _load_batch_state(state_path, state_key) if state_path else {}
+    new_digests = {}
     
+    report = None
     if output_report:
-        with open(output_report, 'w', encoding='utf-8') as f:
-            f.write(f"Batch Validation Report\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\n")
-            f.write(f"Total Files: {len(file_paths)}\n")
-            f.write(f"{'='*70}\n\n")
-            
-            for file_path, result in results.items():
-                f.write(result.summary())
-                f.write("\n")
+        report = BatchReportWriter(
+            output_report,
+            "Batch Validation Report",
+            {"Generated": datetime.now().isoformat(), "Total Files": len(file_paths)},
+            file_paths=file_paths
+        )
+    
+    def previous_digest(file_path: Path) -> Optional[str]:
+        # Empty string requests hashing without a match (first run)
+        if not state_path:
+            return None
+        return known_digests.get(str(file_path), '')
+    
+    def handle(file_path: Path, result: ValidationResult, digest: Optional[str]) -> None:
+        results[file_path] = result
+        if digest and result.is_valid:
+            new_digests[str(file_path)] = digest
+        if print_summaries:
+            print(result.summary())
+        if report:
+            report.write(result)
+        if on_result:
+            on_result(result)
+    
+    try:
+        if workers > 1 and len(file_paths) > 1:
+            _validate_in_pool(file_paths, validator, workers, previous_digest, handle)
+        else:
+            for file_path in file_paths:
+                try:
+                    result, digest = _validate_one(validator, file_path, previous_digest(file_path))
+                except Exception as e:
+                    logger.error(f"Validation of {file_path} failed: {e}")
+                    result, digest = _error_result(file_path, e), None
+                handle(file_path, result, digest)
+    finally:
+        if report:
+            report.close()
+        if state_path:
+            # Keep entries of files not reached (e.g. interrupted run)
+            processed = {str(file_path) for file_path in results}
+            digests = {
+                path: digest for path, digest in known_digests.items()
+                if path not in processed
+            }
+            digests.update(new_digests)
+            _save_batch_state(state_path, state_key, digests)
     
-    return results
+    return {file_path: results[file_path] for file_path in file_paths if file_path in results}
 
 
 # ============================================================================